@@ -0,0 +1,91 @@
+"""Benchmark of the API Error Log list view query on a large table.
+
+Copies the structure of `tabAPI Error Log` into a scratch table, fills it with
+generated rows and prints the plans and times of the list view queries (unseen
+errors by modified descending, the default, and all errors by modified) without
+and with the composite (seen, modified) index added by `on_doctype_update`. A
+plan without "Using filesort" reads only the first page from the index. The scratch table is dropped afterwards;
+the real API Error Logs of the site are never touched.
+
+Run from the bench directory (filling 10M rows takes a while):
+
+    ./env/bin/python apps/swagger/benchmarks/bench_error_log_list.py --site mysite.local
+"""
+import argparse
+import os
+import random
+from datetime import datetime, timedelta
+
+import frappe
+
+from helpers import measure
+
+TABLE = "tabAPI Error Log Benchmark"
+LIST_QUERIES = {
+    "unseen": f"""select name, title, seen, occurrences, modified from `{TABLE}`
+        where seen = 0 order by modified desc limit 20""",
+    "unseen p500": f"""select name, title, seen, occurrences, modified from `{TABLE}`
+        where seen = 0 order by modified desc limit 20 offset 10000""",
+    "all": f"""select name, title, seen, occurrences, modified from `{TABLE}`
+        order by modified desc limit 20""",
+}
+
+
+def fill_table(rows, chunk_size):
+    start = datetime.now() - timedelta(days=365)
+    fields = ("name", "owner", "creation", "modified", "modified_by", "docstatus",
+              "title", "error", "seen", "fingerprint", "occurrences")
+    for offset in range(0, rows, chunk_size):
+        values = []
+        for i in range(offset, min(offset + chunk_size, rows)):
+            modified = start + timedelta(seconds=i * 31536000 // rows)
+            values.append(
+                (
+                    f"BENCH-{i:010d}", "Administrator", modified, modified, "Administrator", 0,
+                    f"Endpoint {i % 500} API Error", "Traceback", int(random.random() < 0.9),
+                    f"{i:064x}", 1,
+                )
+            )
+        frappe.db.bulk_insert(TABLE[3:], fields, values)
+        frappe.db.commit()
+        print(f"\r  filled {min(offset + chunk_size, rows):,} / {rows:,} rows", end="", flush=True)
+    print()
+
+
+def report(label, iterations):
+    print(label)
+    for name, query in LIST_QUERIES.items():
+        for row in frappe.db.sql(f"explain {query}", as_dict=True):
+            print(f"  {name:>12}: plan key={row.key} rows={row.rows} extra={row.Extra}")
+        result = measure(lambda: frappe.db.sql(query), iterations)
+        print(f"  {name:>12}: p50 {result['p50_us'] / 1e3:10.2f} ms  p99 {result['p99_us'] / 1e3:10.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--site", required=True)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    frappe.init(site=args.site, sites_path=os.getcwd() + "/sites")
+    frappe.connect()
+    try:
+        frappe.db.sql_ddl(f"drop table if exists `{TABLE}`")
+        frappe.db.sql_ddl(f"create table `{TABLE}` like `tabAPI Error Log`")
+        for index in frappe.db.sql(f"show index from `{TABLE}` where Column_name = 'seen'", as_dict=True):
+            frappe.db.sql_ddl(f"alter table `{TABLE}` drop index `{index.Key_name}`")
+
+        fill_table(args.rows, args.chunk_size)
+        report(f"{args.rows:,} rows, default indexes", args.iterations)
+
+        frappe.db.sql_ddl(f"alter table `{TABLE}` add index seen_modified_index (seen, modified)")
+        report(f"{args.rows:,} rows, (seen, modified) index", args.iterations)
+    finally:
+        frappe.db.sql_ddl(f"drop table if exists `{TABLE}`")
+        frappe.destroy()
+
+
+if __name__ == "__main__":
+    main()
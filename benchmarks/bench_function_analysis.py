@@ -0,0 +1,98 @@
+"""Micro-benchmark of the per-function analysis done by the Swagger generator.
+
+Compares the previous approach (an `ast.dump` of every node to find
+`validate_http_method`, a second walk for the `validate_request` decorator and a
+substring search for HTTP methods) with the single-pass `FunctionAnalyzer`.
+
+Run from the bench directory:
+
+    ./env/bin/python apps/swagger/benchmarks/bench_function_analysis.py
+"""
+import argparse
+import ast
+
+from swagger.swagger_generator import FunctionAnalyzer
+
+from helpers import measure
+
+FUNCTION_TEMPLATE = '''
+@frappe.whitelist()
+@validate_request(Model{index})
+def endpoint_{index}(user_id: str, validated_data: Model{index}, limit: int = 10):
+    swagger.validate_http_method("{method}")
+    result = []
+    for row in frappe.get_all("TARGET Doc", filters={{"owner": user_id}}, limit=limit):
+        if row.get("status") in ("Open", "Closed"):
+            result.append({{"name": row.name, "value": compute(row, validated_data)}})
+        else:
+            result.append({{"name": row.name, "value": None}})
+    return {{"status": "success", "data": result}}
+'''
+
+
+def legacy_analysis(source_code, tree):
+    """The analysis done per function before `FunctionAnalyzer`."""
+    if not any(
+        "validate_http_method" in ast.dump(node) and isinstance(node, ast.Call)
+        for node in ast.walk(tree)
+    ):
+        return None
+
+    model_name = None
+    for n in ast.walk(tree):
+        if isinstance(n, ast.FunctionDef):
+            for decorator in n.decorator_list:
+                if (
+                    isinstance(decorator, ast.Call)
+                    and isinstance(decorator.func, ast.Name)
+                    and decorator.func.id == "validate_request"
+                    and decorator.args
+                ):
+                    model_name = ast.unparse(decorator.args[0])
+
+    http_method = "POST"
+    for method in ("GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS", "HEAD"):
+        if method in source_code:
+            http_method = method
+            break
+    return model_name, http_method
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--functions", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    methods = ("POST", "PUT", "GET", "DELETE")
+    sources = [
+        FUNCTION_TEMPLATE.format(index=index, method=methods[index % len(methods)])
+        for index in range(args.functions)
+    ]
+    trees = [ast.parse(source) for source in sources]
+
+    def run_legacy():
+        for source, tree in zip(sources, trees):
+            legacy_analysis(source, tree)
+
+    def run_analyzer():
+        for tree in trees:
+            FunctionAnalyzer(tree.body[0])
+
+    for name, func in (("legacy", run_legacy), ("analyzer", run_analyzer)):
+        p50 = measure(func, args.repeat)["p50_us"] / 1e6
+        print(
+            f"{name:>8}: p50 {p50 * 1000:8.2f} ms for {args.functions} functions "
+            f"({p50 / args.functions * 1e6:.1f} us/function)"
+        )
+
+    # The legacy substring search reports GET for every function using "TARGET"
+    wrong = sum(
+        legacy_analysis(source, tree)[1] != FunctionAnalyzer(tree.body[0]).http_methods[0]
+        for source, tree in zip(sources, trees)
+    )
+    print(f"legacy detected the wrong HTTP method for {wrong} of {args.functions} functions")
+
+
+if __name__ == "__main__":
+    main()
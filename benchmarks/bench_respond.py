@@ -0,0 +1,71 @@
+"""Benchmark of the per-response overhead of `respond`.
+
+Compares the previous implementation (a new `CookieManager` flushed on every
+call, then frappe's JSON renderer) with the standard and fast response modes
+for growing payloads of rows with datetimes. Every variant includes the
+serialization of the response body, so the numbers are end to end.
+
+Run from the bench directory:
+
+    ./env/bin/python apps/swagger/benchmarks/bench_respond.py --site mysite.local
+"""
+import argparse
+import os
+
+import frappe
+from frappe.auth import CookieManager
+
+from swagger import responder
+
+from helpers import make_request, make_rows, measure, render
+
+
+def legacy_respond(status=200, message="Success", data={}, errors={}):
+    """`respond` before the fast response mode."""
+    response = frappe._dict({"message": frappe._(message)})
+    if data:
+        response["data"] = data
+    if errors:
+        response["errors"] = errors
+    frappe.local.response = response
+    frappe.local.response["http_status_code"] = status
+
+    frappe.local.cookie_manager = CookieManager()
+    frappe.local.cookie_manager.flush_cookies(response=frappe.local.response)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--site", required=True)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[0, 10, 1000, 10000])
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    frappe.init(site=args.site, sites_path=os.getcwd() + "/sites")
+    frappe.connect()
+    settings = frappe.get_cached_doc("Swagger Settings")
+    make_request(method="GET", headers={"Authorization": "token benchmark:benchmark"})
+
+    variants = {
+        "legacy": ("Standard", render(legacy_respond)),
+        "standard": ("Standard", render(responder.respond)),
+        "fast": ("Fast", render(responder.respond)),
+    }
+    try:
+        for size in args.sizes:
+            data = make_rows(size)
+            print(f"{size} rows")
+            for name, (mode, call) in variants.items():
+                settings.response_mode = mode
+                iterations = max(10, args.iterations * 100 // max(size, 100))
+                result = measure(lambda: call(data), iterations)
+                print(
+                    f"  {name:>8}: {result['ops_per_sec']:10.1f} resp/s"
+                    f"  p50 {result['p50_us']:10.1f} us  p99 {result['p99_us']:10.1f} us"
+                )
+    finally:
+        frappe.destroy()
+
+
+if __name__ == "__main__":
+    main()
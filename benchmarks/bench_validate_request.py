@@ -0,0 +1,60 @@
+"""Benchmark of request body validation in `validate_request`.
+
+Compares the previous implementation (`json.loads` of the body followed by
+`model(**data)`) with the current one (`model_validate_json` on the raw bytes)
+for growing payloads, reporting throughput and p50/p99 latency.
+
+Run from the bench directory:
+
+    ./env/bin/python apps/swagger/benchmarks/bench_validate_request.py
+"""
+import argparse
+import json
+
+import frappe
+
+from swagger.validator import validate_request
+
+from helpers import Order, make_order, make_request, measure
+
+
+def legacy_validate_request(model):
+    """The body validation done by `validate_request` before `model_validate_json`."""
+
+    def decorator(func):
+        def wrapper(*args, **kwargs):
+            data = json.loads(frappe.request.data)
+            return func(model(**data))
+
+        return wrapper
+
+    return decorator
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 1000, 10000])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    handler = lambda validated_data: validated_data
+    endpoints = {
+        "legacy": legacy_validate_request(Order)(handler),
+        "current": validate_request(Order)(handler),
+    }
+
+    for size in args.sizes:
+        payload = make_order(size)
+        make_request(data=payload)
+        print(f"{size} items ({len(payload) / 1024:.1f} KiB)")
+        for name, endpoint in endpoints.items():
+            iterations = max(10, args.iterations * 100 // max(size, 100))
+            result = measure(endpoint, iterations)
+            print(
+                f"  {name:>8}: {result['ops_per_sec']:10.1f} req/s"
+                f"  p50 {result['p50_us']:10.1f} us  p99 {result['p99_us']:10.1f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
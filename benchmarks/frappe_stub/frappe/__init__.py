@@ -0,0 +1,203 @@
+"""Offline stand-in for the parts of frappe used by the swagger app.
+
+Only used by `benchmarks/run_suite.py`. Requests, sessions, the site database and
+Swagger Settings are replaced by in-memory objects so the generator and the
+request path can be timed without a bench or a site. Behaviour is kept to what
+the timed code paths need; nothing here is a faithful frappe emulation.
+"""
+import json
+import os
+import traceback
+import types
+import uuid
+
+from . import utils
+
+
+class _dict(dict):
+    def __getattr__(self, key):
+        return self.get(key)
+
+    def __setattr__(self, key, value):
+        self[key] = value
+
+
+class Database:
+    """In-memory tables with the subset of `frappe.db` used by the app."""
+
+    db_type = "mariadb"
+
+    def __init__(self):
+        self.tables = {}
+        self.queries = 0
+
+    def bulk_insert(self, doctype, fields, values, ignore_duplicates=False, chunk_size=10000):
+        self.queries += 1
+        rows = self.tables.setdefault(doctype, [])
+        rows.extend(_dict(zip(fields, row)) for row in values)
+
+    def sql(self, query, values=None, *args, **kwargs):
+        self.queries += 1
+        return []
+
+    def get_single_value(self, doctype, fieldname):
+        return get_cached_doc(doctype).get(fieldname)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+def load_settings():
+    """Swagger Settings with the defaults of the doctype."""
+    path = os.path.join(
+        os.path.dirname(__file__), "..", "..", "..",
+        "swagger", "swagger_ui", "doctype", "swagger_settings", "swagger_settings.json",
+    )
+    with open(path) as f:
+        doctype = json.load(f)
+    settings = _dict()
+    for field in doctype["fields"]:
+        if field["fieldtype"] in ("Section Break", "Column Break", "Button"):
+            continue
+        default = field.get("default")
+        if field["fieldtype"] in ("Int", "Check"):
+            default = utils.cint(default)
+        elif field["fieldtype"] == "Float":
+            default = utils.flt(default)
+        elif field["fieldtype"] == "Table":
+            default = []
+        settings[field["fieldname"]] = default
+    return settings
+
+
+db = Database()
+local = types.SimpleNamespace(
+    site="benchmark.local",
+    sites_path="sites",
+    bench_path=os.getcwd(),
+    installed_apps=["frappe"],
+    request=None,
+    response=_dict(),
+    form_dict=_dict(),
+    message_log=[],
+    db=db,
+)
+session = _dict(user="Administrator")
+flags = _dict()
+settings = {"Swagger Settings": load_settings()}
+error_logs = []
+
+
+class _RequestProxy:
+    def __getattr__(self, name):
+        return getattr(local.request, name)
+
+    def __bool__(self):
+        return local.request is not None
+
+
+request = _RequestProxy()
+
+
+def _(msg, *args, **kwargs):
+    return msg
+
+
+def whitelist(allow_guest=False, methods=None, **kwargs):
+    return lambda func: func
+
+
+def get_cached_doc(doctype, *args, **kwargs):
+    return settings[doctype]
+
+
+get_single = get_cached_doc
+
+
+def get_all(doctype, filters=None, or_filters=None, fields=None, pluck=None, as_list=False, **kwargs):
+    rows = db.tables.get(doctype, [])
+
+    def matches(row, conditions, combine):
+        checks = []
+        for field, condition in (conditions or {}).items():
+            if isinstance(condition, (list, tuple)) and condition[0] == "in":
+                checks.append(row.get(field) in condition[1])
+            else:
+                checks.append(row.get(field) == condition)
+        return combine(checks) if checks else True
+
+    rows = [
+        row for row in rows
+        if matches(row, filters, all) and matches(row, or_filters, any)
+    ]
+    if pluck:
+        return [row.get(pluck) for row in rows]
+    fields = fields or ["name"]
+    if as_list:
+        return [tuple(row.get(field) for field in fields) for row in rows]
+    return [_dict((field, row.get(field)) for field in fields) for row in rows]
+
+
+def get_request_header(key, default=None):
+    if not local.request:
+        return default
+    return local.request.headers.get(key, default)
+
+
+def log_error(message=None, title=None, **kwargs):
+    error_logs.append((title, message))
+
+
+def get_traceback(*args, **kwargs):
+    return traceback.format_exc()
+
+
+def as_unicode(value, *args):
+    return str(value)
+
+
+def msgprint(*args, **kwargs):
+    pass
+
+
+def publish_realtime(*args, **kwargs):
+    pass
+
+
+def enqueue(method, *args, **kwargs):
+    pass
+
+
+def only_for(*args, **kwargs):
+    pass
+
+
+def generate_hash(*args, length=10, **kwargs):
+    return uuid.uuid4().hex[:length]
+
+
+def get_installed_apps(*args, **kwargs):
+    return list(local.installed_apps)
+
+
+def get_site_path(*path):
+    return os.path.join(local.bench_path, "sites", local.site, *path)
+
+
+def safe_decode(value, *args, **kwargs):
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def init(site=None, sites_path=None, *args, **kwargs):
+    pass
+
+
+def connect(*args, **kwargs):
+    pass
+
+
+def destroy():
+    pass
@@ -0,0 +1,10 @@
+class CookieManager:
+    def __init__(self):
+        self.cookies = {}
+        self.to_delete = []
+
+    def flush_cookies(self, response=None):
+        for key, cookie in self.cookies.items():
+            response.set_cookie(key, **cookie)
+        for key in set(self.to_delete):
+            response.set_cookie(key, "", expires=0)
@@ -0,0 +1,29 @@
+import datetime
+
+import frappe
+
+
+def get_bench_path():
+    return frappe.local.bench_path
+
+
+def cint(value, default=0):
+    try:
+        return int(float(value or 0))
+    except (TypeError, ValueError):
+        return default
+
+
+def flt(value, precision=None):
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def now_datetime():
+    return datetime.datetime.now()
+
+
+def now():
+    return str(now_datetime())
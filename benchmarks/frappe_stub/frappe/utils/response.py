@@ -0,0 +1,33 @@
+import datetime
+import decimal
+
+import frappe
+
+
+def json_handler(obj):
+    if isinstance(obj, (datetime.date, datetime.datetime, datetime.time, datetime.timedelta)):
+        return str(obj)
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj)} with value of {obj!r} is not JSON serializable")
+
+
+def make_logs():
+    if frappe.local.message_log:
+        frappe.local.response["_server_messages"] = frappe.local.message_log
+
+
+def as_json():
+    """Render `frappe.local.response` the way frappe answers whitelisted methods."""
+    import json
+
+    from werkzeug.wrappers import Response
+
+    make_logs()
+    response = Response()
+    if frappe.local.response.http_status_code:
+        response.status_code = frappe.local.response["http_status_code"]
+        del frappe.local.response["http_status_code"]
+    response.mimetype = "application/json"
+    response.data = json.dumps(frappe.local.response, default=json_handler, separators=(",", ":"))
+    return response
@@ -0,0 +1,91 @@
+"""Measurement and fixtures shared by `run_suite.py` and the standalone benchmarks.
+
+Imported by the scripts of this directory, which Python puts on `sys.path` when
+one of them is run. `frappe` is whatever the running script resolved: the
+in-memory stub for `run_suite.py`, the bench's frappe for the others.
+"""
+import json
+import statistics
+import time
+import types
+from datetime import datetime
+from typing import List, Optional
+
+import frappe
+from frappe.utils.response import as_json
+from pydantic import BaseModel
+
+
+class Item(BaseModel):
+    sku: str
+    quantity: int
+    price: float
+    tags: List[str] = []
+
+
+class Order(BaseModel):
+    customer: str
+    notes: Optional[str] = None
+    items: List[Item]
+
+
+def make_order(items):
+    """The JSON body of an `Order` with `items` items."""
+    return json.dumps(
+        {
+            "customer": "CUST-0001",
+            "notes": "benchmark",
+            "items": [
+                {"sku": f"SKU-{i}", "quantity": i, "price": i * 1.5, "tags": ["a", "b"]}
+                for i in range(items)
+            ],
+        }
+    ).encode()
+
+
+def make_rows(count):
+    """`count` list view rows, each with a datetime to serialize."""
+    start = datetime(2024, 1, 1)
+    return [
+        {"name": f"SO-{i:06d}", "grand_total": i * 10.5, "creation": start}
+        for i in range(count)
+    ]
+
+
+def make_request(method="POST", data=b"", headers=None):
+    """Set up `frappe.local` as for a call of an API method."""
+    frappe.local.request = types.SimpleNamespace(
+        method=method, data=data, headers=headers or {}, path="/api/method/benchapp.api.orders.create"
+    )
+    frappe.local.form_dict = frappe._dict(cmd="benchapp.api.orders.create")
+
+
+def render(respond):
+    """Wrap a respond function to build the HTTP response body the way frappe would."""
+
+    def call(data):
+        response = respond(data=data)
+        if response is None:
+            response = as_json()
+        return response.get_data()
+
+    return call
+
+
+def measure(call, iterations):
+    """Time `iterations` calls of `call`.
+
+    Returns:
+        dict: The throughput and the p50 and p99 latencies in microseconds.
+    """
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return {
+        "ops_per_sec": len(timings) / sum(timings),
+        "p50_us": statistics.median(timings) * 1e6,
+        "p99_us": timings[max(int(len(timings) * 0.99) - 1, 0)] * 1e6,
+    }
@@ -0,0 +1,353 @@
+"""Offline benchmark suite of the Swagger generator and the request path.
+
+Runs without a bench or a site: `frappe` is replaced by the in-memory stub in
+`benchmarks/frappe_stub`. Covers
+
+- spec generation over synthetic apps of 100 to 5000 endpoints, with shallow
+  and deeply nested Pydantic models, cold (forced) and warm (cached),
+- `validate_request` throughput for growing payloads, parsed whole and streamed,
+- the cost of rejecting a request with `validate_http_method` and `http_methods`,
+- `respond()` overhead in the standard and fast response modes, including the
+  rendering of the response body,
+- bursts of `log_api_error` in the synchronous and buffered logging modes.
+
+Results are written as JSON and compared with a stored baseline; the run fails
+when a benchmark got slower than the baseline by more than the threshold.
+
+Run from the app directory:
+
+    python benchmarks/run_suite.py
+    python benchmarks/run_suite.py --quick --output results.json
+    python benchmarks/run_suite.py --update-baseline
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.join(BENCHMARKS_DIR, "frappe_stub"), os.path.dirname(BENCHMARKS_DIR)]
+
+import frappe  # noqa: E402
+
+import swagger  # noqa: E402
+from swagger import api_logger, swagger_generator  # noqa: E402
+from swagger.exceptions import MethodNotAllowedException  # noqa: E402
+from swagger.responder import respond  # noqa: E402
+from swagger.validator import http_methods, validate_http_method, validate_request  # noqa: E402
+
+from helpers import Item, Order, make_order, make_request, make_rows, measure, render  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(BENCHMARKS_DIR, "baseline.json")
+ENDPOINTS_PER_MODULE = 50
+MODEL_COUNT = 50
+MODEL_DEPTH = 5
+
+SHALLOW_MODEL = '''
+class Model{index}(BaseModel):
+    name: str
+    quantity: int
+    price: float
+    active: bool = True
+    notes: Optional[str] = None
+'''
+
+DEEP_MODEL_LEVEL = '''
+class Model{index}Level{level}(BaseModel):
+    name: str
+    value: float
+    children: List[{child}] = []
+'''
+
+ENDPOINT_TEMPLATE = '''
+@frappe.whitelist()
+@validate_request(models.Model{model})
+def create_{index}(validated_data):
+    swagger.validate_http_method("POST")
+    return {{"name": validated_data.name}}
+
+
+@frappe.whitelist()
+@http_methods("GET")
+def get_{index}(name: str, limit: int = 20) -> List[models.Model{model}]:
+    return []
+'''
+
+
+# Synthetic apps
+
+
+def write_synthetic_app(bench_path, endpoints, deep):
+    """Write an app with `endpoints` API functions split in modules of 50."""
+    app_dir = os.path.join(bench_path, "apps", "benchapp", "benchapp")
+    api_dir = os.path.join(app_dir, "api")
+    os.makedirs(api_dir)
+    for path in (os.path.join(app_dir, "__init__.py"), os.path.join(api_dir, "__init__.py")):
+        open(path, "w").close()
+
+    source = ["from typing import List, Optional", "from pydantic import BaseModel"]
+    for index in range(MODEL_COUNT):
+        if deep:
+            child = "dict"
+            for level in range(MODEL_DEPTH - 1, -1, -1):
+                source.append(DEEP_MODEL_LEVEL.format(index=index, level=level, child=child))
+                child = f"Model{index}Level{level}"
+            source.append(f"Model{index} = Model{index}Level0\n")
+        else:
+            source.append(SHALLOW_MODEL.format(index=index))
+    with open(os.path.join(app_dir, "models.py"), "w") as f:
+        f.write("\n".join(source))
+
+    # every template holds a POST and a GET endpoint
+    for module in range(0, endpoints // 2, ENDPOINTS_PER_MODULE // 2):
+        body = [
+            "import frappe",
+            "import swagger",
+            "from typing import List",
+            "from swagger import validate_request, http_methods",
+            "from benchapp import models",
+        ]
+        for index in range(module, min(module + ENDPOINTS_PER_MODULE // 2, endpoints // 2)):
+            body.append(ENDPOINT_TEMPLATE.format(index=index, model=index % MODEL_COUNT))
+        with open(os.path.join(api_dir, f"module_{module:05d}.py"), "w") as f:
+            f.write("\n".join(body))
+
+    os.makedirs(os.path.join(bench_path, "apps", "swagger", "swagger", "www"))
+    os.makedirs(os.path.join(bench_path, "sites", frappe.local.site, "private"))
+    return os.path.join(bench_path, "apps", "benchapp")
+
+
+def clear_synthetic_modules():
+    for name in list(sys.modules):
+        if name == "benchapp" or name.startswith("benchapp."):
+            del sys.modules[name]
+
+
+def bench_generator(results, sizes, repeat):
+    settings = frappe.get_cached_doc("Swagger Settings")
+    for deep in (False, True):
+        for endpoints in sizes:
+            bench_path = tempfile.mkdtemp(prefix="swagger-bench-")
+            app_path = write_synthetic_app(bench_path, endpoints, deep)
+            sys.path.insert(0, app_path)
+            frappe.local.bench_path = bench_path
+            frappe.local.installed_apps = ["benchapp"]
+            name = f"generator.{'deep' if deep else 'shallow'}.{endpoints}"
+            try:
+                for mode in ("Import", "Static"):
+                    settings.analysis_mode = mode
+                    for label, force in (("cold", True), ("warm", False)):
+                        timings = []
+                        for _ in range(repeat):
+                            clear_synthetic_modules()
+                            with contextlib.redirect_stdout(io.StringIO()):
+                                start = time.perf_counter()
+                                swagger_generator.generate_swagger_json(force=force)
+                                timings.append(time.perf_counter() - start)
+                        key = f"{name}.{mode.lower()}.{label}"
+                        results[key] = {"seconds": min(timings)}
+                        report(key, results[key])
+            finally:
+                sys.path.remove(app_path)
+                clear_synthetic_modules()
+                shutil.rmtree(bench_path)
+    settings.analysis_mode = "Import"
+
+
+# Request path
+
+
+def bench_validate_request(results, iterations):
+    endpoint = validate_request(Order)(lambda validated_data: validated_data)
+    for items in (1, 100, 1000):
+        make_request(data=make_order(items))
+        key = f"validate_request.{items}_items"
+        results[key] = measure(endpoint, max(10, iterations * 100 // max(items, 100)))
+        report(key, results[key])
+
+    # the same items as newline-delimited JSON, parsed and validated one at a time
+    streamed = validate_request(Item, stream=True)(
+        lambda validated_data: sum(1 for _ in validated_data)
+    )
+    for items in (100, 1000):
+        lines = json.loads(make_order(items))["items"]
+        body = b"\n".join(json.dumps(line).encode() for line in lines)
+        make_request(data=body, headers={"Content-Type": "application/x-ndjson"})
+
+        def call():
+            frappe.local.request.stream = io.BytesIO(body)
+            return streamed()
+
+        key = f"validate_request.stream.{items}_items"
+        results[key] = measure(call, max(10, iterations * 100 // max(items, 100)))
+        report(key, results[key])
+
+
+def bench_method_rejection(results, iterations):
+    make_request(method="GET")
+
+    def reject_call():
+        try:
+            validate_http_method("POST", "PUT")
+        except MethodNotAllowedException:
+            pass
+
+    decorated = http_methods("POST", "PUT")(lambda: None)
+
+    def reject_decorator():
+        try:
+            decorated()
+        except MethodNotAllowedException:
+            pass
+
+    for key, call in (
+        ("validate_http_method.reject", reject_call),
+        ("http_methods.reject", reject_decorator),
+    ):
+        results[key] = measure(call, iterations * 10)
+        report(key, results[key])
+
+
+def bench_respond(results, iterations):
+    settings = frappe.get_cached_doc("Swagger Settings")
+    render_response = render(respond)
+    for rows in (0, 100):
+        data = make_rows(rows)
+        for mode, headers in (
+            ("standard", {}),
+            ("fast", {"Authorization": "token benchmark:benchmark"}),
+        ):
+            settings.response_mode = "Fast" if mode == "fast" else "Standard"
+            make_request(method="GET", headers=headers)
+            key = f"respond.{mode}.{rows}_rows"
+            results[key] = measure(lambda: render_response(data), iterations * 10)
+            report(key, results[key])
+    settings.response_mode = "Standard"
+
+
+def bench_log_api_error(results, burst):
+    settings = frappe.get_cached_doc("Swagger Settings")
+    make_request(headers={"Content-Type": "application/json"})
+
+    def log_error():
+        try:
+            raise ValueError("Order 42 is not valid")
+        except ValueError:
+            swagger.log_api_error("benchmark")
+
+    for mode in ("Synchronous", "Buffered"):
+        settings.error_logging_mode = mode
+        settings.error_log_queue_size = burst
+        frappe.db.tables.pop("API Error Log", None)
+        key = f"log_api_error.{mode.lower()}.burst_{burst}"
+        results[key] = measure(log_error, burst)
+        report(key, results[key])
+    settings.error_logging_mode = "Synchronous"
+    # let the flusher drain the buffered records before the next runs
+    api_logger._error_log_buffer.flush(api_logger._error_log_buffer.drain())
+
+
+# Reporting and comparison
+
+
+def report(key, result):
+    if "seconds" in result:
+        print(f"  {key:<48} {result['seconds'] * 1000:12.1f} ms")
+    else:
+        print(
+            f"  {key:<48} {result['ops_per_sec']:12.1f} ops/s"
+            f"  p50 {result['p50_us']:10.1f} us  p99 {result['p99_us']:10.1f} us"
+        )
+
+
+def get_cost(result):
+    """The figure compared with the baseline: lower is better."""
+    return result["seconds"] if "seconds" in result else result["p50_us"]
+
+
+def compare(results, baseline, threshold):
+    """Print the change of every benchmark against the baseline.
+
+    Returns:
+        list: The names of the benchmarks slower than the baseline by more than
+            the threshold.
+    """
+    regressions = []
+    print(f"\nCompared with the baseline (regression above +{threshold:.0%}):")
+    for key, result in results.items():
+        if key not in baseline:
+            print(f"  {key:<48} {'new':>10}")
+            continue
+        change = get_cost(result) / get_cost(baseline[key]) - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(f"  {key:<48} {change:+10.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="smaller sizes, for a smoke run")
+    parser.add_argument("--only", nargs="+", help="run only benchmarks with these prefixes")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args()
+
+    sizes = [100, 1000] if args.quick else [100, 1000, 5000]
+    iterations = 100 if args.quick else 1000
+    suites = {
+        "generator": lambda results: bench_generator(results, sizes, 1 if args.quick else 3),
+        "validate_request": lambda results: bench_validate_request(results, iterations),
+        "method_rejection": lambda results: bench_method_rejection(results, iterations),
+        "respond": lambda results: bench_respond(results, iterations),
+        "log_api_error": lambda results: bench_log_api_error(results, 1000),
+    }
+
+    results = {}
+    for name, suite in suites.items():
+        if args.only and not any(name.startswith(prefix) for prefix in args.only):
+            continue
+        print(name)
+        suite(results)
+
+    document = {
+        "meta": {
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": args.quick,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=1)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(document, f, indent=1)
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}, run with --update-baseline to store one")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.threshold)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
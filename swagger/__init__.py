@@ -3,4 +3,6 @@ __version__ = '0.0.1'
 
 from swagger.responder import *
 from swagger.validator import *
-from swagger.api_logger import *
\ No newline at end of file
+from swagger.api_logger import *
+from swagger.response_cache import cached_response
+from swagger.rate_limiter import rate_limit
\ No newline at end of file
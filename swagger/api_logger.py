@@ -1,16 +1,365 @@
+import atexit
+import hashlib
+import logging
+import os
+import queue
+import random
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+
 import frappe
 from .responder import respondNotFound
 
+# Columns written for new API Error Logs, besides the standard document fields
+ERROR_LOG_FIELDS = (
+    "title",
+    "error",
+    "seen",
+    "fingerprint",
+    "endpoint",
+    "exception_type",
+    "occurrences",
+    "first_seen",
+    "last_seen",
+)
+STANDARD_FIELDS = ("name", "owner", "creation", "modified", "modified_by", "docstatus")
+
+# Stack frames of a formatted traceback, without the volatile line numbers
+TRACEBACK_FRAME = re.compile(r'File "([^"]+)", line \d+, in (\S+)')
+VOLATILE_VALUES = re.compile(r"0x[0-9a-fA-F]+|\d+")
+
+OVERFLOW_FINGERPRINT = "api-error-log-overflow"
+
+# Failures of the flusher thread, which runs without a site to log them to
+logger = logging.getLogger(__name__)
+
+# Resolved user names by (site, session user), least recently used first
+USER_CACHE_TTL = 300
+USER_CACHE_SIZE = 1024
+_user_cache = OrderedDict()
+_user_cache_lock = threading.Lock()
+
+
+class ErrorLogBuffer:
+    """Bounded in-process queue of API Error Log records, bulk-inserted in batches by a
+    background thread.
+
+    When the queue is full new records are dropped, never blocking the failing
+    request, and the number of dropped records is itself logged on the next flush.
+    """
+
+    def __init__(self):
+        self.pid = None
+        self.queue = None
+        self.thread = None
+        self.lock = threading.Lock()
+        self.stats = {"enqueued": 0, "dropped": 0, "flushed": 0, "failed": 0}
+        self.unreported_drops = 0
+        self.batch_size = 50
+        self.flush_interval = 2.0
+
+    def configure(self, settings):
+        self.batch_size = max(frappe.utils.cint(settings.error_log_batch_size), 1)
+        self.flush_interval = max(frappe.utils.flt(settings.error_log_flush_interval), 0.1)
+        queue_size = max(frappe.utils.cint(settings.error_log_queue_size), 1)
+
+        # Threads do not survive a fork, so every process starts its own flusher
+        if self.pid != os.getpid():
+            with self.lock:
+                if self.pid != os.getpid():
+                    self.queue = queue.Queue(maxsize=queue_size)
+                    self.thread = threading.Thread(
+                        target=self.run, name="api-error-log-flusher", daemon=True
+                    )
+                    self.thread.start()
+                    self.pid = os.getpid()
+
+    def put(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self.lock:
+                self.stats["dropped"] += 1
+                self.unreported_drops += 1
+            return False
+        with self.lock:
+            self.stats["enqueued"] += 1
+        return True
+
+    def run(self):
+        while True:
+            try:
+                self.flush(self.collect_batch())
+            except Exception:
+                # the thread must outlive any failure, or the process stops logging
+                logger.exception("API error log flush failed")
+
+    def collect_batch(self):
+        batch = [self.queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def drain(self):
+        batch = []
+        while True:
+            try:
+                batch.append(self.queue.get_nowait())
+            except (queue.Empty, AttributeError):
+                return batch
+
+    def flush(self, batch):
+        if not batch:
+            return
+        with self.lock:
+            drops, self.unreported_drops = self.unreported_drops, 0
+
+        by_site = {}
+        for record in batch:
+            by_site.setdefault((record.pop("site"), record.pop("sites_path")), []).append(record)
+
+        for (site, sites_path), records in by_site.items():
+            try:
+                frappe.init(site=site, sites_path=sites_path)
+                frappe.connect()
+                if drops:
+                    # built once the site is bound, as `frappe.utils.now` needs it
+                    records.append(
+                        make_error_record(
+                            title="API Error Log Overflow",
+                            error="API error log records were dropped because the buffer was full",
+                            fingerprint=OVERFLOW_FINGERPRINT,
+                            occurrences=drops,
+                        )
+                    )
+                    drops = 0
+                write_error_logs(records)
+                frappe.db.commit()
+                with self.lock:
+                    self.stats["flushed"] += len(records)
+            except Exception:
+                with self.lock:
+                    self.stats["failed"] += len(records)
+                try:
+                    frappe.log_error(
+                        message=frappe.get_traceback(), title="API Error Log Error"
+                    )
+                    frappe.db.commit()
+                except Exception:
+                    pass
+            finally:
+                frappe.destroy()
+
+
+_error_log_buffer = ErrorLogBuffer()
+
+
+@atexit.register
+def _flush_error_log_buffer():
+    if _error_log_buffer.pid == os.getpid():
+        _error_log_buffer.flush(_error_log_buffer.drain())
+
+
+def get_error_fingerprint(traceback, endpoint, exception_type, message=""):
+    """Fingerprint an error by its stack frames, endpoint and exception type
+
+    Line numbers, addresses and exception messages are left out, so repeats of the
+    same bug share a fingerprint across requests and small code changes
+    """
+    frames = TRACEBACK_FRAME.findall(traceback or "")
+    if frames:
+        normalized = "\n".join(f"{path}:{function}" for path, function in frames)
+    else:
+        normalized = VOLATILE_VALUES.sub("?", str(message))
+    key = "\n".join((endpoint or "", exception_type or "", normalized))
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def make_error_record(
+    title,
+    error,
+    fingerprint,
+    endpoint=None,
+    exception_type=None,
+    owner=None,
+    sampled=True,
+    occurrences=1,
+):
+    """Build an API Error Log record for `write_error_logs`"""
+    return {
+        "title": title,
+        "error": error,
+        "seen": 0,
+        "fingerprint": fingerprint,
+        "endpoint": endpoint,
+        "exception_type": exception_type,
+        "occurrences": occurrences,
+        "first_seen": frappe.utils.now(),
+        "last_seen": frappe.utils.now(),
+        "owner": owner or "Administrator",
+        "sampled": sampled,
+    }
+
+
+def aggregate_error_records(records):
+    """Merge records sharing a fingerprint, keeping the latest sampled payload"""
+    groups = {}
+    for record in records:
+        group = groups.get(record["fingerprint"])
+        if group is None:
+            groups[record["fingerprint"]] = dict(record)
+            continue
+        group["occurrences"] += record["occurrences"]
+        group["last_seen"] = max(group["last_seen"], record["last_seen"])
+        if record["sampled"]:
+            group["error"] = record["error"]
+            group["sampled"] = True
+    return groups
+
+
+def write_error_logs(records):
+    """
+    Write API Error Log records, one aggregate row per fingerprint
+
+    New fingerprints are inserted and repeats of a known one only increment its
+    occurrences and last seen time, replacing the stored payload for sampled records.
+    Both happen in a single upsert on the unique fingerprint, so workers writing the
+    same fingerprint at once cannot clash. The rows are written with raw SQL, so the
+    hooks, validation and doc events of API Error Log do not run for them.
+
+    Returns the API Error Log names by fingerprint.
+    """
+    groups = aggregate_error_records(records)
+
+    # the stored payload is only replaced by sampled records
+    for sampled in (True, False):
+        batch = [group for group in groups.values() if bool(group["sampled"]) == sampled]
+        if batch:
+            upsert_error_logs(batch, replace_error=sampled)
+
+    return dict(
+        frappe.get_all(
+            "API Error Log",
+            filters={"fingerprint": ["in", list(groups)]},
+            fields=["fingerprint", "name"],
+            as_list=True,
+        )
+    )
+
+
+def upsert_error_logs(groups, replace_error):
+    fields = STANDARD_FIELDS + ERROR_LOG_FIELDS
+    values = []
+    for group in groups:
+        values.extend(
+            (
+                frappe.generate_hash(length=10),
+                group["owner"],
+                group["first_seen"],
+                group["last_seen"],
+                group["owner"],
+                0,
+            )
+            + tuple(group[field] for field in ERROR_LOG_FIELDS)
+        )
+
+    if frappe.db.db_type == "postgres":
+        update = """on conflict (fingerprint) do update set
+            occurrences = `tabAPI Error Log`.occurrences + excluded.occurrences,
+            last_seen = greatest(`tabAPI Error Log`.last_seen, excluded.last_seen),
+            modified = excluded.last_seen,
+            seen = 0
+            {error}""".format(error=", error = excluded.error" if replace_error else "")
+    else:
+        update = """on duplicate key update
+            occurrences = occurrences + values(occurrences),
+            last_seen = greatest(coalesce(last_seen, values(last_seen)), values(last_seen)),
+            modified = values(last_seen),
+            seen = 0
+            {error}""".format(error=", error = values(error)" if replace_error else "")
+
+    row = "({})".format(", ".join(["%s"] * len(fields)))
+    frappe.db.sql(
+        """insert into `tabAPI Error Log` ({fields})
+        values {rows}
+        {update}""".format(
+            fields=", ".join(f"`{field}`" for field in fields),
+            rows=", ".join([row] * len(groups)),
+            update=update,
+        ),
+        values,
+    )
+
+
+@frappe.whitelist()
+def get_error_log_buffer_stats():
+    """Counters of the buffered error logger of the current worker process"""
+    frappe.only_for("System Manager")
+    with _error_log_buffer.lock:
+        stats = dict(_error_log_buffer.stats)
+    stats["queued"] = _error_log_buffer.queue.qsize() if _error_log_buffer.queue else 0
+    return stats
+
+
 def __user(input=None):
     # get session user if input is not provided
     if not input:
         input = frappe.session.user
+
+    # resolved once per request, then from the process cache until it expires
+    request_cache = getattr(frappe.local, "swagger_user_cache", None)
+    if request_cache is None:
+        request_cache = frappe.local.swagger_user_cache = {}
+    if input in request_cache:
+        return request_cache[input]
+
+    key = (frappe.local.site, input)
+    now = time.monotonic()
+    with _user_cache_lock:
+        cached = _user_cache.get(key)
+        if cached and cached[1] > now:
+            _user_cache.move_to_end(key)
+            request_cache[input] = cached[0]
+            return cached[0]
+
     res = frappe.get_all("User", or_filters={"email": input, "username": input})
+    user = res[0].name if res else "Guest"
+
+    with _user_cache_lock:
+        _user_cache[key] = (user, now + USER_CACHE_TTL)
+        _user_cache.move_to_end(key)
+        while len(_user_cache) > USER_CACHE_SIZE:
+            _user_cache.popitem(last=False)
+    request_cache[input] = user
+    return user
+
 
-    if len((res)) == 0:
-        return "Guest"
+def clear_user_cache(doc=None, *args):
+    """
+    Invalidate cached user resolutions, hooked to User updates, renames and deletions
 
-    return frappe.get_doc("User", res[0].name).name
+    Other worker processes pick up the change once their entries expire
+    """
+    with _user_cache_lock:
+        if doc is None:
+            _user_cache.clear()
+        else:
+            site = frappe.local.site
+            names = {doc.name, doc.get("email"), doc.get("username")} | set(args[1:3])
+            for key, (user, expires) in list(_user_cache.items()):
+                if key[0] == site and (key[1] in names or user in names):
+                    del _user_cache[key]
+    frappe.local.swagger_user_cache = {}
 
 
 def log_api_error(mess=""):
@@ -19,6 +368,9 @@ def log_api_error(mess=""):
         Log API error to Error Log
 
         This method should be called before API responds the HTTP status code
+
+        Returns the aggregated API Error Log document, or None in the buffered mode,
+        where the record is written later by the flusher thread
         """
 
         # AI ALERT:
@@ -45,13 +397,39 @@ def log_api_error(mess=""):
             + " API Error"
         )
 
-        error = frappe.get_traceback() + "\n\n" + str(mess) + "\n\n" + message
-        log = frappe.get_doc(
-            dict(doctype="API Error Log", error=frappe.as_unicode(error), title=title)
-        ).insert(ignore_permissions=True)
+        traceback = frappe.get_traceback()
+        error = traceback + "\n\n" + str(mess) + "\n\n" + message
+
+        # Repeats of the same error are aggregated on one API Error Log
+        endpoint = request_parameters.get("cmd")
+        exc_type = sys.exc_info()[0]
+        exception_type = exc_type.__name__ if exc_type else None
+        settings = frappe.get_cached_doc("Swagger Settings")
+        record = make_error_record(
+            title=title,
+            error=frappe.as_unicode(error),
+            fingerprint=get_error_fingerprint(traceback, endpoint, exception_type, mess),
+            endpoint=endpoint,
+            exception_type=exception_type,
+            owner=frappe.session.user,
+            sampled=random.random() < frappe.utils.flt(settings.error_log_sample_rate),
+        )
+
+        if settings.error_logging_mode == "Buffered":
+            _error_log_buffer.configure(settings)
+            _error_log_buffer.put(
+                {
+                    "site": frappe.local.site,
+                    "sites_path": frappe.local.sites_path,
+                    **record,
+                }
+            )
+            return None
+
+        name = write_error_logs([record]).get(record["fingerprint"])
         frappe.db.commit()
 
-        return log
+        return frappe.get_doc("API Error Log", name) if name else None
 
     except Exception:
         frappe.log_error(
@@ -0,0 +1,260 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Literal, Optional
+
+import frappe
+from pydantic import BaseModel, Field
+from werkzeug.test import EnvironBuilder
+from werkzeug.wrappers import Response
+
+import swagger
+from .metrics import flush_metrics, is_endpoint_path, record_request
+from .rate_limiter import apply_limit, get_rate_limit_rule, release_slot
+from .validator import validate_request
+
+BATCH_PATH = "/api/method/swagger.batch.execute_batch"
+MAX_BATCH_SIZE = 50
+# Threads running the read-only calls of a concurrent batch, each with its own
+# database connection
+BATCH_WORKERS = 4
+READ_ONLY_METHODS = ("GET", "HEAD")
+
+# Request headers passed on to the calls, e.g. for the fast response mode
+FORWARDED_HEADERS = ("Authorization", "Accept", "Accept-Language")
+
+
+class BatchCall(BaseModel):
+    path: str = Field(
+        description="Path of a documented endpoint, e.g. /api/method/myapp.api.orders.get_order"
+    )
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE", "HEAD"] = "GET"
+    params: Dict[str, Any] = Field(default_factory=dict, description="Query arguments")
+    body: Optional[Any] = Field(default=None, description="JSON request body")
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchCall] = Field(max_length=MAX_BATCH_SIZE)
+    concurrent: bool = Field(
+        default=False,
+        description=(
+            "Run consecutive GET and HEAD calls concurrently, in separate database transactions"
+        ),
+    )
+
+
+class BatchResult(BaseModel):
+    status: int
+    body: Any = None
+    headers: Dict[str, str] = Field(default_factory=dict)
+
+
+class BatchResponse(BaseModel):
+    responses: List[BatchResult]
+
+
+@frappe.whitelist(methods=["POST"])
+@validate_request(BatchRequest)
+def execute_batch(validated_data: BatchRequest):
+    """Run several documented API calls in one request.
+
+    Guests cannot send batches, as one request fans out into many calls and threads.
+    The calls run in order under the session of the batch request, each with its own
+    request, so `validate_http_method`, `validate_request` and the rate limits apply
+    as if it was sent on its own. The changes of a call raising an exception are
+    rolled back, without affecting the others.
+
+    With `concurrent`, consecutive GET and HEAD calls run at the same time in
+    separate threads and database transactions. The changes of the calls before them
+    are committed first, so they are visible to them.
+
+    Returns:
+        dict: The status and body of each call, in order.
+    """
+    calls = list(enumerate(validated_data.requests))
+    headers = {
+        name: frappe.request.headers[name]
+        for name in FORWARDED_HEADERS
+        if name in frappe.request.headers
+    }
+    results = [None] * len(calls)
+    wrote = False
+    position = 0
+    while position < len(calls):
+        group = []
+        if validated_data.concurrent:
+            while position + len(group) < len(calls):
+                call = calls[position + len(group)][1]
+                if call.method not in READ_ONLY_METHODS:
+                    break
+                group.append(calls[position + len(group)])
+
+        if len(group) > 1:
+            if wrote:
+                frappe.db.commit()
+                wrote = False
+            for index, result in run_concurrently(group, headers):
+                results[index] = result
+            position += len(group)
+            continue
+
+        index, call = calls[position]
+        results[index] = dispatch(call, headers, savepoint=f"batch_call_{index}")
+        wrote = wrote or call.method not in READ_ONLY_METHODS
+        position += 1
+
+    return BatchResponse(responses=results).model_dump(mode="json")
+
+
+def dispatch(call, headers, savepoint=None):
+    """Run a call of a batch as a request of its own.
+
+    Args:
+        call (BatchCall): The call.
+        headers (dict): The headers of the request of the call.
+        savepoint (str, optional): The savepoint rolled back to when the call fails.
+
+    Returns:
+        BatchResult: The status and body of the response of the call.
+    """
+    from frappe.handler import execute_cmd
+
+    path = call.path.lower()
+    if not is_endpoint_path(path):
+        return BatchResult(status=404, body={"message": frappe._("Endpoint not found")})
+
+    request = EnvironBuilder(
+        path=call.path,
+        method=call.method,
+        headers=headers,
+        query_string={
+            name: value if isinstance(value, str) else json.dumps(value)
+            for name, value in call.params.items()
+        },
+        json=call.body,
+    ).get_request()
+
+    saved = {
+        name: getattr(frappe.local, name, None)
+        for name in (
+            "request",
+            "form_dict",
+            "response",
+            "message_log",
+            "cookie_manager",
+            "swagger_metrics",
+            "swagger_retry_after",
+        )
+    }
+    settings = frappe.get_cached_doc("Swagger Settings")
+    frappe.local.request = request
+    frappe.local.form_dict = get_form_dict(request, call)
+    frappe.local.form_dict.cmd = call.path[len("/api/method/"):]
+    frappe.local.response = frappe._dict({"docs": []})
+    frappe.local.message_log = []
+    frappe.local.swagger_retry_after = None
+    frappe.local.swagger_metrics = {} if settings.enable_metrics else None
+
+    slot = None
+    start = time.perf_counter()
+    try:
+        if savepoint:
+            frappe.db.savepoint(savepoint)
+        limit = get_rate_limit_rule(path)
+        if limit:
+            slot = apply_limit(path, limit)
+        result = get_call_result(execute_cmd(frappe.local.form_dict.cmd))
+    except Exception as e:
+        if savepoint:
+            frappe.db.rollback(save_point=savepoint)
+        status = getattr(e, "http_status_code", 500)
+        if status >= 500:
+            swagger.log_api_error()
+        message = getattr(e, "message", None) or str(e) or type(e).__name__
+        result = BatchResult(status=status, body={"exc_type": type(e).__name__, "message": message})
+    finally:
+        release_slot(slot)
+
+    if frappe.local.swagger_retry_after:
+        result.headers["Retry-After"] = str(frappe.local.swagger_retry_after)
+    if frappe.local.swagger_metrics is not None:
+        timings = frappe.local.swagger_metrics
+        timings["total"] = time.perf_counter() - start
+        record_request(path, timings, result.status >= 400)
+
+    for name, value in saved.items():
+        setattr(frappe.local, name, value)
+    return result
+
+
+def get_form_dict(request, call):
+    """Get the arguments of a call, the way frappe reads them from a request.
+
+    A JSON body takes the place of the query arguments.
+    """
+    if call.body is not None:
+        if isinstance(call.body, dict):
+            return frappe._dict(call.body)
+        return frappe._dict(data=call.body)
+    return frappe._dict(request.args.to_dict())
+
+
+def get_call_result(result):
+    """Get the response of a call from the value returned by its endpoint.
+
+    Args:
+        result: The value returned by the endpoint, a Response, or None when the
+            response was set on `frappe.local.response` by `respond()`.
+
+    Returns:
+        BatchResult: The status and body of the response.
+    """
+    if isinstance(result, Response):
+        body = result.get_data(as_text=True)
+        if result.mimetype == "application/json":
+            body = json.loads(body)
+        return BatchResult(status=result.status_code, body=body)
+
+    response = frappe.local.response
+    if result is not None:
+        response["message"] = result
+    status = response.pop("http_status_code", 200)
+    body = {key: value for key, value in response.items() if key != "docs" or value}
+    return BatchResult(status=status, body=json.loads(frappe.as_json(body)))
+
+
+def run_concurrently(calls, headers):
+    """Run read-only calls across threads.
+
+    Returns:
+        list: The (position, result) tuples of the calls.
+    """
+    context = {
+        "site": frappe.local.site,
+        "sites_path": frappe.local.sites_path,
+        "user": frappe.session.user,
+        "request_ip": frappe.local.request_ip,
+    }
+    workers = min(BATCH_WORKERS, len(calls))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(run_in_thread, context, calls[offset::workers], headers)
+            for offset in range(workers)
+        ]
+    return [item for future in futures for item in future.result()]
+
+
+def run_in_thread(context, calls, headers):
+    """Run calls in a new thread, with a site connection of its own."""
+    frappe.init(site=context["site"], sites_path=context["sites_path"])
+    try:
+        frappe.connect()
+        frappe.set_user(context["user"])
+        frappe.local.request_ip = context["request_ip"]
+        results = [(index, dispatch(call, headers)) for index, call in calls]
+        if frappe.get_cached_doc("Swagger Settings").enable_metrics:
+            # the buffers of the thread are lost with it
+            flush_metrics()
+        return results
+    finally:
+        frappe.destroy()
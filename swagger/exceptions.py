@@ -47,6 +47,29 @@ class ValidationException(APIException):
 		self.errors = errors_
 		self.data = data
 
+class PayloadTooLargeException(APIException):
+	http_status_code = 413
+	message = frappe._('Request body too large')
+	save_error_log = False
+
+
+class UnsupportedMediaTypeException(APIException):
+	http_status_code = 415
+	message = frappe._('Unsupported media type')
+	save_error_log = False
+
+
+class TooManyRequestsException(APIException):
+	http_status_code = 429
+	message = frappe._('Too many requests')
+	save_error_log = False
+
+	def __init__(self, message=None, retry_after=1):
+		super().__init__(message)
+		# seconds, sent in the Retry-After header of the response
+		self.retry_after = retry_after
+
+
 class NotFoundException(APIException):
 	http_status_code = 404
 	message = frappe._("Data not found")
@@ -76,6 +76,14 @@ app_license = "mit"
 # before_uninstall = "swagger.uninstall.before_uninstall"
 # after_uninstall = "swagger.uninstall.after_uninstall"
 
+# Migration
+# ------------
+
+after_migrate = [
+	"swagger.swagger_generator.regenerate_on_migrate",
+	"swagger.spec_server.write_ui_assets",
+]
+
 # Integration Setup
 # ------------------
 # To set up dependencies/integrations with other apps
@@ -122,34 +130,27 @@ app_license = "mit"
 # ---------------
 # Hook on document methods and events
 
-# doc_events = {
-#	"*": {
-#		"on_update": "method",
-#		"on_cancel": "method",
-#		"on_trash": "method"
-#	}
-# }
+doc_events = {
+	"*": {
+		"on_change": "swagger.response_cache.invalidate_cached_responses",
+		"after_rename": "swagger.response_cache.invalidate_cached_responses",
+		"on_trash": "swagger.response_cache.invalidate_cached_responses",
+	},
+	"User": {
+		"on_update": "swagger.api_logger.clear_user_cache",
+		"after_rename": "swagger.api_logger.clear_user_cache",
+		"on_trash": "swagger.api_logger.clear_user_cache",
+	}
+}
 
 # Scheduled Tasks
 # ---------------
 
-# scheduler_events = {
-#	"all": [
-#		"swagger.tasks.all"
-#	],
-#	"daily": [
-#		"swagger.tasks.daily"
-#	],
-#	"hourly": [
-#		"swagger.tasks.hourly"
-#	],
-#	"weekly": [
-#		"swagger.tasks.weekly"
-#	],
-#	"monthly": [
-#		"swagger.tasks.monthly"
-#	],
-# }
+scheduler_events = {
+	"daily_long": [
+		"swagger.swagger_ui.doctype.api_error_log.api_error_log.purge_old_logs"
+	],
+}
 
 # Testing
 # -------
@@ -181,8 +182,16 @@ app_license = "mit"
 
 # Request Events
 # ----------------
-# before_request = ["swagger.utils.before_request"]
-# after_request = ["swagger.utils.after_request"]
+before_request = [
+	"swagger.metrics.before_request",
+	"swagger.rate_limiter.before_request",
+	"swagger.profiler.before_request",
+]
+after_request = [
+	"swagger.profiler.after_request",
+	"swagger.rate_limiter.after_request",
+	"swagger.metrics.after_request",
+]
 
 # Job Events
 # ----------
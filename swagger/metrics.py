@@ -0,0 +1,281 @@
+import re
+import threading
+import time
+from bisect import bisect_left
+
+import frappe
+from werkzeug.wrappers import Response
+
+# Upper bounds in seconds of the latency histogram buckets, the last one is +Inf
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# Request phases; body, validation and handler are only split by `validate_request`
+PHASES = ("total", "body", "validation", "handler")
+PERCENTILES = (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))
+
+# Only endpoints documented by the generator are recorded, under its lower-cased paths
+ENDPOINT_PATH = re.compile(r"^/api/method/\w+\.api\.[\w.]+$")
+
+METRICS_KEY = "swagger_metrics"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Each thread records into its own buffers and flushes them itself, so recording never
+# takes a lock; the shared totals are only updated by the atomic redis increments
+_local = threading.local()
+
+
+def is_endpoint_path(path):
+    """Check whether a request path is recorded in the metrics.
+
+    Args:
+        path (str): The request path.
+
+    Returns:
+        bool: True for the `/api/method/<app>.api.<module>.<function>` paths.
+    """
+    return bool(path and ENDPOINT_PATH.match(path))
+
+
+def before_request():
+    """Start timing a documented endpoint request, when metrics are enabled.
+
+    The phase timings of the request are collected in `frappe.local.swagger_metrics`,
+    which stays None while metrics are disabled.
+    """
+    frappe.local.swagger_metrics = None
+    request = frappe.local.request
+    if not is_endpoint_path(request.path.lower()):
+        return
+    if not frappe.get_cached_doc("Swagger Settings").enable_metrics:
+        return
+    frappe.local.swagger_metrics = {"start": time.perf_counter()}
+
+
+def after_request(response=None, request=None):
+    """Record the timings of the finished request in the buffers of the thread."""
+    timings = getattr(frappe.local, "swagger_metrics", None)
+    if timings is None:
+        return
+    frappe.local.swagger_metrics = None
+    timings["total"] = time.perf_counter() - timings.pop("start")
+
+    status = response.status_code if response is not None else 500
+    record_request(frappe.local.request.path.lower(), timings, status >= 400)
+
+    settings = frappe.get_cached_doc("Swagger Settings")
+    flushed_at = get_flush_times().get(frappe.local.site, 0)
+    if time.monotonic() - flushed_at >= frappe.utils.flt(settings.metrics_flush_interval):
+        flush_metrics()
+
+
+def get_site_buffer():
+    """Get the metrics buffer of the current thread for the current site.
+
+    Returns:
+        dict: Endpoint metrics by path, each with a request count, an error count and
+            per-phase `[sum, bucket counts]` histograms.
+    """
+    buffers = getattr(_local, "buffers", None)
+    if buffers is None:
+        buffers = _local.buffers = {}
+    return buffers.setdefault(frappe.local.site, {})
+
+
+def get_flush_times():
+    flush_times = getattr(_local, "flush_times", None)
+    if flush_times is None:
+        flush_times = _local.flush_times = {}
+    return flush_times
+
+
+def record_request(path, timings, failed=False):
+    """Add a request to the buffered metrics of its endpoint.
+
+    Args:
+        path (str): The endpoint path.
+        timings (dict): Seconds spent by phase.
+        failed (bool, optional): Whether the request ended with an error status.
+    """
+    buffer = get_site_buffer()
+    endpoint = buffer.get(path)
+    if endpoint is None:
+        endpoint = buffer[path] = {"count": 0, "errors": 0, "phases": {}}
+    endpoint["count"] += 1
+    if failed:
+        endpoint["errors"] += 1
+    for phase, seconds in timings.items():
+        histogram = endpoint["phases"].get(phase)
+        if histogram is None:
+            histogram = endpoint["phases"][phase] = [0.0, [0] * (len(LATENCY_BUCKETS) + 1)]
+        histogram[0] += seconds
+        histogram[1][bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+
+def flush_metrics():
+    """Add the buffered metrics of the current thread and site to the shared totals.
+
+    The totals are a redis hash per site, updated with a single pipelined round trip.
+    """
+    buffers = getattr(_local, "buffers", None) or {}
+    buffer = buffers.pop(frappe.local.site, None)
+    get_flush_times()[frappe.local.site] = time.monotonic()
+    if not buffer:
+        return
+
+    key = frappe.cache().make_key(METRICS_KEY)
+    pipeline = frappe.cache().pipeline()
+    for path, endpoint in buffer.items():
+        pipeline.hincrby(key, f"{path}|count", endpoint["count"])
+        if endpoint["errors"]:
+            pipeline.hincrby(key, f"{path}|errors", endpoint["errors"])
+        for phase, (total, counts) in endpoint["phases"].items():
+            pipeline.hincrbyfloat(key, f"{path}|{phase}|sum", total)
+            for index, count in enumerate(counts):
+                if count:
+                    pipeline.hincrby(key, f"{path}|{phase}|{index}", count)
+    try:
+        pipeline.execute()
+    except Exception:
+        frappe.log_error(message=frappe.get_traceback(), title="Swagger Metrics Error")
+
+
+def get_percentile(counts, quantile):
+    """Estimate a percentile from histogram bucket counts.
+
+    The value is interpolated linearly within the bucket holding the percentile;
+    percentiles in the +Inf bucket are reported as the largest finite bound.
+
+    Args:
+        counts (list): Request counts by bucket.
+        quantile (float): The quantile, between 0 and 1.
+
+    Returns:
+        float: The estimated latency in seconds, or None without requests.
+    """
+    total = sum(counts)
+    if not total:
+        return None
+    rank = quantile * total
+    cumulative = 0
+    for index, count in enumerate(counts):
+        if count and cumulative + count >= rank:
+            if index == len(LATENCY_BUCKETS):
+                return LATENCY_BUCKETS[-1]
+            lower = LATENCY_BUCKETS[index - 1] if index else 0.0
+            upper = LATENCY_BUCKETS[index]
+            return lower + (upper - lower) * (rank - cumulative) / count
+        cumulative += count
+    return LATENCY_BUCKETS[-1]
+
+
+def load_metrics():
+    """Load the aggregated metrics of the site, flushing the current thread first.
+
+    Returns:
+        dict: Endpoint metrics by path, with per-phase sums and bucket counts.
+    """
+    flush_metrics()
+    # read through a raw pipeline, RedisWrapper.hgetall expects pickled values
+    pipeline = frappe.cache().pipeline()
+    pipeline.hgetall(frappe.cache().make_key(METRICS_KEY))
+    raw = pipeline.execute()[0] or {}
+
+    endpoints = {}
+    for field, value in raw.items():
+        path, _, name = frappe.safe_decode(field).partition("|")
+        endpoint = endpoints.setdefault(path, {"count": 0, "errors": 0, "phases": {}})
+        if name in ("count", "errors"):
+            endpoint[name] = int(value)
+            continue
+        phase, _, bucket = name.partition("|")
+        histogram = endpoint["phases"].setdefault(
+            phase, {"sum": 0.0, "counts": [0] * (len(LATENCY_BUCKETS) + 1)}
+        )
+        if bucket == "sum":
+            histogram["sum"] = float(value)
+        else:
+            histogram["counts"][int(bucket)] = int(value)
+    return endpoints
+
+
+@frappe.whitelist()
+def get_metrics():
+    """Get the request metrics of the documented endpoints.
+
+    Returns:
+        dict: By endpoint path, the request and error counts and, by phase, the
+            request count, mean and p50/p95/p99 latencies in seconds.
+    """
+    frappe.only_for("System Manager")
+    result = {}
+    for path, endpoint in sorted(load_metrics().items()):
+        phases = {}
+        for phase in PHASES:
+            histogram = endpoint["phases"].get(phase)
+            if not histogram:
+                continue
+            count = sum(histogram["counts"])
+            phases[phase] = {
+                "count": count,
+                "mean": histogram["sum"] / count if count else None,
+                **{
+                    name: get_percentile(histogram["counts"], quantile)
+                    for name, quantile in PERCENTILES
+                },
+            }
+        result[path] = {"count": endpoint["count"], "errors": endpoint["errors"], "phases": phases}
+    return result
+
+
+@frappe.whitelist(methods=["GET"])
+def get_prometheus_metrics():
+    """Get the request metrics in the Prometheus text exposition format.
+
+    Returns:
+        Response: The `swagger_requests_total` and `swagger_request_errors_total`
+            counters and the `swagger_request_duration_seconds` histograms.
+    """
+    frappe.only_for("System Manager")
+    endpoints = sorted(load_metrics().items())
+    bounds = [repr(float(bound)) for bound in LATENCY_BUCKETS] + ["+Inf"]
+
+    lines = [
+        "# HELP swagger_requests_total Requests handled by the endpoint.",
+        "# TYPE swagger_requests_total counter",
+    ]
+    lines += [f'swagger_requests_total{{path="{path}"}} {e["count"]}' for path, e in endpoints]
+    lines += [
+        "# HELP swagger_request_errors_total Requests answered with an error status.",
+        "# TYPE swagger_request_errors_total counter",
+    ]
+    lines += [
+        f'swagger_request_errors_total{{path="{path}"}} {e["errors"]}' for path, e in endpoints
+    ]
+    lines += [
+        "# HELP swagger_request_duration_seconds Request latency by phase.",
+        "# TYPE swagger_request_duration_seconds histogram",
+    ]
+    for path, endpoint in endpoints:
+        for phase in PHASES:
+            histogram = endpoint["phases"].get(phase)
+            if not histogram:
+                continue
+            labels = f'path="{path}",phase="{phase}"'
+            cumulative = 0
+            for bound, count in zip(bounds, histogram["counts"]):
+                cumulative += count
+                lines.append(
+                    f'swagger_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}'
+                )
+            lines.append(f"swagger_request_duration_seconds_sum{{{labels}}} {histogram['sum']}")
+            lines.append(f"swagger_request_duration_seconds_count{{{labels}}} {cumulative}")
+
+    return Response("\n".join(lines) + "\n", content_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@frappe.whitelist(methods=["POST"])
+def reset_metrics():
+    """Clear the aggregated request metrics of the site."""
+    frappe.only_for("System Manager")
+    getattr(_local, "buffers", {}).pop(frappe.local.site, None)
+    frappe.cache().delete_value(METRICS_KEY)
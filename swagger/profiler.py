@@ -0,0 +1,140 @@
+import cProfile
+import io
+import pstats
+import random
+import time
+from fnmatch import fnmatchcase
+
+import frappe
+
+from .metrics import is_endpoint_path
+
+# Functions listed in a stored profile, by cumulative time
+PROFILE_LINES = 40
+
+
+def get_profiling_rule(path):
+    """Get the profiling rule of an endpoint from Swagger Settings.
+
+    Args:
+        path (str): The lower-cased endpoint path.
+
+    Returns:
+        Document: The first rule whose endpoint pattern matches the path, or None.
+    """
+    settings = frappe.get_cached_doc("Swagger Settings")
+    if not settings.enable_profiling:
+        return None
+    for rule in settings.profiling_rules:
+        if fnmatchcase(path, (rule.endpoint or "").strip().lower()):
+            return rule
+    return None
+
+
+def before_request():
+    """Start profiling a sampled request to an endpoint with a profiling rule.
+
+    The profiler, SQL counters and threshold of the request are kept in
+    `frappe.local.swagger_profile`, which stays None for requests not sampled.
+    """
+    frappe.local.swagger_profile = None
+    path = frappe.local.request.path.lower()
+    if not is_endpoint_path(path):
+        return
+    rule = get_profiling_rule(path)
+    if not rule or random.random() >= frappe.utils.flt(rule.sample_rate):
+        return
+
+    state = frappe.local.swagger_profile = {
+        "path": path,
+        "threshold": frappe.utils.cint(rule.threshold) / 1000,
+        "sql_count": 0,
+        "sql_time": 0.0,
+        "profiler": cProfile.Profile(),
+    }
+    try:
+        # fails while another profiler, like the frappe recorder, is active
+        state["profiler"].enable()
+    except ValueError:
+        frappe.local.swagger_profile = None
+        return
+    instrument_sql(state)
+    state["start"] = time.perf_counter()
+
+
+def instrument_sql(state):
+    """Count the queries of the request and the time spent in them.
+
+    Wraps `sql` on the database connection of the request, until `after_request`.
+    """
+    db = getattr(frappe.local, "db", None)
+    if db is None:
+        return
+    sql = db.sql
+
+    def counted_sql(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return sql(*args, **kwargs)
+        finally:
+            state["sql_time"] += time.perf_counter() - start
+            state["sql_count"] += 1
+
+    db.sql = counted_sql
+
+
+def restore_sql():
+    db = getattr(frappe.local, "db", None)
+    if db is not None and "sql" in vars(db):
+        del db.sql
+
+
+def after_request(response=None, request=None):
+    """Keep the profile of a sampled request when it crossed the threshold."""
+    state = getattr(frappe.local, "swagger_profile", None)
+    if state is None:
+        return
+    state["profiler"].disable()
+    duration = time.perf_counter() - state["start"]
+    frappe.local.swagger_profile = None
+    restore_sql()
+    if duration < state["threshold"]:
+        return
+
+    # stored from a background job: committing here would also commit the changes the
+    # request left uncommitted, which frappe discards for GET requests
+    try:
+        frappe.enqueue(
+            "swagger.profiler.insert_profile",
+            queue="short",
+            endpoint=state["path"],
+            http_method=frappe.local.request.method,
+            user=frappe.session.user,
+            duration=duration * 1000,
+            sql_count=state["sql_count"],
+            sql_time=state["sql_time"] * 1000,
+            profile=format_profile(state["profiler"]),
+        )
+    except Exception:
+        frappe.log_error(message=frappe.get_traceback(), title="API Profile Error")
+
+
+def insert_profile(**profile):
+    """Store the profile of a request, run as a background job."""
+    frappe.get_doc({"doctype": "API Profile", **profile}).insert(ignore_permissions=True)
+
+
+def format_profile(profiler):
+    """Format the functions of a profile with the highest cumulative time.
+
+    Args:
+        profiler (cProfile.Profile): The stopped profiler.
+
+    Returns:
+        str: The pstats report, with paths relative to the bench.
+    """
+    output = io.StringIO()
+    stats = pstats.Stats(profiler, stream=output)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_LINES)
+    bench_path = frappe.utils.get_bench_path().rstrip("/") + "/"
+    return output.getvalue().replace(bench_path, "").strip()
@@ -0,0 +1,2 @@
+/*! For license information please see swagger-ui-standalone-preset.js.LICENSE.txt */
+!function webpackUniversalModuleDefinition(t,e){"object"==typeof exports&&"object"==typeof module?module.exports=e():"function"==typeof define&&define.amd?define([],e):"object"==typeof exports?exports.SwaggerUIStandalonePreset=e():t.SwaggerUIStandalonePreset=e()}(this,(()=>(()=>{var t={7526(t,e){"use strict";e.byteLength=function byteLength(t){var e=getLens(t),r=e[0],n=e[1];return 3*(r+n)/4-n},e.toByteArray=function toByteArray(t){var e,r,i=getLens(t),a=i[0],s=i[1],u=new o(function _byteLength(t,e,r){return 3*(e+r)/4-r}(0,a,s)),c=0,l=s>0?a-4:a;for(r=0;r<l;r+=4)e=n[t.charCodeAt(r)]<<18|n[t.charCodeAt(r+1)]<<12|n[t.charCodeAt(r+2)]<<6|n[t.charCodeAt(r+3)],u[c++]=e>>16&255,u[c++]=e>>8&255,u[c++]=255&e;2===s&&(e=n[t.charCodeAt(r)]<<2|n[t.charCodeAt(r+1)]>>4,u[c++]=255&e);1===s&&(e=n[t.charCodeAt(r)]<<10|n[t.charCodeAt(r+1)]<<4|n[t.charCodeAt(r+2)]>>2,u[c++]=e>>8&255,u[c++]=255&e);return u},e.fromByteArray=function fromByteArray(t){for(var e,n=t.length,o=n%3,i=[],a=16383,s=0,u=n-o;s<u;s+=a)i.push(encodeChunk(t,s,s+a>u?u:s+a));1===o?(e=t[n-1],i.push(r[e>>2]+r[e<<4&63]+"==")):2===o&&(e=(t[n-2]<<8)+t[n-1],i.push(r[e>>10]+r[e>>4&63]+r[e<<2&63]+"="));return i.join("")};for(var r=[],n=[],o="undefined"!=typeof Uint8Array?Uint8Array:Array,i="ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/",a=0;a<64;++a)r[a]=i[a],n[i.charCodeAt(a)]=a;function getLens(t){var e=t.length;if(e%4>0)throw new Error("Invalid string. Length must be a multiple of 4");var r=t.indexOf("=");return-1===r&&(r=e),[r,r===e?0:4-r%4]}function encodeChunk(t,e,n){for(var o,i,a=[],s=e;s<n;s+=3)o=(t[s]<<16&16711680)+(t[s+1]<<8&65280)+(255&t[s+2]),a.push(r[(i=o)>>18&63]+r[i>>12&63]+r[i>>6&63]+r[63&i]);return a.join("")}n["-".charCodeAt(0)]=62,n["_".charCodeAt(0)]=63},8287(t,e,r){"use strict";const n=r(7526),o=r(251),i="function"==typeof Symbol&&"function"==typeof Symbol.for?Symbol.for("nodejs.util.inspect.custom"):null;e.Buffer=Buffer,e.SlowBuffer=function SlowBuffer(t){+t!=t&&(t=0);return Buffer.alloc(+t)},e.INSPECT_MAX_BYTES=50;const a=2147483647;function createBuffer(t){if(t>a)throw new RangeError('The value "'+t+'" is invalid for option "size"');const e=new Uint8Array(t);return Object.setPrototypeOf(e,Buffer.prototype),e}function Buffer(t,e,r){if("number"==typeof t){if("string"==typeof e)throw new TypeError('The "string" argument must be of type string. Received type number');return allocUnsafe(t)}return from(t,e,r)}function from(t,e,r){if("string"==typeof t)return function fromString(t,e){"string"==typeof e&&""!==e||(e="utf8");if(!Buffer.isEncoding(e))throw new TypeError("Unknown encoding: "+e);const r=0|byteLength(t,e);let n=createBuffer(r);const o=n.write(t,e);o!==r&&(n=n.slice(0,o));return n}(t,e);if(ArrayBuffer.isView(t))return function fromArrayView(t){if(isInstance(t,Uint8Array)){const e=new Uint8Array(t);return fromArrayBuffer(e.buffer,e.byteOffset,e.byteLength)}return fromArrayLike(t)}(t);if(null==t)throw new TypeError("The first argument must be one of type string, Buffer, ArrayBuffer, Array, or Array-like Object. Received type "+typeof t);if(isInstance(t,ArrayBuffer)||t&&isInstance(t.buffer,ArrayBuffer))return fromArrayBuffer(t,e,r);if("undefined"!=typeof SharedArrayBuffer&&(isInstance(t,SharedArrayBuffer)||t&&isInstance(t.buffer,SharedArrayBuffer)))return fromArrayBuffer(t,e,r);if("number"==typeof t)throw new TypeError('The "value" argument must not be of type number. Received type number');const n=t.valueOf&&t.valueOf();if(null!=n&&n!==t)return Buffer.from(n,e,r);const o=function fromObject(t){if(Buffer.isBuffer(t)){const e=0|checked(t.length),r=createBuffer(e);return 0===r.length||t.copy(r,0,0,e),r}if(void 0!==t.length)return"number"!=typeof t.length||numberIsNaN(t.length)?createBuffer(0):fromArrayLike(t);if("Buffer"===t.type&&Array.isArray(t.data))return fromArrayLike(t.data)}(t);if(o)return o;if("undefined"!=typeof Symbol&&null!=Symbol.toPrimitive&&"function"==typeof t[Symbol.toPrimitive])return Buffer.from(t[Symbol.toPrimitive]("string"),e,r);throw new TypeError("The first argument must be one of type string, Buffer, ArrayBuffer, Array, or Array-like Object. Received type "+typeof t)}function assertSize(t){if("number"!=typeof t)throw new TypeError('"size" argument must be of type number');if(t<0)throw new RangeError('The value "'+t+'" is invalid for option "size"')}function allocUnsafe(t){return assertSize(t),createBuffer(t<0?0:0|checked(t))}function fromArrayLike(t){const e=t.length<0?0:0|checked(t.length),r=createBuffer(e);for(let n=0;n<e;n+=1)r[n]=255&t[n];return r}function fromArrayBuffer(t,e,r){if(e<0||t.byteLength<e)throw new RangeError('"offset" is outside of buffer bounds');if(t.byteLength<e+(r||0))throw new RangeError('"length" is outside of buffer bounds');let n;return n=void 0===e&&void 0===r?new Uint8Array(t):void 0===r?new Uint8Array(t,e):new Uint8Array(t,e,r),Object.setPrototypeOf(n,Buffer.prototype),n}function checked(t){if(t>=a)throw new RangeError("Attempt to allocate Buffer larger than maximum size: 0x"+a.toString(16)+" bytes");return 0|t}function byteLength(t,e){if(Buffer.isBuffer(t))return t.length;if(ArrayBuffer.isView(t)||isInstance(t,ArrayBuffer))return t.byteLength;if("string"!=typeof t)throw new TypeError('The "string" argument must be one of type string, Buffer, or ArrayBuffer. Received type '+typeof t);const r=t.length,n=arguments.length>2&&!0===arguments[2];if(!n&&0===r)return 0;let o=!1;for(;;)switch(e){case"ascii":case"latin1":case"binary":return r;case"utf8":case"utf-8":return utf8ToBytes(t).length;case"ucs2":case"ucs-2":case"utf16le":case"utf-16le":return 2*r;case"hex":return r>>>1;case"base64":return base64ToBytes(t).length;default:if(o)return n?-1:utf8ToBytes(t).length;e=(""+e).toLowerCase(),o=!0}}function slowToString(t,e,r){let n=!1;if((void 0===e||e<0)&&(e=0),e>this.length)return"";if((void 0===r||r>this.length)&&(r=this.length),r<=0)return"";if((r>>>=0)<=(e>>>=0))return"";for(t||(t="utf8");;)switch(t){case"hex":return hexSlice(this,e,r);case"utf8":case"utf-8":return utf8Slice(this,e,r);case"ascii":return asciiSlice(this,e,r);case"latin1":case"binary":return latin1Slice(this,e,r);case"base64":return base64Slice(this,e,r);case"ucs2":case"ucs-2":case"utf16le":case"utf-16le":return utf16leSlice(this,e,r);default:if(n)throw new TypeError("Unknown encoding: "+t);t=(t+"").toLowerCase(),n=!0}}function swap(t,e,r){const n=t[e];t[e]=t[r],t[r]=n}function bidirectionalIndexOf(t,e,r,n,o){if(0===t.length)return-1;if("string"==typeof r?(n=r,r=0):r>2147483647?r=2147483647:r<-2147483648&&(r=-2147483648),numberIsNaN(r=+r)&&(r=o?0:t.length-1),r<0&&(r=t.length+r),r>=t.length){if(o)return-1;r=t.length-1}else if(r<0){if(!o)return-1;r=0}if("string"==typeof e&&(e=Buffer.from(e,n)),Buffer.isBuffer(e))return 0===e.length?-1:arrayIndexOf(t,e,r,n,o);if("number"==typeof e)return e&=255,"function"==typeof Uint8Array.prototype.indexOf?o?Uint8Array.prototype.indexOf.call(t,e,r):Uint8Array.prototype.lastIndexOf.call(t,e,r):arrayIndexOf(t,[e],r,n,o);throw new TypeError("val must be string, number or Buffer")}function arrayIndexOf(t,e,r,n,o){let i,a=1,s=t.length,u=e.length;if(void 0!==n&&("ucs2"===(n=String(n).toLowerCase())||"ucs-2"===n||"utf16le"===n||"utf-16le"===n)){if(t.length<2||e.length<2)return-1;a=2,s/=2,u/=2,r/=2}function read(t,e){return 1===a?t[e]:t.readUInt16BE(e*a)}if(o){let n=-1;for(i=r;i<s;i++)if(read(t,i)===read(e,-1===n?0:i-n)){if(-1===n&&(n=i),i-n+1===u)return n*a}else-1!==n&&(i-=i-n),n=-1}else for(r+u>s&&(r=s-u),i=r;i>=0;i--){let r=!0;for(let n=0;n<u;n++)if(read(t,i+n)!==read(e,n)){r=!1;break}if(r)return i}return-1}function hexWrite(t,e,r,n){r=Number(r)||0;const o=t.length-r;n?(n=Number(n))>o&&(n=o):n=o;const i=e.length;let a;for(n>i/2&&(n=i/2),a=0;a<n;++a){const n=parseInt(e.substr(2*a,2),16);if(numberIsNaN(n))return a;t[r+a]=n}return a}function utf8Write(t,e,r,n){return blitBuffer(utf8ToBytes(e,t.length-r),t,r,n)}function asciiWrite(t,e,r,n){return blitBuffer(function asciiToBytes(t){const e=[];for(let r=0;r<t.length;++r)e.push(255&t.charCodeAt(r));return e}(e),t,r,n)}function base64Write(t,e,r,n){return blitBuffer(base64ToBytes(e),t,r,n)}function ucs2Write(t,e,r,n){return blitBuffer(function utf16leToBytes(t,e){let r,n,o;const i=[];for(let a=0;a<t.length&&!((e-=2)<0);++a)r=t.charCodeAt(a),n=r>>8,o=r%256,i.push(o),i.push(n);return i}(e,t.length-r),t,r,n)}function base64Slice(t,e,r){return 0===e&&r===t.length?n.fromByteArray(t):n.fromByteArray(t.slice(e,r))}function utf8Slice(t,e,r){r=Math.min(t.length,r);const n=[];let o=e;for(;o<r;){const e=t[o];let i=null,a=e>239?4:e>223?3:e>191?2:1;if(o+a<=r){let r,n,s,u;switch(a){case 1:e<128&&(i=e);break;case 2:r=t[o+1],128==(192&r)&&(u=(31&e)<<6|63&r,u>127&&(i=u));break;case 3:r=t[o+1],n=t[o+2],128==(192&r)&&128==(192&n)&&(u=(15&e)<<12|(63&r)<<6|63&n,u>2047&&(u<55296||u>57343)&&(i=u));break;case 4:r=t[o+1],n=t[o+2],s=t[o+3],128==(192&r)&&128==(192&n)&&128==(192&s)&&(u=(15&e)<<18|(63&r)<<12|(63&n)<<6|63&s,u>65535&&u<1114112&&(i=u))}}null===i?(i=65533,a=1):i>65535&&(i-=65536,n.push(i>>>10&1023|55296),i=56320|1023&i),n.push(i),o+=a}return function decodeCodePointsArray(t){const e=t.length;if(e<=s)return String.fromCharCode.apply(String,t);let r="",n=0;for(;n<e;)r+=String.fromCharCode.apply(String,t.slice(n,n+=s));return r}(n)}e.kMaxLength=a,Buffer.TYPED_ARRAY_SUPPORT=function typedArraySupport(){try{const t=new Uint8Array(1),e={foo:function(){return 42}};return Object.setPrototypeOf(e,Uint8Array.prototype),Object.setPrototypeOf(t,e),42===t.foo()}catch(t){return!1}}(),Buffer.TYPED_ARRAY_SUPPORT||"undefined"==typeof console||"function"!=typeof console.error||console.error("This browser lacks typed array (Uint8Array) support which is required by `buffer` v5.x. Use `buffer` v4.x if you require old browser support."),Object.defineProperty(Buffer.prototype,"parent",{enumerable:!0,get:function(){if(Buffer.isBuffer(this))return this.buffer}}),Object.defineProperty(Buffer.prototype,"offset",{enumerable:!0,get:function(){if(Buffer.isBuffer(this))return this.byteOffset}}),Buffer.poolSize=8192,Buffer.from=function(t,e,r){return from(t,e,r)},Object.setPrototypeOf(Buffer.prototype,Uint8Array.prototype),Object.setPrototypeOf(Buffer,Uint8Array),Buffer.alloc=function(t,e,r){return function alloc(t,e,r){return assertSize(t),t<=0?createBuffer(t):void 0!==e?"string"==typeof r?createBuffer(t).fill(e,r):createBuffer(t).fill(e):createBuffer(t)}(t,e,r)},Buffer.allocUnsafe=function(t){return allocUnsafe(t)},Buffer.allocUnsafeSlow=function(t){return allocUnsafe(t)},Buffer.isBuffer=function isBuffer(t){return null!=t&&!0===t._isBuffer&&t!==Buffer.prototype},Buffer.compare=function compare(t,e){if(isInstance(t,Uint8Array)&&(t=Buffer.from(t,t.offset,t.byteLength)),isInstance(e,Uint8Array)&&(e=Buffer.from(e,e.offset,e.byteLength)),!Buffer.isBuffer(t)||!Buffer.isBuffer(e))throw new TypeError('The "buf1", "buf2" arguments must be one of type Buffer or Uint8Array');if(t===e)return 0;let r=t.length,n=e.length;for(let o=0,i=Math.min(r,n);o<i;++o)if(t[o]!==e[o]){r=t[o],n=e[o];break}return r<n?-1:n<r?1:0},Buffer.isEncoding=function isEncoding(t){switch(String(t).toLowerCase()){case"hex":case"utf8":case"utf-8":case"ascii":case"latin1":case"binary":case"base64":case"ucs2":case"ucs-2":case"utf16le":case"utf-16le":return!0;default:return!1}},Buffer.concat=function concat(t,e){if(!Array.isArray(t))throw new TypeError('"list" argument must be an Array of Buffers');if(0===t.length)return Buffer.alloc(0);let r;if(void 0===e)for(e=0,r=0;r<t.length;++r)e+=t[r].length;const n=Buffer.allocUnsafe(e);let o=0;for(r=0;r<t.length;++r){let e=t[r];if(isInstance(e,Uint8Array))o+e.length>n.length?(Buffer.isBuffer(e)||(e=Buffer.from(e)),e.copy(n,o)):Uint8Array.prototype.set.call(n,e,o);else{if(!Buffer.isBuffer(e))throw new TypeError('"list" argument must be an Array of Buffers');e.copy(n,o)}o+=e.length}return n},Buffer.byteLength=byteLength,Buffer.prototype._isBuffer=!0,Buffer.prototype.swap16=function swap16(){const t=this.length;if(t%2!=0)throw new RangeError("Buffer size must be a multiple of 16-bits");for(let e=0;e<t;e+=2)swap(this,e,e+1);return this},Buffer.prototype.swap32=function swap32(){const t=this.length;if(t%4!=0)throw new RangeError("Buffer size must be a multiple of 32-bits");for(let e=0;e<t;e+=4)swap(this,e,e+3),swap(this,e+1,e+2);return this},Buffer.prototype.swap64=function swap64(){const t=this.length;if(t%8!=0)throw new RangeError("Buffer size must be a multiple of 64-bits");for(let e=0;e<t;e+=8)swap(this,e,e+7),swap(this,e+1,e+6),swap(this,e+2,e+5),swap(this,e+3,e+4);return this},Buffer.prototype.toString=function toString(){const t=this.length;return 0===t?"":0===arguments.length?utf8Slice(this,0,t):slowToString.apply(this,arguments)},Buffer.prototype.toLocaleString=Buffer.prototype.toString,Buffer.prototype.equals=function equals(t){if(!Buffer.isBuffer(t))throw new TypeError("Argument must be a Buffer");return this===t||0===Buffer.compare(this,t)},Buffer.prototype.inspect=function inspect(){let t="";const r=e.INSPECT_MAX_BYTES;return t=this.toString("hex",0,r).replace(/(.{2})/g,"$1 ").trim(),this.length>r&&(t+=" ... "),"<Buffer "+t+">"},i&&(Buffer.prototype[i]=Buffer.prototype.inspect),Buffer.prototype.compare=function compare(t,e,r,n,o){if(isInstance(t,Uint8Array)&&(t=Buffer.from(t,t.offset,t.byteLength)),!Buffer.isBuffer(t))throw new TypeError('The "target" argument must be one of type Buffer or Uint8Array. Received type '+typeof t);if(void 0===e&&(e=0),void 0===r&&(r=t?t.length:0),void 0===n&&(n=0),void 0===o&&(o=this.length),e<0||r>t.length||n<0||o>this.length)throw new RangeError("out of range index");if(n>=o&&e>=r)return 0;if(n>=o)return-1;if(e>=r)return 1;if(this===t)return 0;let i=(o>>>=0)-(n>>>=0),a=(r>>>=0)-(e>>>=0);const s=Math.min(i,a),u=this.slice(n,o),c=t.slice(e,r);for(let t=0;t<s;++t)if(u[t]!==c[t]){i=u[t],a=c[t];break}return i<a?-1:a<i?1:0},Buffer.prototype.includes=function includes(t,e,r){return-1!==this.indexOf(t,e,r)},Buffer.prototype.indexOf=function indexOf(t,e,r){return bidirectionalIndexOf(this,t,e,r,!0)},Buffer.prototype.lastIndexOf=function lastIndexOf(t,e,r){return bidirectionalIndexOf(this,t,e,r,!1)},Buffer.prototype.write=function write(t,e,r,n){if(void 0===e)n="utf8",r=this.length,e=0;else if(void 0===r&&"string"==typeof e)n=e,r=this.length,e=0;else{if(!isFinite(e))throw new Error("Buffer.write(string, encoding, offset[, length]) is no longer supported");e>>>=0,isFinite(r)?(r>>>=0,void 0===n&&(n="utf8")):(n=r,r=void 0)}const o=this.length-e;if((void 0===r||r>o)&&(r=o),t.length>0&&(r<0||e<0)||e>this.length)throw new RangeError("Attempt to write outside buffer bounds");n||(n="utf8");let i=!1;for(;;)switch(n){case"hex":return hexWrite(this,t,e,r);case"utf8":case"utf-8":return utf8Write(this,t,e,r);case"ascii":case"latin1":case"binary":return asciiWrite(this,t,e,r);case"base64":return base64Write(this,t,e,r);case"ucs2":case"ucs-2":case"utf16le":case"utf-16le":return ucs2Write(this,t,e,r);default:if(i)throw new TypeError("Unknown encoding: "+n);n=(""+n).toLowerCase(),i=!0}},Buffer.prototype.toJSON=function toJSON(){return{type:"Buffer",data:Array.prototype.slice.call(this._arr||this,0)}};const s=4096;function asciiSlice(t,e,r){let n="";r=Math.min(t.length,r);for(let o=e;o<r;++o)n+=String.fromCharCode(127&t[o]);return n}function latin1Slice(t,e,r){let n="";r=Math.min(t.length,r);for(let o=e;o<r;++o)n+=String.fromCharCode(t[o]);return n}function hexSlice(t,e,r){const n=t.length;(!e||e<0)&&(e=0),(!r||r<0||r>n)&&(r=n);let o="";for(let n=e;n<r;++n)o+=l[t[n]];return o}function utf16leSlice(t,e,r){const n=t.slice(e,r);let o="";for(let t=0;t<n.length-1;t+=2)o+=String.fromCharCode(n[t]+256*n[t+1]);return o}function checkOffset(t,e,r){if(t%1!=0||t<0)throw new RangeError("offset is not uint");if(t+e>r)throw new RangeError("Trying to access beyond buffer length")}function checkInt(t,e,r,n,o,i){if(!Buffer.isBuffer(t))throw new TypeError('"buffer" argument must be a Buffer instance');if(e>o||e<i)throw new RangeError('"value" argument is out of bounds');if(r+n>t.length)throw new RangeError("Index out of range")}function wrtBigUInt64LE(t,e,r,n,o){checkIntBI(e,n,o,t,r,7);let i=Number(e&BigInt(4294967295));t[r++]=i,i>>=8,t[r++]=i,i>>=8,t[r++]=i,i>>=8,t[r++]=i;let a=Number(e>>BigInt(32)&BigInt(4294967295));return t[r++]=a,a>>=8,t[r++]=a,a>>=8,t[r++]=a,a>>=8,t[r++]=a,r}function wrtBigUInt64BE(t,e,r,n,o){checkIntBI(e,n,o,t,r,7);let i=Number(e&BigInt(4294967295));t[r+7]=i,i>>=8,t[r+6]=i,i>>=8,t[r+5]=i,i>>=8,t[r+4]=i;let a=Number(e>>BigInt(32)&BigInt(4294967295));return t[r+3]=a,a>>=8,t[r+2]=a,a>>=8,t[r+1]=a,a>>=8,t[r]=a,r+8}function checkIEEE754(t,e,r,n,o,i){if(r+n>t.length)throw new RangeError("Index out of range");if(r<0)throw new RangeError("Index out of range")}function writeFloat(t,e,r,n,i){return e=+e,r>>>=0,i||checkIEEE754(t,0,r,4),o.write(t,e,r,n,23,4),r+4}function writeDouble(t,e,r,n,i){return e=+e,r>>>=0,i||checkIEEE754(t,0,r,8),o.write(t,e,r,n,52,8),r+8}Buffer.prototype.slice=function slice(t,e){const r=this.length;(t=~~t)<0?(t+=r)<0&&(t=0):t>r&&(t=r),(e=void 0===e?r:~~e)<0?(e+=r)<0&&(e=0):e>r&&(e=r),e<t&&(e=t);const n=this.subarray(t,e);return Object.setPrototypeOf(n,Buffer.prototype),n},Buffer.prototype.readUintLE=Buffer.prototype.readUIntLE=function readUIntLE(t,e,r){t>>>=0,e>>>=0,r||checkOffset(t,e,this.length);let n=this[t],o=1,i=0;for(;++i<e&&(o*=256);)n+=this[t+i]*o;return n},Buffer.prototype.readUintBE=Buffer.prototype.readUIntBE=function readUIntBE(t,e,r){t>>>=0,e>>>=0,r||checkOffset(t,e,this.length);let n=this[t+--e],o=1;for(;e>0&&(o*=256);)n+=this[t+--e]*o;return n},Buffer.prototype.readUint8=Buffer.prototype.readUInt8=function readUInt8(t,e){return t>>>=0,e||checkOffset(t,1,this.length),this[t]},Buffer.prototype.readUint16LE=Buffer.prototype.readUInt16LE=function readUInt16LE(t,e){return t>>>=0,e||checkOffset(t,2,this.length),this[t]|this[t+1]<<8},Buffer.prototype.readUint16BE=Buffer.prototype.readUInt16BE=function readUInt16BE(t,e){return t>>>=0,e||checkOffset(t,2,this.length),this[t]<<8|this[t+1]},Buffer.prototype.readUint32LE=Buffer.prototype.readUInt32LE=function readUInt32LE(t,e){return t>>>=0,e||checkOffset(t,4,this.length),(this[t]|this[t+1]<<8|this[t+2]<<16)+16777216*this[t+3]},Buffer.prototype.readUint32BE=Buffer.prototype.readUInt32BE=function readUInt32BE(t,e){return t>>>=0,e||checkOffset(t,4,this.length),16777216*this[t]+(this[t+1]<<16|this[t+2]<<8|this[t+3])},Buffer.prototype.readBigUInt64LE=defineBigIntMethod((function readBigUInt64LE(t){validateNumber(t>>>=0,"offset");const e=this[t],r=this[t+7];void 0!==e&&void 0!==r||boundsError(t,this.length-8);const n=e+256*this[++t]+65536*this[++t]+this[++t]*2**24,o=this[++t]+256*this[++t]+65536*this[++t]+r*2**24;return BigInt(n)+(BigInt(o)<<BigInt(32))})),Buffer.prototype.readBigUInt64BE=defineBigIntMethod((function readBigUInt64BE(t){validateNumber(t>>>=0,"offset");const e=this[t],r=this[t+7];void 0!==e&&void 0!==r||boundsError(t,this.length-8);const n=e*2**24+65536*this[++t]+256*this[++t]+this[++t],o=this[++t]*2**24+65536*this[++t]+256*this[++t]+r;return(BigInt(n)<<BigInt(32))+BigInt(o)})),Buffer.prototype.readIntLE=function readIntLE(t,e,r){t>>>=0,e>>>=0,r||checkOffset(t,e,this.length);let n=this[t],o=1,i=0;for(;++i<e&&(o*=256);)n+=this[t+i]*o;return o*=128,n>=o&&(n-=Math.pow(2,8*e)),n},Buffer.prototype.readIntBE=function readIntBE(t,e,r){t>>>=0,e>>>=0,r||checkOffset(t,e,this.length);let n=e,o=1,i=this[t+--n];for(;n>0&&(o*=256);)i+=this[t+--n]*o;return o*=128,i>=o&&(i-=Math.pow(2,8*e)),i},Buffer.prototype.readInt8=function readInt8(t,e){return t>>>=0,e||checkOffset(t,1,this.length),128&this[t]?-1*(255-this[t]+1):this[t]},Buffer.prototype.readInt16LE=function readInt16LE(t,e){t>>>=0,e||checkOffset(t,2,this.length);const r=this[t]|this[t+1]<<8;return 32768&r?4294901760|r:r},Buffer.prototype.readInt16BE=function readInt16BE(t,e){t>>>=0,e||checkOffset(t,2,this.length);const r=this[t+1]|this[t]<<8;return 32768&r?4294901760|r:r},Buffer.prototype.readInt32LE=function readInt32LE(t,e){return t>>>=0,e||checkOffset(t,4,this.length),this[t]|this[t+1]<<8|this[t+2]<<16|this[t+3]<<24},Buffer.prototype.readInt32BE=function readInt32BE(t,e){return t>>>=0,e||checkOffset(t,4,this.length),this[t]<<24|this[t+1]<<16|this[t+2]<<8|this[t+3]},Buffer.prototype.readBigInt64LE=defineBigIntMethod((function readBigInt64LE(t){validateNumber(t>>>=0,"offset");const e=this[t],r=this[t+7];void 0!==e&&void 0!==r||boundsError(t,this.length-8);const n=this[t+4]+256*this[t+5]+65536*this[t+6]+(r<<24);return(BigInt(n)<<BigInt(32))+BigInt(e+256*this[++t]+65536*this[++t]+this[++t]*2**24)})),Buffer.prototype.readBigInt64BE=defineBigIntMethod((function readBigInt64BE(t){validateNumber(t>>>=0,"offset");const e=this[t],r=this[t+7];void 0!==e&&void 0!==r||boundsError(t,this.length-8);const n=(e<<24)+65536*this[++t]+256*this[++t]+this[++t];return(BigInt(n)<<BigInt(32))+BigInt(this[++t]*2**24+65536*this[++t]+256*this[++t]+r)})),Buffer.prototype.readFloatLE=function readFloatLE(t,e){return t>>>=0,e||checkOffset(t,4,this.length),o.read(this,t,!0,23,4)},Buffer.prototype.readFloatBE=function readFloatBE(t,e){return t>>>=0,e||checkOffset(t,4,this.length),o.read(this,t,!1,23,4)},Buffer.prototype.readDoubleLE=function readDoubleLE(t,e){return t>>>=0,e||checkOffset(t,8,this.length),o.read(this,t,!0,52,8)},Buffer.prototype.readDoubleBE=function readDoubleBE(t,e){return t>>>=0,e||checkOffset(t,8,this.length),o.read(this,t,!1,52,8)},Buffer.prototype.writeUintLE=Buffer.prototype.writeUIntLE=function writeUIntLE(t,e,r,n){if(t=+t,e>>>=0,r>>>=0,!n){checkInt(this,t,e,r,Math.pow(2,8*r)-1,0)}let o=1,i=0;for(this[e]=255&t;++i<r&&(o*=256);)this[e+i]=t/o&255;return e+r},Buffer.prototype.writeUintBE=Buffer.prototype.writeUIntBE=function writeUIntBE(t,e,r,n){if(t=+t,e>>>=0,r>>>=0,!n){checkInt(this,t,e,r,Math.pow(2,8*r)-1,0)}let o=r-1,i=1;for(this[e+o]=255&t;--o>=0&&(i*=256);)this[e+o]=t/i&255;return e+r},Buffer.prototype.writeUint8=Buffer.prototype.writeUInt8=function writeUInt8(t,e,r){return t=+t,e>>>=0,r||checkInt(this,t,e,1,255,0),this[e]=255&t,e+1},Buffer.prototype.writeUint16LE=Buffer.prototype.writeUInt16LE=function writeUInt16LE(t,e,r){return t=+t,e>>>=0,r||checkInt(this,t,e,2,65535,0),this[e]=255&t,this[e+1]=t>>>8,e+2},Buffer.prototype.writeUint16BE=Buffer.prototype.writeUInt16BE=function writeUInt16BE(t,e,r){return t=+t,e>>>=0,r||checkInt(this,t,e,2,65535,0),this[e]=t>>>8,this[e+1]=255&t,e+2},Buffer.prototype.writeUint32LE=Buffer.prototype.writeUInt32LE=function writeUInt32LE(t,e,r){return t=+t,e>>>=0,r||checkInt(this,t,e,4,4294967295,0),this[e+3]=t>>>24,this[e+2]=t>>>16,this[e+1]=t>>>8,this[e]=255&t,e+4},Buffer.prototype.writeUint32BE=Buffer.prototype.writeUInt32BE=function writeUInt32BE(t,e,r){return t=+t,e>>>=0,r||checkInt(this,t,e,4,4294967295,0),this[e]=t>>>24,this[e+1]=t>>>16,this[e+2]=t>>>8,this[e+3]=255&t,e+4},Buffer.prototype.writeBigUInt64LE=defineBigIntMethod((function writeBigUInt64LE(t,e=0){return wrtBigUInt64LE(this,t,e,BigInt(0),BigInt("0xffffffffffffffff"))})),Buffer.prototype.writeBigUInt64BE=defineBigIntMethod((function writeBigUInt64BE(t,e=0){return wrtBigUInt64BE(this,t,e,BigInt(0),BigInt("0xffffffffffffffff"))})),Buffer.prototype.writeIntLE=function writeIntLE(t,e,r,n){if(t=+t,e>>>=0,!n){const n=Math.pow(2,8*r-1);checkInt(this,t,e,r,n-1,-n)}let o=0,i=1,a=0;for(this[e]=255&t;++o<r&&(i*=256);)t<0&&0===a&&0!==this[e+o-1]&&(a=1),this[e+o]=(t/i|0)-a&255;return e+r},Buffer.prototype.writeIntBE=function writeIntBE(t,e,r,n){if(t=+t,e>>>=0,!n){const n=Math.pow(2,8*r-1);checkInt(this,t,e,r,n-1,-n)}let o=r-1,i=1,a=0;for(this[e+o]=255&t;--o>=0&&(i*=256);)t<0&&0===a&&0!==this[e+o+1]&&(a=1),this[e+o]=(t/i|0)-a&255;return e+r},Buffer.prototype.writeInt8=function writeInt8(t,e,r){return t=+t,e>>>=0,r||checkInt(this,t,e,1,127,-128),t<0&&(t=255+t+1),this[e]=255&t,e+1},Buffer.prototype.writeInt16LE=function writeInt16LE(t,e,r){return t=+t,e>>>=0,r||checkInt(this,t,e,2,32767,-32768),this[e]=255&t,this[e+1]=t>>>8,e+2},Buffer.prototype.writeInt16BE=function writeInt16BE(t,e,r){return t=+t,e>>>=0,r||checkInt(this,t,e,2,32767,-32768),this[e]=t>>>8,this[e+1]=255&t,e+2},Buffer.prototype.writeInt32LE=function writeInt32LE(t,e,r){return t=+t,e>>>=0,r||checkInt(this,t,e,4,2147483647,-2147483648),this[e]=255&t,this[e+1]=t>>>8,this[e+2]=t>>>16,this[e+3]=t>>>24,e+4},Buffer.prototype.writeInt32BE=function writeInt32BE(t,e,r){return t=+t,e>>>=0,r||checkInt(this,t,e,4,2147483647,-2147483648),t<0&&(t=4294967295+t+1),this[e]=t>>>24,this[e+1]=t>>>16,this[e+2]=t>>>8,this[e+3]=255&t,e+4},Buffer.prototype.writeBigInt64LE=defineBigIntMethod((function writeBigInt64LE(t,e=0){return wrtBigUInt64LE(this,t,e,-BigInt("0x8000000000000000"),BigInt("0x7fffffffffffffff"))})),Buffer.prototype.writeBigInt64BE=defineBigIntMethod((function writeBigInt64BE(t,e=0){return wrtBigUInt64BE(this,t,e,-BigInt("0x8000000000000000"),BigInt("0x7fffffffffffffff"))})),Buffer.prototype.writeFloatLE=function writeFloatLE(t,e,r){return writeFloat(this,t,e,!0,r)},Buffer.prototype.writeFloatBE=function writeFloatBE(t,e,r){return writeFloat(this,t,e,!1,r)},Buffer.prototype.writeDoubleLE=function writeDoubleLE(t,e,r){return writeDouble(this,t,e,!0,r)},Buffer.prototype.writeDoubleBE=function writeDoubleBE(t,e,r){return writeDouble(this,t,e,!1,r)},Buffer.prototype.copy=function copy(t,e,r,n){if(!Buffer.isBuffer(t))throw new TypeError("argument should be a Buffer");if(r||(r=0),n||0===n||(n=this.length),e>=t.length&&(e=t.length),e||(e=0),n>0&&n<r&&(n=r),n===r)return 0;if(0===t.length||0===this.length)return 0;if(e<0)throw new RangeError("targetStart out of bounds");if(r<0||r>=this.length)throw new RangeError("Index out of range");if(n<0)throw new RangeError("sourceEnd out of bounds");n>this.length&&(n=this.length),t.length-e<n-r&&(n=t.length-e+r);const o=n-r;return this===t&&"function"==typeof Uint8Array.prototype.copyWithin?this.copyWithin(e,r,n):Uint8Array.prototype.set.call(t,this.subarray(r,n),e),o},Buffer.prototype.fill=function fill(t,e,r,n){if("string"==typeof t){if("string"==typeof e?(n=e,e=0,r=this.length):"string"==typeof r&&(n=r,r=this.length),void 0!==n&&"string"!=typeof n)throw new TypeError("encoding must be a string");if("string"==typeof n&&!Buffer.isEncoding(n))throw new TypeError("Unknown encoding: "+n);if(1===t.length){const e=t.charCodeAt(0);("utf8"===n&&e<128||"latin1"===n)&&(t=e)}}else"number"==typeof t?t&=255:"boolean"==typeof t&&(t=Number(t));if(e<0||this.length<e||this.length<r)throw new RangeError("Out of range index");if(r<=e)return this;let o;if(e>>>=0,r=void 0===r?this.length:r>>>0,t||(t=0),"number"==typeof t)for(o=e;o<r;++o)this[o]=t;else{const i=Buffer.isBuffer(t)?t:Buffer.from(t,n),a=i.length;if(0===a)throw new TypeError('The value "'+t+'" is invalid for argument "value"');for(o=0;o<r-e;++o)this[o+e]=i[o%a]}return this};const u={};function E(t,e,r){u[t]=class NodeError extends r{constructor(){super(),Object.defineProperty(this,"message",{value:e.apply(this,arguments),writable:!0,configurable:!0}),this.name=`${this.name} [${t}]`,this.stack,delete this.name}get code(){return t}set code(t){Object.defineProperty(this,"code",{configurable:!0,enumerable:!0,value:t,writable:!0})}toString(){return`${this.name} [${t}]: ${this.message}`}}}function addNumericalSeparator(t){let e="",r=t.length;const n="-"===t[0]?1:0;for(;r>=n+4;r-=3)e=`_${t.slice(r-3,r)}${e}`;return`${t.slice(0,r)}${e}`}function checkIntBI(t,e,r,n,o,i){if(t>r||t<e){const n="bigint"==typeof e?"n":"";let o;throw o=i>3?0===e||e===BigInt(0)?`>= 0${n} and < 2${n} ** ${8*(i+1)}${n}`:`>= -(2${n} ** ${8*(i+1)-1}${n}) and < 2 ** ${8*(i+1)-1}${n}`:`>= ${e}${n} and <= ${r}${n}`,new u.ERR_OUT_OF_RANGE("value",o,t)}!function checkBounds(t,e,r){validateNumber(e,"offset"),void 0!==t[e]&&void 0!==t[e+r]||boundsError(e,t.length-(r+1))}(n,o,i)}function validateNumber(t,e){if("number"!=typeof t)throw new u.ERR_INVALID_ARG_TYPE(e,"number",t)}function boundsError(t,e,r){if(Math.floor(t)!==t)throw validateNumber(t,r),new u.ERR_OUT_OF_RANGE(r||"offset","an integer",t);if(e<0)throw new u.ERR_BUFFER_OUT_OF_BOUNDS;throw new u.ERR_OUT_OF_RANGE(r||"offset",`>= ${r?1:0} and <= ${e}`,t)}E("ERR_BUFFER_OUT_OF_BOUNDS",(function(t){return t?`${t} is outside of buffer bounds`:"Attempt to access memory outside buffer bounds"}),RangeError),E("ERR_INVALID_ARG_TYPE",(function(t,e){return`The "${t}" argument must be of type number. Received type ${typeof e}`}),TypeError),E("ERR_OUT_OF_RANGE",(function(t,e,r){let n=`The value of "${t}" is out of range.`,o=r;return Number.isInteger(r)&&Math.abs(r)>2**32?o=addNumericalSeparator(String(r)):"bigint"==typeof r&&(o=String(r),(r>BigInt(2)**BigInt(32)||r<-(BigInt(2)**BigInt(32)))&&(o=addNumericalSeparator(o)),o+="n"),n+=` It must be ${e}. Received ${o}`,n}),RangeError);const c=/[^+/0-9A-Za-z-_]/g;function utf8ToBytes(t,e){let r;e=e||1/0;const n=t.length;let o=null;const i=[];for(let a=0;a<n;++a){if(r=t.charCodeAt(a),r>55295&&r<57344){if(!o){if(r>56319){(e-=3)>-1&&i.push(239,191,189);continue}if(a+1===n){(e-=3)>-1&&i.push(239,191,189);continue}o=r;continue}if(r<56320){(e-=3)>-1&&i.push(239,191,189),o=r;continue}r=65536+(o-55296<<10|r-56320)}else o&&(e-=3)>-1&&i.push(239,191,189);if(o=null,r<128){if((e-=1)<0)break;i.push(r)}else if(r<2048){if((e-=2)<0)break;i.push(r>>6|192,63&r|128)}else if(r<65536){if((e-=3)<0)break;i.push(r>>12|224,r>>6&63|128,63&r|128)}else{if(!(r<1114112))throw new Error("Invalid code point");if((e-=4)<0)break;i.push(r>>18|240,r>>12&63|128,r>>6&63|128,63&r|128)}}return i}function base64ToBytes(t){return n.toByteArray(function base64clean(t){if((t=(t=t.split("=")[0]).trim().replace(c,"")).length<2)return"";for(;t.length%4!=0;)t+="=";return t}(t))}function blitBuffer(t,e,r,n){let o;for(o=0;o<n&&!(o+r>=e.length||o>=t.length);++o)e[o+r]=t[o];return o}function isInstance(t,e){return t instanceof e||null!=t&&null!=t.constructor&&null!=t.constructor.name&&t.constructor.name===e.name}function numberIsNaN(t){return t!=t}const l=function(){const t="0123456789abcdef",e=new Array(256);for(let r=0;r<16;++r){const n=16*r;for(let o=0;o<16;++o)e[n+o]=t[r]+t[o]}return e}();function defineBigIntMethod(t){return"undefined"==typeof BigInt?BufferBigIntNotDefined:t}function BufferBigIntNotDefined(){throw new Error("BigInt not supported")}},3144(t,e,r){"use strict";var n=r(6743),o=r(1002),i=r(76),a=r(7119);t.exports=a||n.call(i,o)},4586(t,e,r){"use strict";var n=r(6743),o=r(1002),i=r(3144);t.exports=function applyBind(){return i(n,o,arguments)}},1002(t){"use strict";t.exports=Function.prototype.apply},76(t){"use strict";t.exports=Function.prototype.call},3126(t,e,r){"use strict";var n=r(6743),o=r(9675),i=r(76),a=r(3144);t.exports=function callBindBasic(t){if(t.length<1||"function"!=typeof t[0])throw new o("a function is required");return a(n,i,t)}},7119(t){"use strict";t.exports="undefined"!=typeof Reflect&&Reflect&&Reflect.apply},487(t,e,r){"use strict";var n=r(6897),o=r(655),i=r(3126),a=r(4586);t.exports=function callBind(t){var e=i(arguments),r=t.length-(arguments.length-1);return n(e,1+(r>0?r:0),!0)},o?o(t.exports,"apply",{value:a}):t.exports.apply=a},6556(t,e,r){"use strict";var n=r(453),o=r(3126),i=o([n("%String.prototype.indexOf%")]);t.exports=function callBoundIntrinsic(t,e){var r=n(t,!!e);return"function"==typeof r&&i(t,".prototype.")>-1?o([r]):r}},2205(t,e,r){var n;n=void 0!==r.g?r.g:this,t.exports=function(t){if(t.CSS&&t.CSS.escape)return t.CSS.escape;var cssEscape=function(t){if(0==arguments.length)throw new TypeError("`CSS.escape` requires an argument.");for(var e,r=String(t),n=r.length,o=-1,i="",a=r.charCodeAt(0);++o<n;)0!=(e=r.charCodeAt(o))?i+=e>=1&&e<=31||127==e||0==o&&e>=48&&e<=57||1==o&&e>=48&&e<=57&&45==a?"\\"+e.toString(16)+" ":0==o&&1==n&&45==e||!(e>=128||45==e||95==e||e>=48&&e<=57||e>=65&&e<=90||e>=97&&e<=122)?"\\"+r.charAt(o):r.charAt(o):i+="�";return i};return t.CSS||(t.CSS={}),t.CSS.escape=cssEscape,cssEscape}(n)},41(t,e,r){"use strict";var n=r(655),o=r(8068),i=r(9675),a=r(5795);t.exports=function defineDataProperty(t,e,r){if(!t||"object"!=typeof t&&"function"!=typeof t)throw new i("`obj` must be an object or a function`");if("string"!=typeof e&&"symbol"!=typeof e)throw new i("`property` must be a string or a symbol`");if(arguments.length>3&&"boolean"!=typeof arguments[3]&&null!==arguments[3])throw new i("`nonEnumerable`, if provided, must be a boolean or null");if(arguments.length>4&&"boolean"!=typeof arguments[4]&&null!==arguments[4])throw new i("`nonWritable`, if provided, must be a boolean or null");if(arguments.length>5&&"boolean"!=typeof arguments[5]&&null!==arguments[5])throw new i("`nonConfigurable`, if provided, must be a boolean or null");if(arguments.length>6&&"boolean"!=typeof arguments[6])throw new i("`loose`, if provided, must be a boolean");var s=arguments.length>3?arguments[3]:null,u=arguments.length>4?arguments[4]:null,c=arguments.length>5?arguments[5]:null,l=arguments.length>6&&arguments[6],f=!!a&&a(t,e);if(n)n(t,e,{configurable:null===c&&f?f.configurable:!c,enumerable:null===s&&f?f.enumerable:!s,value:r,writable:null===u&&f?f.writable:!u});else{if(!l&&(s||u||c))throw new o("This environment does not support defining a property as non-configurable, non-writable, or non-enumerable.");t[e]=r}}},7176(t,e,r){"use strict";var n,o=r(3126),i=r(5795);try{n=[].__proto__===Array.prototype}catch(t){if(!t||"object"!=typeof t||!("code"in t)||"ERR_PROTO_ACCESS"!==t.code)throw t}var a=!!n&&i&&i(Object.prototype,"__proto__"),s=Object,u=s.getPrototypeOf;t.exports=a&&"function"==typeof a.get?o([a.get]):"function"==typeof u&&function getDunder(t){return u(null==t?t:s(t))}},655(t){"use strict";var e=Object.defineProperty||!1;if(e)try{e({},"a",{value:1})}catch(t){e=!1}t.exports=e},1237(t){"use strict";t.exports=EvalError},9383(t){"use strict";t.exports=Error},9290(t){"use strict";t.exports=RangeError},9538(t){"use strict";t.exports=ReferenceError},8068(t){"use strict";t.exports=SyntaxError},9675(t){"use strict";t.exports=TypeError},5345(t){"use strict";t.exports=URIError},9612(t){"use strict";t.exports=Object},2682(t,e,r){"use strict";var n=r(9600),o=Object.prototype.toString,i=Object.prototype.hasOwnProperty;t.exports=function forEach(t,e,r){if(!n(e))throw new TypeError("iterator must be a function");var a;arguments.length>=3&&(a=r),function isArray(t){return"[object Array]"===o.call(t)}(t)?function forEachArray(t,e,r){for(var n=0,o=t.length;n<o;n++)i.call(t,n)&&(null==r?e(t[n],n,t):e.call(r,t[n],n,t))}(t,e,a):"string"==typeof t?function forEachString(t,e,r){for(var n=0,o=t.length;n<o;n++)null==r?e(t.charAt(n),n,t):e.call(r,t.charAt(n),n,t)}(t,e,a):function forEachObject(t,e,r){for(var n in t)i.call(t,n)&&(null==r?e(t[n],n,t):e.call(r,t[n],n,t))}(t,e,a)}},9353(t){"use strict";var e=Object.prototype.toString,r=Math.max,n=function concatty(t,e){for(var r=[],n=0;n<t.length;n+=1)r[n]=t[n];for(var o=0;o<e.length;o+=1)r[o+t.length]=e[o];return r};t.exports=function bind(t){var o=this;if("function"!=typeof o||"[object Function]"!==e.apply(o))throw new TypeError("Function.prototype.bind called on incompatible "+o);for(var i,a=function slicy(t,e){for(var r=[],n=e||0,o=0;n<t.length;n+=1,o+=1)r[o]=t[n];return r}(arguments,1),s=r(0,o.length-a.length),u=[],c=0;c<s;c++)u[c]="$"+c;if(i=Function("binder","return function ("+function(t,e){for(var r="",n=0;n<t.length;n+=1)r+=t[n],n+1<t.length&&(r+=e);return r}(u,",")+"){ return binder.apply(this,arguments); }")((function(){if(this instanceof i){var e=o.apply(this,n(a,arguments));return Object(e)===e?e:this}return o.apply(t,n(a,arguments))})),o.prototype){var l=function Empty(){};l.prototype=o.prototype,i.prototype=new l,l.prototype=null}return i}},6743(t,e,r){"use strict";var n=r(9353);t.exports=Function.prototype.bind||n},453(t,e,r){"use strict";var n,o=r(9612),i=r(9383),a=r(1237),s=r(9290),u=r(9538),c=r(8068),l=r(9675),f=r(5345),p=r(1514),h=r(8968),d=r(6188),y=r(8002),_=r(5880),g=r(414),m=r(3093),v=Function,getEvalledConstructor=function(t){try{return v('"use strict"; return ('+t+").constructor;")()}catch(t){}},b=r(5795),w=r(655),throwTypeError=function(){throw new l},I=b?function(){try{return throwTypeError}catch(t){try{return b(arguments,"callee").get}catch(t){return throwTypeError}}}():throwTypeError,x=r(4039)(),B=r(3628),k=r(1064),q=r(8648),C=r(1002),j=r(76),P={},L="undefined"!=typeof Uint8Array&&B?B(Uint8Array):n,U={__proto__:null,"%AggregateError%":"undefined"==typeof AggregateError?n:AggregateError,"%Array%":Array,"%ArrayBuffer%":"undefined"==typeof ArrayBuffer?n:ArrayBuffer,"%ArrayIteratorPrototype%":x&&B?B([][Symbol.iterator]()):n,"%AsyncFromSyncIteratorPrototype%":n,"%AsyncFunction%":P,"%AsyncGenerator%":P,"%AsyncGeneratorFunction%":P,"%AsyncIteratorPrototype%":P,"%Atomics%":"undefined"==typeof Atomics?n:Atomics,"%BigInt%":"undefined"==typeof BigInt?n:BigInt,"%BigInt64Array%":"undefined"==typeof BigInt64Array?n:BigInt64Array,"%BigUint64Array%":"undefined"==typeof BigUint64Array?n:BigUint64Array,"%Boolean%":Boolean,"%DataView%":"undefined"==typeof DataView?n:DataView,"%Date%":Date,"%decodeURI%":decodeURI,"%decodeURIComponent%":decodeURIComponent,"%encodeURI%":encodeURI,"%encodeURIComponent%":encodeURIComponent,"%Error%":i,"%eval%":eval,"%EvalError%":a,"%Float32Array%":"undefined"==typeof Float32Array?n:Float32Array,"%Float64Array%":"undefined"==typeof Float64Array?n:Float64Array,"%FinalizationRegistry%":"undefined"==typeof FinalizationRegistry?n:FinalizationRegistry,"%Function%":v,"%GeneratorFunction%":P,"%Int8Array%":"undefined"==typeof Int8Array?n:Int8Array,"%Int16Array%":"undefined"==typeof Int16Array?n:Int16Array,"%Int32Array%":"undefined"==typeof Int32Array?n:Int32Array,"%isFinite%":isFinite,"%isNaN%":isNaN,"%IteratorPrototype%":x&&B?B(B([][Symbol.iterator]())):n,"%JSON%":"object"==typeof JSON?JSON:n,"%Map%":"undefined"==typeof Map?n:Map,"%MapIteratorPrototype%":"undefined"!=typeof Map&&x&&B?B((new Map)[Symbol.iterator]()):n,"%Math%":Math,"%Number%":Number,"%Object%":o,"%Object.getOwnPropertyDescriptor%":b,"%parseFloat%":parseFloat,"%parseInt%":parseInt,"%Promise%":"undefined"==typeof Promise?n:Promise,"%Proxy%":"undefined"==typeof Proxy?n:Proxy,"%RangeError%":s,"%ReferenceError%":u,"%Reflect%":"undefined"==typeof Reflect?n:Reflect,"%RegExp%":RegExp,"%Set%":"undefined"==typeof Set?n:Set,"%SetIteratorPrototype%":"undefined"!=typeof Set&&x&&B?B((new Set)[Symbol.iterator]()):n,"%SharedArrayBuffer%":"undefined"==typeof SharedArrayBuffer?n:SharedArrayBuffer,"%String%":String,"%StringIteratorPrototype%":x&&B?B(""[Symbol.iterator]()):n,"%Symbol%":x?Symbol:n,"%SyntaxError%":c,"%ThrowTypeError%":I,"%TypedArray%":L,"%TypeError%":l,"%Uint8Array%":"undefined"==typeof Uint8Array?n:Uint8Array,"%Uint8ClampedArray%":"undefined"==typeof Uint8ClampedArray?n:Uint8ClampedArray,"%Uint16Array%":"undefined"==typeof Uint16Array?n:Uint16Array,"%Uint32Array%":"undefined"==typeof Uint32Array?n:Uint32Array,"%URIError%":f,"%WeakMap%":"undefined"==typeof WeakMap?n:WeakMap,"%WeakRef%":"undefined"==typeof WeakRef?n:WeakRef,"%WeakSet%":"undefined"==typeof WeakSet?n:WeakSet,"%Function.prototype.call%":j,"%Function.prototype.apply%":C,"%Object.defineProperty%":w,"%Object.getPrototypeOf%":k,"%Math.abs%":p,"%Math.floor%":h,"%Math.max%":d,"%Math.min%":y,"%Math.pow%":_,"%Math.round%":g,"%Math.sign%":m,"%Reflect.getPrototypeOf%":q};if(B)try{null.error}catch(t){var z=B(B(t));U["%Error.prototype%"]=z}var D=function doEval(t){var e;if("%AsyncFunction%"===t)e=getEvalledConstructor("async function () {}");else if("%GeneratorFunction%"===t)e=getEvalledConstructor("function* () {}");else if("%AsyncGeneratorFunction%"===t)e=getEvalledConstructor("async function* () {}");else if("%AsyncGenerator%"===t){var r=doEval("%AsyncGeneratorFunction%");r&&(e=r.prototype)}else if("%AsyncIteratorPrototype%"===t){var n=doEval("%AsyncGenerator%");n&&B&&(e=B(n.prototype))}return U[t]=e,e},W={__proto__:null,"%ArrayBufferPrototype%":["ArrayBuffer","prototype"],"%ArrayPrototype%":["Array","prototype"],"%ArrayProto_entries%":["Array","prototype","entries"],"%ArrayProto_forEach%":["Array","prototype","forEach"],"%ArrayProto_keys%":["Array","prototype","keys"],"%ArrayProto_values%":["Array","prototype","values"],"%AsyncFunctionPrototype%":["AsyncFunction","prototype"],"%AsyncGenerator%":["AsyncGeneratorFunction","prototype"],"%AsyncGeneratorPrototype%":["AsyncGeneratorFunction","prototype","prototype"],"%BooleanPrototype%":["Boolean","prototype"],"%DataViewPrototype%":["DataView","prototype"],"%DatePrototype%":["Date","prototype"],"%ErrorPrototype%":["Error","prototype"],"%EvalErrorPrototype%":["EvalError","prototype"],"%Float32ArrayPrototype%":["Float32Array","prototype"],"%Float64ArrayPrototype%":["Float64Array","prototype"],"%FunctionPrototype%":["Function","prototype"],"%Generator%":["GeneratorFunction","prototype"],"%GeneratorPrototype%":["GeneratorFunction","prototype","prototype"],"%Int8ArrayPrototype%":["Int8Array","prototype"],"%Int16ArrayPrototype%":["Int16Array","prototype"],"%Int32ArrayPrototype%":["Int32Array","prototype"],"%JSONParse%":["JSON","parse"],"%JSONStringify%":["JSON","stringify"],"%MapPrototype%":["Map","prototype"],"%NumberPrototype%":["Number","prototype"],"%ObjectPrototype%":["Object","prototype"],"%ObjProto_toString%":["Object","prototype","toString"],"%ObjProto_valueOf%":["Object","prototype","valueOf"],"%PromisePrototype%":["Promise","prototype"],"%PromiseProto_then%":["Promise","prototype","then"],"%Promise_all%":["Promise","all"],"%Promise_reject%":["Promise","reject"],"%Promise_resolve%":["Promise","resolve"],"%RangeErrorPrototype%":["RangeError","prototype"],"%ReferenceErrorPrototype%":["ReferenceError","prototype"],"%RegExpPrototype%":["RegExp","prototype"],"%SetPrototype%":["Set","prototype"],"%SharedArrayBufferPrototype%":["SharedArrayBuffer","prototype"],"%StringPrototype%":["String","prototype"],"%SymbolPrototype%":["Symbol","prototype"],"%SyntaxErrorPrototype%":["SyntaxError","prototype"],"%TypedArrayPrototype%":["TypedArray","prototype"],"%TypeErrorPrototype%":["TypeError","prototype"],"%Uint8ArrayPrototype%":["Uint8Array","prototype"],"%Uint8ClampedArrayPrototype%":["Uint8ClampedArray","prototype"],"%Uint16ArrayPrototype%":["Uint16Array","prototype"],"%Uint32ArrayPrototype%":["Uint32Array","prototype"],"%URIErrorPrototype%":["URIError","prototype"],"%WeakMapPrototype%":["WeakMap","prototype"],"%WeakSetPrototype%":["WeakSet","prototype"]},K=r(6743),V=r(9957),$=K.call(j,Array.prototype.concat),Y=K.call(C,Array.prototype.splice),H=K.call(j,String.prototype.replace),Z=K.call(j,String.prototype.slice),J=K.call(j,RegExp.prototype.exec),tt=/[^%.[\]]+|\[(?:(-?\d+(?:\.\d+)?)|(["'])((?:(?!\2)[^\\]|\\.)*?)\2)\]|(?=(?:\.|\[\])(?:\.|\[\]|%$))/g,et=/\\(\\)?/g,rt=function getBaseIntrinsic(t,e){var r,n=t;if(V(W,n)&&(n="%"+(r=W[n])[0]+"%"),V(U,n)){var o=U[n];if(o===P&&(o=D(n)),void 0===o&&!e)throw new l("intrinsic "+t+" exists, but is not available. Please file an issue!");return{alias:r,name:n,value:o}}throw new c("intrinsic "+t+" does not exist!")};t.exports=function GetIntrinsic(t,e){if("string"!=typeof t||0===t.length)throw new l("intrinsic name must be a non-empty string");if(arguments.length>1&&"boolean"!=typeof e)throw new l('"allowMissing" argument must be a boolean');if(null===J(/^%?[^%]*%?$/,t))throw new c("`%` may not be present anywhere but at the beginning and end of the intrinsic name");var r=function stringToPath(t){var e=Z(t,0,1),r=Z(t,-1);if("%"===e&&"%"!==r)throw new c("invalid intrinsic syntax, expected closing `%`");if("%"===r&&"%"!==e)throw new c("invalid intrinsic syntax, expected opening `%`");var n=[];return H(t,tt,(function(t,e,r,o){n[n.length]=r?H(o,et,"$1"):e||t})),n}(t),n=r.length>0?r[0]:"",o=rt("%"+n+"%",e),i=o.name,a=o.value,s=!1,u=o.alias;u&&(n=u[0],Y(r,$([0,1],u)));for(var f=1,p=!0;f<r.length;f+=1){var h=r[f],d=Z(h,0,1),y=Z(h,-1);if(('"'===d||"'"===d||"`"===d||'"'===y||"'"===y||"`"===y)&&d!==y)throw new c("property names with quotes must have matching quotes");if("constructor"!==h&&p||(s=!0),V(U,i="%"+(n+="."+h)+"%"))a=U[i];else if(null!=a){if(!(h in a)){if(!e)throw new l("base intrinsic for "+t+" exists, but the property is not available.");return}if(b&&f+1>=r.length){var _=b(a,h);a=(p=!!_)&&"get"in _&&!("originalValue"in _.get)?_.get:a[h]}else p=V(a,h),a=a[h];p&&!s&&(U[i]=a)}}return a}},1064(t,e,r){"use strict";var n=r(9612);t.exports=n.getPrototypeOf||null},8648(t){"use strict";t.exports="undefined"!=typeof Reflect&&Reflect.getPrototypeOf||null},3628(t,e,r){"use strict";var n=r(8648),o=r(1064),i=r(7176);t.exports=n?function getProto(t){return n(t)}:o?function getProto(t){if(!t||"object"!=typeof t&&"function"!=typeof t)throw new TypeError("getProto: not an object");return o(t)}:i?function getProto(t){return i(t)}:null},6549(t){"use strict";t.exports=Object.getOwnPropertyDescriptor},5795(t,e,r){"use strict";var n=r(6549);if(n)try{n([],"length")}catch(t){n=null}t.exports=n},592(t,e,r){"use strict";var n=r(655),o=function hasPropertyDescriptors(){return!!n};o.hasArrayLengthDefineBug=function hasArrayLengthDefineBug(){if(!n)return null;try{return 1!==n([],"length",{value:1}).length}catch(t){return!0}},t.exports=o},4039(t,e,r){"use strict";var n="undefined"!=typeof Symbol&&Symbol,o=r(1333);t.exports=function hasNativeSymbols(){return"function"==typeof n&&("function"==typeof Symbol&&("symbol"==typeof n("foo")&&("symbol"==typeof Symbol("bar")&&o())))}},1333(t){"use strict";t.exports=function hasSymbols(){if("function"!=typeof Symbol||"function"!=typeof Object.getOwnPropertySymbols)return!1;if("symbol"==typeof Symbol.iterator)return!0;var t={},e=Symbol("test"),r=Object(e);if("string"==typeof e)return!1;if("[object Symbol]"!==Object.prototype.toString.call(e))return!1;if("[object Symbol]"!==Object.prototype.toString.call(r))return!1;for(var n in t[e]=42,t)return!1;if("function"==typeof Object.keys&&0!==Object.keys(t).length)return!1;if("function"==typeof Object.getOwnPropertyNames&&0!==Object.getOwnPropertyNames(t).length)return!1;var o=Object.getOwnPropertySymbols(t);if(1!==o.length||o[0]!==e)return!1;if(!Object.prototype.propertyIsEnumerable.call(t,e))return!1;if("function"==typeof Object.getOwnPropertyDescriptor){var i=Object.getOwnPropertyDescriptor(t,e);if(42!==i.value||!0!==i.enumerable)return!1}return!0}},9092(t,e,r){"use strict";var n=r(1333);t.exports=function hasToStringTagShams(){return n()&&!!Symbol.toStringTag}},9957(t,e,r){"use strict";var n=Function.prototype.call,o=Object.prototype.hasOwnProperty,i=r(6743);t.exports=i.call(n,o)},251(t,e){e.read=function(t,e,r,n,o){var i,a,s=8*o-n-1,u=(1<<s)-1,c=u>>1,l=-7,f=r?o-1:0,p=r?-1:1,h=t[e+f];for(f+=p,i=h&(1<<-l)-1,h>>=-l,l+=s;l>0;i=256*i+t[e+f],f+=p,l-=8);for(a=i&(1<<-l)-1,i>>=-l,l+=n;l>0;a=256*a+t[e+f],f+=p,l-=8);if(0===i)i=1-c;else{if(i===u)return a?NaN:1/0*(h?-1:1);a+=Math.pow(2,n),i-=c}return(h?-1:1)*a*Math.pow(2,i-n)},e.write=function(t,e,r,n,o,i){var a,s,u,c=8*i-o-1,l=(1<<c)-1,f=l>>1,p=23===o?Math.pow(2,-24)-Math.pow(2,-77):0,h=n?0:i-1,d=n?1:-1,y=e<0||0===e&&1/e<0?1:0;for(e=Math.abs(e),isNaN(e)||e===1/0?(s=isNaN(e)?1:0,a=l):(a=Math.floor(Math.log(e)/Math.LN2),e*(u=Math.pow(2,-a))<1&&(a--,u*=2),(e+=a+f>=1?p/u:p*Math.pow(2,1-f))*u>=2&&(a++,u/=2),a+f>=l?(s=0,a=l):a+f>=1?(s=(e*u-1)*Math.pow(2,o),a+=f):(s=e*Math.pow(2,f-1)*Math.pow(2,o),a=0));o>=8;t[r+h]=255&s,h+=d,s/=256,o-=8);for(a=a<<o|s,c+=o;c>0;t[r+h]=255&a,h+=d,a/=256,c-=8);t[r+h-d]|=128*y}},6698(t){"function"==typeof Object.create?t.exports=function inherits(t,e){e&&(t.super_=e,t.prototype=Object.create(e.prototype,{constructor:{value:t,enumerable:!1,writable:!0,configurable:!0}}))}:t.exports=function inherits(t,e){if(e){t.super_=e;var TempCtor=function(){};TempCtor.prototype=e.prototype,t.prototype=new TempCtor,t.prototype.constructor=t}}},9600(t){"use strict";var e,r,n=Function.prototype.toString,o="object"==typeof Reflect&&null!==Reflect&&Reflect.apply;if("function"==typeof o&&"function"==typeof Object.defineProperty)try{e=Object.defineProperty({},"length",{get:function(){throw r}}),r={},o((function(){throw 42}),null,e)}catch(t){t!==r&&(o=null)}else o=null;var i=/^\s*class\b/,a=function isES6ClassFunction(t){try{var e=n.call(t);return i.test(e)}catch(t){return!1}},s=function tryFunctionToStr(t){try{return!a(t)&&(n.call(t),!0)}catch(t){return!1}},u=Object.prototype.toString,c="function"==typeof Symbol&&!!Symbol.toStringTag,l=!(0 in[,]),f=function isDocumentDotAll(){return!1};if("object"==typeof document){var p=document.all;u.call(p)===u.call(document.all)&&(f=function isDocumentDotAll(t){if((l||!t)&&(void 0===t||"object"==typeof t))try{var e=u.call(t);return("[object HTMLAllCollection]"===e||"[object HTML document.all class]"===e||"[object HTMLCollection]"===e||"[object Object]"===e)&&null==t("")}catch(t){}return!1})}t.exports=o?function isCallable(t){if(f(t))return!0;if(!t)return!1;if("function"!=typeof t&&"object"!=typeof t)return!1;try{o(t,null,e)}catch(t){if(t!==r)return!1}return!a(t)&&s(t)}:function isCallable(t){if(f(t))return!0;if(!t)return!1;if("function"!=typeof t&&"object"!=typeof t)return!1;if(c)return s(t);if(a(t))return!1;var e=u.call(t);return!("[object Function]"!==e&&"[object GeneratorFunction]"!==e&&!/^\[object HTML/.test(e))&&s(t)}},5680(t,e,r){"use strict";var n=r(5767);t.exports=function isTypedArray(t){return!!n(t)}},4634(t){var e={}.toString;t.exports=Array.isArray||function(t){return"[object Array]"==e.call(t)}},5580(t,e,r){var n=r(6110)(r(9325),"DataView");t.exports=n},1549(t,e,r){var n=r(2032),o=r(3862),i=r(6721),a=r(2749),s=r(5749);function Hash(t){var e=-1,r=null==t?0:t.length;for(this.clear();++e<r;){var n=t[e];this.set(n[0],n[1])}}Hash.prototype.clear=n,Hash.prototype.delete=o,Hash.prototype.get=i,Hash.prototype.has=a,Hash.prototype.set=s,t.exports=Hash},79(t,e,r){var n=r(3702),o=r(80),i=r(4739),a=r(8655),s=r(1175);function ListCache(t){var e=-1,r=null==t?0:t.length;for(this.clear();++e<r;){var n=t[e];this.set(n[0],n[1])}}ListCache.prototype.clear=n,ListCache.prototype.delete=o,ListCache.prototype.get=i,ListCache.prototype.has=a,ListCache.prototype.set=s,t.exports=ListCache},8223(t,e,r){var n=r(6110)(r(9325),"Map");t.exports=n},3661(t,e,r){var n=r(3040),o=r(7670),i=r(289),a=r(4509),s=r(2949);function MapCache(t){var e=-1,r=null==t?0:t.length;for(this.clear();++e<r;){var n=t[e];this.set(n[0],n[1])}}MapCache.prototype.clear=n,MapCache.prototype.delete=o,MapCache.prototype.get=i,MapCache.prototype.has=a,MapCache.prototype.set=s,t.exports=MapCache},2804(t,e,r){var n=r(6110)(r(9325),"Promise");t.exports=n},6545(t,e,r){var n=r(6110)(r(9325),"Set");t.exports=n},8859(t,e,r){var n=r(3661),o=r(1380),i=r(1459);function SetCache(t){var e=-1,r=null==t?0:t.length;for(this.__data__=new n;++e<r;)this.add(t[e])}SetCache.prototype.add=SetCache.prototype.push=o,SetCache.prototype.has=i,t.exports=SetCache},7217(t,e,r){var n=r(79),o=r(1420),i=r(938),a=r(3605),s=r(9817),u=r(945);function Stack(t){var e=this.__data__=new n(t);this.size=e.size}Stack.prototype.clear=o,Stack.prototype.delete=i,Stack.prototype.get=a,Stack.prototype.has=s,Stack.prototype.set=u,t.exports=Stack},1873(t,e,r){var n=r(9325).Symbol;t.exports=n},7828(t,e,r){var n=r(9325).Uint8Array;t.exports=n},8303(t,e,r){var n=r(6110)(r(9325),"WeakMap");t.exports=n},9770(t){t.exports=function arrayFilter(t,e){for(var r=-1,n=null==t?0:t.length,o=0,i=[];++r<n;){var a=t[r];e(a,r,t)&&(i[o++]=a)}return i}},695(t,e,r){var n=r(8096),o=r(2428),i=r(6449),a=r(3656),s=r(361),u=r(7167),c=Object.prototype.hasOwnProperty;t.exports=function arrayLikeKeys(t,e){var r=i(t),l=!r&&o(t),f=!r&&!l&&a(t),p=!r&&!l&&!f&&u(t),h=r||l||f||p,d=h?n(t.length,String):[],y=d.length;for(var _ in t)!e&&!c.call(t,_)||h&&("length"==_||f&&("offset"==_||"parent"==_)||p&&("buffer"==_||"byteLength"==_||"byteOffset"==_)||s(_,y))||d.push(_);return d}},4932(t){t.exports=function arrayMap(t,e){for(var r=-1,n=null==t?0:t.length,o=Array(n);++r<n;)o[r]=e(t[r],r,t);return o}},4528(t){t.exports=function arrayPush(t,e){for(var r=-1,n=e.length,o=t.length;++r<n;)t[o+r]=e[r];return t}},882(t){t.exports=function arrayReduce(t,e,r,n){var o=-1,i=null==t?0:t.length;for(n&&i&&(r=t[++o]);++o<i;)r=e(r,t[o],o,t);return r}},4248(t){t.exports=function arraySome(t,e){for(var r=-1,n=null==t?0:t.length;++r<n;)if(e(t[r],r,t))return!0;return!1}},1074(t){t.exports=function asciiToArray(t){return t.split("")}},1733(t){var e=/[^\x00-\x2f\x3a-\x40\x5b-\x60\x7b-\x7f]+/g;t.exports=function asciiWords(t){return t.match(e)||[]}},6547(t,e,r){var n=r(3360),o=r(5288),i=Object.prototype.hasOwnProperty;t.exports=function assignValue(t,e,r){var a=t[e];i.call(t,e)&&o(a,r)&&(void 0!==r||e in t)||n(t,e,r)}},6025(t,e,r){var n=r(5288);t.exports=function assocIndexOf(t,e){for(var r=t.length;r--;)if(n(t[r][0],e))return r;return-1}},3360(t,e,r){var n=r(3243);t.exports=function baseAssignValue(t,e,r){"__proto__"==e&&n?n(t,e,{configurable:!0,enumerable:!0,value:r,writable:!0}):t[e]=r}},909(t,e,r){var n=r(641),o=r(8329)(n);t.exports=o},2523(t){t.exports=function baseFindIndex(t,e,r,n){for(var o=t.length,i=r+(n?1:-1);n?i--:++i<o;)if(e(t[i],i,t))return i;return-1}},6649(t,e,r){var n=r(3221)();t.exports=n},641(t,e,r){var n=r(6649),o=r(5950);t.exports=function baseForOwn(t,e){return t&&n(t,e,o)}},7422(t,e,r){var n=r(1769),o=r(7797);t.exports=function baseGet(t,e){for(var r=0,i=(e=n(e,t)).length;null!=t&&r<i;)t=t[o(e[r++])];return r&&r==i?t:void 0}},2199(t,e,r){var n=r(4528),o=r(6449);t.exports=function baseGetAllKeys(t,e,r){var i=e(t);return o(t)?i:n(i,r(t))}},2552(t,e,r){var n=r(1873),o=r(659),i=r(9350),a=n?n.toStringTag:void 0;t.exports=function baseGetTag(t){return null==t?void 0===t?"[object Undefined]":"[object Null]":a&&a in Object(t)?o(t):i(t)}},8077(t){t.exports=function baseHasIn(t,e){return null!=t&&e in Object(t)}},7534(t,e,r){var n=r(2552),o=r(346);t.exports=function baseIsArguments(t){return o(t)&&"[object Arguments]"==n(t)}},270(t,e,r){var n=r(7068),o=r(346);t.exports=function baseIsEqual(t,e,r,i,a){return t===e||(null==t||null==e||!o(t)&&!o(e)?t!=t&&e!=e:n(t,e,r,i,baseIsEqual,a))}},7068(t,e,r){var n=r(7217),o=r(5911),i=r(1986),a=r(689),s=r(5861),u=r(6449),c=r(3656),l=r(7167),f="[object Arguments]",p="[object Array]",h="[object Object]",d=Object.prototype.hasOwnProperty;t.exports=function baseIsEqualDeep(t,e,r,y,_,g){var m=u(t),v=u(e),b=m?p:s(t),w=v?p:s(e),I=(b=b==f?h:b)==h,x=(w=w==f?h:w)==h,B=b==w;if(B&&c(t)){if(!c(e))return!1;m=!0,I=!1}if(B&&!I)return g||(g=new n),m||l(t)?o(t,e,r,y,_,g):i(t,e,b,r,y,_,g);if(!(1&r)){var k=I&&d.call(t,"__wrapped__"),q=x&&d.call(e,"__wrapped__");if(k||q){var C=k?t.value():t,j=q?e.value():e;return g||(g=new n),_(C,j,r,y,g)}}return!!B&&(g||(g=new n),a(t,e,r,y,_,g))}},1799(t,e,r){var n=r(7217),o=r(270);t.exports=function baseIsMatch(t,e,r,i){var a=r.length,s=a,u=!i;if(null==t)return!s;for(t=Object(t);a--;){var c=r[a];if(u&&c[2]?c[1]!==t[c[0]]:!(c[0]in t))return!1}for(;++a<s;){var l=(c=r[a])[0],f=t[l],p=c[1];if(u&&c[2]){if(void 0===f&&!(l in t))return!1}else{var h=new n;if(i)var d=i(f,p,l,t,e,h);if(!(void 0===d?o(p,f,3,i,h):d))return!1}}return!0}},5083(t,e,r){var n=r(1882),o=r(7296),i=r(3805),a=r(7473),s=/^\[object .+?Constructor\]$/,u=Function.prototype,c=Object.prototype,l=u.toString,f=c.hasOwnProperty,p=RegExp("^"+l.call(f).replace(/[\\^$.*+?()[\]{}|]/g,"\\$&").replace(/hasOwnProperty|(function).*?(?=\\\()| for .+?(?=\\\])/g,"$1.*?")+"$");t.exports=function baseIsNative(t){return!(!i(t)||o(t))&&(n(t)?p:s).test(a(t))}},4901(t,e,r){var n=r(2552),o=r(294),i=r(346),a={};a["[object Float32Array]"]=a["[object Float64Array]"]=a["[object Int8Array]"]=a["[object Int16Array]"]=a["[object Int32Array]"]=a["[object Uint8Array]"]=a["[object Uint8ClampedArray]"]=a["[object Uint16Array]"]=a["[object Uint32Array]"]=!0,a["[object Arguments]"]=a["[object Array]"]=a["[object ArrayBuffer]"]=a["[object Boolean]"]=a["[object DataView]"]=a["[object Date]"]=a["[object Error]"]=a["[object Function]"]=a["[object Map]"]=a["[object Number]"]=a["[object Object]"]=a["[object RegExp]"]=a["[object Set]"]=a["[object String]"]=a["[object WeakMap]"]=!1,t.exports=function baseIsTypedArray(t){return i(t)&&o(t.length)&&!!a[n(t)]}},5389(t,e,r){var n=r(3663),o=r(7978),i=r(3488),a=r(6449),s=r(583);t.exports=function baseIteratee(t){return"function"==typeof t?t:null==t?i:"object"==typeof t?a(t)?o(t[0],t[1]):n(t):s(t)}},8984(t,e,r){var n=r(5527),o=r(3650),i=Object.prototype.hasOwnProperty;t.exports=function baseKeys(t){if(!n(t))return o(t);var e=[];for(var r in Object(t))i.call(t,r)&&"constructor"!=r&&e.push(r);return e}},3663(t,e,r){var n=r(1799),o=r(776),i=r(7197);t.exports=function baseMatches(t){var e=o(t);return 1==e.length&&e[0][2]?i(e[0][0],e[0][1]):function(r){return r===t||n(r,t,e)}}},7978(t,e,r){var n=r(270),o=r(8156),i=r(631),a=r(8586),s=r(756),u=r(7197),c=r(7797);t.exports=function baseMatchesProperty(t,e){return a(t)&&s(e)?u(c(t),e):function(r){var a=o(r,t);return void 0===a&&a===e?i(r,t):n(e,a,3)}}},7237(t){t.exports=function baseProperty(t){return function(e){return null==e?void 0:e[t]}}},7255(t,e,r){var n=r(7422);t.exports=function basePropertyDeep(t){return function(e){return n(e,t)}}},4552(t){t.exports=function basePropertyOf(t){return function(e){return null==t?void 0:t[e]}}},5160(t){t.exports=function baseSlice(t,e,r){var n=-1,o=t.length;e<0&&(e=-e>o?0:o+e),(r=r>o?o:r)<0&&(r+=o),o=e>r?0:r-e>>>0,e>>>=0;for(var i=Array(o);++n<o;)i[n]=t[n+e];return i}},916(t,e,r){var n=r(909);t.exports=function baseSome(t,e){var r;return n(t,(function(t,n,o){return!(r=e(t,n,o))})),!!r}},8096(t){t.exports=function baseTimes(t,e){for(var r=-1,n=Array(t);++r<t;)n[r]=e(r);return n}},7556(t,e,r){var n=r(1873),o=r(4932),i=r(6449),a=r(4394),s=n?n.prototype:void 0,u=s?s.toString:void 0;t.exports=function baseToString(t){if("string"==typeof t)return t;if(i(t))return o(t,baseToString)+"";if(a(t))return u?u.call(t):"";var e=t+"";return"0"==e&&1/t==-1/0?"-0":e}},4128(t,e,r){var n=r(1800),o=/^\s+/;t.exports=function baseTrim(t){return t?t.slice(0,n(t)+1).replace(o,""):t}},7301(t){t.exports=function baseUnary(t){return function(e){return t(e)}}},1234(t){t.exports=function baseZipObject(t,e,r){for(var n=-1,o=t.length,i=e.length,a={};++n<o;){var s=n<i?e[n]:void 0;r(a,t[n],s)}return a}},9219(t){t.exports=function cacheHas(t,e){return t.has(e)}},1769(t,e,r){var n=r(6449),o=r(8586),i=r(1802),a=r(3222);t.exports=function castPath(t,e){return n(t)?t:o(t,e)?[t]:i(a(t))}},8754(t,e,r){var n=r(5160);t.exports=function castSlice(t,e,r){var o=t.length;return r=void 0===r?o:r,!e&&r>=o?t:n(t,e,r)}},5481(t,e,r){var n=r(9325)["__core-js_shared__"];t.exports=n},8329(t,e,r){var n=r(4894);t.exports=function createBaseEach(t,e){return function(r,o){if(null==r)return r;if(!n(r))return t(r,o);for(var i=r.length,a=e?i:-1,s=Object(r);(e?a--:++a<i)&&!1!==o(s[a],a,s););return r}}},3221(t){t.exports=function createBaseFor(t){return function(e,r,n){for(var o=-1,i=Object(e),a=n(e),s=a.length;s--;){var u=a[t?s:++o];if(!1===r(i[u],u,i))break}return e}}},2507(t,e,r){var n=r(8754),o=r(9698),i=r(3912),a=r(3222);t.exports=function createCaseFirst(t){return function(e){e=a(e);var r=o(e)?i(e):void 0,s=r?r[0]:e.charAt(0),u=r?n(r,1).join(""):e.slice(1);return s[t]()+u}}},5539(t,e,r){var n=r(882),o=r(828),i=r(6645),a=RegExp("['’]","g");t.exports=function createCompounder(t){return function(e){return n(i(o(e).replace(a,"")),t,"")}}},2006(t,e,r){var n=r(5389),o=r(4894),i=r(5950);t.exports=function createFind(t){return function(e,r,a){var s=Object(e);if(!o(e)){var u=n(r,3);e=i(e),r=function(t){return u(s[t],t,s)}}var c=t(e,r,a);return c>-1?s[u?e[c]:c]:void 0}}},4647(t,e,r){var n=r(4552)({À:"A",Á:"A",Â:"A",Ã:"A",Ä:"A",Å:"A",à:"a",á:"a",â:"a",ã:"a",ä:"a",å:"a",Ç:"C",ç:"c",Ð:"D",ð:"d",È:"E",É:"E",Ê:"E",Ë:"E",è:"e",é:"e",ê:"e",ë:"e",Ì:"I",Í:"I",Î:"I",Ï:"I",ì:"i",í:"i",î:"i",ï:"i",Ñ:"N",ñ:"n",Ò:"O",Ó:"O",Ô:"O",Õ:"O",Ö:"O",Ø:"O",ò:"o",ó:"o",ô:"o",õ:"o",ö:"o",ø:"o",Ù:"U",Ú:"U",Û:"U",Ü:"U",ù:"u",ú:"u",û:"u",ü:"u",Ý:"Y",ý:"y",ÿ:"y",Æ:"Ae",æ:"ae",Þ:"Th",þ:"th",ß:"ss",Ā:"A",Ă:"A",Ą:"A",ā:"a",ă:"a",ą:"a",Ć:"C",Ĉ:"C",Ċ:"C",Č:"C",ć:"c",ĉ:"c",ċ:"c",č:"c",Ď:"D",Đ:"D",ď:"d",đ:"d",Ē:"E",Ĕ:"E",Ė:"E",Ę:"E",Ě:"E",ē:"e",ĕ:"e",ė:"e",ę:"e",ě:"e",Ĝ:"G",Ğ:"G",Ġ:"G",Ģ:"G",ĝ:"g",ğ:"g",ġ:"g",ģ:"g",Ĥ:"H",Ħ:"H",ĥ:"h",ħ:"h",Ĩ:"I",Ī:"I",Ĭ:"I",Į:"I",İ:"I",ĩ:"i",ī:"i",ĭ:"i",į:"i",ı:"i",Ĵ:"J",ĵ:"j",Ķ:"K",ķ:"k",ĸ:"k",Ĺ:"L",Ļ:"L",Ľ:"L",Ŀ:"L",Ł:"L",ĺ:"l",ļ:"l",ľ:"l",ŀ:"l",ł:"l",Ń:"N",Ņ:"N",Ň:"N",Ŋ:"N",ń:"n",ņ:"n",ň:"n",ŋ:"n",Ō:"O",Ŏ:"O",Ő:"O",ō:"o",ŏ:"o",ő:"o",Ŕ:"R",Ŗ:"R",Ř:"R",ŕ:"r",ŗ:"r",ř:"r",Ś:"S",Ŝ:"S",Ş:"S",Š:"S",ś:"s",ŝ:"s",ş:"s",š:"s",Ţ:"T",Ť:"T",Ŧ:"T",ţ:"t",ť:"t",ŧ:"t",Ũ:"U",Ū:"U",Ŭ:"U",Ů:"U",Ű:"U",Ų:"U",ũ:"u",ū:"u",ŭ:"u",ů:"u",ű:"u",ų:"u",Ŵ:"W",ŵ:"w",Ŷ:"Y",ŷ:"y",Ÿ:"Y",Ź:"Z",Ż:"Z",Ž:"Z",ź:"z",ż:"z",ž:"z",Ĳ:"IJ",ĳ:"ij",Œ:"Oe",œ:"oe",ŉ:"'n",ſ:"s"});t.exports=n},3243(t,e,r){var n=r(6110),o=function(){try{var t=n(Object,"defineProperty");return t({},"",{}),t}catch(t){}}();t.exports=o},5911(t,e,r){var n=r(8859),o=r(4248),i=r(9219);t.exports=function equalArrays(t,e,r,a,s,u){var c=1&r,l=t.length,f=e.length;if(l!=f&&!(c&&f>l))return!1;var p=u.get(t),h=u.get(e);if(p&&h)return p==e&&h==t;var d=-1,y=!0,_=2&r?new n:void 0;for(u.set(t,e),u.set(e,t);++d<l;){var g=t[d],m=e[d];if(a)var v=c?a(m,g,d,e,t,u):a(g,m,d,t,e,u);if(void 0!==v){if(v)continue;y=!1;break}if(_){if(!o(e,(function(t,e){if(!i(_,e)&&(g===t||s(g,t,r,a,u)))return _.push(e)}))){y=!1;break}}else if(g!==m&&!s(g,m,r,a,u)){y=!1;break}}return u.delete(t),u.delete(e),y}},1986(t,e,r){var n=r(1873),o=r(7828),i=r(5288),a=r(5911),s=r(317),u=r(4247),c=n?n.prototype:void 0,l=c?c.valueOf:void 0;t.exports=function equalByTag(t,e,r,n,c,f,p){switch(r){case"[object DataView]":if(t.byteLength!=e.byteLength||t.byteOffset!=e.byteOffset)return!1;t=t.buffer,e=e.buffer;case"[object ArrayBuffer]":return!(t.byteLength!=e.byteLength||!f(new o(t),new o(e)));case"[object Boolean]":case"[object Date]":case"[object Number]":return i(+t,+e);case"[object Error]":return t.name==e.name&&t.message==e.message;case"[object RegExp]":case"[object String]":return t==e+"";case"[object Map]":var h=s;case"[object Set]":var d=1&n;if(h||(h=u),t.size!=e.size&&!d)return!1;var y=p.get(t);if(y)return y==e;n|=2,p.set(t,e);var _=a(h(t),h(e),n,c,f,p);return p.delete(t),_;case"[object Symbol]":if(l)return l.call(t)==l.call(e)}return!1}},689(t,e,r){var n=r(2),o=Object.prototype.hasOwnProperty;t.exports=function equalObjects(t,e,r,i,a,s){var u=1&r,c=n(t),l=c.length;if(l!=n(e).length&&!u)return!1;for(var f=l;f--;){var p=c[f];if(!(u?p in e:o.call(e,p)))return!1}var h=s.get(t),d=s.get(e);if(h&&d)return h==e&&d==t;var y=!0;s.set(t,e),s.set(e,t);for(var _=u;++f<l;){var g=t[p=c[f]],m=e[p];if(i)var v=u?i(m,g,p,e,t,s):i(g,m,p,t,e,s);if(!(void 0===v?g===m||a(g,m,r,i,s):v)){y=!1;break}_||(_="constructor"==p)}if(y&&!_){var b=t.constructor,w=e.constructor;b==w||!("constructor"in t)||!("constructor"in e)||"function"==typeof b&&b instanceof b&&"function"==typeof w&&w instanceof w||(y=!1)}return s.delete(t),s.delete(e),y}},4840(t,e,r){var n="object"==typeof r.g&&r.g&&r.g.Object===Object&&r.g;t.exports=n},2(t,e,r){var n=r(2199),o=r(4664),i=r(5950);t.exports=function getAllKeys(t){return n(t,i,o)}},2651(t,e,r){var n=r(4218);t.exports=function getMapData(t,e){var r=t.__data__;return n(e)?r["string"==typeof e?"string":"hash"]:r.map}},776(t,e,r){var n=r(756),o=r(5950);t.exports=function getMatchData(t){for(var e=o(t),r=e.length;r--;){var i=e[r],a=t[i];e[r]=[i,a,n(a)]}return e}},6110(t,e,r){var n=r(5083),o=r(392);t.exports=function getNative(t,e){var r=o(t,e);return n(r)?r:void 0}},659(t,e,r){var n=r(1873),o=Object.prototype,i=o.hasOwnProperty,a=o.toString,s=n?n.toStringTag:void 0;t.exports=function getRawTag(t){var e=i.call(t,s),r=t[s];try{t[s]=void 0;var n=!0}catch(t){}var o=a.call(t);return n&&(e?t[s]=r:delete t[s]),o}},4664(t,e,r){var n=r(9770),o=r(3345),i=Object.prototype.propertyIsEnumerable,a=Object.getOwnPropertySymbols,s=a?function(t){return null==t?[]:(t=Object(t),n(a(t),(function(e){return i.call(t,e)})))}:o;t.exports=s},5861(t,e,r){var n=r(5580),o=r(8223),i=r(2804),a=r(6545),s=r(8303),u=r(2552),c=r(7473),l="[object Map]",f="[object Promise]",p="[object Set]",h="[object WeakMap]",d="[object DataView]",y=c(n),_=c(o),g=c(i),m=c(a),v=c(s),b=u;(n&&b(new n(new ArrayBuffer(1)))!=d||o&&b(new o)!=l||i&&b(i.resolve())!=f||a&&b(new a)!=p||s&&b(new s)!=h)&&(b=function(t){var e=u(t),r="[object Object]"==e?t.constructor:void 0,n=r?c(r):"";if(n)switch(n){case y:return d;case _:return l;case g:return f;case m:return p;case v:return h}return e}),t.exports=b},392(t){t.exports=function getValue(t,e){return null==t?void 0:t[e]}},9326(t,e,r){var n=r(1769),o=r(2428),i=r(6449),a=r(361),s=r(294),u=r(7797);t.exports=function hasPath(t,e,r){for(var c=-1,l=(e=n(e,t)).length,f=!1;++c<l;){var p=u(e[c]);if(!(f=null!=t&&r(t,p)))break;t=t[p]}return f||++c!=l?f:!!(l=null==t?0:t.length)&&s(l)&&a(p,l)&&(i(t)||o(t))}},9698(t){var e=RegExp("[\\u200d\\ud800-\\udfff\\u0300-\\u036f\\ufe20-\\ufe2f\\u20d0-\\u20ff\\ufe0e\\ufe0f]");t.exports=function hasUnicode(t){return e.test(t)}},5434(t){var e=/[a-z][A-Z]|[A-Z]{2}[a-z]|[0-9][a-zA-Z]|[a-zA-Z][0-9]|[^a-zA-Z0-9 ]/;t.exports=function hasUnicodeWord(t){return e.test(t)}},2032(t,e,r){var n=r(1042);t.exports=function hashClear(){this.__data__=n?n(null):{},this.size=0}},3862(t){t.exports=function hashDelete(t){var e=this.has(t)&&delete this.__data__[t];return this.size-=e?1:0,e}},6721(t,e,r){var n=r(1042),o=Object.prototype.hasOwnProperty;t.exports=function hashGet(t){var e=this.__data__;if(n){var r=e[t];return"__lodash_hash_undefined__"===r?void 0:r}return o.call(e,t)?e[t]:void 0}},2749(t,e,r){var n=r(1042),o=Object.prototype.hasOwnProperty;t.exports=function hashHas(t){var e=this.__data__;return n?void 0!==e[t]:o.call(e,t)}},5749(t,e,r){var n=r(1042);t.exports=function hashSet(t,e){var r=this.__data__;return this.size+=this.has(t)?0:1,r[t]=n&&void 0===e?"__lodash_hash_undefined__":e,this}},361(t){var e=/^(?:0|[1-9]\d*)$/;t.exports=function isIndex(t,r){var n=typeof t;return!!(r=null==r?9007199254740991:r)&&("number"==n||"symbol"!=n&&e.test(t))&&t>-1&&t%1==0&&t<r}},6800(t,e,r){var n=r(5288),o=r(4894),i=r(361),a=r(3805);t.exports=function isIterateeCall(t,e,r){if(!a(r))return!1;var s=typeof e;return!!("number"==s?o(r)&&i(e,r.length):"string"==s&&e in r)&&n(r[e],t)}},8586(t,e,r){var n=r(6449),o=r(4394),i=/\.|\[(?:[^[\]]*|(["'])(?:(?!\1)[^\\]|\\.)*?\1)\]/,a=/^\w*$/;t.exports=function isKey(t,e){if(n(t))return!1;var r=typeof t;return!("number"!=r&&"symbol"!=r&&"boolean"!=r&&null!=t&&!o(t))||(a.test(t)||!i.test(t)||null!=e&&t in Object(e))}},4218(t){t.exports=function isKeyable(t){var e=typeof t;return"string"==e||"number"==e||"symbol"==e||"boolean"==e?"__proto__"!==t:null===t}},7296(t,e,r){var n,o=r(5481),i=(n=/[^.]+$/.exec(o&&o.keys&&o.keys.IE_PROTO||""))?"Symbol(src)_1."+n:"";t.exports=function isMasked(t){return!!i&&i in t}},5527(t){var e=Object.prototype;t.exports=function isPrototype(t){var r=t&&t.constructor;return t===("function"==typeof r&&r.prototype||e)}},756(t,e,r){var n=r(3805);t.exports=function isStrictComparable(t){return t==t&&!n(t)}},3702(t){t.exports=function listCacheClear(){this.__data__=[],this.size=0}},80(t,e,r){var n=r(6025),o=Array.prototype.splice;t.exports=function listCacheDelete(t){var e=this.__data__,r=n(e,t);return!(r<0)&&(r==e.length-1?e.pop():o.call(e,r,1),--this.size,!0)}},4739(t,e,r){var n=r(6025);t.exports=function listCacheGet(t){var e=this.__data__,r=n(e,t);return r<0?void 0:e[r][1]}},8655(t,e,r){var n=r(6025);t.exports=function listCacheHas(t){return n(this.__data__,t)>-1}},1175(t,e,r){var n=r(6025);t.exports=function listCacheSet(t,e){var r=this.__data__,o=n(r,t);return o<0?(++this.size,r.push([t,e])):r[o][1]=e,this}},3040(t,e,r){var n=r(1549),o=r(79),i=r(8223);t.exports=function mapCacheClear(){this.size=0,this.__data__={hash:new n,map:new(i||o),string:new n}}},7670(t,e,r){var n=r(2651);t.exports=function mapCacheDelete(t){var e=n(this,t).delete(t);return this.size-=e?1:0,e}},289(t,e,r){var n=r(2651);t.exports=function mapCacheGet(t){return n(this,t).get(t)}},4509(t,e,r){var n=r(2651);t.exports=function mapCacheHas(t){return n(this,t).has(t)}},2949(t,e,r){var n=r(2651);t.exports=function mapCacheSet(t,e){var r=n(this,t),o=r.size;return r.set(t,e),this.size+=r.size==o?0:1,this}},317(t){t.exports=function mapToArray(t){var e=-1,r=Array(t.size);return t.forEach((function(t,n){r[++e]=[n,t]})),r}},7197(t){t.exports=function matchesStrictComparable(t,e){return function(r){return null!=r&&(r[t]===e&&(void 0!==e||t in Object(r)))}}},2224(t,e,r){var n=r(104);t.exports=function memoizeCapped(t){var e=n(t,(function(t){return 500===r.size&&r.clear(),t})),r=e.cache;return e}},1042(t,e,r){var n=r(6110)(Object,"create");t.exports=n},3650(t,e,r){var n=r(4335)(Object.keys,Object);t.exports=n},6009(t,e,r){t=r.nmd(t);var n=r(4840),o=e&&!e.nodeType&&e,i=o&&t&&!t.nodeType&&t,a=i&&i.exports===o&&n.process,s=function(){try{var t=i&&i.require&&i.require("util").types;return t||a&&a.binding&&a.binding("util")}catch(t){}}();t.exports=s},9350(t){var e=Object.prototype.toString;t.exports=function objectToString(t){return e.call(t)}},4335(t){t.exports=function overArg(t,e){return function(r){return t(e(r))}}},9325(t,e,r){var n=r(4840),o="object"==typeof self&&self&&self.Object===Object&&self,i=n||o||Function("return this")();t.exports=i},1380(t){t.exports=function setCacheAdd(t){return this.__data__.set(t,"__lodash_hash_undefined__"),this}},1459(t){t.exports=function setCacheHas(t){return this.__data__.has(t)}},4247(t){t.exports=function setToArray(t){var e=-1,r=Array(t.size);return t.forEach((function(t){r[++e]=t})),r}},1420(t,e,r){var n=r(79);t.exports=function stackClear(){this.__data__=new n,this.size=0}},938(t){t.exports=function stackDelete(t){var e=this.__data__,r=e.delete(t);return this.size=e.size,r}},3605(t){t.exports=function stackGet(t){return this.__data__.get(t)}},9817(t){t.exports=function stackHas(t){return this.__data__.has(t)}},945(t,e,r){var n=r(79),o=r(8223),i=r(3661);t.exports=function stackSet(t,e){var r=this.__data__;if(r instanceof n){var a=r.__data__;if(!o||a.length<199)return a.push([t,e]),this.size=++r.size,this;r=this.__data__=new i(a)}return r.set(t,e),this.size=r.size,this}},3912(t,e,r){var n=r(1074),o=r(9698),i=r(2054);t.exports=function stringToArray(t){return o(t)?i(t):n(t)}},1802(t,e,r){var n=r(2224),o=/[^.[\]]+|\[(?:(-?\d+(?:\.\d+)?)|(["'])((?:(?!\2)[^\\]|\\.)*?)\2)\]|(?=(?:\.|\[\])(?:\.|\[\]|$))/g,i=/\\(\\)?/g,a=n((function(t){var e=[];return 46===t.charCodeAt(0)&&e.push(""),t.replace(o,(function(t,r,n,o){e.push(n?o.replace(i,"$1"):r||t)})),e}));t.exports=a},7797(t,e,r){var n=r(4394);t.exports=function toKey(t){if("string"==typeof t||n(t))return t;var e=t+"";return"0"==e&&1/t==-1/0?"-0":e}},7473(t){var e=Function.prototype.toString;t.exports=function toSource(t){if(null!=t){try{return e.call(t)}catch(t){}try{return t+""}catch(t){}}return""}},1800(t){var e=/\s/;t.exports=function trimmedEndIndex(t){for(var r=t.length;r--&&e.test(t.charAt(r)););return r}},2054(t){var e="\\ud800-\\udfff",r="["+e+"]",n="[\\u0300-\\u036f\\ufe20-\\ufe2f\\u20d0-\\u20ff]",o="\\ud83c[\\udffb-\\udfff]",i="[^"+e+"]",a="(?:\\ud83c[\\udde6-\\uddff]){2}",s="[\\ud800-\\udbff][\\udc00-\\udfff]",u="(?:"+n+"|"+o+")"+"?",c="[\\ufe0e\\ufe0f]?",l=c+u+("(?:\\u200d(?:"+[i,a,s].join("|")+")"+c+u+")*"),f="(?:"+[i+n+"?",n,a,s,r].join("|")+")",p=RegExp(o+"(?="+o+")|"+f+l,"g");t.exports=function unicodeToArray(t){return t.match(p)||[]}},2225(t){var e="\\ud800-\\udfff",r="\\u2700-\\u27bf",n="a-z\\xdf-\\xf6\\xf8-\\xff",o="A-Z\\xc0-\\xd6\\xd8-\\xde",i="\\xac\\xb1\\xd7\\xf7\\x00-\\x2f\\x3a-\\x40\\x5b-\\x60\\x7b-\\xbf\\u2000-\\u206f \\t\\x0b\\f\\xa0\\ufeff\\n\\r\\u2028\\u2029\\u1680\\u180e\\u2000\\u2001\\u2002\\u2003\\u2004\\u2005\\u2006\\u2007\\u2008\\u2009\\u200a\\u202f\\u205f\\u3000",a="["+i+"]",s="\\d+",u="["+r+"]",c="["+n+"]",l="[^"+e+i+s+r+n+o+"]",f="(?:\\ud83c[\\udde6-\\uddff]){2}",p="[\\ud800-\\udbff][\\udc00-\\udfff]",h="["+o+"]",d="(?:"+c+"|"+l+")",y="(?:"+h+"|"+l+")",_="(?:['’](?:d|ll|m|re|s|t|ve))?",g="(?:['’](?:D|LL|M|RE|S|T|VE))?",m="(?:[\\u0300-\\u036f\\ufe20-\\ufe2f\\u20d0-\\u20ff]|\\ud83c[\\udffb-\\udfff])?",v="[\\ufe0e\\ufe0f]?",b=v+m+("(?:\\u200d(?:"+["[^"+e+"]",f,p].join("|")+")"+v+m+")*"),w="(?:"+[u,f,p].join("|")+")"+b,I=RegExp([h+"?"+c+"+"+_+"(?="+[a,h,"$"].join("|")+")",y+"+"+g+"(?="+[a,h+d,"$"].join("|")+")",h+"?"+d+"+"+_,h+"+"+g,"\\d*(?:1ST|2ND|3RD|(?![123])\\dTH)(?=\\b|[a-z_])","\\d*(?:1st|2nd|3rd|(?![123])\\dth)(?=\\b|[A-Z_])",s,w].join("|"),"g");t.exports=function unicodeWords(t){return t.match(I)||[]}},4058(t,e,r){var n=r(4792),o=r(5539)((function(t,e,r){return e=e.toLowerCase(),t+(r?n(e):e)}));t.exports=o},4792(t,e,r){var n=r(3222),o=r(5808);t.exports=function capitalize(t){return o(n(t).toLowerCase())}},828(t,e,r){var n=r(4647),o=r(3222),i=/[\xc0-\xd6\xd8-\xf6\xf8-\xff\u0100-\u017f]/g,a=RegExp("[\\u0300-\\u036f\\ufe20-\\ufe2f\\u20d0-\\u20ff]","g");t.exports=function deburr(t){return(t=o(t))&&t.replace(i,n).replace(a,"")}},5288(t){t.exports=function eq(t,e){return t===e||t!=t&&e!=e}},7309(t,e,r){var n=r(2006)(r(4713));t.exports=n},4713(t,e,r){var n=r(2523),o=r(5389),i=r(1489),a=Math.max;t.exports=function findIndex(t,e,r){var s=null==t?0:t.length;if(!s)return-1;var u=null==r?0:i(r);return u<0&&(u=a(s+u,0)),n(t,o(e,3),u)}},8156(t,e,r){var n=r(7422);t.exports=function get(t,e,r){var o=null==t?void 0:n(t,e);return void 0===o?r:o}},631(t,e,r){var n=r(8077),o=r(9326);t.exports=function hasIn(t,e){return null!=t&&o(t,e,n)}},3488(t){t.exports=function identity(t){return t}},2428(t,e,r){var n=r(7534),o=r(346),i=Object.prototype,a=i.hasOwnProperty,s=i.propertyIsEnumerable,u=n(function(){return arguments}())?n:function(t){return o(t)&&a.call(t,"callee")&&!s.call(t,"callee")};t.exports=u},6449(t){var e=Array.isArray;t.exports=e},4894(t,e,r){var n=r(1882),o=r(294);t.exports=function isArrayLike(t){return null!=t&&o(t.length)&&!n(t)}},3656(t,e,r){t=r.nmd(t);var n=r(9325),o=r(9935),i=e&&!e.nodeType&&e,a=i&&t&&!t.nodeType&&t,s=a&&a.exports===i?n.Buffer:void 0,u=(s?s.isBuffer:void 0)||o;t.exports=u},1882(t,e,r){var n=r(2552),o=r(3805);t.exports=function isFunction(t){if(!o(t))return!1;var e=n(t);return"[object Function]"==e||"[object GeneratorFunction]"==e||"[object AsyncFunction]"==e||"[object Proxy]"==e}},294(t){t.exports=function isLength(t){return"number"==typeof t&&t>-1&&t%1==0&&t<=9007199254740991}},3805(t){t.exports=function isObject(t){var e=typeof t;return null!=t&&("object"==e||"function"==e)}},346(t){t.exports=function isObjectLike(t){return null!=t&&"object"==typeof t}},4394(t,e,r){var n=r(2552),o=r(346);t.exports=function isSymbol(t){return"symbol"==typeof t||o(t)&&"[object Symbol]"==n(t)}},7167(t,e,r){var n=r(4901),o=r(7301),i=r(6009),a=i&&i.isTypedArray,s=a?o(a):n;t.exports=s},5950(t,e,r){var n=r(695),o=r(8984),i=r(4894);t.exports=function keys(t){return i(t)?n(t):o(t)}},104(t,e,r){var n=r(3661);function memoize(t,e){if("function"!=typeof t||null!=e&&"function"!=typeof e)throw new TypeError("Expected a function");var memoized=function(){var r=arguments,n=e?e.apply(this,r):r[0],o=memoized.cache;if(o.has(n))return o.get(n);var i=t.apply(this,r);return memoized.cache=o.set(n,i)||o,i};return memoized.cache=new(memoize.Cache||n),memoized}memoize.Cache=n,t.exports=memoize},583(t,e,r){var n=r(7237),o=r(7255),i=r(8586),a=r(7797);t.exports=function property(t){return i(t)?n(a(t)):o(t)}},2426(t,e,r){var n=r(4248),o=r(5389),i=r(916),a=r(6449),s=r(6800);t.exports=function some(t,e,r){var u=a(t)?n:i;return r&&s(t,e,r)&&(e=void 0),u(t,o(e,3))}},3345(t){t.exports=function stubArray(){return[]}},9935(t){t.exports=function stubFalse(){return!1}},7400(t,e,r){var n=r(9374),o=1/0;t.exports=function toFinite(t){return t?(t=n(t))===o||t===-1/0?17976931348623157e292*(t<0?-1:1):t==t?t:0:0===t?t:0}},1489(t,e,r){var n=r(7400);t.exports=function toInteger(t){var e=n(t),r=e%1;return e==e?r?e-r:e:0}},9374(t,e,r){var n=r(4128),o=r(3805),i=r(4394),a=/^[-+]0x[0-9a-f]+$/i,s=/^0b[01]+$/i,u=/^0o[0-7]+$/i,c=parseInt;t.exports=function toNumber(t){if("number"==typeof t)return t;if(i(t))return NaN;if(o(t)){var e="function"==typeof t.valueOf?t.valueOf():t;t=o(e)?e+"":e}if("string"!=typeof t)return 0===t?t:+t;t=n(t);var r=s.test(t);return r||u.test(t)?c(t.slice(2),r?2:8):a.test(t)?NaN:+t}},3222(t,e,r){var n=r(7556);t.exports=function toString(t){return null==t?"":n(t)}},5808(t,e,r){var n=r(2507)("toUpperCase");t.exports=n},6645(t,e,r){var n=r(1733),o=r(5434),i=r(3222),a=r(2225);t.exports=function words(t,e,r){return t=i(t),void 0===(e=r?void 0:e)?o(t)?a(t):n(t):t.match(e)||[]}},7248(t,e,r){var n=r(6547),o=r(1234);t.exports=function zipObject(t,e){return o(t||[],e||[],n)}},1514(t){"use strict";t.exports=Math.abs},8968(t){"use strict";t.exports=Math.floor},4459(t){"use strict";t.exports=Number.isNaN||function isNaN(t){return t!=t}},6188(t){"use strict";t.exports=Math.max},8002(t){"use strict";t.exports=Math.min},5880(t){"use strict";t.exports=Math.pow},414(t){"use strict";t.exports=Math.round},3093(t,e,r){"use strict";var n=r(4459);t.exports=function sign(t){return n(t)||0===t?t:t<0?-1:1}},6578(t){"use strict";t.exports=["Float16Array","Float32Array","Float64Array","Int8Array","Int16Array","Int32Array","Uint8Array","Uint8ClampedArray","Uint16Array","Uint32Array","BigInt64Array","BigUint64Array"]},5606(t){var e,r,n=t.exports={};function defaultSetTimout(){throw new Error("setTimeout has not been defined")}function defaultClearTimeout(){throw new Error("clearTimeout has not been defined")}function runTimeout(t){if(e===setTimeout)return setTimeout(t,0);if((e===defaultSetTimout||!e)&&setTimeout)return e=setTimeout,setTimeout(t,0);try{return e(t,0)}catch(r){try{return e.call(null,t,0)}catch(r){return e.call(this,t,0)}}}!function(){try{e="function"==typeof setTimeout?setTimeout:defaultSetTimout}catch(t){e=defaultSetTimout}try{r="function"==typeof clearTimeout?clearTimeout:defaultClearTimeout}catch(t){r=defaultClearTimeout}}();var o,i=[],a=!1,s=-1;function cleanUpNextTick(){a&&o&&(a=!1,o.length?i=o.concat(i):s=-1,i.length&&drainQueue())}function drainQueue(){if(!a){var t=runTimeout(cleanUpNextTick);a=!0;for(var e=i.length;e;){for(o=i,i=[];++s<e;)o&&o[s].run();s=-1,e=i.length}o=null,a=!1,function runClearTimeout(t){if(r===clearTimeout)return clearTimeout(t);if((r===defaultClearTimeout||!r)&&clearTimeout)return r=clearTimeout,clearTimeout(t);try{return r(t)}catch(e){try{return r.call(null,t)}catch(e){return r.call(this,t)}}}(t)}}function Item(t,e){this.fun=t,this.array=e}function noop(){}n.nextTick=function(t){var e=new Array(arguments.length-1);if(arguments.length>1)for(var r=1;r<arguments.length;r++)e[r-1]=arguments[r];i.push(new Item(t,e)),1!==i.length||a||runTimeout(drainQueue)},Item.prototype.run=function(){this.fun.apply(null,this.array)},n.title="browser",n.browser=!0,n.env={},n.argv=[],n.version="",n.versions={},n.on=noop,n.addListener=noop,n.once=noop,n.off=noop,n.removeListener=noop,n.removeAllListeners=noop,n.emit=noop,n.prependListener=noop,n.prependOnceListener=noop,n.listeners=function(t){return[]},n.binding=function(t){throw new Error("process.binding is not supported")},n.cwd=function(){return"/"},n.chdir=function(t){throw new Error("process.chdir is not supported")},n.umask=function(){return 0}},3209(t,e,r){"use strict";var n=r(5606),o=65536,i=4294967295;var a=r(2861).Buffer,s=r.g.crypto||r.g.msCrypto;s&&s.getRandomValues?t.exports=function randomBytes(t,e){if(t>i)throw new RangeError("requested too many random bytes");var r=a.allocUnsafe(t);if(t>0)if(t>o)for(var u=0;u<t;u+=o)s.getRandomValues(r.slice(u,u+o));else s.getRandomValues(r);if("function"==typeof e)return n.nextTick((function(){e(null,r)}));return r}:t.exports=function oldBrowser(){throw new Error("Secure random number generation is not supported by this browser.\nUse Chrome, Firefox or Internet Explorer 11")}},5287(t,e){"use strict";var r=Symbol.for("react.element"),n=Symbol.for("react.portal"),o=Symbol.for("react.fragment"),i=Symbol.for("react.strict_mode"),a=Symbol.for("react.profiler"),s=Symbol.for("react.provider"),u=Symbol.for("react.context"),c=Symbol.for("react.forward_ref"),l=Symbol.for("react.suspense"),f=Symbol.for("react.memo"),p=Symbol.for("react.lazy"),h=Symbol.iterator;var d={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},y=Object.assign,_={};function E(t,e,r){this.props=t,this.context=e,this.refs=_,this.updater=r||d}function F(){}function G(t,e,r){this.props=t,this.context=e,this.refs=_,this.updater=r||d}E.prototype.isReactComponent={},E.prototype.setState=function(t,e){if("object"!=typeof t&&"function"!=typeof t&&null!=t)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,t,e,"setState")},E.prototype.forceUpdate=function(t){this.updater.enqueueForceUpdate(this,t,"forceUpdate")},F.prototype=E.prototype;var g=G.prototype=new F;g.constructor=G,y(g,E.prototype),g.isPureReactComponent=!0;var m=Array.isArray,v=Object.prototype.hasOwnProperty,b={current:null},w={key:!0,ref:!0,__self:!0,__source:!0};function M(t,e,n){var o,i={},a=null,s=null;if(null!=e)for(o in void 0!==e.ref&&(s=e.ref),void 0!==e.key&&(a=""+e.key),e)v.call(e,o)&&!w.hasOwnProperty(o)&&(i[o]=e[o]);var u=arguments.length-2;if(1===u)i.children=n;else if(1<u){for(var c=Array(u),l=0;l<u;l++)c[l]=arguments[l+2];i.children=c}if(t&&t.defaultProps)for(o in u=t.defaultProps)void 0===i[o]&&(i[o]=u[o]);return{$$typeof:r,type:t,key:a,ref:s,props:i,_owner:b.current}}function O(t){return"object"==typeof t&&null!==t&&t.$$typeof===r}var I=/\/+/g;function Q(t,e){return"object"==typeof t&&null!==t&&null!=t.key?function escape(t){var e={"=":"=0",":":"=2"};return"$"+t.replace(/[=:]/g,(function(t){return e[t]}))}(""+t.key):e.toString(36)}function R(t,e,o,i,a){var s=typeof t;"undefined"!==s&&"boolean"!==s||(t=null);var u=!1;if(null===t)u=!0;else switch(s){case"string":case"number":u=!0;break;case"object":switch(t.$$typeof){case r:case n:u=!0}}if(u)return a=a(u=t),t=""===i?"."+Q(u,0):i,m(a)?(o="",null!=t&&(o=t.replace(I,"$&/")+"/"),R(a,e,o,"",(function(t){return t}))):null!=a&&(O(a)&&(a=function N(t,e){return{$$typeof:r,type:t.type,key:e,ref:t.ref,props:t.props,_owner:t._owner}}(a,o+(!a.key||u&&u.key===a.key?"":(""+a.key).replace(I,"$&/")+"/")+t)),e.push(a)),1;if(u=0,i=""===i?".":i+":",m(t))for(var c=0;c<t.length;c++){var l=i+Q(s=t[c],c);u+=R(s,e,o,l,a)}else if(l=function A(t){return null===t||"object"!=typeof t?null:"function"==typeof(t=h&&t[h]||t["@@iterator"])?t:null}(t),"function"==typeof l)for(t=l.call(t),c=0;!(s=t.next()).done;)u+=R(s=s.value,e,o,l=i+Q(s,c++),a);else if("object"===s)throw e=String(t),Error("Objects are not valid as a React child (found: "+("[object Object]"===e?"object with keys {"+Object.keys(t).join(", ")+"}":e)+"). If you meant to render a collection of children, use an array instead.");return u}function S(t,e,r){if(null==t)return t;var n=[],o=0;return R(t,n,"","",(function(t){return e.call(r,t,o++)})),n}function T(t){if(-1===t._status){var e=t._result;(e=e()).then((function(e){0!==t._status&&-1!==t._status||(t._status=1,t._result=e)}),(function(e){0!==t._status&&-1!==t._status||(t._status=2,t._result=e)})),-1===t._status&&(t._status=0,t._result=e)}if(1===t._status)return t._result.default;throw t._result}var x={current:null},B={transition:null},k={ReactCurrentDispatcher:x,ReactCurrentBatchConfig:B,ReactCurrentOwner:b};function X(){throw Error("act(...) is not supported in production builds of React.")}e.Children={map:S,forEach:function(t,e,r){S(t,(function(){e.apply(this,arguments)}),r)},count:function(t){var e=0;return S(t,(function(){e++})),e},toArray:function(t){return S(t,(function(t){return t}))||[]},only:function(t){if(!O(t))throw Error("React.Children.only expected to receive a single React element child.");return t}},e.Component=E,e.Fragment=o,e.Profiler=a,e.PureComponent=G,e.StrictMode=i,e.Suspense=l,e.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=k,e.act=X,e.cloneElement=function(t,e,n){if(null==t)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+t+".");var o=y({},t.props),i=t.key,a=t.ref,s=t._owner;if(null!=e){if(void 0!==e.ref&&(a=e.ref,s=b.current),void 0!==e.key&&(i=""+e.key),t.type&&t.type.defaultProps)var u=t.type.defaultProps;for(c in e)v.call(e,c)&&!w.hasOwnProperty(c)&&(o[c]=void 0===e[c]&&void 0!==u?u[c]:e[c])}var c=arguments.length-2;if(1===c)o.children=n;else if(1<c){u=Array(c);for(var l=0;l<c;l++)u[l]=arguments[l+2];o.children=u}return{$$typeof:r,type:t.type,key:i,ref:a,props:o,_owner:s}},e.createContext=function(t){return(t={$$typeof:u,_currentValue:t,_currentValue2:t,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null}).Provider={$$typeof:s,_context:t},t.Consumer=t},e.createElement=M,e.createFactory=function(t){var e=M.bind(null,t);return e.type=t,e},e.createRef=function(){return{current:null}},e.forwardRef=function(t){return{$$typeof:c,render:t}},e.isValidElement=O,e.lazy=function(t){return{$$typeof:p,_payload:{_status:-1,_result:t},_init:T}},e.memo=function(t,e){return{$$typeof:f,type:t,compare:void 0===e?null:e}},e.startTransition=function(t){var e=B.transition;B.transition={};try{t()}finally{B.transition=e}},e.unstable_act=X,e.useCallback=function(t,e){return x.current.useCallback(t,e)},e.useContext=function(t){return x.current.useContext(t)},e.useDebugValue=function(){},e.useDeferredValue=function(t){return x.current.useDeferredValue(t)},e.useEffect=function(t,e){return x.current.useEffect(t,e)},e.useId=function(){return x.current.useId()},e.useImperativeHandle=function(t,e,r){return x.current.useImperativeHandle(t,e,r)},e.useInsertionEffect=function(t,e){return x.current.useInsertionEffect(t,e)},e.useLayoutEffect=function(t,e){return x.current.useLayoutEffect(t,e)},e.useMemo=function(t,e){return x.current.useMemo(t,e)},e.useReducer=function(t,e,r){return x.current.useReducer(t,e,r)},e.useRef=function(t){return x.current.useRef(t)},e.useState=function(t){return x.current.useState(t)},e.useSyncExternalStore=function(t,e,r){return x.current.useSyncExternalStore(t,e,r)},e.useTransition=function(){return x.current.useTransition()},e.version="18.3.1"},6540(t,e,r){"use strict";t.exports=r(5287)},2861(t,e,r){var n=r(8287),o=n.Buffer;function copyProps(t,e){for(var r in t)e[r]=t[r]}function SafeBuffer(t,e,r){return o(t,e,r)}o.from&&o.alloc&&o.allocUnsafe&&o.allocUnsafeSlow?t.exports=n:(copyProps(n,e),e.Buffer=SafeBuffer),SafeBuffer.prototype=Object.create(o.prototype),copyProps(o,SafeBuffer),SafeBuffer.from=function(t,e,r){if("number"==typeof t)throw new TypeError("Argument must not be a number");return o(t,e,r)},SafeBuffer.alloc=function(t,e,r){if("number"!=typeof t)throw new TypeError("Argument must be a number");var n=o(t);return void 0!==e?"string"==typeof r?n.fill(e,r):n.fill(e):n.fill(0),n},SafeBuffer.allocUnsafe=function(t){if("number"!=typeof t)throw new TypeError("Argument must be a number");return o(t)},SafeBuffer.allocUnsafeSlow=function(t){if("number"!=typeof t)throw new TypeError("Argument must be a number");return n.SlowBuffer(t)}},6897(t,e,r){"use strict";var n=r(453),o=r(41),i=r(592)(),a=r(5795),s=r(9675),u=n("%Math.floor%");t.exports=function setFunctionLength(t,e){if("function"!=typeof t)throw new s("`fn` is not a function");if("number"!=typeof e||e<0||e>4294967295||u(e)!==e)throw new s("`length` must be a positive 32-bit integer");var r=arguments.length>2&&!!arguments[2],n=!0,c=!0;if("length"in t&&a){var l=a(t,"length");l&&!l.configurable&&(n=!1),l&&!l.writable&&(c=!1)}return(n||c||!r)&&(i?o(t,"length",e,!0,!0):o(t,"length",e)),t}},8011(t,e,r){"use strict";var n=r(2861).Buffer,o=r(5377);function Hash(t,e){this._block=n.alloc(t),this._finalSize=e,this._blockSize=t,this._len=0}Hash.prototype.update=function(t,e){t=o(t,e||"utf8");for(var r=this._block,n=this._blockSize,i=t.length,a=this._len,s=0;s<i;){for(var u=a%n,c=Math.min(i-s,n-u),l=0;l<c;l++)r[u+l]=t[s+l];s+=c,(a+=c)%n==0&&this._update(r)}return this._len+=i,this},Hash.prototype.digest=function(t){var e=this._len%this._blockSize;this._block[e]=128,this._block.fill(0,e+1),e>=this._finalSize&&(this._update(this._block),this._block.fill(0));var r=8*this._len;if(r<=4294967295)this._block.writeUInt32BE(r,this._blockSize-4);else{var n=(4294967295&r)>>>0,o=(r-n)/4294967296;this._block.writeUInt32BE(o,this._blockSize-8),this._block.writeUInt32BE(n,this._blockSize-4)}this._update(this._block);var i=this._hash();return t?i.toString(t):i},Hash.prototype._update=function(){throw new Error("_update must be implemented by subclass")},t.exports=Hash},2802(t,e,r){"use strict";t.exports=function SHA(e){var r=e.toLowerCase(),n=t.exports[r];if(!n)throw new Error(r+" is not supported (we accept pull requests)");return new n},t.exports.sha=r(7816),t.exports.sha1=r(3737),t.exports.sha224=r(6710),t.exports.sha256=r(4107),t.exports.sha384=r(2827),t.exports.sha512=r(2890)},7816(t,e,r){"use strict";var n=r(6698),o=r(8011),i=r(2861).Buffer,a=[1518500249,1859775393,-1894007588,-899497514],s=new Array(80);function Sha(){this.init(),this._w=s,o.call(this,64,56)}function rotl30(t){return t<<30|t>>>2}function ft(t,e,r,n){return 0===t?e&r|~e&n:2===t?e&r|e&n|r&n:e^r^n}n(Sha,o),Sha.prototype.init=function(){return this._a=1732584193,this._b=4023233417,this._c=2562383102,this._d=271733878,this._e=3285377520,this},Sha.prototype._update=function(t){for(var e,r=this._w,n=0|this._a,o=0|this._b,i=0|this._c,s=0|this._d,u=0|this._e,c=0;c<16;++c)r[c]=t.readInt32BE(4*c);for(;c<80;++c)r[c]=r[c-3]^r[c-8]^r[c-14]^r[c-16];for(var l=0;l<80;++l){var f=~~(l/20),p=0|((e=n)<<5|e>>>27)+ft(f,o,i,s)+u+r[l]+a[f];u=s,s=i,i=rotl30(o),o=n,n=p}this._a=n+this._a|0,this._b=o+this._b|0,this._c=i+this._c|0,this._d=s+this._d|0,this._e=u+this._e|0},Sha.prototype._hash=function(){var t=i.allocUnsafe(20);return t.writeInt32BE(0|this._a,0),t.writeInt32BE(0|this._b,4),t.writeInt32BE(0|this._c,8),t.writeInt32BE(0|this._d,12),t.writeInt32BE(0|this._e,16),t},t.exports=Sha},3737(t,e,r){"use strict";var n=r(6698),o=r(8011),i=r(2861).Buffer,a=[1518500249,1859775393,-1894007588,-899497514],s=new Array(80);function Sha1(){this.init(),this._w=s,o.call(this,64,56)}function rotl5(t){return t<<5|t>>>27}function rotl30(t){return t<<30|t>>>2}function ft(t,e,r,n){return 0===t?e&r|~e&n:2===t?e&r|e&n|r&n:e^r^n}n(Sha1,o),Sha1.prototype.init=function(){return this._a=1732584193,this._b=4023233417,this._c=2562383102,this._d=271733878,this._e=3285377520,this},Sha1.prototype._update=function(t){for(var e,r=this._w,n=0|this._a,o=0|this._b,i=0|this._c,s=0|this._d,u=0|this._e,c=0;c<16;++c)r[c]=t.readInt32BE(4*c);for(;c<80;++c)r[c]=(e=r[c-3]^r[c-8]^r[c-14]^r[c-16])<<1|e>>>31;for(var l=0;l<80;++l){var f=~~(l/20),p=rotl5(n)+ft(f,o,i,s)+u+r[l]+a[f]|0;u=s,s=i,i=rotl30(o),o=n,n=p}this._a=n+this._a|0,this._b=o+this._b|0,this._c=i+this._c|0,this._d=s+this._d|0,this._e=u+this._e|0},Sha1.prototype._hash=function(){var t=i.allocUnsafe(20);return t.writeInt32BE(0|this._a,0),t.writeInt32BE(0|this._b,4),t.writeInt32BE(0|this._c,8),t.writeInt32BE(0|this._d,12),t.writeInt32BE(0|this._e,16),t},t.exports=Sha1},6710(t,e,r){"use strict";var n=r(6698),o=r(4107),i=r(8011),a=r(2861).Buffer,s=new Array(64);function Sha224(){this.init(),this._w=s,i.call(this,64,56)}n(Sha224,o),Sha224.prototype.init=function(){return this._a=3238371032,this._b=914150663,this._c=812702999,this._d=4144912697,this._e=4290775857,this._f=1750603025,this._g=1694076839,this._h=3204075428,this},Sha224.prototype._hash=function(){var t=a.allocUnsafe(28);return t.writeInt32BE(this._a,0),t.writeInt32BE(this._b,4),t.writeInt32BE(this._c,8),t.writeInt32BE(this._d,12),t.writeInt32BE(this._e,16),t.writeInt32BE(this._f,20),t.writeInt32BE(this._g,24),t},t.exports=Sha224},4107(t,e,r){"use strict";var n=r(6698),o=r(8011),i=r(2861).Buffer,a=[1116352408,1899447441,3049323471,3921009573,961987163,1508970993,2453635748,2870763221,3624381080,310598401,607225278,1426881987,1925078388,2162078206,2614888103,3248222580,3835390401,4022224774,264347078,604807628,770255983,1249150122,1555081692,1996064986,2554220882,2821834349,2952996808,3210313671,3336571891,3584528711,113926993,338241895,666307205,773529912,1294757372,1396182291,1695183700,1986661051,2177026350,2456956037,2730485921,2820302411,3259730800,3345764771,3516065817,3600352804,4094571909,275423344,430227734,506948616,659060556,883997877,958139571,1322822218,1537002063,1747873779,1955562222,2024104815,2227730452,2361852424,2428436474,2756734187,3204031479,3329325298],s=new Array(64);function Sha256(){this.init(),this._w=s,o.call(this,64,56)}function ch(t,e,r){return r^t&(e^r)}function maj(t,e,r){return t&e|r&(t|e)}function sigma0(t){return(t>>>2|t<<30)^(t>>>13|t<<19)^(t>>>22|t<<10)}function sigma1(t){return(t>>>6|t<<26)^(t>>>11|t<<21)^(t>>>25|t<<7)}function gamma0(t){return(t>>>7|t<<25)^(t>>>18|t<<14)^t>>>3}n(Sha256,o),Sha256.prototype.init=function(){return this._a=1779033703,this._b=3144134277,this._c=1013904242,this._d=2773480762,this._e=1359893119,this._f=2600822924,this._g=528734635,this._h=1541459225,this},Sha256.prototype._update=function(t){for(var e,r=this._w,n=0|this._a,o=0|this._b,i=0|this._c,s=0|this._d,u=0|this._e,c=0|this._f,l=0|this._g,f=0|this._h,p=0;p<16;++p)r[p]=t.readInt32BE(4*p);for(;p<64;++p)r[p]=0|(((e=r[p-2])>>>17|e<<15)^(e>>>19|e<<13)^e>>>10)+r[p-7]+gamma0(r[p-15])+r[p-16];for(var h=0;h<64;++h){var d=f+sigma1(u)+ch(u,c,l)+a[h]+r[h]|0,y=sigma0(n)+maj(n,o,i)|0;f=l,l=c,c=u,u=s+d|0,s=i,i=o,o=n,n=d+y|0}this._a=n+this._a|0,this._b=o+this._b|0,this._c=i+this._c|0,this._d=s+this._d|0,this._e=u+this._e|0,this._f=c+this._f|0,this._g=l+this._g|0,this._h=f+this._h|0},Sha256.prototype._hash=function(){var t=i.allocUnsafe(32);return t.writeInt32BE(this._a,0),t.writeInt32BE(this._b,4),t.writeInt32BE(this._c,8),t.writeInt32BE(this._d,12),t.writeInt32BE(this._e,16),t.writeInt32BE(this._f,20),t.writeInt32BE(this._g,24),t.writeInt32BE(this._h,28),t},t.exports=Sha256},2827(t,e,r){"use strict";var n=r(6698),o=r(2890),i=r(8011),a=r(2861).Buffer,s=new Array(160);function Sha384(){this.init(),this._w=s,i.call(this,128,112)}n(Sha384,o),Sha384.prototype.init=function(){return this._ah=3418070365,this._bh=1654270250,this._ch=2438529370,this._dh=355462360,this._eh=1731405415,this._fh=2394180231,this._gh=3675008525,this._hh=1203062813,this._al=3238371032,this._bl=914150663,this._cl=812702999,this._dl=4144912697,this._el=4290775857,this._fl=1750603025,this._gl=1694076839,this._hl=3204075428,this},Sha384.prototype._hash=function(){var t=a.allocUnsafe(48);function writeInt64BE(e,r,n){t.writeInt32BE(e,n),t.writeInt32BE(r,n+4)}return writeInt64BE(this._ah,this._al,0),writeInt64BE(this._bh,this._bl,8),writeInt64BE(this._ch,this._cl,16),writeInt64BE(this._dh,this._dl,24),writeInt64BE(this._eh,this._el,32),writeInt64BE(this._fh,this._fl,40),t},t.exports=Sha384},2890(t,e,r){"use strict";var n=r(6698),o=r(8011),i=r(2861).Buffer,a=[1116352408,3609767458,1899447441,602891725,3049323471,3964484399,3921009573,2173295548,961987163,4081628472,1508970993,3053834265,2453635748,2937671579,2870763221,3664609560,3624381080,2734883394,310598401,1164996542,607225278,1323610764,1426881987,3590304994,1925078388,4068182383,2162078206,991336113,2614888103,633803317,3248222580,3479774868,3835390401,2666613458,4022224774,944711139,264347078,2341262773,604807628,2007800933,770255983,1495990901,1249150122,1856431235,1555081692,3175218132,1996064986,2198950837,2554220882,3999719339,2821834349,766784016,2952996808,2566594879,3210313671,3203337956,3336571891,1034457026,3584528711,2466948901,113926993,3758326383,338241895,168717936,666307205,1188179964,773529912,1546045734,1294757372,1522805485,1396182291,2643833823,1695183700,2343527390,1986661051,1014477480,2177026350,1206759142,2456956037,344077627,2730485921,1290863460,2820302411,3158454273,3259730800,3505952657,3345764771,106217008,3516065817,3606008344,3600352804,1432725776,4094571909,1467031594,275423344,851169720,430227734,3100823752,506948616,1363258195,659060556,3750685593,883997877,3785050280,958139571,3318307427,1322822218,3812723403,1537002063,2003034995,1747873779,3602036899,1955562222,1575990012,2024104815,1125592928,2227730452,2716904306,2361852424,442776044,2428436474,593698344,2756734187,3733110249,3204031479,2999351573,3329325298,3815920427,3391569614,3928383900,3515267271,566280711,3940187606,3454069534,4118630271,4000239992,116418474,1914138554,174292421,2731055270,289380356,3203993006,460393269,320620315,685471733,587496836,852142971,1086792851,1017036298,365543100,1126000580,2618297676,1288033470,3409855158,1501505948,4234509866,1607167915,987167468,1816402316,1246189591],s=new Array(160);function Sha512(){this.init(),this._w=s,o.call(this,128,112)}function Ch(t,e,r){return r^t&(e^r)}function maj(t,e,r){return t&e|r&(t|e)}function sigma0(t,e){return(t>>>28|e<<4)^(e>>>2|t<<30)^(e>>>7|t<<25)}function sigma1(t,e){return(t>>>14|e<<18)^(t>>>18|e<<14)^(e>>>9|t<<23)}function Gamma0(t,e){return(t>>>1|e<<31)^(t>>>8|e<<24)^t>>>7}function Gamma0l(t,e){return(t>>>1|e<<31)^(t>>>8|e<<24)^(t>>>7|e<<25)}function Gamma1(t,e){return(t>>>19|e<<13)^(e>>>29|t<<3)^t>>>6}function Gamma1l(t,e){return(t>>>19|e<<13)^(e>>>29|t<<3)^(t>>>6|e<<26)}function getCarry(t,e){return t>>>0<e>>>0?1:0}n(Sha512,o),Sha512.prototype.init=function(){return this._ah=1779033703,this._bh=3144134277,this._ch=1013904242,this._dh=2773480762,this._eh=1359893119,this._fh=2600822924,this._gh=528734635,this._hh=1541459225,this._al=4089235720,this._bl=2227873595,this._cl=4271175723,this._dl=1595750129,this._el=2917565137,this._fl=725511199,this._gl=4215389547,this._hl=327033209,this},Sha512.prototype._update=function(t){for(var e=this._w,r=0|this._ah,n=0|this._bh,o=0|this._ch,i=0|this._dh,s=0|this._eh,u=0|this._fh,c=0|this._gh,l=0|this._hh,f=0|this._al,p=0|this._bl,h=0|this._cl,d=0|this._dl,y=0|this._el,_=0|this._fl,g=0|this._gl,m=0|this._hl,v=0;v<32;v+=2)e[v]=t.readInt32BE(4*v),e[v+1]=t.readInt32BE(4*v+4);for(;v<160;v+=2){var b=e[v-30],w=e[v-30+1],I=Gamma0(b,w),x=Gamma0l(w,b),B=Gamma1(b=e[v-4],w=e[v-4+1]),k=Gamma1l(w,b),q=e[v-14],C=e[v-14+1],j=e[v-32],P=e[v-32+1],L=x+C|0,U=I+q+getCarry(L,x)|0;U=(U=U+B+getCarry(L=L+k|0,k)|0)+j+getCarry(L=L+P|0,P)|0,e[v]=U,e[v+1]=L}for(var z=0;z<160;z+=2){U=e[z],L=e[z+1];var D=maj(r,n,o),W=maj(f,p,h),K=sigma0(r,f),V=sigma0(f,r),$=sigma1(s,y),Y=sigma1(y,s),H=a[z],Z=a[z+1],J=Ch(s,u,c),tt=Ch(y,_,g),et=m+Y|0,rt=l+$+getCarry(et,m)|0;rt=(rt=(rt=rt+J+getCarry(et=et+tt|0,tt)|0)+H+getCarry(et=et+Z|0,Z)|0)+U+getCarry(et=et+L|0,L)|0;var nt=V+W|0,ot=K+D+getCarry(nt,V)|0;l=c,m=g,c=u,g=_,u=s,_=y,s=i+rt+getCarry(y=d+et|0,d)|0,i=o,d=h,o=n,h=p,n=r,p=f,r=rt+ot+getCarry(f=et+nt|0,et)|0}this._al=this._al+f|0,this._bl=this._bl+p|0,this._cl=this._cl+h|0,this._dl=this._dl+d|0,this._el=this._el+y|0,this._fl=this._fl+_|0,this._gl=this._gl+g|0,this._hl=this._hl+m|0,this._ah=this._ah+r+getCarry(this._al,f)|0,this._bh=this._bh+n+getCarry(this._bl,p)|0,this._ch=this._ch+o+getCarry(this._cl,h)|0,this._dh=this._dh+i+getCarry(this._dl,d)|0,this._eh=this._eh+s+getCarry(this._el,y)|0,this._fh=this._fh+u+getCarry(this._fl,_)|0,this._gh=this._gh+c+getCarry(this._gl,g)|0,this._hh=this._hh+l+getCarry(this._hl,m)|0},Sha512.prototype._hash=function(){var t=i.allocUnsafe(64);function writeInt64BE(e,r,n){t.writeInt32BE(e,n),t.writeInt32BE(r,n+4)}return writeInt64BE(this._ah,this._al,0),writeInt64BE(this._bh,this._bl,8),writeInt64BE(this._ch,this._cl,16),writeInt64BE(this._dh,this._dl,24),writeInt64BE(this._eh,this._el,32),writeInt64BE(this._fh,this._fl,40),writeInt64BE(this._gh,this._gl,48),writeInt64BE(this._hh,this._hl,56),t},t.exports=Sha512},5377(t,e,r){"use strict";var n=r(2861).Buffer,o=r(4634),i=r(4372),a=ArrayBuffer.isView||function isView(t){try{return i(t),!0}catch(t){return!1}},s="undefined"!=typeof Uint8Array,u="undefined"!=typeof ArrayBuffer&&"undefined"!=typeof Uint8Array,c=u&&(n.prototype instanceof Uint8Array||n.TYPED_ARRAY_SUPPORT);t.exports=function toBuffer(t,e){if(t instanceof n)return t;if("string"==typeof t)return n.from(t,e);if(u&&a(t)){if(0===t.byteLength)return n.alloc(0);if(c){var r=n.from(t.buffer,t.byteOffset,t.byteLength);if(r.byteLength===t.byteLength)return r}var i=t instanceof Uint8Array?t:new Uint8Array(t.buffer,t.byteOffset,t.byteLength),l=n.from(i);if(l.length===t.byteLength)return l}if(s&&t instanceof Uint8Array)return n.from(t);var f=o(t);if(f)for(var p=0;p<t.length;p+=1){var h=t[p];if("number"!=typeof h||h<0||h>255||~~h!==h)throw new RangeError("Array items must be numbers in the range 0-255.")}if(f||n.isBuffer(t)&&t.constructor&&"function"==typeof t.constructor.isBuffer&&t.constructor.isBuffer(t))return n.from(t);throw new TypeError('The "data" argument must be a string, an Array, a Buffer, a Uint8Array, or a DataView.')}},4372(t,e,r){"use strict";var n=r(9675),o=r(6556)("TypedArray.prototype.buffer",!0),i=r(5680);t.exports=o||function typedArrayBuffer(t){if(!i(t))throw new n("Not a Typed Array");return t.buffer}},5767(t,e,r){"use strict";var n=r(2682),o=r(9209),i=r(487),a=r(6556),s=r(5795),u=a("Object.prototype.toString"),c=r(9092)(),l="undefined"==typeof globalThis?r.g:globalThis,f=o(),p=a("String.prototype.slice"),h=Object.getPrototypeOf,d=a("Array.prototype.indexOf",!0)||function indexOf(t,e){for(var r=0;r<t.length;r+=1)if(t[r]===e)return r;return-1},y={__proto__:null};n(f,c&&s&&h?function(t){var e=new l[t];if(Symbol.toStringTag in e){var r=h(e),n=s(r,Symbol.toStringTag);if(!n){var o=h(r);n=s(o,Symbol.toStringTag)}y["$"+t]=i(n.get)}}:function(t){var e=new l[t],r=e.slice||e.set;r&&(y["$"+t]=i(r))});t.exports=function whichTypedArray(t){if(!t||"object"!=typeof t)return!1;if(!c){var e=p(u(t),8,-1);return d(f,e)>-1?e:"Object"===e&&function tryAllSlices(t){var e=!1;return n(y,(function(r,n){if(!e)try{r(t),e=p(n,1)}catch(t){}})),e}(t)}return s?function tryAllTypedArrays(t){var e=!1;return n(y,(function(r,n){if(!e)try{"$"+r(t)===n&&(e=p(n,1))}catch(t){}})),e}(t):null}},7666(t,e,r){var n=r(4851),o=r(953);function _extends(){var e;return t.exports=_extends=n?o(e=n).call(e):function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)({}).hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},t.exports.__esModule=!0,t.exports.default=t.exports,_extends.apply(null,arguments)}t.exports=_extends,t.exports.__esModule=!0,t.exports.default=t.exports},9209(t,e,r){"use strict";var n=r(6578),o="undefined"==typeof globalThis?r.g:globalThis;t.exports=function availableTypedArrays(){for(var t=[],e=0;e<n.length;e++)"function"==typeof o[n[e]]&&(t[t.length]=n[e]);return t}},3700(t,e,r){"use strict";var n=r(9709);t.exports=n},462(t,e,r){"use strict";var n=r(975);t.exports=n},2567(t,e,r){"use strict";r(9307);var n=r(1747);t.exports=n("Function","bind")},3034(t,e,r){"use strict";var n=r(8280),o=r(2567),i=Function.prototype;t.exports=function(t){var e=t.bind;return t===i||n(i,t)&&e===i.bind?o:e}},9748(t,e,r){"use strict";r(1340);var n=r(2046);t.exports=n.Object.assign},953(t,e,r){"use strict";t.exports=r(3375)},4851(t,e,r){"use strict";t.exports=r(5401)},3375(t,e,r){"use strict";var n=r(3700);t.exports=n},5401(t,e,r){"use strict";var n=r(462);t.exports=n},2159(t,e,r){"use strict";var n=r(2250),o=r(4640),i=TypeError;t.exports=function(t){if(n(t))return t;throw new i(o(t)+" is not a function")}},6624(t,e,r){"use strict";var n=r(6285),o=String,i=TypeError;t.exports=function(t){if(n(t))return t;throw new i(o(t)+" is not an object")}},4436(t,e,r){"use strict";var n=r(7374),o=r(4849),i=r(575),createMethod=function(t){return function(e,r,a){var s=n(e),u=i(s);if(0===u)return!t&&-1;var c,l=o(a,u);if(t&&r!=r){for(;u>l;)if((c=s[l++])!=c)return!0}else for(;u>l;l++)if((t||l in s)&&s[l]===r)return t||l||0;return!t&&-1}};t.exports={includes:createMethod(!0),indexOf:createMethod(!1)}},3427(t,e,r){"use strict";var n=r(1907);t.exports=n([].slice)},5807(t,e,r){"use strict";var n=r(1907),o=n({}.toString),i=n("".slice);t.exports=function(t){return i(o(t),8,-1)}},1626(t,e,r){"use strict";var n=r(9447),o=r(4284),i=r(5817);t.exports=n?function(t,e,r){return o.f(t,e,i(1,r))}:function(t,e,r){return t[e]=r,t}},5817(t){"use strict";t.exports=function(t,e){return{enumerable:!(1&t),configurable:!(2&t),writable:!(4&t),value:e}}},2532(t,e,r){"use strict";var n=r(5951),o=Object.defineProperty;t.exports=function(t,e){try{o(n,t,{value:e,configurable:!0,writable:!0})}catch(r){n[t]=e}return e}},9447(t,e,r){"use strict";var n=r(8828);t.exports=!n((function(){return 7!==Object.defineProperty({},1,{get:function(){return 7}})[1]}))},9552(t,e,r){"use strict";var n=r(5951),o=r(6285),i=n.document,a=o(i)&&o(i.createElement);t.exports=function(t){return a?i.createElement(t):{}}},376(t){"use strict";t.exports=["constructor","hasOwnProperty","isPrototypeOf","propertyIsEnumerable","toLocaleString","toString","valueOf"]},6794(t,e,r){"use strict";var n=r(5951).navigator,o=n&&n.userAgent;t.exports=o?String(o):""},798(t,e,r){"use strict";var n,o,i=r(5951),a=r(6794),s=i.process,u=i.Deno,c=s&&s.versions||u&&u.version,l=c&&c.v8;l&&(o=(n=l.split("."))[0]>0&&n[0]<4?1:+(n[0]+n[1])),!o&&a&&(!(n=a.match(/Edge\/(\d+)/))||n[1]>=74)&&(n=a.match(/Chrome\/(\d+)/))&&(o=+n[1]),t.exports=o},1091(t,e,r){"use strict";var n=r(5951),o=r(6024),i=r(2361),a=r(2250),s=r(3846).f,u=r(7463),c=r(2046),l=r(8311),f=r(1626),p=r(9724);r(6128);var wrapConstructor=function(t){var Wrapper=function(e,r,n){if(this instanceof Wrapper){switch(arguments.length){case 0:return new t;case 1:return new t(e);case 2:return new t(e,r)}return new t(e,r,n)}return o(t,this,arguments)};return Wrapper.prototype=t.prototype,Wrapper};t.exports=function(t,e){var r,o,h,d,y,_,g,m,v,b=t.target,w=t.global,I=t.stat,x=t.proto,B=w?n:I?n[b]:n[b]&&n[b].prototype,k=w?c:c[b]||f(c,b,{})[b],q=k.prototype;for(d in e)o=!(r=u(w?d:b+(I?".":"#")+d,t.forced))&&B&&p(B,d),_=k[d],o&&(g=t.dontCallGetSet?(v=s(B,d))&&v.value:B[d]),y=o&&g?g:e[d],(r||x||typeof _!=typeof y)&&(m=t.bind&&o?l(y,n):t.wrap&&o?wrapConstructor(y):x&&a(y)?i(y):y,(t.sham||y&&y.sham||_&&_.sham)&&f(m,"sham",!0),f(k,d,m),x&&(p(c,h=b+"Prototype")||f(c,h,{}),f(c[h],d,y),t.real&&q&&(r||!q[d])&&f(q,d,y)))}},8828(t){"use strict";t.exports=function(t){try{return!!t()}catch(t){return!0}}},6024(t,e,r){"use strict";var n=r(1505),o=Function.prototype,i=o.apply,a=o.call;t.exports="object"==typeof Reflect&&Reflect.apply||(n?a.bind(i):function(){return a.apply(i,arguments)})},8311(t,e,r){"use strict";var n=r(2361),o=r(2159),i=r(1505),a=n(n.bind);t.exports=function(t,e){return o(t),void 0===e?t:i?a(t,e):function(){return t.apply(e,arguments)}}},1505(t,e,r){"use strict";var n=r(8828);t.exports=!n((function(){var t=function(){}.bind();return"function"!=typeof t||t.hasOwnProperty("prototype")}))},4673(t,e,r){"use strict";var n=r(1907),o=r(2159),i=r(6285),a=r(9724),s=r(3427),u=r(1505),c=Function,l=n([].concat),f=n([].join),p={};t.exports=u?c.bind:function bind(t){var e=o(this),r=e.prototype,n=s(arguments,1),u=function bound(){var r=l(n,s(arguments));return this instanceof u?function(t,e,r){if(!a(p,e)){for(var n=[],o=0;o<e;o++)n[o]="a["+o+"]";p[e]=c("C,a","return new C("+f(n,",")+")")}return p[e](t,r)}(e,r.length,r):e.apply(t,r)};return i(r)&&(u.prototype=r),u}},3930(t,e,r){"use strict";var n=r(1505),o=Function.prototype.call;t.exports=n?o.bind(o):function(){return o.apply(o,arguments)}},2361(t,e,r){"use strict";var n=r(5807),o=r(1907);t.exports=function(t){if("Function"===n(t))return o(t)}},1907(t,e,r){"use strict";var n=r(1505),o=Function.prototype,i=o.call,a=n&&o.bind.bind(i,i);t.exports=n?a:function(t){return function(){return i.apply(t,arguments)}}},1747(t,e,r){"use strict";var n=r(5951),o=r(2046);t.exports=function(t,e){var r=o[t+"Prototype"],i=r&&r[e];if(i)return i;var a=n[t],s=a&&a.prototype;return s&&s[e]}},5582(t,e,r){"use strict";var n=r(2046),o=r(5951),i=r(2250),aFunction=function(t){return i(t)?t:void 0};t.exports=function(t,e){return arguments.length<2?aFunction(n[t])||aFunction(o[t]):n[t]&&n[t][e]||o[t]&&o[t][e]}},9367(t,e,r){"use strict";var n=r(2159),o=r(7136);t.exports=function(t,e){var r=t[e];return o(r)?void 0:n(r)}},5951(t,e,r){"use strict";var check=function(t){return t&&t.Math===Math&&t};t.exports=check("object"==typeof globalThis&&globalThis)||check("object"==typeof window&&window)||check("object"==typeof self&&self)||check("object"==typeof r.g&&r.g)||check("object"==typeof this&&this)||function(){return this}()||Function("return this")()},9724(t,e,r){"use strict";var n=r(1907),o=r(9298),i=n({}.hasOwnProperty);t.exports=Object.hasOwn||function hasOwn(t,e){return i(o(t),e)}},8530(t){"use strict";t.exports={}},3648(t,e,r){"use strict";var n=r(9447),o=r(8828),i=r(9552);t.exports=!n&&!o((function(){return 7!==Object.defineProperty(i("div"),"a",{get:function(){return 7}}).a}))},6946(t,e,r){"use strict";var n=r(1907),o=r(8828),i=r(5807),a=Object,s=n("".split);t.exports=o((function(){return!a("z").propertyIsEnumerable(0)}))?function(t){return"String"===i(t)?s(t,""):a(t)}:a},2250(t){"use strict";var e="object"==typeof document&&document.all;t.exports=void 0===e&&void 0!==e?function(t){return"function"==typeof t||t===e}:function(t){return"function"==typeof t}},7463(t,e,r){"use strict";var n=r(8828),o=r(2250),i=/#|\.prototype\./,isForced=function(t,e){var r=s[a(t)];return r===c||r!==u&&(o(e)?n(e):!!e)},a=isForced.normalize=function(t){return String(t).replace(i,".").toLowerCase()},s=isForced.data={},u=isForced.NATIVE="N",c=isForced.POLYFILL="P";t.exports=isForced},7136(t){"use strict";t.exports=function(t){return null==t}},6285(t,e,r){"use strict";var n=r(2250);t.exports=function(t){return"object"==typeof t?null!==t:n(t)}},7376(t){"use strict";t.exports=!0},5594(t,e,r){"use strict";var n=r(5582),o=r(2250),i=r(8280),a=r(3556),s=Object;t.exports=a?function(t){return"symbol"==typeof t}:function(t){var e=n("Symbol");return o(e)&&i(e.prototype,s(t))}},575(t,e,r){"use strict";var n=r(3121);t.exports=function(t){return n(t.length)}},1176(t){"use strict";var e=Math.ceil,r=Math.floor;t.exports=Math.trunc||function trunc(t){var n=+t;return(n>0?r:e)(n)}},7157(t,e,r){"use strict";var n=r(9447),o=r(1907),i=r(3930),a=r(8828),s=r(2875),u=r(7170),c=r(2574),l=r(9298),f=r(6946),p=Object.assign,h=Object.defineProperty,d=o([].concat);t.exports=!p||a((function(){if(n&&1!==p({b:1},p(h({},"a",{enumerable:!0,get:function(){h(this,"b",{value:3,enumerable:!1})}}),{b:2})).b)return!0;var t={},e={},r=Symbol("assign detection"),o="abcdefghijklmnopqrst";return t[r]=7,o.split("").forEach((function(t){e[t]=t})),7!==p({},t)[r]||s(p({},e)).join("")!==o}))?function assign(t,e){for(var r=l(t),o=arguments.length,a=1,p=u.f,h=c.f;o>a;)for(var y,_=f(arguments[a++]),g=p?d(s(_),p(_)):s(_),m=g.length,v=0;m>v;)y=g[v++],n&&!i(h,_,y)||(r[y]=_[y]);return r}:p},4284(t,e,r){"use strict";var n=r(9447),o=r(3648),i=r(8661),a=r(6624),s=r(470),u=TypeError,c=Object.defineProperty,l=Object.getOwnPropertyDescriptor,f="enumerable",p="configurable",h="writable";e.f=n?i?function defineProperty(t,e,r){if(a(t),e=s(e),a(r),"function"==typeof t&&"prototype"===e&&"value"in r&&h in r&&!r[h]){var n=l(t,e);n&&n[h]&&(t[e]=r.value,r={configurable:p in r?r[p]:n[p],enumerable:f in r?r[f]:n[f],writable:!1})}return c(t,e,r)}:c:function defineProperty(t,e,r){if(a(t),e=s(e),a(r),o)try{return c(t,e,r)}catch(t){}if("get"in r||"set"in r)throw new u("Accessors not supported");return"value"in r&&(t[e]=r.value),t}},3846(t,e,r){"use strict";var n=r(9447),o=r(3930),i=r(2574),a=r(5817),s=r(7374),u=r(470),c=r(9724),l=r(3648),f=Object.getOwnPropertyDescriptor;e.f=n?f:function getOwnPropertyDescriptor(t,e){if(t=s(t),e=u(e),l)try{return f(t,e)}catch(t){}if(c(t,e))return a(!o(i.f,t,e),t[e])}},7170(t,e){"use strict";e.f=Object.getOwnPropertySymbols},8280(t,e,r){"use strict";var n=r(1907);t.exports=n({}.isPrototypeOf)},3045(t,e,r){"use strict";var n=r(1907),o=r(9724),i=r(7374),a=r(4436).indexOf,s=r(8530),u=n([].push);t.exports=function(t,e){var r,n=i(t),c=0,l=[];for(r in n)!o(s,r)&&o(n,r)&&u(l,r);for(;e.length>c;)o(n,r=e[c++])&&(~a(l,r)||u(l,r));return l}},2875(t,e,r){"use strict";var n=r(3045),o=r(376);t.exports=Object.keys||function keys(t){return n(t,o)}},2574(t,e){"use strict";var r={}.propertyIsEnumerable,n=Object.getOwnPropertyDescriptor,o=n&&!r.call({1:2},1);e.f=o?function propertyIsEnumerable(t){var e=n(this,t);return!!e&&e.enumerable}:r},581(t,e,r){"use strict";var n=r(3930),o=r(2250),i=r(6285),a=TypeError;t.exports=function(t,e){var r,s;if("string"===e&&o(r=t.toString)&&!i(s=n(r,t)))return s;if(o(r=t.valueOf)&&!i(s=n(r,t)))return s;if("string"!==e&&o(r=t.toString)&&!i(s=n(r,t)))return s;throw new a("Can't convert object to primitive value")}},2046(t){"use strict";t.exports={}},4239(t,e,r){"use strict";var n=r(7136),o=TypeError;t.exports=function(t){if(n(t))throw new o("Can't call method on "+t);return t}},6128(t,e,r){"use strict";var n=r(7376),o=r(5951),i=r(2532),a="__core-js_shared__",s=t.exports=o[a]||i(a,{});(s.versions||(s.versions=[])).push({version:"3.40.0",mode:n?"pure":"global",copyright:"© 2014-2025 Denis Pushkarev (zloirock.ru)",license:"https://github.com/zloirock/core-js/blob/v3.40.0/LICENSE",source:"https://github.com/zloirock/core-js"})},5816(t,e,r){"use strict";var n=r(6128);t.exports=function(t,e){return n[t]||(n[t]=e||{})}},9846(t,e,r){"use strict";var n=r(798),o=r(8828),i=r(5951).String;t.exports=!!Object.getOwnPropertySymbols&&!o((function(){var t=Symbol("symbol detection");return!i(t)||!(Object(t)instanceof Symbol)||!Symbol.sham&&n&&n<41}))},4849(t,e,r){"use strict";var n=r(5482),o=Math.max,i=Math.min;t.exports=function(t,e){var r=n(t);return r<0?o(r+e,0):i(r,e)}},7374(t,e,r){"use strict";var n=r(6946),o=r(4239);t.exports=function(t){return n(o(t))}},5482(t,e,r){"use strict";var n=r(1176);t.exports=function(t){var e=+t;return e!=e||0===e?0:n(e)}},3121(t,e,r){"use strict";var n=r(5482),o=Math.min;t.exports=function(t){var e=n(t);return e>0?o(e,9007199254740991):0}},9298(t,e,r){"use strict";var n=r(4239),o=Object;t.exports=function(t){return o(n(t))}},6028(t,e,r){"use strict";var n=r(3930),o=r(6285),i=r(5594),a=r(9367),s=r(581),u=r(6264),c=TypeError,l=u("toPrimitive");t.exports=function(t,e){if(!o(t)||i(t))return t;var r,u=a(t,l);if(u){if(void 0===e&&(e="default"),r=n(u,t,e),!o(r)||i(r))return r;throw new c("Can't convert object to primitive value")}return void 0===e&&(e="number"),s(t,e)}},470(t,e,r){"use strict";var n=r(6028),o=r(5594);t.exports=function(t){var e=n(t,"string");return o(e)?e:e+""}},4640(t){"use strict";var e=String;t.exports=function(t){try{return e(t)}catch(t){return"Object"}}},6499(t,e,r){"use strict";var n=r(1907),o=0,i=Math.random(),a=n(1..toString);t.exports=function(t){return"Symbol("+(void 0===t?"":t)+")_"+a(++o+i,36)}},3556(t,e,r){"use strict";var n=r(9846);t.exports=n&&!Symbol.sham&&"symbol"==typeof Symbol.iterator},8661(t,e,r){"use strict";var n=r(9447),o=r(8828);t.exports=n&&o((function(){return 42!==Object.defineProperty((function(){}),"prototype",{value:42,writable:!1}).prototype}))},6264(t,e,r){"use strict";var n=r(5951),o=r(5816),i=r(9724),a=r(6499),s=r(9846),u=r(3556),c=n.Symbol,l=o("wks"),f=u?c.for||c:c&&c.withoutSetter||a;t.exports=function(t){return i(l,t)||(l[t]=s&&i(c,t)?c[t]:f("Symbol."+t)),l[t]}},9307(t,e,r){"use strict";var n=r(1091),o=r(4673);n({target:"Function",proto:!0,forced:Function.bind!==o},{bind:o})},1340(t,e,r){"use strict";var n=r(1091),o=r(7157);n({target:"Object",stat:!0,arity:2,forced:Object.assign!==o},{assign:o})},9709(t,e,r){"use strict";var n=r(3034);t.exports=n},975(t,e,r){"use strict";var n=r(9748);t.exports=n}},e={};function __webpack_require__(r){var n=e[r];if(void 0!==n)return n.exports;var o=e[r]={id:r,loaded:!1,exports:{}};return t[r].call(o.exports,o,o.exports,__webpack_require__),o.loaded=!0,o.exports}__webpack_require__.n=t=>{var e=t&&t.__esModule?()=>t.default:()=>t;return __webpack_require__.d(e,{a:e}),e},__webpack_require__.d=(t,e)=>{for(var r in e)__webpack_require__.o(e,r)&&!__webpack_require__.o(t,r)&&Object.defineProperty(t,r,{enumerable:!0,get:e[r]})},__webpack_require__.g=function(){if("object"==typeof globalThis)return globalThis;try{return this||new Function("return this")()}catch(t){if("object"==typeof window)return window}}(),__webpack_require__.o=(t,e)=>Object.prototype.hasOwnProperty.call(t,e),__webpack_require__.r=t=>{"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(t,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(t,"__esModule",{value:!0})},__webpack_require__.nmd=t=>(t.paths=[],t.children||(t.children=[]),t);var r={};return(()=>{"use strict";__webpack_require__.d(r,{default:()=>en});var t={};__webpack_require__.r(t),__webpack_require__.d(t,{TOGGLE_CONFIGS:()=>Yr,UPDATE_CONFIGS:()=>$r,downloadConfig:()=>downloadConfig,getConfigByUrl:()=>getConfigByUrl,loaded:()=>loaded,toggle:()=>toggle,update:()=>actions_update});var e={};__webpack_require__.r(e),__webpack_require__.d(e,{get:()=>selectors_get});var n=__webpack_require__(6540);class StandaloneLayout extends n.Component{render(){const{getComponent:t}=this.props,e=t("Container"),r=t("Row"),o=t("Col"),i=t("Topbar",!0),a=t("BaseLayout",!0),s=t("onlineValidatorBadge",!0),u=t("SkipToOperations",!0);return n.createElement(e,{className:"swagger-ui"},u?n.createElement(u,null):null,i?n.createElement(i,null):null,n.createElement(a,null),n.createElement(r,null,n.createElement(o,null,n.createElement(s,null))))}}const o=StandaloneLayout,stadalone_layout=()=>({components:{StandaloneLayout:o}});var i="@@__IMMUTABLE_INDEXED__@@";function isIndexed(t){return Boolean(t&&t[i])}var a="@@__IMMUTABLE_KEYED__@@";function isKeyed(t){return Boolean(t&&t[a])}function isAssociative(t){return isKeyed(t)||isIndexed(t)}var s="@@__IMMUTABLE_ITERABLE__@@";function isCollection(t){return Boolean(t&&t[s])}var u=function Collection(t){return isCollection(t)?t:B(t)},c=function(t){function KeyedCollection(t){return isKeyed(t)?t:k(t)}return t&&(KeyedCollection.__proto__=t),KeyedCollection.prototype=Object.create(t&&t.prototype),KeyedCollection.prototype.constructor=KeyedCollection,KeyedCollection}(u),l=function(t){function IndexedCollection(t){return isIndexed(t)?t:q(t)}return t&&(IndexedCollection.__proto__=t),IndexedCollection.prototype=Object.create(t&&t.prototype),IndexedCollection.prototype.constructor=IndexedCollection,IndexedCollection}(u),f=function(t){function SetCollection(t){return isCollection(t)&&!isAssociative(t)?t:C(t)}return t&&(SetCollection.__proto__=t),SetCollection.prototype=Object.create(t&&t.prototype),SetCollection.prototype.constructor=SetCollection,SetCollection}(u);u.Keyed=c,u.Indexed=l,u.Set=f;var p="function"==typeof Symbol&&Symbol.iterator,h="@@iterator",d=p||h,y=function Iterator(t){this.next=t};function iteratorValue(t,e,r,n){var o=0===t?e:1===t?r:[e,r];return n?n.value=o:n={value:o,done:!1},n}function iteratorDone(){return{value:void 0,done:!0}}function hasIterator(t){return!!Array.isArray(t)||!!getIteratorFn(t)}function isIterator(t){return!(!t||"function"!=typeof t.next)}function getIterator(t){var e=getIteratorFn(t);return e&&e.call(t)}function getIteratorFn(t){var e=t&&(p&&t[p]||t[h]);if("function"==typeof e)return e}y.prototype.toString=function toString(){return"[Iterator]"},y.KEYS=0,y.VALUES=1,y.ENTRIES=2,y.prototype.inspect=y.prototype.toSource=function(){return this.toString()},y.prototype[d]=function(){return this};var _="delete",g=32,m=31,v={};function SetRef(t){t&&(t.value=!0)}function OwnerID(){}function ensureSize(t){return void 0===t.size&&(t.size=t.__iterate(returnTrue)),t.size}function wrapIndex(t,e){if("number"!=typeof e){var r=e>>>0;if(""+r!==e||4294967295===r)return NaN;e=r}return e<0?ensureSize(t)+e:e}function returnTrue(){return!0}function wholeSlice(t,e,r){return(0===t&&!isNeg(t)||void 0!==r&&t<=-r)&&(void 0===e||void 0!==r&&e>=r)}function resolveBegin(t,e){return resolveIndex(t,e,0)}function resolveEnd(t,e){return resolveIndex(t,e,e)}function resolveIndex(t,e,r){return void 0===t?r:isNeg(t)?e===1/0?e:0|Math.max(0,e+t):void 0===e||e===t?t:0|Math.min(e,t)}function isNeg(t){return t<0||0===t&&1/t==-1/0}var b="@@__IMMUTABLE_RECORD__@@";function isRecord(t){return Boolean(t&&t[b])}function isImmutable(t){return isCollection(t)||isRecord(t)}var w="@@__IMMUTABLE_ORDERED__@@";function isOrdered(t){return Boolean(t&&t[w])}var I="@@__IMMUTABLE_SEQ__@@";function isSeq(t){return Boolean(t&&t[I])}var x=Object.prototype.hasOwnProperty;function isArrayLike(t){return!(!Array.isArray(t)&&"string"!=typeof t)||t&&"object"==typeof t&&Number.isInteger(t.length)&&t.length>=0&&(0===t.length?1===Object.keys(t).length:t.hasOwnProperty(t.length-1))}var B=function(t){function Seq(t){return null==t?emptySequence():isImmutable(t)?t.toSeq():function seqFromValue(t){var e=maybeIndexedSeqFromValue(t);if(e)return function isEntriesIterable(t){var e=getIteratorFn(t);return e&&e===t.entries}(t)?e.fromEntrySeq():function isKeysIterable(t){var e=getIteratorFn(t);return e&&e===t.keys}(t)?e.toSetSeq():e;if("object"==typeof t)return new P(t);throw new TypeError("Expected Array or collection object of values, or keyed object: "+t)}(t)}return t&&(Seq.__proto__=t),Seq.prototype=Object.create(t&&t.prototype),Seq.prototype.constructor=Seq,Seq.prototype.toSeq=function toSeq(){return this},Seq.prototype.toString=function toString(){return this.__toString("Seq {","}")},Seq.prototype.cacheResult=function cacheResult(){return!this._cache&&this.__iterateUncached&&(this._cache=this.entrySeq().toArray(),this.size=this._cache.length),this},Seq.prototype.__iterate=function __iterate(t,e){var r=this._cache;if(r){for(var n=r.length,o=0;o!==n;){var i=r[e?n-++o:o++];if(!1===t(i[1],i[0],this))break}return o}return this.__iterateUncached(t,e)},Seq.prototype.__iterator=function __iterator(t,e){var r=this._cache;if(r){var n=r.length,o=0;return new y((function(){if(o===n)return{value:void 0,done:!0};var i=r[e?n-++o:o++];return iteratorValue(t,i[0],i[1])}))}return this.__iteratorUncached(t,e)},Seq}(u),k=function(t){function KeyedSeq(t){return null==t?emptySequence().toKeyedSeq():isCollection(t)?isKeyed(t)?t.toSeq():t.fromEntrySeq():isRecord(t)?t.toSeq():keyedSeqFromValue(t)}return t&&(KeyedSeq.__proto__=t),KeyedSeq.prototype=Object.create(t&&t.prototype),KeyedSeq.prototype.constructor=KeyedSeq,KeyedSeq.prototype.toKeyedSeq=function toKeyedSeq(){return this},KeyedSeq}(B),q=function(t){function IndexedSeq(t){return null==t?emptySequence():isCollection(t)?isKeyed(t)?t.entrySeq():t.toIndexedSeq():isRecord(t)?t.toSeq().entrySeq():indexedSeqFromValue(t)}return t&&(IndexedSeq.__proto__=t),IndexedSeq.prototype=Object.create(t&&t.prototype),IndexedSeq.prototype.constructor=IndexedSeq,IndexedSeq.of=function of(){return IndexedSeq(arguments)},IndexedSeq.prototype.toIndexedSeq=function toIndexedSeq(){return this},IndexedSeq.prototype.toString=function toString(){return this.__toString("Seq [","]")},IndexedSeq}(B),C=function(t){function SetSeq(t){return(isCollection(t)&&!isAssociative(t)?t:q(t)).toSetSeq()}return t&&(SetSeq.__proto__=t),SetSeq.prototype=Object.create(t&&t.prototype),SetSeq.prototype.constructor=SetSeq,SetSeq.of=function of(){return SetSeq(arguments)},SetSeq.prototype.toSetSeq=function toSetSeq(){return this},SetSeq}(B);B.isSeq=isSeq,B.Keyed=k,B.Set=C,B.Indexed=q,B.prototype[I]=!0;var j=function(t){function ArraySeq(t){this._array=t,this.size=t.length}return t&&(ArraySeq.__proto__=t),ArraySeq.prototype=Object.create(t&&t.prototype),ArraySeq.prototype.constructor=ArraySeq,ArraySeq.prototype.get=function get(t,e){return this.has(t)?this._array[wrapIndex(this,t)]:e},ArraySeq.prototype.__iterate=function __iterate(t,e){for(var r=this._array,n=r.length,o=0;o!==n;){var i=e?n-++o:o++;if(!1===t(r[i],i,this))break}return o},ArraySeq.prototype.__iterator=function __iterator(t,e){var r=this._array,n=r.length,o=0;return new y((function(){if(o===n)return{value:void 0,done:!0};var i=e?n-++o:o++;return iteratorValue(t,i,r[i])}))},ArraySeq}(q),P=function(t){function ObjectSeq(t){var e=Object.keys(t).concat(Object.getOwnPropertySymbols?Object.getOwnPropertySymbols(t):[]);this._object=t,this._keys=e,this.size=e.length}return t&&(ObjectSeq.__proto__=t),ObjectSeq.prototype=Object.create(t&&t.prototype),ObjectSeq.prototype.constructor=ObjectSeq,ObjectSeq.prototype.get=function get(t,e){return void 0===e||this.has(t)?this._object[t]:e},ObjectSeq.prototype.has=function has(t){return x.call(this._object,t)},ObjectSeq.prototype.__iterate=function __iterate(t,e){for(var r=this._object,n=this._keys,o=n.length,i=0;i!==o;){var a=n[e?o-++i:i++];if(!1===t(r[a],a,this))break}return i},ObjectSeq.prototype.__iterator=function __iterator(t,e){var r=this._object,n=this._keys,o=n.length,i=0;return new y((function(){if(i===o)return{value:void 0,done:!0};var a=n[e?o-++i:i++];return iteratorValue(t,a,r[a])}))},ObjectSeq}(k);P.prototype[w]=!0;var L,U=function(t){function CollectionSeq(t){this._collection=t,this.size=t.length||t.size}return t&&(CollectionSeq.__proto__=t),CollectionSeq.prototype=Object.create(t&&t.prototype),CollectionSeq.prototype.constructor=CollectionSeq,CollectionSeq.prototype.__iterateUncached=function __iterateUncached(t,e){if(e)return this.cacheResult().__iterate(t,e);var r=getIterator(this._collection),n=0;if(isIterator(r))for(var o;!(o=r.next()).done&&!1!==t(o.value,n++,this););return n},CollectionSeq.prototype.__iteratorUncached=function __iteratorUncached(t,e){if(e)return this.cacheResult().__iterator(t,e);var r=getIterator(this._collection);if(!isIterator(r))return new y(iteratorDone);var n=0;return new y((function(){var e=r.next();return e.done?e:iteratorValue(t,n++,e.value)}))},CollectionSeq}(q);function emptySequence(){return L||(L=new j([]))}function keyedSeqFromValue(t){var e=maybeIndexedSeqFromValue(t);if(e)return e.fromEntrySeq();if("object"==typeof t)return new P(t);throw new TypeError("Expected Array or collection object of [k, v] entries, or keyed object: "+t)}function indexedSeqFromValue(t){var e=maybeIndexedSeqFromValue(t);if(e)return e;throw new TypeError("Expected Array or collection object of values: "+t)}function maybeIndexedSeqFromValue(t){return isArrayLike(t)?new j(t):hasIterator(t)?new U(t):void 0}function asImmutable(){return this.__ensureOwner()}function asMutable(){return this.__ownerID?this:this.__ensureOwner(new OwnerID)}var z="function"==typeof Math.imul&&-2===Math.imul(4294967295,2)?Math.imul:function imul(t,e){var r=65535&(t|=0),n=65535&(e|=0);return r*n+((t>>>16)*n+r*(e>>>16)<<16>>>0)|0};function smi(t){return t>>>1&1073741824|3221225471&t}var D=Object.prototype.valueOf;function hash(t){if(null==t)return hashNullish(t);if("function"==typeof t.hashCode)return smi(t.hashCode(t));var e=function immutable_es_valueOf(t){return t.valueOf!==D&&"function"==typeof t.valueOf?t.valueOf(t):t}(t);if(null==e)return hashNullish(e);switch(typeof e){case"boolean":return e?1108378657:1108378656;case"number":return function hashNumber(t){if(t!=t||t===1/0)return 0;var e=0|t;e!==t&&(e^=4294967295*t);for(;t>4294967295;)e^=t/=4294967295;return smi(e)}(e);case"string":return e.length>tt?function cachedHashString(t){var e=nt[t];void 0===e&&(e=hashString(t),rt===et&&(rt=0,nt={}),rt++,nt[t]=e);return e}(e):hashString(e);case"object":case"function":return function hashJSObj(t){var e;if(Y&&void 0!==(e=$.get(t)))return e;if(void 0!==(e=t[J]))return e;if(!V){if(void 0!==(e=t.propertyIsEnumerable&&t.propertyIsEnumerable[J]))return e;if(void 0!==(e=function getIENodeHash(t){if(t&&t.nodeType>0)switch(t.nodeType){case 1:return t.uniqueID;case 9:return t.documentElement&&t.documentElement.uniqueID}}(t)))return e}if(e=nextHash(),Y)$.set(t,e);else{if(void 0!==K&&!1===K(t))throw new Error("Non-extensible objects are not allowed as keys.");if(V)Object.defineProperty(t,J,{enumerable:!1,configurable:!1,writable:!1,value:e});else if(void 0!==t.propertyIsEnumerable&&t.propertyIsEnumerable===t.constructor.prototype.propertyIsEnumerable)t.propertyIsEnumerable=function(){return this.constructor.prototype.propertyIsEnumerable.apply(this,arguments)},t.propertyIsEnumerable[J]=e;else{if(void 0===t.nodeType)throw new Error("Unable to set a non-enumerable property on object.");t[J]=e}}return e}(e);case"symbol":return function hashSymbol(t){var e=H[t];if(void 0!==e)return e;return e=nextHash(),H[t]=e,e}(e);default:if("function"==typeof e.toString)return hashString(e.toString());throw new Error("Value type "+typeof e+" cannot be hashed.")}}function hashNullish(t){return null===t?1108378658:1108378659}function hashString(t){for(var e=0,r=0;r<t.length;r++)e=31*e+t.charCodeAt(r)|0;return smi(e)}var W=(1048576*Math.random()|1)%1048576||40503;function hashCollisionKey(t){if("string"!=typeof t)return hash(t);for(var e=0,r=0;r<t.length;r++)e=W*e+t.charCodeAt(r)|0;return e}var K=Object.isExtensible,V=function(){try{return Object.defineProperty({},"@",{}),!0}catch(t){return!1}}();function nextHash(){var t=++Z;return 1073741824&Z&&(Z=0),t}var $,Y="function"==typeof WeakMap;Y&&($=new WeakMap);var H=Object.create(null),Z=0,J="__immutablehash__";"function"==typeof Symbol&&(J=Symbol(J));var tt=16,et=255,rt=0,nt={},ot=function(t){function ToKeyedSequence(t,e){this._iter=t,this._useKeys=e,this.size=t.size}return t&&(ToKeyedSequence.__proto__=t),ToKeyedSequence.prototype=Object.create(t&&t.prototype),ToKeyedSequence.prototype.constructor=ToKeyedSequence,ToKeyedSequence.prototype.get=function get(t,e){return this._iter.get(t,e)},ToKeyedSequence.prototype.has=function has(t){return this._iter.has(t)},ToKeyedSequence.prototype.valueSeq=function valueSeq(){return this._iter.valueSeq()},ToKeyedSequence.prototype.reverse=function reverse(){var t=this,e=reverseFactory(this,!0);return this._useKeys||(e.valueSeq=function(){return t._iter.toSeq().reverse()}),e},ToKeyedSequence.prototype.map=function map(t,e){var r=this,n=mapFactory(this,t,e);return this._useKeys||(n.valueSeq=function(){return r._iter.toSeq().map(t,e)}),n},ToKeyedSequence.prototype.__iterate=function __iterate(t,e){var r=this;return this._iter.__iterate((function(e,n){return t(e,n,r)}),e)},ToKeyedSequence.prototype.__iterator=function __iterator(t,e){return this._iter.__iterator(t,e)},ToKeyedSequence}(k);ot.prototype[w]=!0;var it=function(t){function ToIndexedSequence(t){this._iter=t,this.size=t.size}return t&&(ToIndexedSequence.__proto__=t),ToIndexedSequence.prototype=Object.create(t&&t.prototype),ToIndexedSequence.prototype.constructor=ToIndexedSequence,ToIndexedSequence.prototype.includes=function includes(t){return this._iter.includes(t)},ToIndexedSequence.prototype.__iterate=function __iterate(t,e){var r=this,n=0;return e&&ensureSize(this),this._iter.__iterate((function(o){return t(o,e?r.size-++n:n++,r)}),e)},ToIndexedSequence.prototype.__iterator=function __iterator(t,e){var r=this,n=this._iter.__iterator(1,e),o=0;return e&&ensureSize(this),new y((function(){var i=n.next();return i.done?i:iteratorValue(t,e?r.size-++o:o++,i.value,i)}))},ToIndexedSequence}(q),at=function(t){function ToSetSequence(t){this._iter=t,this.size=t.size}return t&&(ToSetSequence.__proto__=t),ToSetSequence.prototype=Object.create(t&&t.prototype),ToSetSequence.prototype.constructor=ToSetSequence,ToSetSequence.prototype.has=function has(t){return this._iter.includes(t)},ToSetSequence.prototype.__iterate=function __iterate(t,e){var r=this;return this._iter.__iterate((function(e){return t(e,e,r)}),e)},ToSetSequence.prototype.__iterator=function __iterator(t,e){var r=this._iter.__iterator(1,e);return new y((function(){var e=r.next();return e.done?e:iteratorValue(t,e.value,e.value,e)}))},ToSetSequence}(C),st=function(t){function FromEntriesSequence(t){this._iter=t,this.size=t.size}return t&&(FromEntriesSequence.__proto__=t),FromEntriesSequence.prototype=Object.create(t&&t.prototype),FromEntriesSequence.prototype.constructor=FromEntriesSequence,FromEntriesSequence.prototype.entrySeq=function entrySeq(){return this._iter.toSeq()},FromEntriesSequence.prototype.__iterate=function __iterate(t,e){var r=this;return this._iter.__iterate((function(e){if(e){validateEntry(e);var n=isCollection(e);return t(n?e.get(1):e[1],n?e.get(0):e[0],r)}}),e)},FromEntriesSequence.prototype.__iterator=function __iterator(t,e){var r=this._iter.__iterator(1,e);return new y((function(){for(;;){var e=r.next();if(e.done)return e;var n=e.value;if(n){validateEntry(n);var o=isCollection(n);return iteratorValue(t,o?n.get(0):n[0],o?n.get(1):n[1],e)}}}))},FromEntriesSequence}(k);function flipFactory(t){var e=makeSequence(t);return e._iter=t,e.size=t.size,e.flip=function(){return t},e.reverse=function(){var e=t.reverse.apply(this);return e.flip=function(){return t.reverse()},e},e.has=function(e){return t.includes(e)},e.includes=function(e){return t.has(e)},e.cacheResult=cacheResultThrough,e.__iterateUncached=function(e,r){var n=this;return t.__iterate((function(t,r){return!1!==e(r,t,n)}),r)},e.__iteratorUncached=function(e,r){if(2===e){var n=t.__iterator(e,r);return new y((function(){var t=n.next();if(!t.done){var e=t.value[0];t.value[0]=t.value[1],t.value[1]=e}return t}))}return t.__iterator(1===e?0:1,r)},e}function mapFactory(t,e,r){var n=makeSequence(t);return n.size=t.size,n.has=function(e){return t.has(e)},n.get=function(n,o){var i=t.get(n,v);return i===v?o:e.call(r,i,n,t)},n.__iterateUncached=function(n,o){var i=this;return t.__iterate((function(t,o,a){return!1!==n(e.call(r,t,o,a),o,i)}),o)},n.__iteratorUncached=function(n,o){var i=t.__iterator(2,o);return new y((function(){var o=i.next();if(o.done)return o;var a=o.value,s=a[0];return iteratorValue(n,s,e.call(r,a[1],s,t),o)}))},n}function reverseFactory(t,e){var r=makeSequence(t);return r._iter=t,r.size=t.size,r.reverse=function(){return t},t.flip&&(r.flip=function(){var e=flipFactory(t);return e.reverse=function(){return t.flip()},e}),r.get=function(r,n){return t.get(e?r:-1-r,n)},r.has=function(r){return t.has(e?r:-1-r)},r.includes=function(e){return t.includes(e)},r.cacheResult=cacheResultThrough,r.__iterate=function(r,n){var o=this,i=0;return n&&ensureSize(t),t.__iterate((function(t,a){return r(t,e?a:n?o.size-++i:i++,o)}),!n)},r.__iterator=function(n,o){var i=0;o&&ensureSize(t);var a=t.__iterator(2,!o);return new y((function(){var t=a.next();if(t.done)return t;var s=t.value;return iteratorValue(n,e?s[0]:o?r.size-++i:i++,s[1],t)}))},r}function filterFactory(t,e,r,n){var o=makeSequence(t);return n&&(o.has=function(n){var o=t.get(n,v);return o!==v&&!!e.call(r,o,n,t)},o.get=function(n,o){var i=t.get(n,v);return i!==v&&e.call(r,i,n,t)?i:o}),o.__iterateUncached=function(o,i){var a=this,s=0;return t.__iterate((function(t,i,u){if(e.call(r,t,i,u))return s++,o(t,n?i:s-1,a)}),i),s},o.__iteratorUncached=function(o,i){var a=t.__iterator(2,i),s=0;return new y((function(){for(;;){var i=a.next();if(i.done)return i;var u=i.value,c=u[0],l=u[1];if(e.call(r,l,c,t))return iteratorValue(o,n?c:s++,l,i)}}))},o}function sliceFactory(t,e,r,n){var o=t.size;if(wholeSlice(e,r,o))return t;if(void 0===o&&(e<0||r<0))return sliceFactory(t.toSeq().cacheResult(),e,r,n);var i,a=resolveBegin(e,o),s=resolveEnd(r,o)-a;s==s&&(i=s<0?0:s);var u=makeSequence(t);return u.size=0===i?i:t.size&&i||void 0,!n&&isSeq(t)&&i>=0&&(u.get=function(e,r){return(e=wrapIndex(this,e))>=0&&e<i?t.get(e+a,r):r}),u.__iterateUncached=function(e,r){var o=this;if(0===i)return 0;if(r)return this.cacheResult().__iterate(e,r);var s=0,u=!0,c=0;return t.__iterate((function(t,r){if(!u||!(u=s++<a))return c++,!1!==e(t,n?r:c-1,o)&&c!==i})),c},u.__iteratorUncached=function(e,r){if(0!==i&&r)return this.cacheResult().__iterator(e,r);if(0===i)return new y(iteratorDone);var o=t.__iterator(e,r),s=0,u=0;return new y((function(){for(;s++<a;)o.next();if(++u>i)return{value:void 0,done:!0};var t=o.next();return n||1===e||t.done?t:iteratorValue(e,u-1,0===e?void 0:t.value[1],t)}))},u}function skipWhileFactory(t,e,r,n){var o=makeSequence(t);return o.__iterateUncached=function(o,i){var a=this;if(i)return this.cacheResult().__iterate(o,i);var s=!0,u=0;return t.__iterate((function(t,i,c){if(!s||!(s=e.call(r,t,i,c)))return u++,o(t,n?i:u-1,a)})),u},o.__iteratorUncached=function(o,i){var a=this;if(i)return this.cacheResult().__iterator(o,i);var s=t.__iterator(2,i),u=!0,c=0;return new y((function(){var t,i,l;do{if((t=s.next()).done)return n||1===o?t:iteratorValue(o,c++,0===o?void 0:t.value[1],t);var f=t.value;i=f[0],l=f[1],u&&(u=e.call(r,l,i,a))}while(u);return 2===o?t:iteratorValue(o,i,l,t)}))},o}it.prototype.cacheResult=ot.prototype.cacheResult=at.prototype.cacheResult=st.prototype.cacheResult=cacheResultThrough;var ut=function(t){function ConcatSeq(t){this._wrappedIterables=t.flatMap((function(t){return t._wrappedIterables?t._wrappedIterables:[t]})),this.size=this._wrappedIterables.reduce((function(t,e){if(void 0!==t){var r=e.size;if(void 0!==r)return t+r}}),0),this[a]=this._wrappedIterables[0][a],this[i]=this._wrappedIterables[0][i],this[w]=this._wrappedIterables[0][w]}return t&&(ConcatSeq.__proto__=t),ConcatSeq.prototype=Object.create(t&&t.prototype),ConcatSeq.prototype.constructor=ConcatSeq,ConcatSeq.prototype.__iterateUncached=function __iterateUncached(t,e){if(0!==this._wrappedIterables.length){if(e)return this.cacheResult().__iterate(t,e);for(var r=0,n=isKeyed(this),o=n?2:1,i=this._wrappedIterables[r].__iterator(o,e),a=!0,s=0;a;){for(var u=i.next();u.done;){if(++r===this._wrappedIterables.length)return s;u=(i=this._wrappedIterables[r].__iterator(o,e)).next()}a=!1!==(n?t(u.value[1],u.value[0],this):t(u.value,s,this)),s++}return s}},ConcatSeq.prototype.__iteratorUncached=function __iteratorUncached(t,e){var r=this;if(0===this._wrappedIterables.length)return new y(iteratorDone);if(e)return this.cacheResult().__iterator(t,e);var n=0,o=this._wrappedIterables[n].__iterator(t,e);return new y((function(){for(var i=o.next();i.done;){if(++n===r._wrappedIterables.length)return i;i=(o=r._wrappedIterables[n].__iterator(t,e)).next()}return i}))},ConcatSeq}(B);function flattenFactory(t,e,r){var n=makeSequence(t);return n.__iterateUncached=function(o,i){if(i)return this.cacheResult().__iterate(o,i);var a=0,s=!1;return function flatDeep(t,u){t.__iterate((function(t,i){return(!e||u<e)&&isCollection(t)?flatDeep(t,u+1):(a++,!1===o(t,r?i:a-1,n)&&(s=!0)),!s}),i)}(t,0),a},n.__iteratorUncached=function(n,o){if(o)return this.cacheResult().__iterator(n,o);var i=t.__iterator(n,o),a=[],s=0;return new y((function(){for(;i;){var t=i.next();if(!1===t.done){var u=t.value;if(2===n&&(u=u[1]),e&&!(a.length<e)||!isCollection(u))return r?t:iteratorValue(n,s++,u,t);a.push(i),i=u.__iterator(n,o)}else i=a.pop()}return{value:void 0,done:!0}}))},n}function sortFactory(t,e,r){e||(e=defaultComparator);var n=isKeyed(t),o=0,i=t.toSeq().map((function(e,n){return[n,e,o++,r?r(e,n,t):e]})).valueSeq().toArray();return i.sort((function(t,r){return e(t[3],r[3])||t[2]-r[2]})).forEach(n?function(t,e){i[e].length=2}:function(t,e){i[e]=t[1]}),n?k(i):isIndexed(t)?q(i):C(i)}function maxFactory(t,e,r){if(e||(e=defaultComparator),r){var n=t.toSeq().map((function(e,n){return[e,r(e,n,t)]})).reduce((function(t,r){return maxCompare(e,t[1],r[1])?r:t}));return n&&n[0]}return t.reduce((function(t,r){return maxCompare(e,t,r)?r:t}))}function maxCompare(t,e,r){var n=t(r,e);return 0===n&&r!==e&&(null==r||r!=r)||n>0}function zipWithFactory(t,e,r,n){var o=makeSequence(t),i=new j(r).map((function(t){return t.size}));return o.size=n?i.max():i.min(),o.__iterate=function(t,e){for(var r,n=this.__iterator(1,e),o=0;!(r=n.next()).done&&!1!==t(r.value,o++,this););return o},o.__iteratorUncached=function(t,o){var i=r.map((function(t){return t=u(t),getIterator(o?t.reverse():t)})),a=0,s=!1;return new y((function(){var r;return s||(r=i.map((function(t){return t.next()})),s=n?r.every((function(t){return t.done})):r.some((function(t){return t.done}))),s?{value:void 0,done:!0}:iteratorValue(t,a++,e.apply(null,r.map((function(t){return t.value}))))}))},o}function reify(t,e){return t===e?t:isSeq(t)?e:t.constructor(e)}function validateEntry(t){if(t!==Object(t))throw new TypeError("Expected [K, V] tuple: "+t)}function collectionClass(t){return isKeyed(t)?c:isIndexed(t)?l:f}function makeSequence(t){return Object.create((isKeyed(t)?k:isIndexed(t)?q:C).prototype)}function cacheResultThrough(){return this._iter.cacheResult?(this._iter.cacheResult(),this.size=this._iter.size,this):B.prototype.cacheResult.call(this)}function defaultComparator(t,e){return void 0===t&&void 0===e?0:void 0===t?1:void 0===e?-1:t>e?1:t<e?-1:0}function isValueObject(t){return Boolean(t&&"function"==typeof t.equals&&"function"==typeof t.hashCode)}function is(t,e){if(t===e||t!=t&&e!=e)return!0;if(!t||!e)return!1;if("function"==typeof t.valueOf&&"function"==typeof e.valueOf){if((t=t.valueOf())===(e=e.valueOf())||t!=t&&e!=e)return!0;if(!t||!e)return!1}return!!(isValueObject(t)&&isValueObject(e)&&t.equals(e))}function update$1(t,e,r,n){return updateIn(t,[e],r,n)}function merge$1(){for(var t=[],e=arguments.length;e--;)t[e]=arguments[e];return mergeIntoKeyedWith(this,t)}function mergeWith$1(t){for(var e=[],r=arguments.length-1;r-- >0;)e[r]=arguments[r+1];if("function"!=typeof t)throw new TypeError("Invalid merger function: "+t);return mergeIntoKeyedWith(this,e,t)}function mergeIntoKeyedWith(t,e,r){for(var n=[],o=0;o<e.length;o++){var i=c(e[o]);0!==i.size&&n.push(i)}return 0===n.length?t:0!==t.toSeq().size||t.__ownerID||1!==n.length?t.withMutations((function(t){for(var e=r?function(e,n){update$1(t,n,v,(function(t){return t===v?e:r(t,e,n)}))}:function(e,r){t.set(r,e)},o=0;o<n.length;o++)n[o].forEach(e)})):isRecord(t)?t:t.constructor(n[0])}var ct=Object.prototype.toString;function isPlainObject(t){if(!t||"object"!=typeof t||"[object Object]"!==ct.call(t))return!1;var e=Object.getPrototypeOf(t);if(null===e)return!0;for(var r=e,n=Object.getPrototypeOf(e);null!==n;)r=n,n=Object.getPrototypeOf(r);return r===e}function isDataStructure(t){return"object"==typeof t&&(isImmutable(t)||Array.isArray(t)||isPlainObject(t))}function isProtoKey(t){return"string"==typeof t&&("__proto__"===t||"constructor"===t)}function arrCopy(t,e){e=e||0;for(var r=Math.max(0,t.length-e),n=new Array(r),o=0;o<r;o++)n[o]=t[o+e];return n}function shallowCopy(t){if(Array.isArray(t))return arrCopy(t);var e={};for(var r in t)isProtoKey(r)||x.call(t,r)&&(e[r]=t[r]);return e}function mergeDeepWithSources(t,e,r){return mergeWithSources(t,e,function deepMergerWith(t){function deepMerger(e,r,n){return isDataStructure(e)&&isDataStructure(r)&&function areMergeable(t,e){var r=B(t),n=B(e);return isIndexed(r)===isIndexed(n)&&isKeyed(r)===isKeyed(n)}(e,r)?mergeWithSources(e,[r],deepMerger):t?t(e,r,n):r}return deepMerger}(r))}function mergeWithSources(t,e,r){if(!isDataStructure(t))throw new TypeError("Cannot merge into non-data-structure value: "+t);if(isImmutable(t))return"function"==typeof r&&t.mergeWith?t.mergeWith.apply(t,[r].concat(e)):t.merge?t.merge.apply(t,e):t.concat.apply(t,e);for(var n=Array.isArray(t),o=t,i=n?l:c,a=n?function(e){o===t&&(o=shallowCopy(o)),o.push(e)}:function(e,n){if(!isProtoKey(n)){var i=x.call(o,n),a=i&&r?r(o[n],e,n):e;i&&a===o[n]||(o===t&&(o=shallowCopy(o)),o[n]=a)}},s=0;s<e.length;s++)i(e[s]).forEach(a);return o}function mergeDeep(){for(var t=[],e=arguments.length;e--;)t[e]=arguments[e];return mergeDeepWithSources(this,t)}function mergeDeepWith(t){for(var e=[],r=arguments.length-1;r-- >0;)e[r]=arguments[r+1];return mergeDeepWithSources(this,e,t)}function mergeDeepIn(t){for(var e=[],r=arguments.length-1;r-- >0;)e[r]=arguments[r+1];return updateIn(this,t,emptyMap(),(function(t){return mergeDeepWithSources(t,e)}))}function mergeIn(t){for(var e=[],r=arguments.length-1;r-- >0;)e[r]=arguments[r+1];return updateIn(this,t,emptyMap(),(function(t){return mergeWithSources(t,e)}))}function setIn(t,e){return function setIn$1(t,e,r){return updateIn(t,e,v,(function(){return r}))}(this,t,e)}function update(t,e,r){return 1===arguments.length?t(this):update$1(this,t,e,r)}function updateIn$1(t,e,r){return updateIn(this,t,e,r)}function wasAltered(){return this.__altered}function withMutations(t){var e=this.asMutable();return t(e),e.wasAltered()?e.__ensureOwner(this.__ownerID):this}var lt="@@__IMMUTABLE_MAP__@@";function isMap(t){return Boolean(t&&t[lt])}function invariant(t,e){if(!t)throw new Error(e)}function assertNotInfinite(t){invariant(t!==1/0,"Cannot perform this action with an infinite size.")}var pt=function(t){function Map(e){return null==e?emptyMap():isMap(e)&&!isOrdered(e)?e:emptyMap().withMutations((function(r){var n=t(e);assertNotInfinite(n.size),n.forEach((function(t,e){return r.set(e,t)}))}))}return t&&(Map.__proto__=t),Map.prototype=Object.create(t&&t.prototype),Map.prototype.constructor=Map,Map.prototype.toString=function toString(){return this.__toString("Map {","}")},Map.prototype.get=function get(t,e){return this._root?this._root.get(0,void 0,t,e):e},Map.prototype.set=function set(t,e){return updateMap(this,t,e)},Map.prototype.remove=function remove(t){return updateMap(this,t,v)},Map.prototype.deleteAll=function deleteAll(t){var e=u(t);return 0===e.size?this:this.withMutations((function(t){e.forEach((function(e){return t.remove(e)}))}))},Map.prototype.clear=function clear(){return 0===this.size?this:this.__ownerID?(this.size=0,this._root=null,this.__hash=void 0,this.__altered=!0,this):emptyMap()},Map.prototype.sort=function sort(t){return Mt(sortFactory(this,t))},Map.prototype.sortBy=function sortBy(t,e){return Mt(sortFactory(this,e,t))},Map.prototype.map=function map(t,e){var r=this;return this.withMutations((function(n){n.forEach((function(o,i){n.set(i,t.call(e,o,i,r))}))}))},Map.prototype.__iterator=function __iterator(t,e){return new bt(this,t,e)},Map.prototype.__iterate=function __iterate(t,e){var r=this,n=0;return this._root&&this._root.iterate((function(e){return n++,t(e[1],e[0],r)}),e),n},Map.prototype.__ensureOwner=function __ensureOwner(t){return t===this.__ownerID?this:t?makeMap(this.size,this._root,t,this.__hash):0===this.size?emptyMap():(this.__ownerID=t,this.__altered=!1,this)},Map}(c);pt.isMap=isMap;var ht=pt.prototype;ht[lt]=!0,ht[_]=ht.remove,ht.removeAll=ht.deleteAll,ht.setIn=setIn,ht.removeIn=ht.deleteIn=deleteIn,ht.update=update,ht.updateIn=updateIn$1,ht.merge=ht.concat=merge$1,ht.mergeWith=mergeWith$1,ht.mergeDeep=mergeDeep,ht.mergeDeepWith=mergeDeepWith,ht.mergeIn=mergeIn,ht.mergeDeepIn=mergeDeepIn,ht.withMutations=withMutations,ht.wasAltered=wasAltered,ht.asImmutable=asImmutable,ht["@@transducer/init"]=ht.asMutable=asMutable,ht["@@transducer/step"]=function(t,e){return t.set(e[0],e[1])},ht["@@transducer/result"]=function(t){return t.asImmutable()};var dt=function ArrayMapNode(t,e){this.ownerID=t,this.entries=e};dt.prototype.get=function get(t,e,r,n){for(var o=this.entries,i=0,a=o.length;i<a;i++)if(is(r,o[i][0]))return o[i][1];return n},dt.prototype.update=function update(t,e,r,n,o,i,a){for(var s=o===v,u=this.entries,c=0,l=u.length;c<l&&!is(n,u[c][0]);c++);var f=c<l;if(f?u[c][1]===o:s)return this;if(SetRef(a),(s||!f)&&SetRef(i),!s||1!==u.length){if(!f&&!s&&u.length>=wt)return function createNodes(t,e,r,n){t||(t=new OwnerID);for(var o=new mt(t,hash(r),[r,n]),i=0;i<e.length;i++){var a=e[i];o=o.update(t,0,void 0,a[0],a[1])}return o}(t,u,n,o);var p=t&&t===this.ownerID,h=p?u:arrCopy(u);return f?s?c===l-1?h.pop():h[c]=h.pop():h[c]=[n,o]:h.push([n,o]),p?(this.entries=h,this):new dt(t,h)}};var yt=function BitmapIndexedNode(t,e,r){this.ownerID=t,this.bitmap=e,this.nodes=r};yt.prototype.get=function get(t,e,r,n){void 0===e&&(e=hash(r));var o=1<<((0===t?e:e>>>t)&m),i=this.bitmap;return i&o?this.nodes[popCount(i&o-1)].get(t+5,e,r,n):n},yt.prototype.update=function update(t,e,r,n,o,i,a){void 0===r&&(r=hash(n));var s=(0===e?r:r>>>e)&m,u=1<<s,c=this.bitmap,l=!!(c&u);if(!l&&o===v)return this;var f=popCount(c&u-1),p=this.nodes,h=l?p[f]:void 0,d=updateNode(h,t,e+5,r,n,o,i,a);if(d===h)return this;if(!l&&d&&p.length>=St)return function expandNodes(t,e,r,n,o){for(var i=0,a=new Array(g),s=0;0!==r;s++,r>>>=1)a[s]=1&r?e[i++]:void 0;return a[n]=o,new _t(t,i+1,a)}(t,p,c,s,d);if(l&&!d&&2===p.length&&isLeafNode(p[1^f]))return p[1^f];if(l&&d&&1===p.length&&isLeafNode(d))return d;var y=t&&t===this.ownerID,_=l?d?c:c^u:c|u,b=l?d?setAt(p,f,d,y):function spliceOut(t,e,r){var n=t.length-1;if(r&&e===n)return t.pop(),t;for(var o=new Array(n),i=0,a=0;a<n;a++)a===e&&(i=1),o[a]=t[a+i];return o}(p,f,y):function spliceIn(t,e,r,n){var o=t.length+1;if(n&&e+1===o)return t[e]=r,t;for(var i=new Array(o),a=0,s=0;s<o;s++)s===e?(i[s]=r,a=-1):i[s]=t[s+a];return i}(p,f,d,y);return y?(this.bitmap=_,this.nodes=b,this):new yt(t,_,b)};var _t=function HashArrayMapNode(t,e,r){this.ownerID=t,this.count=e,this.nodes=r};_t.prototype.get=function get(t,e,r,n){void 0===e&&(e=hash(r));var o=(0===t?e:e>>>t)&m,i=this.nodes[o];return i?i.get(t+5,e,r,n):n},_t.prototype.update=function update(t,e,r,n,o,i,a){void 0===r&&(r=hash(n));var s=(0===e?r:r>>>e)&m,u=o===v,c=this.nodes,l=c[s];if(u&&!l)return this;var f=updateNode(l,t,e+5,r,n,o,i,a);if(f===l)return this;var p=this.count;if(l){if(!f&&--p<It)return function packNodes(t,e,r,n){for(var o=0,i=0,a=new Array(r),s=0,u=1,c=e.length;s<c;s++,u<<=1){var l=e[s];void 0!==l&&s!==n&&(o|=u,a[i++]=l)}return new yt(t,o,a)}(t,c,p,s)}else p++;var h=t&&t===this.ownerID,d=setAt(c,s,f,h);return h?(this.count=p,this.nodes=d,this):new _t(t,p,d)};var gt=function HashCollisionNode(t,e,r){this.ownerID=t,this.keyHash=e,this.entries=r,this._index=void 0};gt.prototype._positionOf=function _positionOf(t,e){var r=this.entries,n=this._index;if(void 0===n&&e&&r.length>=xt&&(n=this._buildIndex()),void 0!==n){var o=n[hashCollisionKey(t)];if(void 0!==o)for(var i=0;i<o.length;i++){var a=o[i];if(is(t,r[a][0]))return a}return-1}for(var s=0,u=r.length;s<u;s++)if(is(t,r[s][0]))return s;return-1},gt.prototype._buildIndex=function _buildIndex(){for(var t=Object.create(null),e=this.entries,r=0,n=e.length;r<n;r++){var o=hashCollisionKey(e[r][0]),i=t[o];void 0!==i?i.push(r):t[o]=[r]}return this._index=t,t},gt.prototype.get=function get(t,e,r,n){var o=this._positionOf(r,!0);return-1===o?n:this.entries[o][1]},gt.prototype.update=function update(t,e,r,n,o,i,a){void 0===r&&(r=hash(n));var s=o===v;if(r!==this.keyHash)return s?this:(SetRef(a),SetRef(i),mergeIntoNode(this,t,e,r,[n,o]));var u=this.entries,c=u.length,l=t&&t===this.ownerID,f=this._positionOf(n,l),p=-1===f?c:f,h=-1!==f;if(h?u[p][1]===o:s)return this;if(SetRef(a),(s||!h)&&SetRef(i),s&&2===c)return new mt(t,this.keyHash,u[1^p]);var d=l?u:arrCopy(u);if(h)s?(p===c-1?d.pop():d[p]=d.pop(),l&&(this._index=void 0)):d[p]=[n,o];else if(d.push([n,o]),l&&void 0!==this._index){var y=hashCollisionKey(n),_=this._index[y];void 0!==_?_.push(c):this._index[y]=[c]}return l?(this.entries=d,this):new gt(t,this.keyHash,d)};var mt=function ValueNode(t,e,r){this.ownerID=t,this.keyHash=e,this.entry=r};mt.prototype.get=function get(t,e,r,n){return is(r,this.entry[0])?this.entry[1]:n},mt.prototype.update=function update(t,e,r,n,o,i,a){var s=o===v,u=is(n,this.entry[0]);return(u?o===this.entry[1]:s)?this:(SetRef(a),s?void SetRef(i):u?t&&t===this.ownerID?(this.entry[1]=o,this):new mt(t,this.keyHash,[n,o]):(SetRef(i),mergeIntoNode(this,t,e,hash(n),[n,o])))},dt.prototype.iterate=gt.prototype.iterate=function(t,e){for(var r=this.entries,n=0,o=r.length-1;n<=o;n++)if(!1===t(r[e?o-n:n]))return!1},yt.prototype.iterate=_t.prototype.iterate=function(t,e){for(var r=this.nodes,n=0,o=r.length-1;n<=o;n++){var i=r[e?o-n:n];if(i&&!1===i.iterate(t,e))return!1}},mt.prototype.iterate=function(t,e){return t(this.entry)};var vt,bt=function(t){function MapIterator(t,e,r){this._type=e,this._reverse=r,this._stack=t._root&&mapIteratorFrame(t._root)}return t&&(MapIterator.__proto__=t),MapIterator.prototype=Object.create(t&&t.prototype),MapIterator.prototype.constructor=MapIterator,MapIterator.prototype.next=function next(){for(var t=this._type,e=this._stack;e;){var r=e.node,n=e.index++,o=void 0;if(r.entry){if(0===n)return mapIteratorValue(t,r.entry)}else if(r.entries){if(n<=(o=r.entries.length-1))return mapIteratorValue(t,r.entries[this._reverse?o-n:n])}else if(n<=(o=r.nodes.length-1)){var i=r.nodes[this._reverse?o-n:n];if(i){if(i.entry)return mapIteratorValue(t,i.entry);e=this._stack=mapIteratorFrame(i,e)}continue}e=this._stack=this._stack.__prev}return{value:void 0,done:!0}},MapIterator}(y);function mapIteratorValue(t,e){return iteratorValue(t,e[0],e[1])}function mapIteratorFrame(t,e){return{node:t,index:0,__prev:e}}function makeMap(t,e,r,n){var o=Object.create(ht);return o.size=t,o._root=e,o.__ownerID=r,o.__hash=n,o.__altered=!1,o}function emptyMap(){return vt||(vt=makeMap(0))}function updateMap(t,e,r){var n,o;if(t._root){var i={value:!1},a={value:!1};if(n=updateNode(t._root,t.__ownerID,0,void 0,e,r,i,a),!a.value)return t;o=t.size+(i.value?r===v?-1:1:0)}else{if(r===v)return t;o=1,n=new dt(t.__ownerID,[[e,r]])}return t.__ownerID?(t.size=o,t._root=n,t.__hash=void 0,t.__altered=!0,t):n?makeMap(o,n):emptyMap()}function updateNode(t,e,r,n,o,i,a,s){return t?t.update(e,r,n,o,i,a,s):i===v?t:(SetRef(s),SetRef(a),new mt(e,n,[o,i]))}function isLeafNode(t){return t.constructor===mt||t.constructor===gt}function mergeIntoNode(t,e,r,n,o){if(t.keyHash===n)return new gt(e,n,[t.entry,o]);var i,a=(0===r?t.keyHash:t.keyHash>>>r)&m,s=(0===r?n:n>>>r)&m,u=a===s?[mergeIntoNode(t,e,r+5,n,o)]:(i=new mt(e,n,o),a<s?[t,i]:[i,t]);return new yt(e,1<<a|1<<s,u)}function popCount(t){return t=(t=(858993459&(t-=t>>1&1431655765))+(t>>2&858993459))+(t>>4)&252645135,t+=t>>8,127&(t+=t>>16)}function setAt(t,e,r,n){var o=n?t:arrCopy(t);return o[e]=r,o}var wt=8,St=16,It=8,xt=16;function coerceKeyPath(t){if(isArrayLike(t)&&"string"!=typeof t)return t;if(isOrdered(t))return t.toArray();throw new TypeError("Invalid keyPath: expected Ordered Collection or Array: "+t)}function quoteString(t){try{return"string"==typeof t?JSON.stringify(t):String(t)}catch(e){return JSON.stringify(t)}}function get(t,e,r){return isImmutable(t)?t.get(e,r):function has(t,e){return isImmutable(t)?t.has(e):isDataStructure(t)&&x.call(t,e)}(t,e)?"function"==typeof t.get?t.get(e):t[e]:r}function updateIn(t,e,r,n){n||(n=r,r=void 0);var o=updateInDeeply(isImmutable(t),t,coerceKeyPath(e),0,r,n);return o===v?r:o}function updateInDeeply(t,e,r,n,o,i){var a=e===v;if(n===r.length){var s=a?o:e,u=i(s);return u===s?e:u}if(!a&&!isDataStructure(e))throw new TypeError("Cannot update within non-data-structure value in path ["+Array.from(r).slice(0,n).map(quoteString)+"]: "+e);var c=r[n],l=a?v:get(e,c,v),f=updateInDeeply(l===v?t:isImmutable(l),l,r,n+1,o,i);return f===l?e:f===v?function remove(t,e){if(!isDataStructure(t))throw new TypeError("Cannot update non-data-structure value: "+t);if(isImmutable(t)){if(!t.remove)throw new TypeError("Cannot update immutable value without .remove() method: "+t);return t.remove(e)}if(!x.call(t,e))return t;var r=shallowCopy(t);return Array.isArray(r)?r.splice(e,1):delete r[e],r}(e,c):function set(t,e,r){if(isProtoKey(e))return t;if(!isDataStructure(t))throw new TypeError("Cannot update non-data-structure value: "+t);if(isImmutable(t)){if(!t.set)throw new TypeError("Cannot update immutable value without .set() method: "+t);return t.set(e,r)}if(x.call(t,e)&&r===t[e])return t;var n=shallowCopy(t);return n[e]=r,n}(a?t?emptyMap():{}:e,c,f)}function deleteIn(t){return function removeIn(t,e){return updateIn(t,e,(function(){return v}))}(this,t)}var Et="@@__IMMUTABLE_LIST__@@";function isList(t){return Boolean(t&&t[Et])}var At=function(t){function List(e){var r=emptyList();if(null==e)return r;if(isList(e))return e;var n=t(e),o=n.size;return 0===o?r:(assertNotInfinite(o),o>0&&o<g?makeList(0,o,5,void 0,new Bt(n.toArray())):r.withMutations((function(t){t.setSize(o),n.forEach((function(e,r){return t.set(r,e)}))})))}return t&&(List.__proto__=t),List.prototype=Object.create(t&&t.prototype),List.prototype.constructor=List,List.of=function of(){return this(arguments)},List.prototype.toString=function toString(){return this.__toString("List [","]")},List.prototype.get=function get(t,e){if((t=wrapIndex(this,t))>=0&&t<this.size){var r=listNodeFor(this,t+=this._origin);return r&&r.array[t&m]}return e},List.prototype.set=function set(t,e){return function updateList(t,e,r){if(e=wrapIndex(t,e),e!=e)return t;if(e>=t.size||e<0)return t.withMutations((function(t){e<0?setListBounds(t,e).set(0,r):setListBounds(t,0,e+1).set(e,r)}));e+=t._origin;var n=t._tail,o=t._root,i={value:!1};e>=getTailOffset(t._capacity)?n=updateVNode(n,t.__ownerID,0,e,r,i):o=updateVNode(o,t.__ownerID,t._level,e,r,i);if(!i.value)return t;if(t.__ownerID)return t._root=o,t._tail=n,t.__hash=void 0,t.__altered=!0,t;return makeList(t._origin,t._capacity,t._level,o,n)}(this,t,e)},List.prototype.remove=function remove(t){return this.has(t)?0===t?this.shift():t===this.size-1?this.pop():this.splice(t,1):this},List.prototype.insert=function insert(t,e){return this.splice(t,0,e)},List.prototype.clear=function clear(){return 0===this.size?this:this.__ownerID?(this.size=this._origin=this._capacity=0,this._level=5,this._root=this._tail=this.__hash=void 0,this.__altered=!0,this):emptyList()},List.prototype.push=function push(){var t=arguments,e=this.size;return this.withMutations((function(r){setListBounds(r,0,e+t.length);for(var n=0;n<t.length;n++)r.set(e+n,t[n])}))},List.prototype.pop=function pop(){return setListBounds(this,0,-1)},List.prototype.unshift=function unshift(){var t=arguments;return this.withMutations((function(e){setListBounds(e,-t.length);for(var r=0;r<t.length;r++)e.set(r,t[r])}))},List.prototype.shift=function shift(){return setListBounds(this,1)},List.prototype.shuffle=function shuffle(t){return void 0===t&&(t=Math.random),this.withMutations((function(e){for(var r,n,o=e.size;o;)r=Math.floor(t()*o--),n=e.get(r),e.set(r,e.get(o)),e.set(o,n)}))},List.prototype.concat=function concat(){for(var e=arguments,r=[],n=0;n<arguments.length;n++){var o=e[n],i=t("string"!=typeof o&&hasIterator(o)?o:[o]);0!==i.size&&r.push(i)}return 0===r.length?this:0!==this.size||this.__ownerID||1!==r.length?this.withMutations((function(t){r.forEach((function(e){return e.forEach((function(e){return t.push(e)}))}))})):this.constructor(r[0])},List.prototype.setSize=function setSize(t){return setListBounds(this,0,t)},List.prototype.map=function map(t,e){var r=this;return this.withMutations((function(n){for(var o=0;o<r.size;o++)n.set(o,t.call(e,n.get(o),o,r))}))},List.prototype.slice=function slice(t,e){var r=this.size;return wholeSlice(t,e,r)?this:setListBounds(this,resolveBegin(t,r),resolveEnd(e,r))},List.prototype.__iterator=function __iterator(t,e){var r=e?this.size:0,n=iterateList(this,e);return new y((function(){var o=n();return o===kt?{value:void 0,done:!0}:iteratorValue(t,e?--r:r++,o)}))},List.prototype.__iterate=function __iterate(t,e){for(var r,n=e?this.size:0,o=iterateList(this,e);(r=o())!==kt&&!1!==t(r,e?--n:n++,this););return n},List.prototype.__ensureOwner=function __ensureOwner(t){return t===this.__ownerID?this:t?makeList(this._origin,this._capacity,this._level,this._root,this._tail,t,this.__hash):0===this.size?emptyList():(this.__ownerID=t,this.__altered=!1,this)},List}(l);At.isList=isList;var Ot=At.prototype;Ot[Et]=!0,Ot[_]=Ot.remove,Ot.merge=Ot.concat,Ot.setIn=setIn,Ot.deleteIn=Ot.removeIn=deleteIn,Ot.update=update,Ot.updateIn=updateIn$1,Ot.mergeIn=mergeIn,Ot.mergeDeepIn=mergeDeepIn,Ot.withMutations=withMutations,Ot.wasAltered=wasAltered,Ot.asImmutable=asImmutable,Ot["@@transducer/init"]=Ot.asMutable=asMutable,Ot["@@transducer/step"]=function(t,e){return t.push(e)},Ot["@@transducer/result"]=function(t){return t.asImmutable()};var Bt=function VNode(t,e){this.array=t,this.ownerID=e};Bt.prototype.removeBefore=function removeBefore(t,e,r){if(!(r&(1<<e+5)-1)||0===this.array.length)return this;var n=r>>>e&m;if(n>=this.array.length)return new Bt([],t);var o,i=0===n;if(e>0){var a=this.array[n];if((o=a&&a.removeBefore(t,e-5,r))===a&&i)return this}if(i&&!o)return this;var s=editableVNode(this,t);if(!i)for(var u=0;u<n;u++)s.array[u]=void 0;return o&&(s.array[n]=o),s},Bt.prototype.removeAfter=function removeAfter(t,e,r){if(r===(e?1<<e+5:g)||0===this.array.length)return this;var n,o=r-1>>>e&m;if(o>=this.array.length)return this;if(e>0){var i=this.array[o];if((n=i&&i.removeAfter(t,e-5,r))===i&&o===this.array.length-1)return this}var a=editableVNode(this,t);return a.array.splice(o+1),n&&(a.array[o]=n),a};var kt={};function iterateList(t,e){var r=t._origin,n=t._capacity,o=getTailOffset(n),i=t._tail;return iterateNodeOrLeaf(t._root,t._level,0);function iterateNodeOrLeaf(t,a,s){return 0===a?function iterateLeaf(t,a){var s=a===o?i&&i.array:t&&t.array,u=a>r?0:r-a,c=n-a;c>g&&(c=g);return function(){if(u===c)return kt;var t=e?--c:u++;return s&&s[t]}}(t,s):function iterateNode(t,o,i){var a,s=t&&t.array,u=i>r?0:r-i>>o,c=1+(n-i>>o);c>g&&(c=g);return function(){for(;;){if(a){var t=a();if(t!==kt)return t;a=null}if(u===c)return kt;var r=e?--c:u++;a=iterateNodeOrLeaf(s&&s[r],o-5,i+(r<<o))}}}(t,a,s)}}function makeList(t,e,r,n,o,i,a){var s=Object.create(Ot);return s.size=e-t,s._origin=t,s._capacity=e,s._level=r,s._root=n,s._tail=o,s.__ownerID=i,s.__hash=a,s.__altered=!1,s}function emptyList(){return makeList(0,0,5)}function updateVNode(t,e,r,n,o,i){var a,s=n>>>r&m,u=t&&s<t.array.length;if(!u&&void 0===o)return t;if(r>0){var c=t&&t.array[s],l=updateVNode(c,e,r-5,n,o,i);return l===c?t:((a=editableVNode(t,e)).array[s]=l,a)}return u&&t.array[s]===o?t:(i&&SetRef(i),a=editableVNode(t,e),void 0===o&&s===a.array.length-1?a.array.pop():a.array[s]=o,a)}function editableVNode(t,e){return e&&t&&e===t.ownerID?t:new Bt(t?t.array.slice():[],e)}function listNodeFor(t,e){if(e>=getTailOffset(t._capacity))return t._tail;if(e<1<<t._level+5){for(var r=t._root,n=t._level;r&&n>0;)r=r.array[e>>>n&m],n-=5;return r}}function setListBounds(t,e,r){!function validateListBoundsRequest(t,e,r){var n=t._origin+(void 0===e?0:e),o=void 0===r?t._capacity:r<0?t._capacity+r:t._origin+r;if(Number.isFinite(o)&&o>qt||Number.isFinite(n)&&n<-qt||Number.isFinite(o)&&Number.isFinite(n)&&o-n>qt)throw new RangeError("Invalid List size: a List cannot hold more than "+qt+" (2 ** 30) values.")}(t,e,r),void 0!==e&&(e|=0),void 0!==r&&(r|=0);var n=t.__ownerID||new OwnerID,o=t._origin,i=t._capacity,a=o+e,s=void 0===r?i:r<0?i+r:o+r;if(a===o&&s===i)return t;if(a>=s)return t.clear();for(var u=t._level,c=t._root,l=0;a+l<0;)c=new Bt(c&&c.array.length?[void 0,c]:[],n),l+=levelCapacity(u+=5);l&&(a+=l,o+=l,s+=l,i+=l);for(var f=getTailOffset(i),p=getTailOffset(s);p>=levelCapacity(u+5);)c=new Bt(c&&c.array.length?[c]:[],n),u+=5;var h=t._tail,d=p<f?listNodeFor(t,s-1):p>f?new Bt([],n):h;if(h&&p>f&&a<i&&h.array.length){for(var y=c=editableVNode(c,n),_=u;_>5;_-=5){var g=f>>>_&m;y=y.array[g]=editableVNode(y.array[g],n)}y.array[f>>>5&m]=h}if(s<i&&(d=d&&d.removeAfter(n,0,s)),a>=p)a-=p,s-=p,u=5,c=void 0,d=d&&d.removeBefore(n,0,a);else if(a>o||p<f){for(l=0;c;){var v=a>>>u&m;if(v!==p>>>u&m)break;v&&(l+=(1<<u)*v),u-=5,c=c.array[v]}c&&a>o&&(c=c.removeBefore(n,u,a-l)),c&&p<f&&(c=c.removeAfter(n,u,p-l)),l&&(a-=l,s-=l)}return t.__ownerID?(t.size=s-a,t._origin=a,t._capacity=s,t._level=u,t._root=c,t._tail=d,t.__hash=void 0,t.__altered=!0,t):makeList(a,s,u,c,d)}function getTailOffset(t){return t<g?0:t-1>>>5<<5}var qt=Math.pow(2,30);function levelCapacity(t){return t<31?1<<t:Math.pow(2,t)}function isOrderedMap(t){return isMap(t)&&isOrdered(t)}var Ct,Mt=function(t){function OrderedMap(t){return null==t?emptyOrderedMap():isOrderedMap(t)?t:emptyOrderedMap().withMutations((function(e){var r=c(t);assertNotInfinite(r.size),r.forEach((function(t,r){return e.set(r,t)}))}))}return t&&(OrderedMap.__proto__=t),OrderedMap.prototype=Object.create(t&&t.prototype),OrderedMap.prototype.constructor=OrderedMap,OrderedMap.of=function of(){return this(arguments)},OrderedMap.prototype.toString=function toString(){return this.__toString("OrderedMap {","}")},OrderedMap.prototype.get=function get(t,e){var r=this._map.get(t);return void 0!==r?this._list.get(r)[1]:e},OrderedMap.prototype.clear=function clear(){return 0===this.size?this:this.__ownerID?(this.size=0,this._map.clear(),this._list.clear(),this.__altered=!0,this):emptyOrderedMap()},OrderedMap.prototype.set=function set(t,e){return updateOrderedMap(this,t,e)},OrderedMap.prototype.remove=function remove(t){return updateOrderedMap(this,t,v)},OrderedMap.prototype.__iterate=function __iterate(t,e){var r=this;return this._list.__iterate((function(e){return e&&t(e[1],e[0],r)}),e)},OrderedMap.prototype.__iterator=function __iterator(t,e){return this._list.fromEntrySeq().__iterator(t,e)},OrderedMap.prototype.__ensureOwner=function __ensureOwner(t){if(t===this.__ownerID)return this;var e=this._map.__ensureOwner(t),r=this._list.__ensureOwner(t);return t?makeOrderedMap(e,r,t,this.__hash):0===this.size?emptyOrderedMap():(this.__ownerID=t,this.__altered=!1,this._map=e,this._list=r,this)},OrderedMap}(pt);function makeOrderedMap(t,e,r,n){var o=Object.create(Mt.prototype);return o.size=t?t.size:0,o._map=t,o._list=e,o.__ownerID=r,o.__hash=n,o.__altered=!1,o}function emptyOrderedMap(){return Ct||(Ct=makeOrderedMap(emptyMap(),emptyList()))}function updateOrderedMap(t,e,r){var n,o,i=t._map,a=t._list,s=i.get(e),u=void 0!==s;if(r===v){if(!u)return t;a.size>=g&&a.size>=2*i.size?(n=(o=a.filter((function(t,e){return void 0!==t&&s!==e}))).toKeyedSeq().map((function(t){return t[0]})).flip().toMap(),t.__ownerID&&(n.__ownerID=o.__ownerID=t.__ownerID)):(n=i.remove(e),o=s===a.size-1?a.pop():a.set(s,void 0))}else if(u){if(r===a.get(s)[1])return t;n=i,o=a.set(s,[e,r])}else n=i.set(e,a.size),o=a.set(a.size,[e,r]);return t.__ownerID?(t.size=n.size,t._map=n,t._list=o,t.__hash=void 0,t.__altered=!0,t):makeOrderedMap(n,o)}Mt.isOrderedMap=isOrderedMap,Mt.prototype[w]=!0,Mt.prototype[_]=Mt.prototype.remove;var jt="@@__IMMUTABLE_STACK__@@";function isStack(t){return Boolean(t&&t[jt])}var Tt=function(t){function Stack(t){return null==t?emptyStack():isStack(t)?t:emptyStack().pushAll(t)}return t&&(Stack.__proto__=t),Stack.prototype=Object.create(t&&t.prototype),Stack.prototype.constructor=Stack,Stack.of=function of(){return this(arguments)},Stack.prototype.toString=function toString(){return this.__toString("Stack [","]")},Stack.prototype.get=function get(t,e){var r=this._head;for(t=wrapIndex(this,t);r&&t--;)r=r.next;return r?r.value:e},Stack.prototype.peek=function peek(){return this._head&&this._head.value},Stack.prototype.push=function push(){var t=arguments;if(0===arguments.length)return this;for(var e=this.size+arguments.length,r=this._head,n=arguments.length-1;n>=0;n--)r={value:t[n],next:r};return this.__ownerID?(this.size=e,this._head=r,this.__hash=void 0,this.__altered=!0,this):makeStack(e,r)},Stack.prototype.pushAll=function pushAll(e){if(0===(e=t(e)).size)return this;if(0===this.size&&isStack(e))return e;assertNotInfinite(e.size);var r=this.size,n=this._head;return e.__iterate((function(t){r++,n={value:t,next:n}}),!0),this.__ownerID?(this.size=r,this._head=n,this.__hash=void 0,this.__altered=!0,this):makeStack(r,n)},Stack.prototype.pop=function pop(){return this.slice(1)},Stack.prototype.clear=function clear(){return 0===this.size?this:this.__ownerID?(this.size=0,this._head=void 0,this.__hash=void 0,this.__altered=!0,this):emptyStack()},Stack.prototype.slice=function slice(e,r){if(wholeSlice(e,r,this.size))return this;var n=resolveBegin(e,this.size);if(resolveEnd(r,this.size)!==this.size)return t.prototype.slice.call(this,e,r);for(var o=this.size-n,i=this._head;n--;)i=i.next;return this.__ownerID?(this.size=o,this._head=i,this.__hash=void 0,this.__altered=!0,this):makeStack(o,i)},Stack.prototype.__ensureOwner=function __ensureOwner(t){return t===this.__ownerID?this:t?makeStack(this.size,this._head,t,this.__hash):0===this.size?emptyStack():(this.__ownerID=t,this.__altered=!1,this)},Stack.prototype.__iterate=function __iterate(t,e){var r=this;if(e)return new j(this.toArray()).__iterate((function(e,n){return t(e,n,r)}),e);for(var n=0,o=this._head;o&&!1!==t(o.value,n++,this);)o=o.next;return n},Stack.prototype.__iterator=function __iterator(t,e){if(e)return new j(this.toArray()).__iterator(t,e);var r=0,n=this._head;return new y((function(){if(n){var e=n.value;return n=n.next,iteratorValue(t,r++,e)}return{value:void 0,done:!0}}))},Stack}(l);Tt.isStack=isStack;var Pt,Lt=Tt.prototype;function makeStack(t,e,r,n){var o=Object.create(Lt);return o.size=t,o._head=e,o.__ownerID=r,o.__hash=n,o.__altered=!1,o}function emptyStack(){return Pt||(Pt=makeStack(0))}function reduce(t,e,r,n,o,i){return assertNotInfinite(t.size),t.__iterate((function(t,i,a){o?(o=!1,r=t):r=e.call(n,r,t,i,a)}),i),r}function keyMapper(t,e){return e}function entryMapper(t,e){return[e,t]}function not(t){return function(){for(var e=[],r=arguments.length;r--;)e[r]=arguments[r];return!t.apply(this,e)}}function neg(t){return function(){for(var e=[],r=arguments.length;r--;)e[r]=arguments[r];return-t.apply(this,e)}}function defaultNegComparator(t,e){return t<e?1:t>e?-1:0}function deepEqual(t,e){if(t===e)return!0;if(!isCollection(e)||void 0!==t.size&&void 0!==e.size&&t.size!==e.size||void 0!==t.__hash&&void 0!==e.__hash&&t.__hash!==e.__hash||isKeyed(t)!==isKeyed(e)||isIndexed(t)!==isIndexed(e)||isOrdered(t)!==isOrdered(e))return!1;if(0===t.size&&0===e.size)return!0;var r=!isAssociative(t);if(isOrdered(t)){var n=t.entries();return e.every((function(t,e){var o=n.next().value;return o&&is(o[1],t)&&(r||is(o[0],e))}))&&n.next().done}var o=!1;if(void 0===t.size)if(void 0===e.size)"function"==typeof t.cacheResult&&t.cacheResult();else{o=!0;var i=t;t=e,e=i}var a=!0,s=e.__iterate((function(e,n){if(r?!t.has(e):o?!is(e,t.get(n,v)):!is(t.get(n,v),e))return a=!1,!1}));return a&&t.size===s}Lt[jt]=!0,Lt.shift=Lt.pop,Lt.unshift=Lt.push,Lt.unshiftAll=Lt.pushAll,Lt.withMutations=withMutations,Lt.wasAltered=wasAltered,Lt.asImmutable=asImmutable,Lt["@@transducer/init"]=Lt.asMutable=asMutable,Lt["@@transducer/step"]=function(t,e){return t.unshift(e)},Lt["@@transducer/result"]=function(t){return t.asImmutable()};var Nt,Ft=function(t){function Range(t,e,r){if(void 0===r&&(r=1),!(this instanceof Range))return new Range(t,e,r);if(invariant(0!==r,"Cannot step a Range by 0"),invariant(void 0!==t,"You must define a start value when using Range"),invariant(void 0!==e,"You must define an end value when using Range"),r=Math.abs(r),e<t&&(r=-r),this._start=t,this._end=e,this._step=r,this.size=Math.max(0,Math.ceil((e-t)/r-1)+1),0===this.size){if(Nt)return Nt;Nt=this}}return t&&(Range.__proto__=t),Range.prototype=Object.create(t&&t.prototype),Range.prototype.constructor=Range,Range.prototype.toString=function toString(){return 0===this.size?"Range []":"Range [ "+this._start+"..."+this._end+(1!==this._step?" by "+this._step:"")+" ]"},Range.prototype.get=function get(t,e){return this.has(t)?this._start+wrapIndex(this,t)*this._step:e},Range.prototype.includes=function includes(t){var e=(t-this._start)/this._step;return e>=0&&e<this.size&&e===Math.floor(e)},Range.prototype.slice=function slice(t,e){return wholeSlice(t,e,this.size)?this:(t=resolveBegin(t,this.size),(e=resolveEnd(e,this.size))<=t?new Range(0,0):new Range(this.get(t,this._end),this.get(e,this._end),this._step))},Range.prototype.indexOf=function indexOf(t){var e=t-this._start;if(e%this._step==0){var r=e/this._step;if(r>=0&&r<this.size)return r}return-1},Range.prototype.lastIndexOf=function lastIndexOf(t){return this.indexOf(t)},Range.prototype.__iterate=function __iterate(t,e){for(var r=this.size,n=this._step,o=e?this._start+(r-1)*n:this._start,i=0;i!==r&&!1!==t(o,e?r-++i:i++,this);)o+=e?-n:n;return i},Range.prototype.__iterator=function __iterator(t,e){var r=this.size,n=this._step,o=e?this._start+(r-1)*n:this._start,i=0;return new y((function(){if(i===r)return{value:void 0,done:!0};var a=o;return o+=e?-n:n,iteratorValue(t,e?r-++i:i++,a)}))},Range.prototype.equals=function equals(t){return t instanceof Range?this._start===t._start&&this._end===t._end&&this._step===t._step:deepEqual(this,t)},Range}(q),Ut="@@__IMMUTABLE_SET__@@";function isSet(t){return Boolean(t&&t[Ut])}var Rt=function(t){function Set(e){return null==e?emptySet():isSet(e)&&!isOrdered(e)?e:emptySet().withMutations((function(r){var n=t(e);assertNotInfinite(n.size),n.forEach((function(t){return r.add(t)}))}))}return t&&(Set.__proto__=t),Set.prototype=Object.create(t&&t.prototype),Set.prototype.constructor=Set,Set.of=function of(){return this(arguments)},Set.fromKeys=function fromKeys(t){return this(c(t).keySeq())},Set.intersect=function intersect(t){return(t=u(t).toArray()).length?Dt.intersect.apply(Set(t.pop()),t):emptySet()},Set.union=function union(t){return(t=u(t).toArray()).length?Dt.union.apply(Set(t.pop()),t):emptySet()},Set.prototype.toString=function toString(){return this.__toString("Set {","}")},Set.prototype.has=function has(t){return this._map.has(t)},Set.prototype.add=function add(t){return updateSet(this,this._map.set(t,t))},Set.prototype.remove=function remove(t){return updateSet(this,this._map.remove(t))},Set.prototype.clear=function clear(){return updateSet(this,this._map.clear())},Set.prototype.map=function map(t,e){var r=this,n=!1,o=updateSet(this,this._map.mapEntries((function(o){var i=o[1],a=t.call(e,i,i,r);return a!==i&&(n=!0),[a,a]}),e));return n?o:this},Set.prototype.union=function union(){for(var e=[],r=arguments.length;r--;)e[r]=arguments[r];return 0===(e=e.filter((function(t){return 0!==t.size}))).length?this:0!==this.size||this.__ownerID||1!==e.length?this.withMutations((function(r){for(var n=0;n<e.length;n++)"string"==typeof e[n]?r.add(e[n]):t(e[n]).forEach((function(t){return r.add(t)}))})):this.constructor(e[0])},Set.prototype.intersect=function intersect(){for(var e=[],r=arguments.length;r--;)e[r]=arguments[r];if(0===e.length)return this;e=e.map((function(e){return t(e)}));var n=[];return this.forEach((function(t){e.every((function(e){return e.includes(t)}))||n.push(t)})),this.withMutations((function(t){n.forEach((function(e){t.remove(e)}))}))},Set.prototype.subtract=function subtract(){for(var e=[],r=arguments.length;r--;)e[r]=arguments[r];if(0===e.length)return this;e=e.map((function(e){return t(e)}));var n=[];return this.forEach((function(t){e.some((function(e){return e.includes(t)}))&&n.push(t)})),this.withMutations((function(t){n.forEach((function(e){t.remove(e)}))}))},Set.prototype.sort=function sort(t){return Yt(sortFactory(this,t))},Set.prototype.sortBy=function sortBy(t,e){return Yt(sortFactory(this,e,t))},Set.prototype.wasAltered=function wasAltered(){return this._map.wasAltered()},Set.prototype.__iterate=function __iterate(t,e){var r=this;return this._map.__iterate((function(e){return t(e,e,r)}),e)},Set.prototype.__iterator=function __iterator(t,e){return this._map.__iterator(t,e)},Set.prototype.__ensureOwner=function __ensureOwner(t){if(t===this.__ownerID)return this;var e=this._map.__ensureOwner(t);return t?this.__make(e,t):0===this.size?this.__empty():(this.__ownerID=t,this._map=e,this)},Set}(f);Rt.isSet=isSet;var zt,Dt=Rt.prototype;function updateSet(t,e){return t.__ownerID?(t.size=e.size,t._map=e,t):e===t._map?t:0===e.size?t.__empty():t.__make(e)}function makeSet(t,e){var r=Object.create(Dt);return r.size=t?t.size:0,r._map=t,r.__ownerID=e,r}function emptySet(){return zt||(zt=makeSet(emptyMap()))}function getIn$1(t,e,r){for(var n=coerceKeyPath(e),o=0;o!==n.length;)if((t=get(t,n[o++],v))===v)return r;return t}function getIn(t,e){return getIn$1(this,t,e)}function toObject(){assertNotInfinite(this.size);var t={};return this.__iterate((function(e,r){isProtoKey(r)||(t[r]=e)})),t}function toJS(t){if(!t||"object"!=typeof t)return t;if(!isCollection(t)){if(!isDataStructure(t))return t;t=B(t)}if(isKeyed(t)){var e={};return t.__iterate((function(t,r){isProtoKey(r)||(e[r]=toJS(t))})),e}var r=[];return t.__iterate((function(t){r.push(toJS(t))})),r}function hashCollection(t){if(t.size===1/0)return 0;var e=isOrdered(t),r=isKeyed(t),n=e?1:0;return t.__iterate(r?e?function(t,e){n=31*n+hashMerge(hash(t),hash(e))|0}:function(t,e){n=n+hashMerge(hash(t),hash(e))|0}:e?function(t){n=31*n+hash(t)|0}:function(t){n=n+hash(t)|0}),function murmurHashOfSize(t,e){return e=z(e,3432918353),e=z(e<<15|e>>>-15,461845907),e=z(e<<13|e>>>-13,5),e=e+3864292196^t,e=z(e^e>>>16,2246822507),e=z(e^e>>>13,3266489909),e=smi(e^e>>>16),e}(t.size,n)}function hashMerge(t,e){return t^e+2654435769+(t<<6)+(t>>2)}function mixin(t,e){var keyCopier=function(r){t.prototype[r]=e[r]};return Object.keys(e).forEach(keyCopier),Object.getOwnPropertySymbols&&Object.getOwnPropertySymbols(e).forEach(keyCopier),t}Dt[Ut]=!0,Dt[_]=Dt.remove,Dt.merge=Dt.concat=Dt.union,Dt.withMutations=withMutations,Dt.asImmutable=asImmutable,Dt["@@transducer/init"]=Dt.asMutable=asMutable,Dt["@@transducer/step"]=function(t,e){return t.add(e)},Dt["@@transducer/result"]=function(t){return t.asImmutable()},Dt.__empty=emptySet,Dt.__make=makeSet,u.Iterator=y,mixin(u,{toArray:function toArray(){assertNotInfinite(this.size);var t=new Array(this.size||0),e=isKeyed(this),r=0;return this.__iterate((function(n,o){t[r++]=e?[o,n]:n})),t},toIndexedSeq:function toIndexedSeq(){return new it(this)},toJS:function toJS$1(){return toJS(this)},toKeyedSeq:function toKeyedSeq(){return new ot(this,!0)},toMap:function toMap(){return pt(this.toKeyedSeq())},toObject,toOrderedMap:function toOrderedMap(){return Mt(this.toKeyedSeq())},toOrderedSet:function toOrderedSet(){return Yt(isKeyed(this)?this.valueSeq():this)},toSet:function toSet(){return Rt(isKeyed(this)?this.valueSeq():this)},toSetSeq:function toSetSeq(){return new at(this)},toSeq:function toSeq(){return isIndexed(this)?this.toIndexedSeq():isKeyed(this)?this.toKeyedSeq():this.toSetSeq()},toStack:function toStack(){return Tt(isKeyed(this)?this.valueSeq():this)},toList:function toList(){return At(isKeyed(this)?this.valueSeq():this)},toString:function toString(){return"[Collection]"},__toString:function __toString(t,e){return 0===this.size?t+e:t+" "+this.toSeq().map(this.__toStringMapper).join(", ")+" "+e},concat:function concat(){for(var t=[],e=arguments.length;e--;)t[e]=arguments[e];return reify(this,function concatFactory(t,e){var r=isKeyed(t),n=[t].concat(e).map((function(t){return isCollection(t)?r&&(t=c(t)):t=r?keyedSeqFromValue(t):indexedSeqFromValue(Array.isArray(t)?t:[t]),t})).filter((function(t){return 0!==t.size}));if(0===n.length)return t;if(1===n.length){var o=n[0];if(o===t||r&&isKeyed(o)||isIndexed(t)&&isIndexed(o))return o}return new ut(n)}(this,t))},includes:function includes(t){return this.some((function(e){return is(e,t)}))},entries:function entries(){return this.__iterator(2)},every:function every(t,e){assertNotInfinite(this.size);var r=!0;return this.__iterate((function(n,o,i){if(!t.call(e,n,o,i))return r=!1,!1})),r},filter:function filter(t,e){return reify(this,filterFactory(this,t,e,!0))},partition:function partition(t,e){return function partitionFactory(t,e,r){var n=isKeyed(t),o=[[],[]];t.__iterate((function(i,a){o[e.call(r,i,a,t)?1:0].push(n?[a,i]:i)}));var i=collectionClass(t);return o.map((function(e){return reify(t,i(e))}))}(this,t,e)},find:function find(t,e,r){var n=this.findEntry(t,e);return n?n[1]:r},forEach:function forEach(t,e){return assertNotInfinite(this.size),this.__iterate(e?t.bind(e):t)},join:function join(t){assertNotInfinite(this.size),t=void 0!==t?""+t:",";var e="",r=!0;return this.__iterate((function(n){r?r=!1:e+=t,e+=null!=n?n.toString():""})),e},keys:function keys(){return this.__iterator(0)},map:function map(t,e){return reify(this,mapFactory(this,t,e))},reduce:function reduce$1(t,e,r){return reduce(this,t,e,r,arguments.length<2,!1)},reduceRight:function reduceRight(t,e,r){return reduce(this,t,e,r,arguments.length<2,!0)},reverse:function reverse(){return reify(this,reverseFactory(this,!0))},slice:function slice(t,e){return reify(this,sliceFactory(this,t,e,!0))},some:function some(t,e){assertNotInfinite(this.size);var r=!1;return this.__iterate((function(n,o,i){if(t.call(e,n,o,i))return r=!0,!1})),r},sort:function sort(t){return reify(this,sortFactory(this,t))},values:function values(){return this.__iterator(1)},butLast:function butLast(){return this.slice(0,-1)},isEmpty:function isEmpty(){return void 0!==this.size?0===this.size:!this.some((function(){return!0}))},count:function count(t,e){return ensureSize(t?this.toSeq().filter(t,e):this)},countBy:function countBy(t,e){return function countByFactory(t,e,r){var n=pt().asMutable();return t.__iterate((function(o,i){n.update(e.call(r,o,i,t),0,(function(t){return t+1}))})),n.asImmutable()}(this,t,e)},equals:function equals(t){return deepEqual(this,t)},entrySeq:function entrySeq(){var t=this;if(t._cache)return new j(t._cache);var e=t.toSeq().map(entryMapper).toIndexedSeq();return e.fromEntrySeq=function(){return t.toSeq()},e},filterNot:function filterNot(t,e){return this.filter(not(t),e)},findEntry:function findEntry(t,e,r){var n=r;return this.__iterate((function(r,o,i){if(t.call(e,r,o,i))return n=[o,r],!1})),n},findKey:function findKey(t,e){var r=this.findEntry(t,e);return r&&r[0]},findLast:function findLast(t,e,r){return this.toKeyedSeq().reverse().find(t,e,r)},findLastEntry:function findLastEntry(t,e,r){return this.toKeyedSeq().reverse().findEntry(t,e,r)},findLastKey:function findLastKey(t,e){return this.toKeyedSeq().reverse().findKey(t,e)},first:function first(t){return this.find(returnTrue,null,t)},flatMap:function flatMap(t,e){return reify(this,function flatMapFactory(t,e,r){var n=collectionClass(t);return t.toSeq().map((function(o,i){return n(e.call(r,o,i,t))})).flatten(!0)}(this,t,e))},flatten:function flatten(t){return reify(this,flattenFactory(this,t,!0))},fromEntrySeq:function fromEntrySeq(){return new st(this)},get:function get(t,e){return this.find((function(e,r){return is(r,t)}),void 0,e)},getIn,groupBy:function groupBy(t,e){return function groupByFactory(t,e,r){var n=isKeyed(t),o=(isOrdered(t)?Mt():pt()).asMutable();t.__iterate((function(i,a){o.update(e.call(r,i,a,t),(function(t){return(t=t||[]).push(n?[a,i]:i),t}))}));var i=collectionClass(t);return o.map((function(e){return reify(t,i(e))})).asImmutable()}(this,t,e)},has:function has(t){return this.get(t,v)!==v},hasIn:function hasIn(t){return function hasIn$1(t,e){return getIn$1(t,e,v)!==v}(this,t)},isSubset:function isSubset(t){return t="function"==typeof t.includes?t:u(t),this.every((function(e){return t.includes(e)}))},isSuperset:function isSuperset(t){return(t="function"==typeof t.isSubset?t:u(t)).isSubset(this)},keyOf:function keyOf(t){return this.findKey((function(e){return is(e,t)}))},keySeq:function keySeq(){return this.toSeq().map(keyMapper).toIndexedSeq()},last:function last(t){return this.toSeq().reverse().first(t)},lastKeyOf:function lastKeyOf(t){return this.toKeyedSeq().reverse().keyOf(t)},max:function max(t){return maxFactory(this,t)},maxBy:function maxBy(t,e){return maxFactory(this,e,t)},min:function min(t){return maxFactory(this,t?neg(t):defaultNegComparator)},minBy:function minBy(t,e){return maxFactory(this,e?neg(e):defaultNegComparator,t)},rest:function rest(){return this.slice(1)},skip:function skip(t){return 0===t?this:this.slice(Math.max(0,t))},skipLast:function skipLast(t){return 0===t?this:this.slice(0,-Math.max(0,t))},skipWhile:function skipWhile(t,e){return reify(this,skipWhileFactory(this,t,e,!0))},skipUntil:function skipUntil(t,e){return this.skipWhile(not(t),e)},sortBy:function sortBy(t,e){return reify(this,sortFactory(this,e,t))},take:function take(t){return this.slice(0,Math.max(0,t))},takeLast:function takeLast(t){return this.slice(-Math.max(0,t))},takeWhile:function takeWhile(t,e){return reify(this,function takeWhileFactory(t,e,r){var n=makeSequence(t);return n.__iterateUncached=function(n,o){var i=this;if(o)return this.cacheResult().__iterate(n,o);var a=0;return t.__iterate((function(t,o,s){return e.call(r,t,o,s)&&++a&&n(t,o,i)})),a},n.__iteratorUncached=function(n,o){var i=this;if(o)return this.cacheResult().__iterator(n,o);var a=t.__iterator(2,o),s=!0;return new y((function(){if(!s)return{value:void 0,done:!0};var t=a.next();if(t.done)return t;var o=t.value,u=o[0],c=o[1];return e.call(r,c,u,i)?2===n?t:iteratorValue(n,u,c,t):(s=!1,{value:void 0,done:!0})}))},n}(this,t,e))},takeUntil:function takeUntil(t,e){return this.takeWhile(not(t),e)},update:function update(t){return t(this)},valueSeq:function valueSeq(){return this.toIndexedSeq()},hashCode:function hashCode(){return this.__hash||(this.__hash=hashCollection(this))}});var Wt=u.prototype;Wt[s]=!0,Wt[d]=Wt.values,Wt.toJSON=Wt.toArray,Wt.__toStringMapper=quoteString,Wt.inspect=Wt.toSource=function(){return this.toString()},Wt.chain=Wt.flatMap,Wt.contains=Wt.includes,mixin(c,{flip:function flip(){return reify(this,flipFactory(this))},mapEntries:function mapEntries(t,e){var r=this,n=0;return reify(this,this.toSeq().map((function(o,i){return t.call(e,[i,o],n++,r)})).fromEntrySeq())},mapKeys:function mapKeys(t,e){var r=this;return reify(this,this.toSeq().flip().map((function(n,o){return t.call(e,n,o,r)})).flip())}});var Kt=c.prototype;Kt[a]=!0,Kt[d]=Wt.entries,Kt.toJSON=toObject,Kt.__toStringMapper=function(t,e){return quoteString(e)+": "+quoteString(t)},mixin(l,{toKeyedSeq:function toKeyedSeq(){return new ot(this,!1)},filter:function filter(t,e){return reify(this,filterFactory(this,t,e,!1))},findIndex:function findIndex(t,e){var r=this.findEntry(t,e);return r?r[0]:-1},indexOf:function indexOf(t){var e=this.keyOf(t);return void 0===e?-1:e},lastIndexOf:function lastIndexOf(t){var e=this.lastKeyOf(t);return void 0===e?-1:e},reverse:function reverse(){return reify(this,reverseFactory(this,!1))},slice:function slice(t,e){return reify(this,sliceFactory(this,t,e,!1))},splice:function splice(t,e){var r=arguments.length;if(e=Math.max(e||0,0),0===r||2===r&&!e)return this;t=resolveBegin(t,t<0?this.count():this.size);var n=this.slice(0,t);return reify(this,1===r?n:n.concat(arrCopy(arguments,2),this.slice(t+e)))},findLastIndex:function findLastIndex(t,e){var r=this.findLastEntry(t,e);return r?r[0]:-1},first:function first(t){return this.get(0,t)},flatten:function flatten(t){return reify(this,flattenFactory(this,t,!1))},get:function get(t,e){return(t=wrapIndex(this,t))<0||this.size===1/0||void 0!==this.size&&t>this.size?e:this.find((function(e,r){return r===t}),void 0,e)},has:function has(t){return(t=wrapIndex(this,t))>=0&&(void 0!==this.size?this.size===1/0||t<this.size:this.find((function(e,r){return r===t}),void 0,v)!==v)},interpose:function interpose(t){return reify(this,function interposeFactory(t,e){var r=makeSequence(t);return r.size=t.size&&2*t.size-1,r.__iterateUncached=function(r,n){var o=this,i=0;return t.__iterate((function(t){return(!i||!1!==r(e,i++,o))&&!1!==r(t,i++,o)}),n),i},r.__iteratorUncached=function(r,n){var o,i=t.__iterator(1,n),a=0;return new y((function(){return(!o||a%2)&&(o=i.next()).done?o:a%2?iteratorValue(r,a++,e):iteratorValue(r,a++,o.value,o)}))},r}(this,t))},interleave:function interleave(){var t=[this].concat(arrCopy(arguments)),e=zipWithFactory(this.toSeq(),q.of,t),r=e.flatten(!0);return e.size&&(r.size=e.size*t.length),reify(this,r)},keySeq:function keySeq(){return Ft(0,this.size)},last:function last(t){return this.get(-1,t)},skipWhile:function skipWhile(t,e){return reify(this,skipWhileFactory(this,t,e,!1))},zip:function zip(){return reify(this,zipWithFactory(this,defaultZipper,[this].concat(arrCopy(arguments))))},zipAll:function zipAll(){return reify(this,zipWithFactory(this,defaultZipper,[this].concat(arrCopy(arguments)),!0))},zipWith:function zipWith(t){var e=arrCopy(arguments);return e[0]=this,reify(this,zipWithFactory(this,t,e))}});var Vt=l.prototype;Vt[i]=!0,Vt[w]=!0,mixin(f,{get:function get(t,e){return this.has(t)?t:e},includes:function includes(t){return this.has(t)},keySeq:function keySeq(){return this.valueSeq()}});var $t=f.prototype;function defaultZipper(){return arrCopy(arguments)}function isOrderedSet(t){return isSet(t)&&isOrdered(t)}$t.has=Wt.includes,$t.contains=$t.includes,$t.keys=$t.values,mixin(k,Kt),mixin(q,Vt),mixin(C,$t);var Yt=function(t){function OrderedSet(t){return null==t?emptyOrderedSet():isOrderedSet(t)?t:emptyOrderedSet().withMutations((function(e){var r=f(t);assertNotInfinite(r.size),r.forEach((function(t){return e.add(t)}))}))}return t&&(OrderedSet.__proto__=t),OrderedSet.prototype=Object.create(t&&t.prototype),OrderedSet.prototype.constructor=OrderedSet,OrderedSet.of=function of(){return this(arguments)},OrderedSet.fromKeys=function fromKeys(t){return this(c(t).keySeq())},OrderedSet.prototype.toString=function toString(){return this.__toString("OrderedSet {","}")},OrderedSet}(Rt);Yt.isOrderedSet=isOrderedSet;var Ht,Gt=Yt.prototype;function makeOrderedSet(t,e){var r=Object.create(Gt);return r.size=t?t.size:0,r._map=t,r.__ownerID=e,r}function emptyOrderedSet(){return Ht||(Ht=makeOrderedSet(emptyOrderedMap()))}Gt[w]=!0,Gt.zip=Vt.zip,Gt.zipWith=Vt.zipWith,Gt.zipAll=Vt.zipAll,Gt.__empty=emptyOrderedSet,Gt.__make=makeOrderedSet;var Zt=function Record(t,e){var r;!function throwOnInvalidDefaultValues(t){if(isRecord(t))throw new Error("Can not call `Record` with an immutable Record as default values. Use a plain javascript object instead.");if(isImmutable(t))throw new Error("Can not call `Record` with an immutable Collection as default values. Use a plain javascript object instead.");if(null===t||"object"!=typeof t)throw new Error("Can not call `Record` with a non-object as default values. Use a plain javascript object instead.")}(t);var n=function Record(i){var a=this;if(i instanceof n)return i;if(!(this instanceof n))return new n(i);if(!r){r=!0;var s=Object.keys(t),u=o._indices={};o._name=e,o._keys=s,o._defaultValues=t;for(var l=0;l<s.length;l++){var f=s[l];u[f]=l,o[f]?"object"==typeof console&&console.warn&&console.warn("Cannot define "+recordName(this)+' with property "'+f+'" since that property name is part of the Record API.'):setProp(o,f)}}return this.__ownerID=void 0,this._values=At().withMutations((function(t){t.setSize(a._keys.length),c(i).forEach((function(e,r){t.set(a._indices[r],e===a._defaultValues[r]?void 0:e)}))})),this},o=n.prototype=Object.create(Jt);return o.constructor=n,e&&(n.displayName=e),n};Zt.prototype.toString=function toString(){for(var t,e=recordName(this)+" { ",r=this._keys,n=0,o=r.length;n!==o;n++)e+=(n?", ":"")+(t=r[n])+": "+quoteString(this.get(t));return e+" }"},Zt.prototype.equals=function equals(t){return this===t||isRecord(t)&&recordSeq(this).equals(recordSeq(t))},Zt.prototype.hashCode=function hashCode(){return recordSeq(this).hashCode()},Zt.prototype.has=function has(t){return this._indices.hasOwnProperty(t)},Zt.prototype.get=function get(t,e){if(!this.has(t))return e;var r=this._indices[t],n=this._values.get(r);return void 0===n?this._defaultValues[t]:n},Zt.prototype.set=function set(t,e){if(this.has(t)){var r=this._values.set(this._indices[t],e===this._defaultValues[t]?void 0:e);if(r!==this._values&&!this.__ownerID)return makeRecord(this,r)}return this},Zt.prototype.remove=function remove(t){return this.set(t)},Zt.prototype.clear=function clear(){var t=this._values.clear().setSize(this._keys.length);return this.__ownerID?this:makeRecord(this,t)},Zt.prototype.wasAltered=function wasAltered(){return this._values.wasAltered()},Zt.prototype.toSeq=function toSeq(){return recordSeq(this)},Zt.prototype.toJS=function toJS$1(){return toJS(this)},Zt.prototype.entries=function entries(){return this.__iterator(2)},Zt.prototype.__iterator=function __iterator(t,e){return recordSeq(this).__iterator(t,e)},Zt.prototype.__iterate=function __iterate(t,e){return recordSeq(this).__iterate(t,e)},Zt.prototype.__ensureOwner=function __ensureOwner(t){if(t===this.__ownerID)return this;var e=this._values.__ensureOwner(t);return t?makeRecord(this,e,t):(this.__ownerID=t,this._values=e,this)},Zt.isRecord=isRecord,Zt.getDescriptiveName=recordName;var Jt=Zt.prototype;function makeRecord(t,e,r){var n=Object.create(Object.getPrototypeOf(t));return n._values=e,n.__ownerID=r,n}function recordName(t){return t.constructor.displayName||t.constructor.name||"Record"}function recordSeq(t){return keyedSeqFromValue(t._keys.map((function(e){return[e,t.get(e)]})))}function setProp(t,e){try{Object.defineProperty(t,e,{get:function(){return this.get(e)},set:function(t){invariant(this.__ownerID,"Cannot set on an immutable record."),this.set(e,t)}})}catch(t){}}Jt[b]=!0,Jt[_]=Jt.remove,Jt.deleteIn=Jt.removeIn=deleteIn,Jt.getIn=getIn,Jt.hasIn=Wt.hasIn,Jt.merge=merge$1,Jt.mergeWith=mergeWith$1,Jt.mergeIn=mergeIn,Jt.mergeDeep=mergeDeep,Jt.mergeDeepWith=mergeDeepWith,Jt.mergeDeepIn=mergeDeepIn,Jt.setIn=setIn,Jt.update=update,Jt.updateIn=updateIn$1,Jt.withMutations=withMutations,Jt.asMutable=asMutable,Jt.asImmutable=asImmutable,Jt[d]=Jt.entries,Jt.toJSON=Jt.toObject=Wt.toObject,Jt.inspect=Jt.toSource=function(){return this.toString()};function fromJS(t,e){return fromJSWith([],e||defaultConverter,t,"",e&&e.length>2?[]:void 0,{"":t})}function fromJSWith(t,e,r,n,o,i){if("string"!=typeof r&&!isImmutable(r)&&(isArrayLike(r)||hasIterator(r)||isPlainObject(r))){if(~t.indexOf(r))throw new TypeError("Cannot convert circular structure to Immutable");t.push(r),o&&""!==n&&o.push(n);var a=e.call(i,n,B(r).map((function(n,i){return fromJSWith(t,e,n,i,o,r)})),o&&o.slice());return t.pop(),o&&o.pop(),a}return r}function defaultConverter(t,e){return isIndexed(e)?e.toList():isKeyed(e)?e.toMap():e.toSet()}__webpack_require__(4058),__webpack_require__(5808),__webpack_require__(104),__webpack_require__(7309),__webpack_require__(2426),__webpack_require__(5288),__webpack_require__(1882),__webpack_require__(2205),__webpack_require__(3209),__webpack_require__(2802);const Qt=function makeWindow(){var t={location:{},history:{},open:()=>{},close:()=>{},File:function(){},FormData:function(){}};if("undefined"==typeof window)return t;try{t=window;for(var e of["File","Blob","FormData"])e in window&&(t[e]=window[e])}catch(t){console.error(t)}return t}();Rt.of("type","format","items","default","maximum","exclusiveMaximum","minimum","exclusiveMinimum","maxLength","minLength","pattern","maxItems","minItems","uniqueItems","enum","multipleOf");__webpack_require__(8287).Buffer;const parseSearch=()=>{const t=new URLSearchParams(Qt.location.search);return Object.fromEntries(t)};class TopBar extends n.Component{constructor(t,e){super(t,e),this.state={url:t.specSelectors.url(),selectedIndex:0}}UNSAFE_componentWillReceiveProps(t){this.setState({url:t.specSelectors.url()})}onUrlChange=t=>{let{target:{value:e}}=t;this.setState({url:e})};flushAuthData(){const{persistAuthorization:t}=this.props.getConfigs();t||this.props.authActions.restoreAuthorization({authorized:{}})}loadSpec=t=>{this.flushAuthData(),this.props.specActions.updateUrl(t),this.props.specActions.download(t)};onUrlSelect=t=>{let e=t.target.value||t.target.href;this.loadSpec(e),this.setSelectedUrl(e),t.preventDefault()};downloadUrl=t=>{this.loadSpec(this.state.url),t.preventDefault()};setSearch=t=>{let e=parseSearch();e["urls.primaryName"]=t.name;const r=`${window.location.protocol}//${window.location.host}${window.location.pathname}`;window&&window.history&&window.history.pushState&&window.history.replaceState(null,"",`${r}?${(t=>{const e=new URLSearchParams(Object.entries(t));return String(e)})(e)}`)};setSelectedUrl=t=>{const e=this.props.getConfigs().urls||[];e&&e.length&&t&&e.forEach(((e,r)=>{e.url===t&&(this.setState({selectedIndex:r}),this.setSearch(e))}))};componentDidMount(){const t=this.props.getConfigs(),e=t.urls||[];if(e&&e.length){var r=this.state.selectedIndex;let n=parseSearch()["urls.primaryName"]||t.urls.primaryName;n&&e.forEach(((t,e)=>{t.name===n&&(this.setState({selectedIndex:e}),r=e)})),this.loadSpec(e[r].url)}}onFilterChange=t=>{let{target:{value:e}}=t;this.props.layoutActions.updateFilter(e)};render(){let{getComponent:t,specSelectors:e,getConfigs:r}=this.props;const o=t("Button"),i=t("Link"),a=t("Logo"),s=t("DarkModeToggle");let u="loading"===e.loadingStatus();const c=["download-url-input"];"failed"===e.loadingStatus()&&c.push("failed"),u&&c.push("loading");const{urls:l}=r();let f=[],p=null;if(l){let t=[];l.forEach(((e,r)=>{t.push(n.createElement("option",{key:r,value:e.url},e.name))})),f.push(n.createElement("label",{className:"select-label",htmlFor:"select"},n.createElement("span",null,"Select a definition"),n.createElement("select",{id:"select",disabled:u,onChange:this.onUrlSelect,value:l[this.state.selectedIndex].url},t)))}else p=this.downloadUrl,f.push(n.createElement("input",{className:c.join(" "),type:"text",onChange:this.onUrlChange,value:this.state.url,disabled:u,id:"download-url-input"})),f.push(n.createElement(o,{className:"download-url-button",onClick:this.downloadUrl},"Explore"));return n.createElement("header",{className:"topbar",role:"banner"},n.createElement("div",{className:"wrapper"},n.createElement("div",{className:"topbar-wrapper"},n.createElement(i,null,n.createElement(a,null)),n.createElement("form",{className:"download-url-wrapper",onSubmit:p},f.map(((t,e)=>(0,n.cloneElement)(t,{key:e})))),n.createElement(s,null))))}}const Xt=TopBar;var te,ee,re,ne,oe,ie,ae,se,ue,ce,le,fe,pe,he,de,ye,_e,ge,me,ve,be,we,Se,Ie,xe,Ee,Ae,Oe,Be,ke,qe,Ce;function _extends(){return _extends=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)({}).hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},_extends.apply(null,arguments)}const logo_small=t=>n.createElement("svg",_extends({xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 407 116"},t),te||(te=n.createElement("defs",null,n.createElement("clipPath",{id:"logo_small_svg__clip-SW_TM-logo-on-dark"},n.createElement("path",{d:"M0 0h407v116H0z"})),n.createElement("style",null,".logo_small_svg__cls-2{fill:#fff}.logo_small_svg__cls-3{fill:#85ea2d}"))),n.createElement("g",{id:"logo_small_svg__SW_TM-logo-on-dark",style:{clipPath:"url(#logo_small_svg__clip-SW_TM-logo-on-dark)"}},n.createElement("g",{id:"logo_small_svg__SW_In-Product",transform:"translate(-.301)"},ee||(ee=n.createElement("path",{id:"logo_small_svg__Path_2936",d:"M359.15 70.674h-.7v-3.682h-1.26v-.6h3.219v.6h-1.259Z",className:"logo_small_svg__cls-2","data-name":"Path 2936"})),re||(re=n.createElement("path",{id:"logo_small_svg__Path_2937",d:"m363.217 70.674-1.242-3.574h-.023q.05.8.05 1.494v2.083h-.636v-4.286h.987l1.19 3.407h.017l1.225-3.407h.99v4.283h-.675v-2.118a30 30 0 0 1 .044-1.453h-.023l-1.286 3.571Z",className:"logo_small_svg__cls-2","data-name":"Path 2937"})),ne||(ne=n.createElement("path",{id:"logo_small_svg__Path_2938",d:"M50.328 97.669a47.642 47.642 0 1 1 47.643-47.642 47.64 47.64 0 0 1-47.643 47.642",className:"logo_small_svg__cls-3","data-name":"Path 2938"})),oe||(oe=n.createElement("path",{id:"logo_small_svg__Path_2939",d:"M50.328 4.769A45.258 45.258 0 1 1 5.07 50.027 45.26 45.26 0 0 1 50.328 4.769m0-4.769a50.027 50.027 0 1 0 50.027 50.027A50.027 50.027 0 0 0 50.328 0",className:"logo_small_svg__cls-3","data-name":"Path 2939"})),n.createElement("path",{id:"logo_small_svg__Path_2940",d:"M31.8 33.854c-.154 1.712.058 3.482-.057 5.213a43 43 0 0 1-.693 5.156 9.53 9.53 0 0 1-4.1 5.829c4.079 2.654 4.54 6.771 4.81 10.946.135 2.25.077 4.52.308 6.752.173 1.731.846 2.174 2.636 2.231.73.02 1.48 0 2.327 0v5.349c-5.29.9-9.657-.6-10.734-5.079a31 31 0 0 1-.654-5c-.117-1.789.076-3.578-.058-5.367-.386-4.906-1.02-6.56-5.713-6.791v-6.1a9 9 0 0 1 1.028-.173c2.577-.135 3.674-.924 4.231-3.463a29 29 0 0 0 .481-4.329 82 82 0 0 1 .6-8.406c.673-3.982 3.136-5.906 7.234-6.137 1.154-.057 2.327 0 3.655 0v5.464c-.558.038-1.039.115-1.539.115-3.336-.115-3.51 1.02-3.762 3.79m6.406 12.658h-.077a3.515 3.515 0 1 0-.346 7.021h.231a3.46 3.46 0 0 0 3.655-3.251v-.192a3.523 3.523 0 0 0-3.461-3.578Zm12.062 0a3.373 3.373 0 0 0-3.482 3.251 2 2 0 0 0 .02.327 3.3 3.3 0 0 0 3.578 3.443 3.263 3.263 0 0 0 3.443-3.558 3.308 3.308 0 0 0-3.557-3.463Zm12.351 0a3.59 3.59 0 0 0-3.655 3.482 3.53 3.53 0 0 0 3.536 3.539h.039c1.769.309 3.559-1.4 3.674-3.462a3.57 3.57 0 0 0-3.6-3.559Zm16.948.288c-2.232-.1-3.348-.846-3.9-2.962a21.5 21.5 0 0 1-.635-4.136c-.154-2.578-.135-5.175-.308-7.753-.4-6.117-4.828-8.252-11.254-7.195v5.31c1.019 0 1.808 0 2.6.019 1.366.019 2.4.539 2.539 2.059.135 1.385.135 2.789.27 4.193.269 2.79.422 5.618.9 8.369a8.72 8.72 0 0 0 3.921 5.348c-3.4 2.289-4.406 5.559-4.578 9.234-.1 2.52-.154 5.059-.289 7.6-.115 2.308-.923 3.058-3.251 3.116-.654.019-1.289.077-2.019.115v5.445c1.365 0 2.616.077 3.866 0 3.886-.231 6.233-2.117 7-5.887A49 49 0 0 0 75 63.4c.135-1.923.116-3.866.308-5.771.289-2.982 1.655-4.213 4.636-4.4a4 4 0 0 0 .828-.192v-6.1c-.5-.058-.843-.115-1.208-.135Z","data-name":"Path 2940",style:{fill:"#173647"}}),ie||(ie=n.createElement("path",{id:"logo_small_svg__Path_2941",d:"M152.273 58.122a11.23 11.23 0 0 1-4.384 9.424q-4.383 3.382-11.9 3.382-8.14 0-12.524-2.1V63.7a33 33 0 0 0 6.137 1.879 32.3 32.3 0 0 0 6.575.689q5.322 0 8.015-2.02a6.63 6.63 0 0 0 2.692-5.62 7.2 7.2 0 0 0-.954-3.9 8.9 8.9 0 0 0-3.194-2.8 44.6 44.6 0 0 0-6.81-2.911q-6.387-2.286-9.126-5.417a11.96 11.96 0 0 1-2.74-8.172A10.16 10.16 0 0 1 128.039 27q3.977-3.131 10.52-3.131a31 31 0 0 1 12.555 2.5L149.455 31a28.4 28.4 0 0 0-11.021-2.38 10.67 10.67 0 0 0-6.606 1.816 5.98 5.98 0 0 0-2.38 5.041 7.7 7.7 0 0 0 .877 3.9 8.24 8.24 0 0 0 2.959 2.786 36.7 36.7 0 0 0 6.371 2.8q7.2 2.566 9.91 5.51a10.84 10.84 0 0 1 2.708 7.649",className:"logo_small_svg__cls-2","data-name":"Path 2941"})),ae||(ae=n.createElement("path",{id:"logo_small_svg__Path_2942",d:"M185.288 70.3 179 50.17q-.594-1.848-2.222-8.391h-.251q-1.252 5.479-2.192 8.453L167.849 70.3h-6.011l-9.361-34.315h5.447q3.318 12.931 5.057 19.693a80 80 0 0 1 1.988 9.111h.25q.345-1.785 1.112-4.618t1.33-4.493l6.294-19.693h5.635l6.137 19.693a66 66 0 0 1 2.379 9.048h.251a33 33 0 0 1 .673-3.475q.548-2.347 6.528-25.266h5.385L191.456 70.3Z",className:"logo_small_svg__cls-2","data-name":"Path 2942"})),se||(se=n.createElement("path",{id:"logo_small_svg__Path_2943",d:"m225.115 70.3-1.033-4.885h-.25a14.45 14.45 0 0 1-5.119 4.368 15.6 15.6 0 0 1-6.372 1.143q-5.1 0-8-2.63t-2.9-7.483q0-10.4 16.626-10.9l5.823-.188V47.6q0-4.038-1.738-5.964t-5.552-1.923a22.6 22.6 0 0 0-9.706 2.63l-1.6-3.977a24.4 24.4 0 0 1 5.557-2.16 24 24 0 0 1 6.058-.783q6.136 0 9.1 2.724t2.959 8.735V70.3Zm-11.741-3.663a10.55 10.55 0 0 0 7.626-2.66 9.85 9.85 0 0 0 2.771-7.451v-3.1l-5.2.219q-6.2.219-8.939 1.926a5.8 5.8 0 0 0-2.74 5.306 5.35 5.35 0 0 0 1.707 4.29 7.08 7.08 0 0 0 4.775 1.472Z",className:"logo_small_svg__cls-2","data-name":"Path 2943"})),ue||(ue=n.createElement("path",{id:"logo_small_svg__Path_2944",d:"M264.6 35.987v3.287l-6.356.752a11.16 11.16 0 0 1 2.255 6.856 10.15 10.15 0 0 1-3.444 8.047q-3.444 3-9.456 3a15.7 15.7 0 0 1-2.88-.25Q241.4 59.438 241.4 62.1a2.24 2.24 0 0 0 1.159 2.082 8.46 8.46 0 0 0 3.976.673h6.074q5.573 0 8.563 2.348a8.16 8.16 0 0 1 2.99 6.825 9.74 9.74 0 0 1-4.571 8.688q-4.572 2.989-13.338 2.99-6.732 0-10.379-2.5a8.09 8.09 0 0 1-3.647-7.076 7.95 7.95 0 0 1 2-5.417 10.2 10.2 0 0 1 5.636-3.1 5.43 5.43 0 0 1-2.207-1.847 4.9 4.9 0 0 1-.893-2.912 5.53 5.53 0 0 1 1-3.288 10.5 10.5 0 0 1 3.162-2.723 9.28 9.28 0 0 1-4.336-3.726 10.95 10.95 0 0 1-1.675-6.012q0-5.634 3.382-8.688t9.58-3.052a17.4 17.4 0 0 1 4.853.626Zm-27.367 40.075a4.66 4.66 0 0 0 2.348 4.227 12.97 12.97 0 0 0 6.732 1.44q6.543 0 9.69-1.956a5.99 5.99 0 0 0 3.147-5.307q0-2.787-1.723-3.867t-6.481-1.08h-6.23a8.2 8.2 0 0 0-5.51 1.69 6.04 6.04 0 0 0-1.973 4.853m2.818-29.086a6.98 6.98 0 0 0 2.035 5.448 8.12 8.12 0 0 0 5.667 1.847q7.608 0 7.608-7.389 0-7.733-7.7-7.733a7.63 7.63 0 0 0-5.635 1.972q-1.976 1.973-1.975 5.855",className:"logo_small_svg__cls-2","data-name":"Path 2944"})),ce||(ce=n.createElement("path",{id:"logo_small_svg__Path_2945",d:"M299.136 35.987v3.287l-6.356.752a11.17 11.17 0 0 1 2.254 6.856 10.15 10.15 0 0 1-3.444 8.047q-3.444 3-9.455 3a15.7 15.7 0 0 1-2.88-.25q-3.32 1.754-3.319 4.415a2.24 2.24 0 0 0 1.158 2.082 8.46 8.46 0 0 0 3.976.673h6.074q5.574 0 8.563 2.348a8.16 8.16 0 0 1 2.99 6.825 9.74 9.74 0 0 1-4.571 8.688q-4.57 2.989-13.337 2.99-6.732 0-10.379-2.5a8.09 8.09 0 0 1-3.648-7.076 7.95 7.95 0 0 1 2-5.417 10.2 10.2 0 0 1 5.636-3.1 5.43 5.43 0 0 1-2.208-1.847 4.9 4.9 0 0 1-.892-2.912 5.53 5.53 0 0 1 1-3.288 10.5 10.5 0 0 1 3.162-2.723 9.27 9.27 0 0 1-4.336-3.726 10.95 10.95 0 0 1-1.675-6.012q0-5.634 3.381-8.688t9.581-3.052a17.4 17.4 0 0 1 4.853.626Zm-27.364 40.075a4.66 4.66 0 0 0 2.348 4.227 12.97 12.97 0 0 0 6.731 1.44q6.544 0 9.691-1.956a5.99 5.99 0 0 0 3.146-5.307q0-2.787-1.722-3.867t-6.481-1.08h-6.23a8.2 8.2 0 0 0-5.511 1.69 6.04 6.04 0 0 0-1.972 4.853m2.818-29.086a6.98 6.98 0 0 0 2.035 5.448 8.12 8.12 0 0 0 5.667 1.847q7.607 0 7.608-7.389 0-7.733-7.7-7.733a7.63 7.63 0 0 0-5.635 1.972q-1.975 1.973-1.975 5.855",className:"logo_small_svg__cls-2","data-name":"Path 2945"})),le||(le=n.createElement("path",{id:"logo_small_svg__Path_2946",d:"M316.778 70.928q-7.608 0-12.007-4.634t-4.4-12.868q0-8.3 4.086-13.181a13.57 13.57 0 0 1 10.974-4.884 12.94 12.94 0 0 1 10.207 4.239q3.762 4.247 3.762 11.2v3.287h-23.643q.156 6.044 3.053 9.174t8.156 3.131a27.6 27.6 0 0 0 10.958-2.317v4.634a27.5 27.5 0 0 1-5.213 1.706 29.3 29.3 0 0 1-5.933.513m-1.409-31.215a8.49 8.49 0 0 0-6.591 2.692 12.4 12.4 0 0 0-2.9 7.452h17.94q0-4.916-2.191-7.53a7.71 7.71 0 0 0-6.258-2.614",className:"logo_small_svg__cls-2","data-name":"Path 2946"})),fe||(fe=n.createElement("path",{id:"logo_small_svg__Path_2947",d:"M350.9 35.361a20.4 20.4 0 0 1 4.1.375l-.721 4.822a17.7 17.7 0 0 0-3.757-.47 9.14 9.14 0 0 0-7.122 3.382 12.33 12.33 0 0 0-2.959 8.422V70.3h-5.2V35.987h4.29l.6 6.356h.25a15.1 15.1 0 0 1 4.6-5.166 10.36 10.36 0 0 1 5.919-1.816",className:"logo_small_svg__cls-2","data-name":"Path 2947"})),pe||(pe=n.createElement("path",{id:"logo_small_svg__Path_2948",d:"M255.857 96.638s-3.43-.391-4.85-.391c-2.058 0-3.111.735-3.111 2.18 0 1.568.882 1.935 3.748 2.719 3.527.98 4.8 1.911 4.8 4.777 0 3.675-2.3 5.267-5.61 5.267a36 36 0 0 1-5.487-.662l.27-2.18s3.306.441 5.046.441c2.082 0 3.037-.931 3.037-2.7 0-1.421-.759-1.91-3.331-2.523-3.626-.93-5.193-2.033-5.193-4.948 0-3.381 2.229-4.776 5.585-4.776a37 37 0 0 1 5.315.587Z",className:"logo_small_svg__cls-2","data-name":"Path 2948"})),he||(he=n.createElement("path",{id:"logo_small_svg__Path_2949",d:"M262.967 94.14h4.733l3.748 13.106L275.2 94.14h4.752v16.78H277.2v-14.5h-.145l-4.191 13.816h-2.842l-4.191-13.816h-.145v14.5h-2.719Z",className:"logo_small_svg__cls-2","data-name":"Path 2949"})),de||(de=n.createElement("path",{id:"logo_small_svg__Path_2950",d:"M322.057 94.14H334.3v2.425h-4.728v14.355h-2.743V96.565h-4.777Z",className:"logo_small_svg__cls-2","data-name":"Path 2950"})),ye||(ye=n.createElement("path",{id:"logo_small_svg__Path_2951",d:"M346.137 94.14c3.332 0 5.12 1.249 5.12 4.361 0 2.033-.637 3.037-1.984 3.772 1.445.563 2.4 1.592 2.4 3.9 0 3.43-2.081 4.752-5.339 4.752h-6.566V94.14Zm-3.65 2.352v4.8h3.6c1.666 0 2.4-.832 2.4-2.474 0-1.617-.833-2.327-2.5-2.327Zm0 7.1v4.973h3.7c1.689 0 2.694-.539 2.694-2.548 0-1.911-1.421-2.425-2.744-2.425Z",className:"logo_small_svg__cls-2","data-name":"Path 2951"})),_e||(_e=n.createElement("path",{id:"logo_small_svg__Path_2952",d:"M358.414 94.14H369v2.377h-7.864v4.751h6.394v2.332h-6.394v4.924H369v2.4h-10.586Z",className:"logo_small_svg__cls-2","data-name":"Path 2952"})),ge||(ge=n.createElement("path",{id:"logo_small_svg__Path_2953",d:"M378.747 94.14h5.414l4.164 16.78h-2.744l-1.239-4.92h-5.777l-1.239 4.923h-2.719Zm.361 9.456h4.708l-1.737-7.178h-1.225Z",className:"logo_small_svg__cls-2","data-name":"Path 2953"})),me||(me=n.createElement("path",{id:"logo_small_svg__Path_2954",d:"M397.1 105.947v4.973h-2.719V94.14h6.37c3.7 0 5.683 2.12 5.683 5.843 0 2.376-.956 4.519-2.744 5.352l2.769 5.585h-2.989l-2.426-4.973Zm3.651-9.455H397.1v7.1h3.7c2.057 0 2.841-1.85 2.841-3.589 0-1.9-.934-3.511-2.894-3.511Z",className:"logo_small_svg__cls-2","data-name":"Path 2954"})),ve||(ve=n.createElement("path",{id:"logo_small_svg__Path_2955",d:"M290.013 94.14h5.413l4.164 16.78h-2.743l-1.239-4.92h-5.777l-1.239 4.923h-2.719Zm.361 9.456h4.707l-1.737-7.178h-1.225Z",className:"logo_small_svg__cls-2","data-name":"Path 2955"})),be||(be=n.createElement("path",{id:"logo_small_svg__Path_2956",d:"M308.362 105.947v4.973h-2.719V94.14h6.369c3.7 0 5.683 2.12 5.683 5.843 0 2.376-.955 4.519-2.743 5.352l2.768 5.585h-2.989l-2.425-4.973Zm3.65-9.455h-3.65v7.1h3.7c2.058 0 2.841-1.85 2.841-3.589-.003-1.903-.931-3.511-2.891-3.511",className:"logo_small_svg__cls-2","data-name":"Path 2956"})),we||(we=n.createElement("path",{id:"logo_small_svg__Path_2957",d:"M130.606 107.643a3.02 3.02 0 0 1-1.18 2.537 5.1 5.1 0 0 1-3.2.91 8 8 0 0 1-3.371-.564v-1.383a9 9 0 0 0 1.652.506 8.7 8.7 0 0 0 1.77.186 3.57 3.57 0 0 0 2.157-.544 1.78 1.78 0 0 0 .725-1.512 1.95 1.95 0 0 0-.257-1.05 2.4 2.4 0 0 0-.86-.754 12 12 0 0 0-1.833-.784 5.84 5.84 0 0 1-2.456-1.458 3.2 3.2 0 0 1-.738-2.2 2.74 2.74 0 0 1 1.071-2.267 4.44 4.44 0 0 1 2.831-.843 8.3 8.3 0 0 1 3.38.675l-.447 1.247a7.6 7.6 0 0 0-2.966-.641 2.88 2.88 0 0 0-1.779.489 1.61 1.61 0 0 0-.64 1.357 2.1 2.1 0 0 0 .236 1.049 2.2 2.2 0 0 0 .8.75 10 10 0 0 0 1.715.754 6.8 6.8 0 0 1 2.667 1.483 2.92 2.92 0 0 1 .723 2.057",className:"logo_small_svg__cls-2","data-name":"Path 2957"})),Se||(Se=n.createElement("path",{id:"logo_small_svg__Path_2958",d:"M134.447 101.686v5.991a2.4 2.4 0 0 0 .515 1.686 2.1 2.1 0 0 0 1.609.556 2.63 2.63 0 0 0 2.12-.792 4 4 0 0 0 .67-2.587v-4.854h1.4v9.236H139.6l-.2-1.239h-.075a2.8 2.8 0 0 1-1.193 1.045 4 4 0 0 1-1.74.362 3.53 3.53 0 0 1-2.524-.8 3.4 3.4 0 0 1-.839-2.562v-6.042Z",className:"logo_small_svg__cls-2","data-name":"Path 2958"})),Ie||(Ie=n.createElement("path",{id:"logo_small_svg__Path_2959",d:"M148.206 111.09a4 4 0 0 1-1.647-.333 3.1 3.1 0 0 1-1.252-1.023h-.1a12 12 0 0 1 .1 1.533v3.8h-1.4v-13.381h1.137l.194 1.264h.067a3.26 3.26 0 0 1 1.256-1.1 3.8 3.8 0 0 1 1.643-.337 3.41 3.41 0 0 1 2.836 1.256 6.68 6.68 0 0 1-.017 7.057 3.42 3.42 0 0 1-2.817 1.264m-.2-8.385a2.48 2.48 0 0 0-2.048.784 4.04 4.04 0 0 0-.649 2.494v.312a4.63 4.63 0 0 0 .649 2.785 2.47 2.47 0 0 0 2.082.839 2.16 2.16 0 0 0 1.875-.969 4.6 4.6 0 0 0 .678-2.671 4.43 4.43 0 0 0-.678-2.651 2.23 2.23 0 0 0-1.915-.923Z",className:"logo_small_svg__cls-2","data-name":"Path 2959"})),xe||(xe=n.createElement("path",{id:"logo_small_svg__Path_2960",d:"M159.039 111.09a4 4 0 0 1-1.647-.333 3.1 3.1 0 0 1-1.252-1.023h-.1a12 12 0 0 1 .1 1.533v3.8h-1.4v-13.381h1.137l.194 1.264h.067a3.26 3.26 0 0 1 1.256-1.1 3.8 3.8 0 0 1 1.643-.337 3.41 3.41 0 0 1 2.836 1.256 6.68 6.68 0 0 1-.017 7.057 3.42 3.42 0 0 1-2.817 1.264m-.2-8.385a2.48 2.48 0 0 0-2.048.784 4.04 4.04 0 0 0-.649 2.494v.312a4.63 4.63 0 0 0 .649 2.785 2.47 2.47 0 0 0 2.082.839 2.16 2.16 0 0 0 1.875-.969 4.6 4.6 0 0 0 .678-2.671 4.43 4.43 0 0 0-.678-2.651 2.23 2.23 0 0 0-1.911-.923Z",className:"logo_small_svg__cls-2","data-name":"Path 2960"})),Ee||(Ee=n.createElement("path",{id:"logo_small_svg__Path_2961",d:"M173.612 106.3a5.1 5.1 0 0 1-1.137 3.527 4 4 0 0 1-3.143 1.268 4.17 4.17 0 0 1-2.2-.581 3.84 3.84 0 0 1-1.483-1.669 5.8 5.8 0 0 1-.522-2.545 5.1 5.1 0 0 1 1.129-3.518 4 4 0 0 1 3.135-1.26 3.9 3.9 0 0 1 3.08 1.29 5.07 5.07 0 0 1 1.141 3.488m-7.036 0a4.4 4.4 0 0 0 .708 2.7 2.81 2.81 0 0 0 4.167 0 4.37 4.37 0 0 0 .712-2.7 4.3 4.3 0 0 0-.712-2.675 2.5 2.5 0 0 0-2.1-.915 2.46 2.46 0 0 0-2.072.9 4.33 4.33 0 0 0-.7 2.69Z",className:"logo_small_svg__cls-2","data-name":"Path 2961"})),Ae||(Ae=n.createElement("path",{id:"logo_small_svg__Path_2962",d:"M180.525 101.517a5.5 5.5 0 0 1 1.1.1l-.194 1.3a4.8 4.8 0 0 0-1.011-.127 2.46 2.46 0 0 0-1.917.911 3.32 3.32 0 0 0-.8 2.267v4.955h-1.4v-9.236h1.154l.16 1.71h.068a4.05 4.05 0 0 1 1.238-1.39 2.8 2.8 0 0 1 1.6-.49Z",className:"logo_small_svg__cls-2","data-name":"Path 2962"})),Oe||(Oe=n.createElement("path",{id:"logo_small_svg__Path_2963",d:"M187.363 109.936a4.5 4.5 0 0 0 .716-.055 4 4 0 0 0 .548-.114v1.07a2.5 2.5 0 0 1-.67.181 5 5 0 0 1-.8.072q-2.68 0-2.68-2.823v-5.494h-1.323v-.673l1.323-.582.59-1.972h.809v2.141h2.68v1.087h-2.68v5.435a1.87 1.87 0 0 0 .4 1.281 1.38 1.38 0 0 0 1.087.446",className:"logo_small_svg__cls-2","data-name":"Path 2963"})),Be||(Be=n.createElement("path",{id:"logo_small_svg__Path_2964",d:"M194.538 111.09a4.24 4.24 0 0 1-3.231-1.247 4.82 4.82 0 0 1-1.184-3.463 5.36 5.36 0 0 1 1.1-3.548 3.65 3.65 0 0 1 2.954-1.315 3.48 3.48 0 0 1 2.747 1.142 4.38 4.38 0 0 1 1.011 3.013v.885h-6.362a3.66 3.66 0 0 0 .822 2.469 2.84 2.84 0 0 0 2.2.843 7.4 7.4 0 0 0 2.949-.624v1.247a7.4 7.4 0 0 1-1.4.459 8 8 0 0 1-1.6.139Zm-.379-8.4a2.29 2.29 0 0 0-1.774.725 3.34 3.34 0 0 0-.779 2.006h4.828a3.07 3.07 0 0 0-.59-2.027 2.08 2.08 0 0 0-1.685-.706Z",className:"logo_small_svg__cls-2","data-name":"Path 2964"})),ke||(ke=n.createElement("path",{id:"logo_small_svg__Path_2965",d:"M206.951 109.683h-.076a3.29 3.29 0 0 1-2.9 1.407 3.43 3.43 0 0 1-2.819-1.239 5.45 5.45 0 0 1-1.006-3.522 5.54 5.54 0 0 1 1.011-3.548 3.4 3.4 0 0 1 2.814-1.264 3.36 3.36 0 0 1 2.883 1.365h.109l-.059-.665-.034-.649v-3.759h1.4v13.113h-1.138Zm-2.8.236a2.55 2.55 0 0 0 2.078-.779 3.95 3.95 0 0 0 .644-2.516v-.3a4.64 4.64 0 0 0-.653-2.8 2.48 2.48 0 0 0-2.086-.839 2.14 2.14 0 0 0-1.883.957 4.76 4.76 0 0 0-.653 2.7 4.55 4.55 0 0 0 .649 2.671 2.2 2.2 0 0 0 1.906.906Z",className:"logo_small_svg__cls-2","data-name":"Path 2965"})),qe||(qe=n.createElement("path",{id:"logo_small_svg__Path_2966",d:"M220.712 101.534a3.44 3.44 0 0 1 2.827 1.243 6.65 6.65 0 0 1-.009 7.053 3.42 3.42 0 0 1-2.818 1.26 4 4 0 0 1-1.648-.333 3.1 3.1 0 0 1-1.251-1.023h-.1l-.295 1.188h-1V97.809h1.4V101q0 1.069-.068 1.921h.068a3.32 3.32 0 0 1 2.894-1.387m-.2 1.171a2.44 2.44 0 0 0-2.064.822 6.34 6.34 0 0 0 .017 5.553 2.46 2.46 0 0 0 2.081.839 2.16 2.16 0 0 0 1.922-.94 4.83 4.83 0 0 0 .632-2.7 4.64 4.64 0 0 0-.632-2.689 2.24 2.24 0 0 0-1.959-.885Z",className:"logo_small_svg__cls-2","data-name":"Path 2966"})),Ce||(Ce=n.createElement("path",{id:"logo_small_svg__Path_2967",d:"M225.758 101.686h1.5l2.023 5.267a20 20 0 0 1 .826 2.6h.067q.109-.431.459-1.471t2.288-6.4h1.5l-3.969 10.518a5.25 5.25 0 0 1-1.378 2.212 2.93 2.93 0 0 1-1.934.653 5.7 5.7 0 0 1-1.264-.143V113.8a5 5 0 0 0 1.037.1 2.136 2.136 0 0 0 2.056-1.618l.514-1.314Z",className:"logo_small_svg__cls-2","data-name":"Path 2967"}))))),components_Logo=()=>n.createElement(logo_small,{height:"40"});var Me;function lightbulb_extends(){return lightbulb_extends=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)({}).hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},lightbulb_extends.apply(null,arguments)}const lightbulb=t=>n.createElement("svg",lightbulb_extends({xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 24 24"},t),Me||(Me=n.createElement("path",{d:"M12 2a7 7 0 0 0-7 7c0 2.38 1.19 4.47 3 5.74V17a1 1 0 0 0 1 1h6a1 1 0 0 0 1-1v-2.26c1.81-1.27 3-3.36 3-5.74a7 7 0 0 0-7-7M9 21a1 1 0 0 0 1 1h4a1 1 0 0 0 1-1v-1H9z"})));var je;function lightbulb_off_extends(){return lightbulb_off_extends=Object.assign?Object.assign.bind():function(t){for(var e=1;e<arguments.length;e++){var r=arguments[e];for(var n in r)({}).hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},lightbulb_off_extends.apply(null,arguments)}const lightbulb_off=t=>n.createElement("svg",lightbulb_off_extends({xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 24 24"},t),je||(je=n.createElement("path",{d:"M12 2C9.76 2 7.78 3.05 6.5 4.68l9.81 9.82C17.94 13.21 19 11.24 19 9a7 7 0 0 0-7-7M3.28 4 2 5.27 5.04 8.3C5 8.53 5 8.76 5 9c0 2.38 1.19 4.47 3 5.74V17a1 1 0 0 0 1 1h5.73l4 4L20 20.72zM9 20v1a1 1 0 0 0 1 1h4a1 1 0 0 0 1-1v-1z"})));class DarkModeToggle extends n.Component{constructor(t){super(t),this.state={isDarkMode:!1},this.toggleIsDarkMode=this.toggleIsDarkMode.bind(this)}componentDidMount(){window.matchMedia("(prefers-color-scheme: dark)").matches&&(document.documentElement.classList.add("dark-mode"),this.setState({isDarkMode:!0}))}toggleIsDarkMode(){document.documentElement.classList.toggle("dark-mode"),this.setState((t=>({isDarkMode:!t.isDarkMode})))}render(){const{isDarkMode:t}=this.state,e=t?"Switch to light mode":"Switch to dark mode";return n.createElement("div",{className:"dark-mode-toggle"},n.createElement("button",{"aria-label":e,title:e,type:"button","aria-pressed":t,onClick:this.toggleIsDarkMode},t?n.createElement(lightbulb,{"aria-hidden":"true",height:"24"}):n.createElement(lightbulb_off,{"aria-hidden":"true",height:"24"})))}}const Te=DarkModeToggle,top_bar=()=>({components:{Topbar:Xt,Logo:components_Logo,DarkModeToggle:Te}});function getDefaultExportFromCjs(t){return t&&t.__esModule&&Object.prototype.hasOwnProperty.call(t,"default")?t.default:t}var Pe,Le,Ne,Fe,Ue,Re,ze,De,We,Ke,Ve,$e,Ye,He,Ge,Ze,Je,Qe,Xe,tr,er,rr,nr,or,ir,ar,sr,ur,cr,lr,fr,pr,hr,dr,yr,_r,gr,mr,vr,br,wr,Sr,Ir,xr,Er={},Ar={},Or={};function requireCommon(){if(Pe)return Or;function isNothing(t){return null==t}return Pe=1,Or.isNothing=isNothing,Or.isObject=function isObject(t){return"object"==typeof t&&null!==t},Or.toArray=function toArray(t){return Array.isArray(t)?t:isNothing(t)?[]:[t]},Or.repeat=function repeat(t,e){let r="";for(let n=0;n<e;n+=1)r+=t;return r},Or.isNegativeZero=function isNegativeZero(t){return 0===t&&Number.NEGATIVE_INFINITY===1/t},Or.extend=function extend(t,e){if(e){const r=Object.keys(e);for(let n=0,o=r.length;n<o;n+=1){const o=r[n];t[o]=e[o]}}return t},Or}function requireException(){if(Ne)return Le;function formatError(t,e){let r="";const n=t.reason||"(unknown reason)";return t.mark?(t.mark.name&&(r+='in "'+t.mark.name+'" '),r+="("+(t.mark.line+1)+":"+(t.mark.column+1)+")",!e&&t.mark.snippet&&(r+="\n\n"+t.mark.snippet),n+" "+r):n}function YAMLException2(t,e){Error.call(this),this.name="YAMLException",this.reason=t,this.mark=e,this.message=formatError(this,!1),Error.captureStackTrace?Error.captureStackTrace(this,this.constructor):this.stack=(new Error).stack||""}return Ne=1,YAMLException2.prototype=Object.create(Error.prototype),YAMLException2.prototype.constructor=YAMLException2,YAMLException2.prototype.toString=function toString(t){return this.name+": "+formatError(this,t)},Le=YAMLException2}function requireType(){if(ze)return Re;ze=1;const t=requireException(),e=["kind","multi","resolve","construct","instanceOf","predicate","represent","representName","defaultStyle","styleAliases"],r=["scalar","sequence","mapping"];return Re=function Type2(n,o){if(o=o||{},Object.keys(o).forEach((function(r){if(-1===e.indexOf(r))throw new t('Unknown option "'+r+'" is met in definition of "'+n+'" YAML type.')})),this.options=o,this.tag=n,this.kind=o.kind||null,this.resolve=o.resolve||function(){return!0},this.construct=o.construct||function(t){return t},this.instanceOf=o.instanceOf||null,this.predicate=o.predicate||null,this.represent=o.represent||null,this.representName=o.representName||null,this.defaultStyle=o.defaultStyle||null,this.multi=o.multi||!1,this.styleAliases=function compileStyleAliases(t){const e={};return null!==t&&Object.keys(t).forEach((function(r){t[r].forEach((function(t){e[String(t)]=r}))})),e}(o.styleAliases||null),-1===r.indexOf(this.kind))throw new t('Unknown kind "'+this.kind+'" is specified for "'+n+'" YAML type.')}}function requireSchema(){if(We)return De;We=1;const t=requireException(),e=requireType();function compileList(t,e){const r=[];return t[e].forEach((function(t){let e=r.length;r.forEach((function(r,n){r.tag===t.tag&&r.kind===t.kind&&r.multi===t.multi&&(e=n)})),r[e]=t})),r}function Schema2(t){return this.extend(t)}return Schema2.prototype.extend=function extend(r){let n=[],o=[];if(r instanceof e)o.push(r);else if(Array.isArray(r))o=o.concat(r);else{if(!r||!Array.isArray(r.implicit)&&!Array.isArray(r.explicit))throw new t("Schema.extend argument should be a Type, [ Type ], or a schema definition ({ implicit: [...], explicit: [...] })");r.implicit&&(n=n.concat(r.implicit)),r.explicit&&(o=o.concat(r.explicit))}n.forEach((function(r){if(!(r instanceof e))throw new t("Specified list of YAML types (or a single Type object) contains a non-Type object.");if(r.loadKind&&"scalar"!==r.loadKind)throw new t("There is a non-scalar type in the implicit list of a schema. Implicit resolving of such types is not supported.");if(r.multi)throw new t("There is a multi type in the implicit list of a schema. Multi tags can only be listed as explicit.")})),o.forEach((function(r){if(!(r instanceof e))throw new t("Specified list of YAML types (or a single Type object) contains a non-Type object.")}));const i=Object.create(Schema2.prototype);return i.implicit=(this.implicit||[]).concat(n),i.explicit=(this.explicit||[]).concat(o),i.compiledImplicit=compileList(i,"implicit"),i.compiledExplicit=compileList(i,"explicit"),i.compiledTypeMap=function compileMap(){const t={scalar:{},sequence:{},mapping:{},fallback:{},multi:{scalar:[],sequence:[],mapping:[],fallback:[]}};function collectType(e){e.multi?(t.multi[e.kind].push(e),t.multi.fallback.push(e)):t[e.kind][e.tag]=t.fallback[e.tag]=e}for(let t=0,e=arguments.length;t<e;t+=1)arguments[t].forEach(collectType);return t}(i.compiledImplicit,i.compiledExplicit),i},De=Schema2}function requireStr(){if(Ve)return Ke;Ve=1;const t=requireType();return Ke=new t("tag:yaml.org,2002:str",{kind:"scalar",construct:function(t){return null!==t?t:""}})}function requireSeq(){if(Ye)return $e;Ye=1;const t=requireType();return $e=new t("tag:yaml.org,2002:seq",{kind:"sequence",construct:function(t){return null!==t?t:[]}})}function requireMap(){if(Ge)return He;Ge=1;const t=requireType();return He=new t("tag:yaml.org,2002:map",{kind:"mapping",construct:function(t){return null!==t?t:{}}})}function requireFailsafe(){if(Je)return Ze;Je=1;const t=requireSchema();return Ze=new t({explicit:[requireStr(),requireSeq(),requireMap()]})}function require_null(){if(Xe)return Qe;Xe=1;const t=requireType();return Qe=new t("tag:yaml.org,2002:null",{kind:"scalar",resolve:function resolveYamlNull(t){if(null===t)return!0;const e=t.length;return 1===e&&"~"===t||4===e&&("null"===t||"Null"===t||"NULL"===t)},construct:function constructYamlNull(){return null},predicate:function isNull(t){return null===t},represent:{canonical:function(){return"~"},lowercase:function(){return"null"},uppercase:function(){return"NULL"},camelcase:function(){return"Null"},empty:function(){return""}},defaultStyle:"lowercase"})}function requireBool(){if(er)return tr;er=1;const t=requireType();return tr=new t("tag:yaml.org,2002:bool",{kind:"scalar",resolve:function resolveYamlBoolean(t){if(null===t)return!1;const e=t.length;return 4===e&&("true"===t||"True"===t||"TRUE"===t)||5===e&&("false"===t||"False"===t||"FALSE"===t)},construct:function constructYamlBoolean(t){return"true"===t||"True"===t||"TRUE"===t},predicate:function isBoolean(t){return"[object Boolean]"===Object.prototype.toString.call(t)},represent:{lowercase:function(t){return t?"true":"false"},uppercase:function(t){return t?"TRUE":"FALSE"},camelcase:function(t){return t?"True":"False"}},defaultStyle:"lowercase"})}function requireInt(){if(nr)return rr;nr=1;const t=requireCommon(),e=requireType();function isOctCode(t){return t>=48&&t<=55}function isDecCode(t){return t>=48&&t<=57}function parseYamlInteger(t){let e=t,r=1,n=e[0];if("-"!==n&&"+"!==n||("-"===n&&(r=-1),e=e.slice(1),n=e[0]),"0"===e)return 0;if("0"===n){if("b"===e[1])return r*parseInt(e.slice(2),2);if("x"===e[1])return r*parseInt(e.slice(2),16);if("o"===e[1])return r*parseInt(e.slice(2),8)}return r*parseInt(e,10)}return rr=new e("tag:yaml.org,2002:int",{kind:"scalar",resolve:function resolveYamlInteger(t){if(null===t)return!1;const e=t.length;let r=0,n=!1;if(!e)return!1;let o=t[r];if("-"!==o&&"+"!==o||(o=t[++r]),"0"===o){if(r+1===e)return!0;if(o=t[++r],"b"===o){for(r++;r<e;r++){if(o=t[r],"0"!==o&&"1"!==o)return!1;n=!0}return n&&isFinite(parseYamlInteger(t))}if("x"===o){for(r++;r<e;r++){if(!((i=t.charCodeAt(r))>=48&&i<=57||i>=65&&i<=70||i>=97&&i<=102))return!1;n=!0}return n&&isFinite(parseYamlInteger(t))}if("o"===o){for(r++;r<e;r++){if(!isOctCode(t.charCodeAt(r)))return!1;n=!0}return n&&isFinite(parseYamlInteger(t))}}for(var i;r<e;r++){if(!isDecCode(t.charCodeAt(r)))return!1;n=!0}return!!n&&isFinite(parseYamlInteger(t))},construct:function constructYamlInteger(t){return parseYamlInteger(t)},predicate:function isInteger(e){return"[object Number]"===Object.prototype.toString.call(e)&&e%1==0&&!t.isNegativeZero(e)},represent:{binary:function(t){return t>=0?"0b"+t.toString(2):"-0b"+t.toString(2).slice(1)},octal:function(t){return t>=0?"0o"+t.toString(8):"-0o"+t.toString(8).slice(1)},decimal:function(t){return t.toString(10)},hexadecimal:function(t){return t>=0?"0x"+t.toString(16).toUpperCase():"-0x"+t.toString(16).toUpperCase().slice(1)}},defaultStyle:"decimal",styleAliases:{binary:[2,"bin"],octal:[8,"oct"],decimal:[10,"dec"],hexadecimal:[16,"hex"]}})}function requireFloat(){if(ir)return or;ir=1;const t=requireCommon(),e=requireType(),r=new RegExp("^(?:[-+]?(?:[0-9]+)(?:\\.[0-9]*)?(?:[eE][-+]?[0-9]+)?|\\.[0-9]+(?:[eE][-+]?[0-9]+)?|[-+]?\\.(?:inf|Inf|INF)|\\.(?:nan|NaN|NAN))$"),n=new RegExp("^(?:[-+]?\\.(?:inf|Inf|INF)|\\.(?:nan|NaN|NAN))$");const o=/^[-+]?[0-9]+e/;return or=new e("tag:yaml.org,2002:float",{kind:"scalar",resolve:function resolveYamlFloat(t){return null!==t&&(!!r.test(t)&&(!!isFinite(parseFloat(t,10))||n.test(t)))},construct:function constructYamlFloat(t){let e=t.toLowerCase();const r="-"===e[0]?-1:1;return"+-".indexOf(e[0])>=0&&(e=e.slice(1)),".inf"===e?1===r?Number.POSITIVE_INFINITY:Number.NEGATIVE_INFINITY:".nan"===e?NaN:r*parseFloat(e,10)},predicate:function isFloat(e){return"[object Number]"===Object.prototype.toString.call(e)&&(e%1!=0||t.isNegativeZero(e))},represent:function representYamlFloat(e,r){if(isNaN(e))switch(r){case"lowercase":return".nan";case"uppercase":return".NAN";case"camelcase":return".NaN"}else if(Number.POSITIVE_INFINITY===e)switch(r){case"lowercase":return".inf";case"uppercase":return".INF";case"camelcase":return".Inf"}else if(Number.NEGATIVE_INFINITY===e)switch(r){case"lowercase":return"-.inf";case"uppercase":return"-.INF";case"camelcase":return"-.Inf"}else if(t.isNegativeZero(e))return"-0.0";const n=e.toString(10);return o.test(n)?n.replace("e",".e"):n},defaultStyle:"lowercase"})}function requireJson(){return sr?ar:(sr=1,ar=requireFailsafe().extend({implicit:[require_null(),requireBool(),requireInt(),requireFloat()]}))}function requireCore(){return cr?ur:(cr=1,ur=requireJson())}function requireTimestamp(){if(fr)return lr;fr=1;const t=requireType(),e=new RegExp("^([0-9][0-9][0-9][0-9])-([0-9][0-9])-([0-9][0-9])$"),r=new RegExp("^([0-9][0-9][0-9][0-9])-([0-9][0-9]?)-([0-9][0-9]?)(?:[Tt]|[ \\t]+)([0-9][0-9]?):([0-9][0-9]):([0-9][0-9])(?:\\.([0-9]*))?(?:[ \\t]*(Z|([-+])([0-9][0-9]?)(?::([0-9][0-9]))?))?$");return lr=new t("tag:yaml.org,2002:timestamp",{kind:"scalar",resolve:function resolveYamlTimestamp(t){return null!==t&&(null!==e.exec(t)||null!==r.exec(t))},construct:function constructYamlTimestamp(t){let n=0,o=null,i=e.exec(t);if(null===i&&(i=r.exec(t)),null===i)throw new Error("Date resolve error");const a=+i[1],s=+i[2]-1,u=+i[3];if(!i[4])return new Date(Date.UTC(a,s,u));const c=+i[4],l=+i[5],f=+i[6];if(i[7]){for(n=i[7].slice(0,3);n.length<3;)n+="0";n=+n}if(i[9]){o=6e4*(60*+i[10]+ +(i[11]||0)),"-"===i[9]&&(o=-o)}const p=new Date(Date.UTC(a,s,u,c,l,f,n));return o&&p.setTime(p.getTime()-o),p},instanceOf:Date,represent:function representYamlTimestamp(t){return t.toISOString()}})}function requireMerge(){if(hr)return pr;hr=1;const t=requireType();return pr=new t("tag:yaml.org,2002:merge",{kind:"scalar",resolve:function resolveYamlMerge(t){return"<<"===t||null===t}})}function requireBinary(){if(yr)return dr;yr=1;const t=requireType(),e="ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=\n\r";return dr=new t("tag:yaml.org,2002:binary",{kind:"scalar",resolve:function resolveYamlBinary(t){if(null===t)return!1;let r=0;const n=t.length,o=e;for(let e=0;e<n;e++){const n=o.indexOf(t.charAt(e));if(!(n>64)){if(n<0)return!1;r+=6}}return r%8==0},construct:function constructYamlBinary(t){const r=t.replace(/[\r\n=]/g,""),n=r.length,o=e;let i=0;const a=[];for(let t=0;t<n;t++)t%4==0&&t&&(a.push(i>>16&255),a.push(i>>8&255),a.push(255&i)),i=i<<6|o.indexOf(r.charAt(t));const s=n%4*6;return 0===s?(a.push(i>>16&255),a.push(i>>8&255),a.push(255&i)):18===s?(a.push(i>>10&255),a.push(i>>2&255)):12===s&&a.push(i>>4&255),new Uint8Array(a)},predicate:function isBinary(t){return"[object Uint8Array]"===Object.prototype.toString.call(t)},represent:function representYamlBinary(t){let r="",n=0;const o=t.length,i=e;for(let e=0;e<o;e++)e%3==0&&e&&(r+=i[n>>18&63],r+=i[n>>12&63],r+=i[n>>6&63],r+=i[63&n]),n=(n<<8)+t[e];const a=o%3;return 0===a?(r+=i[n>>18&63],r+=i[n>>12&63],r+=i[n>>6&63],r+=i[63&n]):2===a?(r+=i[n>>10&63],r+=i[n>>4&63],r+=i[n<<2&63],r+=i[64]):1===a&&(r+=i[n>>2&63],r+=i[n<<4&63],r+=i[64],r+=i[64]),r}})}function requireOmap(){if(gr)return _r;gr=1;const t=requireType(),e=Object.prototype.hasOwnProperty,r=Object.prototype.toString;return _r=new t("tag:yaml.org,2002:omap",{kind:"sequence",resolve:function resolveYamlOmap(t){if(null===t)return!0;const n={},o=t;for(let t=0,i=o.length;t<i;t+=1){const i=o[t];let a,s=!1;if("[object Object]"!==r.call(i))return!1;for(a in i)if(e.call(i,a)){if(s)return!1;s=!0}if(!s)return!1;if(e.call(n,a))return!1;Object.defineProperty(n,a,{value:!0})}return!0},construct:function constructYamlOmap(t){return null!==t?t:[]}})}function requirePairs(){if(vr)return mr;vr=1;const t=requireType(),e=Object.prototype.toString;return mr=new t("tag:yaml.org,2002:pairs",{kind:"sequence",resolve:function resolveYamlPairs(t){if(null===t)return!0;const r=t,n=new Array(r.length);for(let t=0,o=r.length;t<o;t+=1){const o=r[t];if("[object Object]"!==e.call(o))return!1;const i=Object.keys(o);if(1!==i.length)return!1;n[t]=[i[0],o[i[0]]]}return!0},construct:function constructYamlPairs(t){if(null===t)return[];const e=t,r=new Array(e.length);for(let t=0,n=e.length;t<n;t+=1){const n=e[t],o=Object.keys(n);r[t]=[o[0],n[o[0]]]}return r}})}function requireSet(){if(wr)return br;wr=1;const t=requireType(),e=Object.prototype.hasOwnProperty;return br=new t("tag:yaml.org,2002:set",{kind:"mapping",resolve:function resolveYamlSet(t){if(null===t)return!0;const r=t;for(const t in r)if(e.call(r,t)&&null!==r[t])return!1;return!0},construct:function constructYamlSet(t){return null!==t?t:{}}})}function require_default(){return Ir?Sr:(Ir=1,Sr=requireCore().extend({implicit:[requireTimestamp(),requireMerge()],explicit:[requireBinary(),requireOmap(),requirePairs(),requireSet()]}))}function requireLoader(){if(xr)return Ar;xr=1;const t=requireCommon(),e=requireException(),r=function requireSnippet(){if(Ue)return Fe;Ue=1;const t=requireCommon();function getLine(t,e,r,n,o){let i="",a="";const s=Math.floor(o/2)-1;return n-e>s&&(i=" ... ",e=n-s+i.length),r-n>s&&(a=" ...",r=n+s-a.length),{str:i+t.slice(e,r).replace(/\t/g,"→")+a,pos:n-e+i.length}}function padStart(e,r){return t.repeat(" ",r-e.length)+e}return Fe=function makeSnippet(e,r){if(r=Object.create(r||null),!e.buffer)return null;r.maxLength||(r.maxLength=79),"number"!=typeof r.indent&&(r.indent=1),"number"!=typeof r.linesBefore&&(r.linesBefore=3),"number"!=typeof r.linesAfter&&(r.linesAfter=2);const n=/\r?\n|\r|\0/g,o=[0],i=[];let a,s=-1;for(;a=n.exec(e.buffer);)i.push(a.index),o.push(a.index+a[0].length),e.position<=a.index&&s<0&&(s=o.length-2);s<0&&(s=o.length-1);let u="";const c=Math.min(e.line+r.linesAfter,i.length).toString().length,l=r.maxLength-(r.indent+c+3);for(let n=1;n<=r.linesBefore&&!(s-n<0);n++){const a=getLine(e.buffer,o[s-n],i[s-n],e.position-(o[s]-o[s-n]),l);u=t.repeat(" ",r.indent)+padStart((e.line-n+1).toString(),c)+" | "+a.str+"\n"+u}const f=getLine(e.buffer,o[s],i[s],e.position,l);u+=t.repeat(" ",r.indent)+padStart((e.line+1).toString(),c)+" | "+f.str+"\n",u+=t.repeat("-",r.indent+c+3+f.pos)+"^\n";for(let n=1;n<=r.linesAfter&&!(s+n>=i.length);n++){const a=getLine(e.buffer,o[s+n],i[s+n],e.position-(o[s]-o[s+n]),l);u+=t.repeat(" ",r.indent)+padStart((e.line+n+1).toString(),c)+" | "+a.str+"\n"}return u.replace(/\n$/,"")}}(),n=require_default(),o=Object.prototype.hasOwnProperty,i=/[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x84\x86-\x9F\uFFFE\uFFFF]|[\uD800-\uDBFF](?![\uDC00-\uDFFF])|(?:[^\uD800-\uDBFF]|^)[\uDC00-\uDFFF]/,a=/[\x85\u2028\u2029]/,s=/[,\[\]{}]/,u=/^(?:!|!!|![0-9A-Za-z-]+!)$/,c=/^(?:!|[^,\[\]{}])(?:%[0-9a-f]{2}|[0-9a-z\-#;/?:@&=+$,_.!~*'()\[\]])*$/i;function _class(t){return Object.prototype.toString.call(t)}function isEol(t){return 10===t||13===t}function isWhiteSpace(t){return 9===t||32===t}function isWsOrEol(t){return 9===t||32===t||10===t||13===t}function isFlowIndicator(t){return 44===t||91===t||93===t||123===t||125===t}function fromHexCode(t){if(t>=48&&t<=57)return t-48;const e=32|t;return e>=97&&e<=102?e-97+10:-1}function simpleEscapeSequence(t){switch(t){case 48:return"\0";case 97:return"";case 98:return"\b";case 116:case 9:return"\t";case 110:return"\n";case 118:return"\v";case 102:return"\f";case 114:return"\r";case 101:return"";case 32:return" ";case 34:return'"';case 47:return"/";case 92:return"\\";case 78:return"";case 95:return" ";case 76:return"\u2028";case 80:return"\u2029";default:return""}}function charFromCodepoint(t){return t<=65535?String.fromCharCode(t):String.fromCharCode(55296+(t-65536>>10),56320+(t-65536&1023))}function setProperty(t,e,r){"__proto__"===e?Object.defineProperty(t,e,{configurable:!0,enumerable:!0,writable:!0,value:r}):t[e]=r}const l=new Array(256),f=new Array(256);for(let t=0;t<256;t++)l[t]=simpleEscapeSequence(t)?1:0,f[t]=simpleEscapeSequence(t);function State(t,e){this.input=t,this.filename=e.filename||null,this.schema=e.schema||n,this.onWarning=e.onWarning||null,this.legacy=e.legacy||!1,this.json=e.json||!1,this.listener=e.listener||null,this.maxDepth="number"==typeof e.maxDepth?e.maxDepth:100,this.maxTotalMergeKeys="number"==typeof e.maxTotalMergeKeys?e.maxTotalMergeKeys:1e4,this.implicitTypes=this.schema.compiledImplicit,this.typeMap=this.schema.compiledTypeMap,this.length=t.length,this.position=0,this.line=0,this.lineStart=0,this.lineIndent=0,this.depth=0,this.totalMergeKeys=0,this.firstTabInLine=-1,this.documents=[],this.anchorMapTransactions=[]}function generateError(t,n){const o={name:t.filename,buffer:t.input.slice(0,-1),position:t.position,line:t.line,column:t.position-t.lineStart};return o.snippet=r(o),new e(n,o)}function throwError(t,e){throw generateError(t,e)}function throwWarning(t,e){t.onWarning&&t.onWarning.call(null,generateError(t,e))}function storeAnchor(t,e,r){const n=t.anchorMapTransactions;if(0!==n.length){const r=n[n.length-1];o.call(r,e)||(r[e]={existed:o.call(t.anchorMap,e),value:t.anchorMap[e]})}t.anchorMap[e]=r}function snapshotState(t){return{position:t.position,line:t.line,lineStart:t.lineStart,lineIndent:t.lineIndent,firstTabInLine:t.firstTabInLine,tag:t.tag,anchor:t.anchor,kind:t.kind,result:t.result}}function restoreState(t,e){t.position=e.position,t.line=e.line,t.lineStart=e.lineStart,t.lineIndent=e.lineIndent,t.firstTabInLine=e.firstTabInLine,t.tag=e.tag,t.anchor=e.anchor,t.kind=e.kind,t.result=e.result}const p={YAML:function handleYamlDirective(t,e,r){null!==t.version&&throwError(t,"duplication of %YAML directive"),1!==r.length&&throwError(t,"YAML directive accepts exactly one argument");const n=/^([0-9]+)\.([0-9]+)$/.exec(r[0]);null===n&&throwError(t,"ill-formed argument of the YAML directive");const o=parseInt(n[1],10),i=parseInt(n[2],10);1!==o&&throwError(t,"unacceptable YAML version of the document"),t.version=r[0],t.checkLineBreaks=i<2,1!==i&&2!==i&&throwWarning(t,"unsupported YAML version of the document")},TAG:function handleTagDirective(t,e,r){let n;2!==r.length&&throwError(t,"TAG directive accepts exactly two arguments");const i=r[0];n=r[1],u.test(i)||throwError(t,"ill-formed tag handle (first argument) of the TAG directive"),o.call(t.tagMap,i)&&throwError(t,'there is a previously declared suffix for "'+i+'" tag handle'),c.test(n)||throwError(t,"ill-formed tag prefix (second argument) of the TAG directive");try{n=decodeURIComponent(n)}catch(e){throwError(t,"tag prefix is malformed: "+n)}t.tagMap[i]=n}};function captureSegment(t,e,r,n){if(e<r){const o=t.input.slice(e,r);if(n)for(let e=0,r=o.length;e<r;e+=1){const r=o.charCodeAt(e);9===r||r>=32&&r<=1114111||throwError(t,"expected valid JSON character")}else i.test(o)&&throwError(t,"the stream contains non-printable characters");t.result+=o}}function chargeMergeWork(t){t.totalMergeKeys++,-1!==t.maxTotalMergeKeys&&t.totalMergeKeys>t.maxTotalMergeKeys&&throwError(t,"merge keys exceeded maxTotalMergeKeys ("+t.maxTotalMergeKeys+")")}function mergeMappings(e,r,n,i){t.isObject(n)||throwError(e,"cannot merge mappings; the provided source object is unacceptable"),chargeMergeWork(e);const a=Object.keys(n);for(let t=0,s=a.length;t<s;t+=1){const s=a[t];chargeMergeWork(e),o.call(r,s)||(setProperty(r,s,n[s]),i[s]=!0)}}function storeMappingPair(t,e,r,n,i,a,s,u,c){if(Array.isArray(i))for(let e=0,r=(i=Array.prototype.slice.call(i)).length;e<r;e+=1)Array.isArray(i[e])&&throwError(t,"nested arrays are not supported inside keys"),"object"==typeof i&&"[object Object]"===_class(i[e])&&(i[e]="[object Object]");if("object"==typeof i&&"[object Object]"===_class(i)&&(i="[object Object]"),i=String(i),null===e&&(e={}),"tag:yaml.org,2002:merge"===n)if(Array.isArray(a)){a.length>100&&throwError(t,"abnormal merge sequence size");for(let n=0,o=a.length;n<o;n+=1)mergeMappings(t,e,a[n],r)}else mergeMappings(t,e,a,r);else t.json||o.call(r,i)||!o.call(e,i)||(t.line=s||t.line,t.lineStart=u||t.lineStart,t.position=c||t.position,throwError(t,"duplicated mapping key")),setProperty(e,i,a),delete r[i];return e}function readLineBreak(t){const e=t.input.charCodeAt(t.position);10===e?t.position++:13===e?(t.position++,10===t.input.charCodeAt(t.position)&&t.position++):throwError(t,"a line break is expected"),t.line+=1,t.lineStart=t.position,t.firstTabInLine=-1}function skipSeparationSpace(t,e,r){let n=0,o=t.input.charCodeAt(t.position);for(;0!==o;){for(;isWhiteSpace(o);)9===o&&-1===t.firstTabInLine&&(t.firstTabInLine=t.position),o=t.input.charCodeAt(++t.position);if(e&&35===o)do{o=t.input.charCodeAt(++t.position)}while(10!==o&&13!==o&&0!==o);if(!isEol(o))break;for(readLineBreak(t),o=t.input.charCodeAt(t.position),n++,t.lineIndent=0;32===o;)t.lineIndent++,o=t.input.charCodeAt(++t.position)}return-1!==r&&0!==n&&t.lineIndent<r&&throwWarning(t,"deficient indentation"),n}function testDocumentSeparator(t){let e=t.position,r=t.input.charCodeAt(e);return!(45!==r&&46!==r||r!==t.input.charCodeAt(e+1)||r!==t.input.charCodeAt(e+2)||(e+=3,r=t.input.charCodeAt(e),0!==r&&!isWsOrEol(r)))}function writeFoldedLines(e,r){1===r?e.result+=" ":r>1&&(e.result+=t.repeat("\n",r-1))}function readBlockSequence(t,e){const r=t.tag,n=t.anchor,o=[];let i=!1;if(-1!==t.firstTabInLine)return!1;null!==t.anchor&&storeAnchor(t,t.anchor,o);let a=t.input.charCodeAt(t.position);for(;0!==a&&(-1!==t.firstTabInLine&&(t.position=t.firstTabInLine,throwError(t,"tab characters must not be used in indentation")),45===a);){if(!isWsOrEol(t.input.charCodeAt(t.position+1)))break;if(i=!0,t.position++,skipSeparationSpace(t,!0,-1)&&t.lineIndent<=e){o.push(null),a=t.input.charCodeAt(t.position);continue}const r=t.line;if(composeNode(t,e,3,!1,!0),o.push(t.result),skipSeparationSpace(t,!0,-1),a=t.input.charCodeAt(t.position),(t.line===r||t.lineIndent>e)&&0!==a)throwError(t,"bad indentation of a sequence entry");else if(t.lineIndent<e)break}return!!i&&(t.tag=r,t.anchor=n,t.kind="sequence",t.result=o,!0)}function readBlockMapping(t,e,r){let n,o,i,a;const s=t.tag,u=t.anchor,c={},l=Object.create(null);let f=null,p=null,h=null,d=!1,y=!1;if(-1!==t.firstTabInLine)return!1;null!==t.anchor&&storeAnchor(t,t.anchor,c);let _=t.input.charCodeAt(t.position);for(;0!==_;){d||-1===t.firstTabInLine||(t.position=t.firstTabInLine,throwError(t,"tab characters must not be used in indentation"));const g=t.input.charCodeAt(t.position+1),m=t.line;if(63!==_&&58!==_||!isWsOrEol(g)){if(o=t.line,i=t.lineStart,a=t.position,!composeNode(t,r,2,!1,!0))break;if(t.line===m){for(_=t.input.charCodeAt(t.position);isWhiteSpace(_);)_=t.input.charCodeAt(++t.position);if(58===_)_=t.input.charCodeAt(++t.position),isWsOrEol(_)||throwError(t,"a whitespace character is expected after the key-value separator within a block mapping"),d&&(storeMappingPair(t,c,l,f,p,null,o,i,a),f=p=h=null),y=!0,d=!1,n=!1,f=t.tag,p=t.result;else{if(!y)return t.tag=s,t.anchor=u,!0;throwError(t,"can not read an implicit mapping pair; a colon is missed")}}else{if(!y)return t.tag=s,t.anchor=u,!0;throwError(t,"can not read a block mapping entry; a multiline key may not be an implicit key")}}else 63===_?(d&&(storeMappingPair(t,c,l,f,p,null,o,i,a),f=p=h=null),y=!0,d=!0,n=!0):d?(d=!1,n=!0):throwError(t,"incomplete explicit mapping pair; a key node is missed; or followed by a non-tabulated empty line"),t.position+=1,_=g;if((t.line===m||t.lineIndent>e)&&(d&&(o=t.line,i=t.lineStart,a=t.position),composeNode(t,e,4,!0,n)&&(d?p=t.result:h=t.result),d||(storeMappingPair(t,c,l,f,p,h,o,i,a),f=p=h=null),skipSeparationSpace(t,!0,-1),_=t.input.charCodeAt(t.position)),(t.line===m||t.lineIndent>e)&&0!==_)throwError(t,"bad indentation of a mapping entry");else if(t.lineIndent<e)break}return d&&storeMappingPair(t,c,l,f,p,null,o,i,a),y&&(t.tag=s,t.anchor=u,t.kind="mapping",t.result=c),y}function readTagProperty(t){let e,r,n=!1,i=!1,a=t.input.charCodeAt(t.position);if(33!==a)return!1;null!==t.tag&&throwError(t,"duplication of a tag property"),a=t.input.charCodeAt(++t.position),60===a?(n=!0,a=t.input.charCodeAt(++t.position)):33===a?(i=!0,e="!!",a=t.input.charCodeAt(++t.position)):e="!";let l=t.position;if(n){do{a=t.input.charCodeAt(++t.position)}while(0!==a&&62!==a);t.position<t.length?(r=t.input.slice(l,t.position),a=t.input.charCodeAt(++t.position)):throwError(t,"unexpected end of the stream within a verbatim tag")}else{for(;0!==a&&!isWsOrEol(a);)33===a&&(i?throwError(t,"tag suffix cannot contain exclamation marks"):(e=t.input.slice(l-1,t.position+1),u.test(e)||throwError(t,"named tag handle cannot contain such characters"),i=!0,l=t.position+1)),a=t.input.charCodeAt(++t.position);r=t.input.slice(l,t.position),s.test(r)&&throwError(t,"tag suffix cannot contain flow indicator characters")}r&&!c.test(r)&&throwError(t,"tag name cannot contain such characters: "+r);try{r=decodeURIComponent(r)}catch(e){throwError(t,"tag name is malformed: "+r)}return n?t.tag=r:o.call(t.tagMap,e)?t.tag=t.tagMap[e]+r:"!"===e?t.tag="!"+r:"!!"===e?t.tag="tag:yaml.org,2002:"+r:throwError(t,'undeclared tag handle "'+e+'"'),!0}function readAnchorProperty(t){let e=t.input.charCodeAt(t.position);if(38!==e)return!1;null!==t.anchor&&throwError(t,"duplication of an anchor property"),e=t.input.charCodeAt(++t.position);const r=t.position;for(;0!==e&&!isWsOrEol(e)&&!isFlowIndicator(e);)e=t.input.charCodeAt(++t.position);return t.position===r&&throwError(t,"name of an anchor node must contain at least one character"),t.anchor=t.input.slice(r,t.position),!0}function tryReadBlockMappingFromProperty(t,e,r,n){const i=snapshotState(t);return function beginAnchorTransaction(t){t.anchorMapTransactions.push(Object.create(null))}(t),restoreState(t,e),t.tag=null,t.anchor=null,t.kind=null,t.result=null,readBlockMapping(t,r,n)&&"mapping"===t.kind?(function commitAnchorTransaction(t){const e=t.anchorMapTransactions.pop(),r=t.anchorMapTransactions;if(0===r.length)return;const n=r[r.length-1],i=Object.keys(e);for(let t=0,r=i.length;t<r;t+=1){const r=i[t];o.call(n,r)||(n[r]=e[r])}}(t),!0):(function rollbackAnchorTransaction(t){const e=t.anchorMapTransactions.pop(),r=Object.keys(e);for(let n=r.length-1;n>=0;n-=1){const o=e[r[n]];o.existed?t.anchorMap[r[n]]=o.value:delete t.anchorMap[r[n]]}}(t),restoreState(t,i),!1)}function composeNode(e,r,n,i,a){let s,u,c,p,h,d=1,y=!1,_=!1,g=null;e.depth>=e.maxDepth&&throwError(e,"nesting exceeded maxDepth ("+e.maxDepth+")"),e.depth+=1,null!==e.listener&&e.listener("open",e),e.tag=null,e.anchor=null,e.kind=null,e.result=null;const m=s=u=4===n||3===n;if(i&&skipSeparationSpace(e,!0,-1)&&(y=!0,e.lineIndent>r?d=1:e.lineIndent===r?d=0:e.lineIndent<r&&(d=-1)),1===d)for(;;){const t=e.input.charCodeAt(e.position),n=snapshotState(e);if(y&&(33===t&&null!==e.tag||38===t&&null!==e.anchor))break;if(!readTagProperty(e)&&!readAnchorProperty(e))break;null===g&&(g=n),skipSeparationSpace(e,!0,-1)?(y=!0,u=m,e.lineIndent>r?d=1:e.lineIndent===r?d=0:e.lineIndent<r&&(d=-1)):u=!1}if(u&&(u=y||a),1===d||4===n)if(p=1===n||2===n?r:r+1,h=e.position-e.lineStart,1===d)if(u&&(readBlockSequence(e,h)||readBlockMapping(e,h,p))||function readFlowCollection(t,e){let r,n,o,i=!0;const a=t.tag;let s;const u=t.anchor;let c,l,f,p;const h=Object.create(null);let d,y,_,g=t.input.charCodeAt(t.position);if(91===g)c=93,p=!1,s=[];else{if(123!==g)return!1;c=125,p=!0,s={}}for(null!==t.anchor&&storeAnchor(t,t.anchor,s),g=t.input.charCodeAt(++t.position);0!==g;){if(skipSeparationSpace(t,!0,e),g=t.input.charCodeAt(t.position),g===c)return t.position++,t.tag=a,t.anchor=u,t.kind=p?"mapping":"sequence",t.result=s,!0;i?44===g&&throwError(t,"expected the node content, but found ','"):throwError(t,"missed comma between flow collection entries"),y=d=_=null,l=f=!1,63===g&&isWsOrEol(t.input.charCodeAt(t.position+1))&&(l=f=!0,t.position++,skipSeparationSpace(t,!0,e)),r=t.line,n=t.lineStart,o=t.position,composeNode(t,e,1,!1,!0),y=t.tag,d=t.result,skipSeparationSpace(t,!0,e),g=t.input.charCodeAt(t.position),!f&&t.line!==r||58!==g||(l=!0,g=t.input.charCodeAt(++t.position),skipSeparationSpace(t,!0,e),composeNode(t,e,1,!1,!0),_=t.result),p?storeMappingPair(t,s,h,y,d,_,r,n,o):l?s.push(storeMappingPair(t,null,h,y,d,_,r,n,o)):s.push(d),skipSeparationSpace(t,!0,e),g=t.input.charCodeAt(t.position),44===g?(i=!0,g=t.input.charCodeAt(++t.position)):i=!1}throwError(t,"unexpected end of the stream within a flow collection")}(e,p))_=!0;else{const r=e.input.charCodeAt(e.position);null!==g&&m&&!u&&124!==r&&62!==r&&tryReadBlockMappingFromProperty(e,g,g.position-g.lineStart,p)||s&&function readBlockScalar(e,r){let n,o,i=1,a=!1,s=!1,u=r,c=0,l=!1,f=e.input.charCodeAt(e.position);if(124===f)n=!1;else{if(62!==f)return!1;n=!0}for(e.kind="scalar",e.result="";0!==f;)if(f=e.input.charCodeAt(++e.position),43===f||45===f)1===i?i=43===f?3:2:throwError(e,"repeat of a chomping mode identifier");else{if(!((o=(p=f)>=48&&p<=57?p-48:-1)>=0))break;0===o?throwError(e,"bad explicit indentation width of a block scalar; it cannot be less than one"):s?throwError(e,"repeat of an indentation width identifier"):(u=r+o-1,s=!0)}var p;if(isWhiteSpace(f)){do{f=e.input.charCodeAt(++e.position)}while(isWhiteSpace(f));if(35===f)do{f=e.input.charCodeAt(++e.position)}while(!isEol(f)&&0!==f)}for(;0!==f;){for(readLineBreak(e),e.lineIndent=0,f=e.input.charCodeAt(e.position);(!s||e.lineIndent<u)&&32===f;)e.lineIndent++,f=e.input.charCodeAt(++e.position);if(!s&&e.lineIndent>u&&(u=e.lineIndent),isEol(f)){c++;continue}if(s||0!==u||throwError(e,"missing indentation for block scalar"),e.lineIndent<u){3===i?e.result+=t.repeat("\n",a?1+c:c):1===i&&a&&(e.result+="\n");break}n?isWhiteSpace(f)?(l=!0,e.result+=t.repeat("\n",a?1+c:c)):l?(l=!1,e.result+=t.repeat("\n",c+1)):0===c?a&&(e.result+=" "):e.result+=t.repeat("\n",c):e.result+=t.repeat("\n",a?1+c:c),a=!0,s=!0,c=0;const r=e.position;for(;!isEol(f)&&0!==f;)f=e.input.charCodeAt(++e.position);captureSegment(e,r,e.position,!1)}return!0}(e,p)||function readSingleQuotedScalar(t,e){let r,n,o=t.input.charCodeAt(t.position);if(39!==o)return!1;for(t.kind="scalar",t.result="",t.position++,r=n=t.position;0!==(o=t.input.charCodeAt(t.position));)if(39===o){if(captureSegment(t,r,t.position,!0),o=t.input.charCodeAt(++t.position),39!==o)return!0;r=t.position,t.position++,n=t.position}else isEol(o)?(captureSegment(t,r,n,!0),writeFoldedLines(t,skipSeparationSpace(t,!1,e)),r=n=t.position):t.position===t.lineStart&&testDocumentSeparator(t)?throwError(t,"unexpected end of the document within a single quoted scalar"):(t.position++,isWhiteSpace(o)||(n=t.position));throwError(t,"unexpected end of the stream within a single quoted scalar")}(e,p)||function readDoubleQuotedScalar(t,e){let r,n,o,i=t.input.charCodeAt(t.position);if(34!==i)return!1;for(t.kind="scalar",t.result="",t.position++,r=n=t.position;0!==(i=t.input.charCodeAt(t.position));){if(34===i)return captureSegment(t,r,t.position,!0),t.position++,!0;if(92===i){if(captureSegment(t,r,t.position,!0),i=t.input.charCodeAt(++t.position),isEol(i))skipSeparationSpace(t,!1,e);else if(i<256&&l[i])t.result+=f[i],t.position++;else if((o=120===(a=i)?2:117===a?4:85===a?8:0)>0){let e=o,r=0;for(;e>0;e--)i=t.input.charCodeAt(++t.position),(o=fromHexCode(i))>=0?r=(r<<4)+o:throwError(t,"expected hexadecimal character");t.result+=charFromCodepoint(r),t.position++}else throwError(t,"unknown escape sequence");r=n=t.position}else isEol(i)?(captureSegment(t,r,n,!0),writeFoldedLines(t,skipSeparationSpace(t,!1,e)),r=n=t.position):t.position===t.lineStart&&testDocumentSeparator(t)?throwError(t,"unexpected end of the document within a double quoted scalar"):(t.position++,isWhiteSpace(i)||(n=t.position))}var a;throwError(t,"unexpected end of the stream within a double quoted scalar")}(e,p)?_=!0:!function readAlias(t){let e=t.input.charCodeAt(t.position);if(42!==e)return!1;e=t.input.charCodeAt(++t.position);const r=t.position;for(;0!==e&&!isWsOrEol(e)&&!isFlowIndicator(e);)e=t.input.charCodeAt(++t.position);t.position===r&&throwError(t,"name of an alias node must contain at least one character");const n=t.input.slice(r,t.position);return o.call(t.anchorMap,n)||throwError(t,'unidentified alias "'+n+'"'),t.result=t.anchorMap[n],skipSeparationSpace(t,!0,-1),!0}(e)?function readPlainScalar(t,e,r){let n,o,i,a,s,u;const c=t.kind,l=t.result;let f=t.input.charCodeAt(t.position);if(isWsOrEol(f)||isFlowIndicator(f)||35===f||38===f||42===f||33===f||124===f||62===f||39===f||34===f||37===f||64===f||96===f)return!1;if(63===f||45===f){const e=t.input.charCodeAt(t.position+1);if(isWsOrEol(e)||r&&isFlowIndicator(e))return!1}for(t.kind="scalar",t.result="",n=o=t.position,i=!1;0!==f;){if(58===f){const e=t.input.charCodeAt(t.position+1);if(isWsOrEol(e)||r&&isFlowIndicator(e))break}else if(35===f){if(isWsOrEol(t.input.charCodeAt(t.position-1)))break}else{if(t.position===t.lineStart&&testDocumentSeparator(t)||r&&isFlowIndicator(f))break;if(isEol(f)){if(a=t.line,s=t.lineStart,u=t.lineIndent,skipSeparationSpace(t,!1,-1),t.lineIndent>=e){i=!0,f=t.input.charCodeAt(t.position);continue}t.position=o,t.line=a,t.lineStart=s,t.lineIndent=u;break}}i&&(captureSegment(t,n,o,!1),writeFoldedLines(t,t.line-a),n=o=t.position,i=!1),isWhiteSpace(f)||(o=t.position+1),f=t.input.charCodeAt(++t.position)}return captureSegment(t,n,o,!1),!!t.result||(t.kind=c,t.result=l,!1)}(e,p,1===n)&&(_=!0,null===e.tag&&(e.tag="?")):(_=!0,null===e.tag&&null===e.anchor||throwError(e,"alias node should not have any properties")),null!==e.anchor&&storeAnchor(e,e.anchor,e.result)}else 0===d&&(_=u&&readBlockSequence(e,h));if(null===e.tag)null!==e.anchor&&storeAnchor(e,e.anchor,e.result);else if("?"===e.tag){null!==e.result&&"scalar"!==e.kind&&throwError(e,'unacceptable node kind for !<?> tag; it should be "scalar", not "'+e.kind+'"');for(let t=0,r=e.implicitTypes.length;t<r;t+=1)if(c=e.implicitTypes[t],c.resolve(e.result)){e.result=c.construct(e.result),e.tag=c.tag,null!==e.anchor&&storeAnchor(e,e.anchor,e.result);break}}else if("!"!==e.tag){if(o.call(e.typeMap[e.kind||"fallback"],e.tag))c=e.typeMap[e.kind||"fallback"][e.tag];else{c=null;const t=e.typeMap.multi[e.kind||"fallback"];for(let r=0,n=t.length;r<n;r+=1)if(e.tag.slice(0,t[r].tag.length)===t[r].tag){c=t[r];break}}c||throwError(e,"unknown tag !<"+e.tag+">"),null!==e.result&&c.kind!==e.kind&&throwError(e,"unacceptable node kind for !<"+e.tag+'> tag; it should be "'+c.kind+'", not "'+e.kind+'"'),c.resolve(e.result,e.tag)?(e.result=c.construct(e.result,e.tag),null!==e.anchor&&storeAnchor(e,e.anchor,e.result)):throwError(e,"cannot resolve a node with !<"+e.tag+"> explicit tag")}return null!==e.listener&&e.listener("close",e),e.depth-=1,null!==e.tag||null!==e.anchor||_}function readDocument(t){const e=t.position;let r,n=!1;for(t.version=null,t.checkLineBreaks=t.legacy,t.tagMap=Object.create(null),t.anchorMap=Object.create(null);0!==(r=t.input.charCodeAt(t.position))&&(skipSeparationSpace(t,!0,-1),r=t.input.charCodeAt(t.position),!(t.lineIndent>0||37!==r));){n=!0,r=t.input.charCodeAt(++t.position);let e=t.position;for(;0!==r&&!isWsOrEol(r);)r=t.input.charCodeAt(++t.position);const i=t.input.slice(e,t.position),a=[];for(i.length<1&&throwError(t,"directive name must not be less than one character in length");0!==r;){for(;isWhiteSpace(r);)r=t.input.charCodeAt(++t.position);if(35===r){do{r=t.input.charCodeAt(++t.position)}while(0!==r&&!isEol(r));break}if(isEol(r))break;for(e=t.position;0!==r&&!isWsOrEol(r);)r=t.input.charCodeAt(++t.position);a.push(t.input.slice(e,t.position))}0!==r&&readLineBreak(t),o.call(p,i)?p[i](t,i,a):throwWarning(t,'unknown document directive "'+i+'"')}skipSeparationSpace(t,!0,-1),0===t.lineIndent&&45===t.input.charCodeAt(t.position)&&45===t.input.charCodeAt(t.position+1)&&45===t.input.charCodeAt(t.position+2)?(t.position+=3,skipSeparationSpace(t,!0,-1)):n&&throwError(t,"directives end mark is expected"),composeNode(t,t.lineIndent-1,4,!1,!0),skipSeparationSpace(t,!0,-1),t.checkLineBreaks&&a.test(t.input.slice(e,t.position))&&throwWarning(t,"non-ASCII line breaks are interpreted as content"),t.documents.push(t.result),t.position===t.lineStart&&testDocumentSeparator(t)?46===t.input.charCodeAt(t.position)&&(t.position+=3,skipSeparationSpace(t,!0,-1)):t.position<t.length-1&&throwError(t,"end of the stream or a document separator is expected")}function loadDocuments(t,e){e=e||{},0!==(t=String(t)).length&&(10!==t.charCodeAt(t.length-1)&&13!==t.charCodeAt(t.length-1)&&(t+="\n"),65279===t.charCodeAt(0)&&(t=t.slice(1)));const r=new State(t,e),n=t.indexOf("\0");for(-1!==n&&(r.position=n,throwError(r,"null byte is not allowed in input")),r.input+="\0";32===r.input.charCodeAt(r.position);)r.lineIndent+=1,r.position+=1;for(;r.position<r.length-1;)readDocument(r);return r.documents}return Ar.loadAll=function loadAll2(t,e,r){null!==e&&"object"==typeof e&&void 0===r&&(r=e,e=null);const n=loadDocuments(t,r);if("function"!=typeof e)return n;for(let t=0,r=n.length;t<r;t+=1)e(n[t])},Ar.load=function load2(t,r){const n=loadDocuments(t,r);if(0!==n.length){if(1===n.length)return n[0];throw new e("expected a single document in the stream, but found more")}},Ar}var Br,kr,qr={};function requireDumper(){if(Br)return qr;Br=1;const t=requireCommon(),e=requireException(),r=require_default(),n=Object.prototype.toString,o=Object.prototype.hasOwnProperty,i=65279,a={0:"\\0",7:"\\a",8:"\\b",9:"\\t",10:"\\n",11:"\\v",12:"\\f",13:"\\r",27:"\\e",34:'\\"',92:"\\\\",133:"\\N",160:"\\_",8232:"\\L",8233:"\\P"},s=["y","Y","yes","Yes","YES","on","On","ON","n","N","no","No","NO","off","Off","OFF"],u=/^[-+]?[0-9_]+(?::[0-9_]+)+(?:\.[0-9_]*)?$/;function encodeHex(r){let n,o;const i=r.toString(16).toUpperCase();if(r<=255)n="x",o=2;else if(r<=65535)n="u",o=4;else{if(!(r<=4294967295))throw new e("code point within a string may not be greater than 0xFFFFFFFF");n="U",o=8}return"\\"+n+t.repeat("0",o-i.length)+i}function State(e){this.schema=e.schema||r,this.indent=Math.max(1,e.indent||2),this.noArrayIndent=e.noArrayIndent||!1,this.skipInvalid=e.skipInvalid||!1,this.flowLevel=t.isNothing(e.flowLevel)?-1:e.flowLevel,this.styleMap=function compileStyleMap(t,e){if(null===e)return{};const r={},n=Object.keys(e);for(let i=0,a=n.length;i<a;i+=1){let a=n[i],s=String(e[a]);"!!"===a.slice(0,2)&&(a="tag:yaml.org,2002:"+a.slice(2));const u=t.compiledTypeMap.fallback[a];u&&o.call(u.styleAliases,s)&&(s=u.styleAliases[s]),r[a]=s}return r}(this.schema,e.styles||null),this.sortKeys=e.sortKeys||!1,this.lineWidth=e.lineWidth||80,this.noRefs=e.noRefs||!1,this.noCompatMode=e.noCompatMode||!1,this.condenseFlow=e.condenseFlow||!1,this.quotingType='"'===e.quotingType?2:1,this.forceQuotes=e.forceQuotes||!1,this.replacer="function"==typeof e.replacer?e.replacer:null,this.implicitTypes=this.schema.compiledImplicit,this.explicitTypes=this.schema.compiledExplicit,this.tag=null,this.result="",this.duplicates=[],this.usedDuplicates=null}function indentString(e,r){const n=t.repeat(" ",r);let o=0,i="";const a=e.length;for(;o<a;){let t;const r=e.indexOf("\n",o);-1===r?(t=e.slice(o),o=a):(t=e.slice(o,r+1),o=r+1),t.length&&"\n"!==t&&(i+=n),i+=t}return i}function generateNextLine(e,r){return"\n"+t.repeat(" ",e.indent*r)}function isWhitespace(t){return 32===t||9===t}function isPrintable(t){return t>=32&&t<=126||t>=161&&t<=55295&&8232!==t&&8233!==t||t>=57344&&t<=65533&&t!==i||t>=65536&&t<=1114111}function isNsCharOrWhitespace(t){return isPrintable(t)&&t!==i&&13!==t&&10!==t}function isPlainSafe(t,e,r){const n=isNsCharOrWhitespace(t),o=n&&!isWhitespace(t);return(r?n:n&&44!==t&&91!==t&&93!==t&&123!==t&&125!==t)&&35!==t&&!(58===e&&!o)||isNsCharOrWhitespace(e)&&!isWhitespace(e)&&35===t||58===e&&o}function codePointAt(t,e){const r=t.charCodeAt(e);let n;return r>=55296&&r<=56319&&e+1<t.length&&(n=t.charCodeAt(e+1),n>=56320&&n<=57343)?1024*(r-55296)+n-56320+65536:r}function needIndentIndicator(t){return/^\n* /.test(t)}function chooseScalarStyle(t,e,r,n,o,a,s,u){let c,l=0,f=null,p=!1,h=!1;const d=-1!==n;let y=-1,_=function isPlainSafeFirst(t){return isPrintable(t)&&t!==i&&!isWhitespace(t)&&45!==t&&63!==t&&58!==t&&44!==t&&91!==t&&93!==t&&123!==t&&125!==t&&35!==t&&38!==t&&42!==t&&33!==t&&124!==t&&61!==t&&62!==t&&39!==t&&34!==t&&37!==t&&64!==t&&96!==t}(codePointAt(t,0))&&function isPlainSafeLast(t){return!isWhitespace(t)&&58!==t}(codePointAt(t,t.length-1));if(e||s)for(c=0;c<t.length;l>=65536?c+=2:c++){if(l=codePointAt(t,c),!isPrintable(l))return 5;_=_&&isPlainSafe(l,f,u),f=l}else{for(c=0;c<t.length;l>=65536?c+=2:c++){if(l=codePointAt(t,c),10===l)p=!0,d&&(h=h||c-y-1>n&&" "!==t[y+1],y=c);else if(!isPrintable(l))return 5;_=_&&isPlainSafe(l,f,u),f=l}h=h||d&&c-y-1>n&&" "!==t[y+1]}return p||h?r>9&&needIndentIndicator(t)?5:s?2===a?5:2:h?4:3:!_||s||o(t)?2===a?5:2:1}function writeScalar(t,r,n,o,i){t.dump=function(){if(0===r.length)return 2===t.quotingType?'""':"''";if(!t.noCompatMode&&(-1!==s.indexOf(r)||u.test(r)))return 2===t.quotingType?'"'+r+'"':"'"+r+"'";const c=t.indent*Math.max(1,n),l=-1===t.lineWidth?-1:Math.max(Math.min(t.lineWidth,40),t.lineWidth-c),f=o||t.flowLevel>-1&&n>=t.flowLevel;switch(chooseScalarStyle(r,f,t.indent,l,(function testAmbiguity(e){return function testImplicitResolving(t,e){for(let r=0,n=t.implicitTypes.length;r<n;r+=1)if(t.implicitTypes[r].resolve(e))return!0;return!1}(t,e)}),t.quotingType,t.forceQuotes&&!o,i)){case 1:return r;case 2:return"'"+r.replace(/'/g,"''")+"'";case 3:return"|"+blockHeader(r,t.indent)+dropEndingNewline(indentString(r,c));case 4:return">"+blockHeader(r,t.indent)+dropEndingNewline(indentString(function foldString(t,e){const r=/(\n+)([^\n]*)/g;let n,o,i=function(){let n=t.indexOf("\n");return n=-1!==n?n:t.length,r.lastIndex=n,foldLine(t.slice(0,n),e)}(),a="\n"===t[0]||" "===t[0];for(;o=r.exec(t);){const t=o[1],r=o[2];n=" "===r[0],i+=t+(a||n||""===r?"":"\n")+foldLine(r,e),a=n}return i}(r,l),c));case 5:return'"'+function escapeString(t){let e="",r=0;for(let n=0;n<t.length;r>=65536?n+=2:n++){r=codePointAt(t,n);const o=a[r];!o&&isPrintable(r)?(e+=t[n],r>=65536&&(e+=t[n+1])):e+=o||encodeHex(r)}return e}(r)+'"';default:throw new e("impossible error: invalid scalar style")}}()}function blockHeader(t,e){const r=needIndentIndicator(t)?String(e):"",n="\n"===t[t.length-1];return r+(n&&("\n"===t[t.length-2]||"\n"===t)?"+":n?"":"-")+"\n"}function dropEndingNewline(t){return"\n"===t[t.length-1]?t.slice(0,-1):t}function foldLine(t,e){if(""===t||" "===t[0])return t;const r=/ [^ ]/g;let n,o,i=0,a=0,s=0,u="";for(;n=r.exec(t);)s=n.index,s-i>e&&(o=a>i?a:s,u+="\n"+t.slice(i,o),i=o+1),a=s;return u+="\n",t.length-i>e&&a>i?u+=t.slice(i,a)+"\n"+t.slice(a+1):u+=t.slice(i),u.slice(1)}function writeBlockSequence(t,e,r,n){let o="";const i=t.tag;for(let i=0,a=r.length;i<a;i+=1){let a=r[i];t.replacer&&(a=t.replacer.call(r,String(i),a)),(writeNode(t,e+1,a,!0,!0,!1,!0)||void 0===a&&writeNode(t,e+1,null,!0,!0,!1,!0))&&(n&&""===o||(o+=generateNextLine(t,e)),t.dump&&10===t.dump.charCodeAt(0)?o+="-":o+="- ",o+=t.dump)}t.tag=i,t.dump=o||"[]"}function detectType(t,r,i){const a=i?t.explicitTypes:t.implicitTypes;for(let s=0,u=a.length;s<u;s+=1){const u=a[s];if((u.instanceOf||u.predicate)&&(!u.instanceOf||"object"==typeof r&&r instanceof u.instanceOf)&&(!u.predicate||u.predicate(r))){if(i?u.multi&&u.representName?t.tag=u.representName(r):t.tag=u.tag:t.tag="?",u.represent){const i=t.styleMap[u.tag]||u.defaultStyle;let a;if("[object Function]"===n.call(u.represent))a=u.represent(r,i);else{if(!o.call(u.represent,i))throw new e("!<"+u.tag+'> tag resolver accepts not "'+i+'" style');a=u.represent[i](r,i)}t.dump=a}return!0}}return!1}function writeNode(t,r,o,i,a,s,u){t.tag=null,t.dump=o,detectType(t,o,!1)||detectType(t,o,!0);const c=n.call(t.dump),l=i;i&&(i=t.flowLevel<0||t.flowLevel>r);const f="[object Object]"===c||"[object Array]"===c;let p,h;if(f&&(p=t.duplicates.indexOf(o),h=-1!==p),(null!==t.tag&&"?"!==t.tag||h||2!==t.indent&&r>0)&&(a=!1),h&&t.usedDuplicates[p])t.dump="*ref_"+p;else{if(f&&h&&!t.usedDuplicates[p]&&(t.usedDuplicates[p]=!0),"[object Object]"===c)i&&0!==Object.keys(t.dump).length?(!function writeBlockMapping(t,r,n,o){let i="";const a=t.tag,s=Object.keys(n);if(!0===t.sortKeys)s.sort();else if("function"==typeof t.sortKeys)s.sort(t.sortKeys);else if(t.sortKeys)throw new e("sortKeys must be a boolean or a function");for(let e=0,a=s.length;e<a;e+=1){let a="";o&&""===i||(a+=generateNextLine(t,r));const u=s[e];let c=n[u];if(t.replacer&&(c=t.replacer.call(n,u,c)),!writeNode(t,r+1,u,!0,!0,!0))continue;const l=null!==t.tag&&"?"!==t.tag||t.dump&&t.dump.length>1024;l&&(t.dump&&10===t.dump.charCodeAt(0)?a+="?":a+="? "),a+=t.dump,l&&(a+=generateNextLine(t,r)),writeNode(t,r+1,c,!0,l)&&(t.dump&&10===t.dump.charCodeAt(0)?a+=":":a+=": ",a+=t.dump,i+=a)}t.tag=a,t.dump=i||"{}"}(t,r,t.dump,a),h&&(t.dump="&ref_"+p+t.dump)):(!function writeFlowMapping(t,e,r){let n="";const o=t.tag,i=Object.keys(r);for(let o=0,a=i.length;o<a;o+=1){let a="";""!==n&&(a+=", "),t.condenseFlow&&(a+='"');const s=i[o];let u=r[s];t.replacer&&(u=t.replacer.call(r,s,u)),writeNode(t,e,s,!1,!1)&&(t.dump.length>1024&&(a+="? "),a+=t.dump+(t.condenseFlow?'"':"")+":"+(t.condenseFlow?"":" "),writeNode(t,e,u,!1,!1)&&(a+=t.dump,n+=a))}t.tag=o,t.dump="{"+n+"}"}(t,r,t.dump),h&&(t.dump="&ref_"+p+" "+t.dump));else if("[object Array]"===c)i&&0!==t.dump.length?(t.noArrayIndent&&!u&&r>0?writeBlockSequence(t,r-1,t.dump,a):writeBlockSequence(t,r,t.dump,a),h&&(t.dump="&ref_"+p+t.dump)):(!function writeFlowSequence(t,e,r){let n="";const o=t.tag;for(let o=0,i=r.length;o<i;o+=1){let i=r[o];t.replacer&&(i=t.replacer.call(r,String(o),i)),(writeNode(t,e,i,!1,!1)||void 0===i&&writeNode(t,e,null,!1,!1))&&(""!==n&&(n+=","+(t.condenseFlow?"":" ")),n+=t.dump)}t.tag=o,t.dump="["+n+"]"}(t,r,t.dump),h&&(t.dump="&ref_"+p+" "+t.dump));else{if("[object String]"!==c){if("[object Undefined]"===c)return!1;if(t.skipInvalid)return!1;throw new e("unacceptable kind of an object to dump "+c)}"?"!==t.tag&&writeScalar(t,t.dump,r,s,l)}if(null!==t.tag&&"?"!==t.tag){let e=encodeURI("!"===t.tag[0]?t.tag.slice(1):t.tag).replace(/!/g,"%21");e="!"===t.tag[0]?"!"+e:"tag:yaml.org,2002:"===e.slice(0,18)?"!!"+e.slice(18):"!<"+e+">",t.dump=e+" "+t.dump}}return!0}function getDuplicateReferences(t,e){const r=[],n=[];inspectNode(t,r,n);const o=n.length;for(let t=0;t<o;t+=1)e.duplicates.push(r[n[t]]);e.usedDuplicates=new Array(o)}function inspectNode(t,e,r){if(null!==t&&"object"==typeof t){const n=e.indexOf(t);if(-1!==n)-1===r.indexOf(n)&&r.push(n);else if(e.push(t),Array.isArray(t))for(let n=0,o=t.length;n<o;n+=1)inspectNode(t[n],e,r);else{const n=Object.keys(t);for(let o=0,i=n.length;o<i;o+=1)inspectNode(t[n[o]],e,r)}}}return qr.dump=function dump2(t,e){const r=new State(e=e||{});r.noRefs||getDuplicateReferences(t,r);let n=t;return r.replacer&&(n=r.replacer.call({"":n},"",n)),writeNode(r,0,n,!0,!0)?r.dump+"\n":""},qr}const Cr=getDefaultExportFromCjs(function requireJsYaml(){if(kr)return Er;kr=1;const t=requireLoader(),e=requireDumper();function renamed(t,e){return function(){throw new Error("Function yaml."+t+" is removed in js-yaml 4. Use yaml."+e+" instead, which is now safe by default.")}}return Er.Type=requireType(),Er.Schema=requireSchema(),Er.FAILSAFE_SCHEMA=requireFailsafe(),Er.JSON_SCHEMA=requireJson(),Er.CORE_SCHEMA=requireCore(),Er.DEFAULT_SCHEMA=require_default(),Er.load=t.load,Er.loadAll=t.loadAll,Er.dump=e.dump,Er.YAMLException=requireException(),Er.types={binary:requireBinary(),float:requireFloat(),map:requireMap(),null:require_null(),pairs:requirePairs(),set:requireSet(),timestamp:requireTimestamp(),bool:requireBool(),int:requireInt(),merge:requireMerge(),omap:requireOmap(),seq:requireSeq(),str:requireStr()},Er.safeLoad=renamed("safeLoad","load"),Er.safeLoadAll=renamed("safeLoadAll","loadAll"),Er.safeDump=renamed("safeDump","dump"),Er}()),{Type:Mr,Schema:jr,FAILSAFE_SCHEMA:Tr,JSON_SCHEMA:Pr,CORE_SCHEMA:Lr,DEFAULT_SCHEMA:Nr,load:Fr,loadAll:Ur,dump:Rr,YAMLException:zr,types:Dr,safeLoad:Wr,safeLoadAll:Kr,safeDump:Vr}=Cr,$r="configs_update",Yr="configs_toggle";function actions_update(t,e){return{type:$r,payload:{[t]:e}}}function toggle(t){return{type:Yr,payload:t}}const loaded=()=>()=>{},downloadConfig=t=>e=>{const{fn:{fetch:r}}=e;return r(t)},getConfigByUrl=(t,e)=>r=>{const{specActions:n,configsActions:o}=r;if(t)return o.downloadConfig(t).then(next,next);function next(o){o instanceof Error||o.status>=400?(n.updateLoadingStatus("failedConfig"),n.updateLoadingStatus("failedConfig"),n.updateUrl(""),console.error(o.statusText+" "+t.url),e(null)):e(((t,e)=>{try{return Cr.load(t)}catch(t){return e&&e.errActions.newThrownErr(new Error(t)),{}}})(o.text,r))}},selectors_get=(t,e)=>t.getIn(Array.isArray(e)?e:[e]),Hr={[$r]:(t,e)=>t.merge(fromJS(e.payload)),[Yr]:(t,e)=>{const r=e.payload,n=t.get(r);return t.set(r,!n)}};var Gr=__webpack_require__(7248),Zr=__webpack_require__.n(Gr),Jr=__webpack_require__(7666),Qr=__webpack_require__.n(Jr);const Xr=console.error,withErrorBoundary=t=>e=>{const{getComponent:r,fn:o}=t(),i=r("ErrorBoundary"),a=o.getDisplayName(e);class WithErrorBoundary extends n.Component{render(){return n.createElement(i,{targetName:a,getComponent:r,fn:o},n.createElement(e,Qr()({},this.props,this.context)))}}var s;return WithErrorBoundary.displayName=`WithErrorBoundary(${a})`,(s=e).prototype&&s.prototype.isReactComponent&&(WithErrorBoundary.prototype.mapStateToProps=e.prototype.mapStateToProps),WithErrorBoundary},fallback=({name:t})=>n.createElement("div",{className:"fallback"},"😱 ",n.createElement("i",null,"Could not render ","t"===t?"this component":t,", see the console."));class ErrorBoundary extends n.Component{static defaultProps={targetName:"this component",getComponent:()=>fallback,fn:{componentDidCatch:Xr},children:null};static getDerivedStateFromError(t){return{hasError:!0,error:t}}constructor(...t){super(...t),this.state={hasError:!1,error:null}}componentDidCatch(t,e){this.props.fn.componentDidCatch(t,e)}render(){const{getComponent:t,targetName:e,children:r}=this.props;if(this.state.hasError){const r=t("Fallback");return n.createElement(r,{name:e})}return r}}const tn=ErrorBoundary,en=[top_bar,function configsPlugin(){return{statePlugins:{configs:{reducers:Hr,actions:t,selectors:e}}}},stadalone_layout,(({componentList:t=[],fullOverride:e=!1}={})=>({getSystem:r})=>{const n=e?t:["App","BaseLayout","VersionPragmaFilter","InfoContainer","ServersContainer","SchemesContainer","AuthorizeBtnContainer","FilterContainer","Operations","OperationContainer","parameters","responses","OperationServers","Models","ModelWrapper",...t],o=Zr()(n,Array(n.length).fill(((t,{fn:e})=>e.withErrorBoundary(t))));return{fn:{componentDidCatch:Xr,withErrorBoundary:withErrorBoundary(r)},components:{ErrorBoundary:tn,Fallback:fallback},wrapComponents:o}})({fullOverride:!0,componentList:["Topbar","StandaloneLayout","onlineValidatorBadge"]})]})(),r=r.default})()));
\ No newline at end of file
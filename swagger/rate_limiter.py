@@ -0,0 +1,328 @@
+import base64
+import hashlib
+import math
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from functools import wraps
+
+import frappe
+from redis.exceptions import RedisError
+
+from .exceptions import TooManyRequestsException
+from .metrics import is_endpoint_path
+
+KEY_BY = ("user", "api_key")
+RATE_LIMIT_PREFIX = "swagger_rate_limit"
+
+# In-flight requests older than this are dropped, e.g. when their worker was killed
+CONCURRENCY_LEASE = 300
+# Retry-After of requests rejected by a concurrency limit
+CONCURRENCY_RETRY_AFTER = 1
+
+# Takes a token from a bucket refilled continuously at ARGV[1] tokens per second, up
+# to ARGV[2] tokens. Returns the seconds until a token is available, "0" if one was
+# taken. The clock of redis is shared by all workers.
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local clock = redis.call("TIME")
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "updated")
+local tokens = tonumber(bucket[1]) or capacity
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    retry_after = (1 - tokens) / rate
+end
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "updated", tostring(now))
+redis.call("EXPIRE", KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(retry_after)
+"""
+
+# Adds ARGV[3] to the in-flight requests unless there are ARGV[1] of them already,
+# after dropping those older than ARGV[2] seconds. Returns 1 if it was added.
+CONCURRENCY_SCRIPT = """
+local clock = redis.call("TIME")
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", now - tonumber(ARGV[2]))
+if redis.call("ZCARD", KEYS[1]) >= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call("ZADD", KEYS[1], now, ARGV[3])
+redis.call("EXPIRE", KEYS[1], ARGV[2])
+return 1
+"""
+
+# Registered scripts by name, sent to redis by their SHA1 after the first call
+_scripts = {}
+
+# Per-process state used while redis is unavailable, least recently used first
+LOCAL_STATE_SIZE = 4096
+_local_buckets = OrderedDict()
+_local_in_flight = {}
+_local_lock = threading.Lock()
+
+
+def rate_limit(rate=None, per=60, burst=None, max_in_flight=None, key_by="user"):
+    """Limit the request rate and the concurrent requests of an endpoint.
+
+    The rate is enforced with a token bucket holding `burst` tokens, refilled with
+    `rate` tokens every `per` seconds. Both limits apply separately to each user, or
+    to each API key, and guest requests are limited per IP address. Rejected requests
+    get a 429 response with a Retry-After header:
+
+        @frappe.whitelist()
+        @http_methods("POST")
+        @rate_limit(rate=10, per=60, max_in_flight=2)
+        @validate_request(ReportModel)
+        def create_report(validated_data: ReportModel): ...
+
+    Args:
+        rate (int, optional): The requests allowed per period.
+        per (int): The period in seconds.
+        burst (int, optional): The requests allowed at once after an idle period,
+            `rate` by default.
+        max_in_flight (int, optional): The requests processed at the same time.
+        key_by (str): `user` or `api_key`.
+
+    Raises:
+        ValueError: If no limit is given, or `key_by` is unknown.
+    """
+    if not rate and not max_in_flight:
+        raise ValueError("rate_limit needs a rate or max_in_flight")
+    if key_by not in KEY_BY:
+        raise ValueError(f"Unknown key_by value: {key_by}")
+    limit = {
+        "rate": rate,
+        "per": per,
+        "burst": burst or rate,
+        "max_in_flight": max_in_flight,
+        "key_by": key_by,
+    }
+
+    def decorator(func):
+        scope = f"{func.__module__}.{func.__qualname__}"
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            slot = apply_limit(scope, limit)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                release_slot(slot)
+
+        # read by the swagger generator instead of scanning the source code
+        wrapper._rate_limit = limit
+        return wrapper
+
+    return decorator
+
+
+def get_rate_limit_rule(path):
+    """Get the rate limit rule of an endpoint from Swagger Settings.
+
+    Args:
+        path (str): The lower-cased endpoint path.
+
+    Returns:
+        dict: The limit of the first rule whose endpoint pattern matches the path, in
+            the form of the `rate_limit` options, or None.
+    """
+    settings = frappe.get_cached_doc("Swagger Settings")
+    if not settings.enable_rate_limiting:
+        return None
+    for rule in settings.rate_limit_rules:
+        if not fnmatchcase(path, (rule.endpoint or "").strip().lower()):
+            continue
+        rate = frappe.utils.cint(rule.rate)
+        max_in_flight = frappe.utils.cint(rule.max_in_flight)
+        if not rate and not max_in_flight:
+            return None
+        return {
+            "rate": rate or None,
+            "per": frappe.utils.cint(rule.period) or 60,
+            "burst": frappe.utils.cint(rule.burst) or rate or None,
+            "max_in_flight": max_in_flight or None,
+            "key_by": "api_key" if rule.key_by == "API Key" else "user",
+        }
+    return None
+
+
+def before_request():
+    """Apply the rate limit rule of the requested endpoint, if any.
+
+    The concurrency slot of the request is kept in `frappe.local.swagger_rate_limit`
+    until `after_request`.
+    """
+    frappe.local.swagger_rate_limit = None
+    path = frappe.local.request.path.lower()
+    if not is_endpoint_path(path):
+        return
+    limit = get_rate_limit_rule(path)
+    if limit:
+        frappe.local.swagger_rate_limit = apply_limit(path, limit)
+
+
+def after_request(response=None, request=None):
+    """Release the concurrency slot of the request and set Retry-After on rejections."""
+    slot = getattr(frappe.local, "swagger_rate_limit", None)
+    if slot:
+        frappe.local.swagger_rate_limit = None
+        release_slot(slot)
+
+    retry_after = getattr(frappe.local, "swagger_retry_after", None)
+    if retry_after and response is not None:
+        response.headers["Retry-After"] = str(retry_after)
+
+
+def apply_limit(scope, limit):
+    """Admit a request within a limit, or reject it.
+
+    Args:
+        scope (str): The endpoint the limit applies to.
+        limit (dict): The `rate_limit` options.
+
+    Returns:
+        tuple: The concurrency slot taken by the request, to release once it is
+            processed, or None without a concurrency limit.
+
+    Raises:
+        TooManyRequestsException: If a limit is exceeded.
+    """
+    key = f"{RATE_LIMIT_PREFIX}|{scope}|{get_identity(limit['key_by'])}"
+    slot = None
+    if limit["max_in_flight"]:
+        slot = acquire_slot(f"{key}|in_flight", limit["max_in_flight"])
+        if slot is None:
+            reject(CONCURRENCY_RETRY_AFTER)
+
+    if limit["rate"]:
+        retry_after = take_token(f"{key}|bucket", limit["rate"] / limit["per"], limit["burst"])
+        if retry_after:
+            release_slot(slot)
+            reject(math.ceil(retry_after))
+    return slot
+
+
+def reject(retry_after):
+    # read by `after_request`, which also runs for requests rejected by the decorator
+    frappe.local.swagger_retry_after = retry_after
+    raise TooManyRequestsException(retry_after=retry_after)
+
+
+def get_identity(key_by):
+    """Get who the limits of the current request apply to.
+
+    Requests are identified by their user, or by their API key with `api_key`, and
+    then by the other one when missing. Guest requests without an API key are
+    identified by their IP address.
+    """
+    session = getattr(frappe.local, "session", None)
+    user = session.user if session and session.user != "Guest" else None
+    api_key = get_api_key()
+    if key_by == "api_key" and api_key:
+        return f"key:{api_key}"
+    if user:
+        return f"user:{user}"
+    if api_key:
+        return f"key:{api_key}"
+    return f"ip:{frappe.local.request_ip}"
+
+
+def get_api_key():
+    """Get the API key of the `Authorization` header of the current request.
+
+    Bearer tokens are hashed, so they are never stored in redis.
+    """
+    scheme, _, credentials = frappe.get_request_header("Authorization", "").partition(" ")
+    scheme = scheme.lower()
+    if scheme == "token":
+        return credentials.partition(":")[0] or None
+    if scheme == "basic":
+        try:
+            return base64.b64decode(credentials).decode().partition(":")[0] or None
+        except ValueError:
+            return None
+    if scheme == "bearer" and credentials:
+        return hashlib.sha256(credentials.encode()).hexdigest()[:16]
+    return None
+
+
+def run_script(name, source, key, *args):
+    cache = frappe.cache()
+    script = _scripts.get(name)
+    if script is None:
+        script = _scripts[name] = cache.register_script(source)
+    return script(keys=[cache.make_key(key)], args=args, client=cache)
+
+
+def take_token(key, rate, capacity):
+    """Take a token from a bucket, in redis or in the local fallback.
+
+    Returns:
+        float: The seconds until a token is available, 0 if one was taken.
+    """
+    try:
+        return float(run_script("token_bucket", TOKEN_BUCKET_SCRIPT, key, rate, capacity))
+    except RedisError:
+        pass
+
+    now = time.monotonic()
+    with _local_lock:
+        tokens, updated = _local_buckets.pop(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated) * rate)
+        retry_after = 0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / rate
+        _local_buckets[key] = (tokens, now)
+        while len(_local_buckets) > LOCAL_STATE_SIZE:
+            _local_buckets.popitem(last=False)
+    return retry_after
+
+
+def acquire_slot(key, max_in_flight):
+    """Count the request as in flight, unless the limit is reached.
+
+    Returns:
+        tuple: The slot to release, or None if the limit is reached.
+    """
+    token = uuid.uuid4().hex
+    try:
+        args = (max_in_flight, CONCURRENCY_LEASE, token)
+        if run_script("concurrency", CONCURRENCY_SCRIPT, key, *args):
+            return ("redis", key, token)
+        return None
+    except RedisError:
+        pass
+
+    with _local_lock:
+        if _local_in_flight.get(key, 0) >= max_in_flight:
+            return None
+        _local_in_flight[key] = _local_in_flight.get(key, 0) + 1
+    return ("local", key, token)
+
+
+def release_slot(slot):
+    if slot is None:
+        return
+    backend, key, token = slot
+    if backend == "local":
+        with _local_lock:
+            _local_in_flight[key] -= 1
+            if not _local_in_flight[key]:
+                del _local_in_flight[key]
+        return
+    try:
+        cache = frappe.cache()
+        cache.zrem(cache.make_key(key), token)
+    except RedisError:
+        # the slot is dropped once its lease expires
+        pass
@@ -1,12 +1,36 @@
+import json
+
 import frappe
 from frappe.auth import CookieManager
+from frappe.utils.response import json_handler, make_logs
+from pydantic import BaseModel
+from werkzeug.wrappers import Response
+
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+# Authorization schemes of stateless API calls, which never read or set cookies
+TOKEN_AUTH_SCHEMES = ("token ", "bearer ")
 
-def respond(status=200, message='Success', data={}, errors={}):
+def respond(status=200, message='Success', data=None, errors=None):
 	response = frappe._dict({'message': frappe._(message)})
 	if data:
 		response['data'] = data
 	if errors:
 		response['errors'] = errors
+
+	if is_fast_response():
+		# serialized once, straight from the payload, instead of by frappe's JSON renderer
+		frappe.local.response = response
+		make_logs()
+		body = dumps_json(response)
+		response['http_status_code'] = status
+		return Response(body, status=status, content_type='application/json')
+
+	if isinstance(data, BaseModel):
+		response['data'] = data.model_dump(mode='json')
 	frappe.local.response = response
 	frappe.local.response['http_status_code'] = status
 
@@ -14,10 +38,37 @@ def respond(status=200, message='Success', data={}, errors={}):
 	frappe.local.cookie_manager.flush_cookies(response=frappe.local.response)
 	# return Response(response=json.dumps(response), status=status, content_type='application/json')
 
-def respondWithSuccess(status=200, message='Success', data={}):
+def is_fast_response():
+	"""Whether the current request is answered in the fast response mode
+
+	Only token and bearer authenticated requests are, when "Response Mode" is "Fast"
+	"""
+	if not getattr(frappe.local, 'request', None):
+		return False
+	authorization = frappe.get_request_header('Authorization', '')[:7].lower()
+	if not authorization.startswith(TOKEN_AUTH_SCHEMES):
+		return False
+	return frappe.get_cached_doc('Swagger Settings').response_mode == 'Fast'
+
+def json_default(value):
+	if isinstance(value, BaseModel):
+		return value.model_dump(mode='json')
+	return json_handler(value)
+
+def dumps_json(value):
+	"""Serialize a response to JSON bytes, with orjson when it is installed
+
+	Pydantic models are dumped in JSON mode; orjson writes datetimes, dates and UUIDs
+	natively, as ISO 8601 strings
+	"""
+	if orjson:
+		return orjson.dumps(value, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+	return json.dumps(value, default=json_default, separators=(',', ':')).encode('utf-8')
+
+def respondWithSuccess(status=200, message='Success', data=None):
 	return respond(status=status, message=message, data=data)
 
-def respondWithFailure(status=500, message='Something went wrong', data={}, errors={}):
+def respondWithFailure(status=500, message='Something went wrong', data=None, errors=None):
 	return respond(status=status, message=message, data=data, errors=errors)
 
 def respondUnauthorized(status=401, message='Unauthorized'):
@@ -0,0 +1,293 @@
+import hashlib
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from functools import partial, wraps
+
+import frappe
+from werkzeug.wrappers import Response
+
+from .responder import dumps_json
+
+# Request methods whose responses are cached
+CACHED_METHODS = frozenset(("GET", "HEAD"))
+VARY_ON = ("params", "user", "roles")
+
+RESPONSE_CACHE_PREFIX = "swagger_response_cache"
+# Redis hash of invalidation counters by DocType, part of the keys of dependent entries
+GENERATIONS_KEY = "swagger_response_cache_generations"
+# Redis set of the DocTypes cached responses depend on; changes of other DocTypes
+# skip the invalidation
+WATCHED_DOCTYPES_KEY = "swagger_response_cache_doctypes"
+# How long a process trusts its copy of the watched DocTypes. A DocType first
+# cached by an endpoint may miss invalidations for that long in other processes.
+WATCHED_DOCTYPES_TTL = 10
+
+# Concurrent misses of an entry wait this long for the request computing it
+SINGLE_FLIGHT_TIMEOUT = 5
+SINGLE_FLIGHT_POLL_INTERVAL = 0.05
+
+# Responses by (site, cache key), least recently used first
+LOCAL_CACHE_SIZE = 256
+_local_cache = OrderedDict()
+_local_cache_lock = threading.Lock()
+
+# Watched DocTypes and the time they were read by site
+_watched_doctypes = {}
+
+
+def cached_response(ttl=60, vary_on=("params", "user"), doctypes=()):
+    """Cache the successful responses of a GET endpoint.
+
+    Responses are stored serialized in the redis cache of the site for `ttl` seconds,
+    with an in-process LRU tier in front of it. When an entry is missing, one request
+    computes it while concurrent requests for the same entry wait for the result.
+    Entries depending on `doctypes` are invalidated whenever a document of one of
+    them is changed, renamed or deleted.
+
+    Apply it above `validate_query`, so cache hits skip validation:
+
+        @frappe.whitelist()
+        @http_methods("GET")
+        @cached_response(ttl=300, vary_on=["params", "roles"], doctypes=["Item"])
+        @validate_query
+        def get_items(item_group: str): ...
+
+    Args:
+        ttl (int): The lifetime of an entry in seconds.
+        vary_on (list): What distinguishes entries of the endpoint: the request
+            arguments (`params`), the session user (`user`) and their roles (`roles`).
+            Entries are per user by default; share them between users only for
+            endpoints whose data does not depend on permissions.
+        doctypes (list): The DocTypes whose changes invalidate the entries.
+
+    Raises:
+        ValueError: If `vary_on` contains an unknown value.
+    """
+    vary_on = tuple(vary_on)
+    doctypes = tuple(doctypes)
+    unknown = set(vary_on) - set(VARY_ON)
+    if unknown:
+        raise ValueError(f"Unknown vary_on values: {', '.join(sorted(unknown))}")
+
+    def decorator(func):
+        endpoint = f"{func.__module__}.{func.__qualname__}"
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not frappe.request or frappe.request.method not in CACHED_METHODS:
+                return func(*args, **kwargs)
+
+            key = get_cache_key(endpoint, vary_on, doctypes, args, kwargs)
+            entry = get_cached_entry(key)
+            if entry is not None:
+                return make_response(entry, "HIT")
+
+            lock = acquire_lock(key)
+            if lock is None:
+                entry = wait_for_entry(key)
+                if entry is not None:
+                    return make_response(entry, "HIT")
+            try:
+                result = func(*args, **kwargs)
+                entry = get_response_entry(result, ttl)
+                if entry is None:
+                    return result
+                set_cached_entry(key, entry, ttl)
+                return make_response(entry, "MISS")
+            finally:
+                if lock is not None:
+                    release_lock(key, lock)
+
+        # read by the swagger generator instead of scanning the source code
+        wrapper._cache_options = {"ttl": ttl, "vary_on": vary_on, "doctypes": doctypes}
+        return wrapper
+
+    return decorator
+
+
+def get_cache_key(endpoint, vary_on, doctypes, args, kwargs):
+    """Get the cache key of a request to an endpoint.
+
+    Args:
+        endpoint (str): The dotted path of the endpoint.
+        vary_on (tuple): What distinguishes the entries of the endpoint.
+        doctypes (tuple): The DocTypes whose changes invalidate the entries.
+        args (tuple): The positional arguments of the request.
+        kwargs (dict): The keyword arguments of the request.
+
+    Returns:
+        str: The key, unique to the endpoint, the varying values and the current
+            invalidation counters of the DocTypes.
+    """
+    parts = [endpoint]
+    if "params" in vary_on:
+        arguments = {name: value for name, value in kwargs.items() if name != "cmd"}
+        parts.append(json.dumps([args, arguments], sort_keys=True, default=str))
+    if "user" in vary_on:
+        parts.append(frappe.session.user)
+    if "roles" in vary_on:
+        parts.append(",".join(sorted(frappe.get_roles())))
+    if doctypes:
+        parts.append(",".join(get_generations(doctypes)))
+    digest = hashlib.sha1("\0".join(parts).encode("utf-8")).hexdigest()
+    return f"{RESPONSE_CACHE_PREFIX}|{endpoint}|{digest}"
+
+
+def get_generations(doctypes):
+    """Get the invalidation counters of DocTypes, in a single round trip.
+
+    The DocTypes are also added to the watched ones, so they are watched again
+    once redis lost its data.
+    """
+    cache = frappe.cache()
+    pipeline = cache.pipeline()
+    pipeline.sadd(cache.make_key(WATCHED_DOCTYPES_KEY), *doctypes)
+    pipeline.hmget(cache.make_key(GENERATIONS_KEY), doctypes)
+    values = pipeline.execute()[1]
+    return [value.decode() if value else "0" for value in values]
+
+
+def get_watched_doctypes():
+    """Get the DocTypes cached responses depend on, read from redis at most every
+    `WATCHED_DOCTYPES_TTL` seconds.
+    """
+    site = frappe.local.site
+    doctypes, read_at = _watched_doctypes.get(site, (None, 0))
+    if doctypes is None or time.monotonic() - read_at > WATCHED_DOCTYPES_TTL:
+        cache = frappe.cache()
+        members = cache.smembers(cache.make_key(WATCHED_DOCTYPES_KEY))
+        doctypes = {value.decode() for value in members}
+        _watched_doctypes[site] = (doctypes, time.monotonic())
+    return doctypes
+
+
+def get_cached_entry(key):
+    """Get a cached response from the local tier, else from redis.
+
+    Returns:
+        tuple: The content type, body and expiry timestamp of the response, or None.
+    """
+    local_key = (frappe.local.site, key)
+    with _local_cache_lock:
+        entry = _local_cache.get(local_key)
+        if entry:
+            if entry[2] > time.time():
+                _local_cache.move_to_end(local_key)
+                return entry
+            del _local_cache[local_key]
+
+    entry = frappe.cache().get_value(key)
+    if entry is not None:
+        set_local_entry(local_key, entry)
+    return entry
+
+
+def set_cached_entry(key, entry, ttl):
+    frappe.cache().set_value(key, entry, expires_in_sec=ttl)
+    set_local_entry((frappe.local.site, key), entry)
+
+
+def set_local_entry(local_key, entry):
+    with _local_cache_lock:
+        _local_cache[local_key] = entry
+        _local_cache.move_to_end(local_key)
+        while len(_local_cache) > LOCAL_CACHE_SIZE:
+            _local_cache.popitem(last=False)
+
+
+def get_response_entry(result, ttl):
+    """Get the cacheable form of the result of an endpoint.
+
+    Args:
+        result: The value returned by the endpoint, a Response, or None when the
+            response was set on `frappe.local.response` by `respond()`.
+        ttl (int): The lifetime of the entry in seconds.
+
+    Returns:
+        tuple: The content type, serialized body and expiry timestamp, or None for
+            unsuccessful responses and responses setting cookies. The local tier
+            keeps entries no longer than redis does.
+    """
+    expires = time.time() + ttl
+    if isinstance(result, Response):
+        if result.status_code != 200 or result.is_streamed or "Set-Cookie" in result.headers:
+            return None
+        return (result.content_type, result.get_data(), expires)
+
+    if result is None:
+        response = frappe.local.response
+        if response.get("http_status_code", 200) != 200:
+            return None
+        payload = {key: response[key] for key in ("message", "data", "errors") if key in response}
+    else:
+        payload = {"message": result}
+    return ("application/json", dumps_json(payload), expires)
+
+
+def make_response(entry, cache_status):
+    content_type, body, expires = entry
+    return Response(body, content_type=content_type, headers={"X-Cache": cache_status})
+
+
+def acquire_lock(key):
+    """Take the right to compute an entry, unless another request holds it.
+
+    Returns:
+        str: The token of the lock, or None if it is held by another request.
+    """
+    cache = frappe.cache()
+    token = uuid.uuid4().hex
+    if cache.set(cache.make_key(f"{key}|lock"), token, nx=True, ex=SINGLE_FLIGHT_TIMEOUT):
+        return token
+    return None
+
+
+def release_lock(key, token):
+    cache = frappe.cache()
+    lock_key = cache.make_key(f"{key}|lock")
+    # the lock may have expired and been taken by another request
+    if cache.get(lock_key) == token.encode():
+        cache.delete(lock_key)
+
+
+def wait_for_entry(key):
+    """Wait for the entry computed by another request.
+
+    Returns:
+        tuple: The cached response, or None if it did not appear in time, e.g.
+            because the response was not cacheable.
+    """
+    cache = frappe.cache()
+    lock_key = cache.make_key(f"{key}|lock")
+    deadline = time.monotonic() + SINGLE_FLIGHT_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+        entry = get_cached_entry(key)
+        if entry is not None or cache.get(lock_key) is None:
+            return entry
+    return None
+
+
+def invalidate_cached_responses(doc, *args):
+    """Invalidate the cached responses depending on the DocType of a document.
+
+    Hooked to the changes, renames and deletions of all documents, but only DocTypes
+    declared in the `doctypes` of a cached endpoint are counted. The counter of the
+    DocType is incremented once the transaction is committed, so the entries computed
+    in the meantime cannot keep data that is being replaced.
+    """
+    if doc.doctype not in get_watched_doctypes():
+        return
+    after_commit = getattr(frappe.db, "after_commit", None)
+    if after_commit is None:
+        increment_generation(doc.doctype)
+    else:
+        after_commit.add(partial(increment_generation, doc.doctype))
+
+
+def increment_generation(doctype):
+    cache = frappe.cache()
+    cache.hincrby(cache.make_key(GENERATIONS_KEY), doctype, 1)
@@ -0,0 +1,309 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+
+import frappe
+from werkzeug.wrappers import Response
+
+from .responder import respondNotFound
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Clients revalidate with the ETag on every load and get a 304 while unchanged
+CACHE_CONTROL = "public, no-cache"
+
+# Precompressed variants by content coding, in order of preference
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+# Brotli quality of generated specs, written on every generation that changes them.
+# Quality 11 compresses a few percent better at about ten times the cost.
+SPEC_BROTLI_QUALITY = 9
+
+# Swagger UI assets are served under content-hashed names, cached for a year
+UI_ASSETS_DIR = os.path.join(os.path.dirname(__file__), "public", "swagger-ui")
+UI_ASSETS = {
+    "swagger-ui.css": "text/css",
+    "swagger-ui-bundle.js": "application/javascript",
+    "swagger-ui-standalone-preset.js": "application/javascript",
+}
+UI_ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+UI_ASSET_NAME_PATTERN = re.compile(r"^(?P<stem>[\w.-]+?)\.(?P<hash>[0-9a-f]{12})\.(?P<ext>css|js)$")
+# Hashed copies are written on migrate and served as static files by the web server;
+# the endpoint only serves pages rendered before they exist
+UI_ASSET_STATIC_URL = "/assets/swagger/swagger-ui/{}"
+UI_ASSET_URL = "/api/method/swagger.spec_server.get_swagger_ui_asset?file={}"
+
+# Per-app and per-tag shards are written to this subdirectory, with an index
+SHARDS_DIR = "shards"
+SHARDS_INDEX = "_index"
+SHARD_NAME_PATTERN = re.compile(r"^\w[\w.-]*$")
+
+# Content hashes by spec file path, keyed by the file's modification time and size
+_content_hashes = {}
+
+
+def get_spec_dir():
+    """Get the directory where the generated specifications are written.
+
+    Returns:
+        str: The `www` directory of the swagger app.
+    """
+    return os.path.join(frappe.utils.get_bench_path(), "apps", "swagger", "swagger", "www")
+
+
+def write_compact_spec(directory, name, spec):
+    """Write the compact and precompressed forms of a specification.
+
+    Writes `<name>.min.json` with its gzip (`.gz`) and, when the `brotli` package is
+    installed, brotli (`.br`) variants. Stale brotli variants are removed otherwise.
+    Nothing is written or compressed when the file already holds the same content,
+    so generations served from the cache leave unchanged files and their ETags alone.
+
+    Args:
+        directory (str): The output directory.
+        name (str): The base file name.
+        spec (dict): The OpenAPI specification.
+
+    Returns:
+        bool: True if the files were written.
+    """
+    content = json.dumps(spec, separators=(",", ":")).encode("utf-8")
+    file_path = os.path.join(directory, f"{name}.min.json")
+    if brotli is None and os.path.exists(f"{file_path}.br"):
+        os.remove(f"{file_path}.br")
+
+    suffixes = [suffix for encoding, suffix in ENCODINGS if brotli or encoding != "br"]
+    if (
+        os.path.isfile(file_path)
+        and all(os.path.isfile(file_path + suffix) for suffix in suffixes)
+        and get_content_hash(file_path) == hashlib.sha256(content).hexdigest()
+    ):
+        return False
+
+    variants = {file_path: content, f"{file_path}.gz": gzip.compress(content, 9, mtime=0)}
+    if brotli:
+        variants[f"{file_path}.br"] = brotli.compress(content, quality=SPEC_BROTLI_QUALITY)
+
+    # Write the compressed variants first, so a new ETag never serves stale variants
+    for path in sorted(variants, key=lambda path: path == file_path):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(variants[path])
+        os.replace(tmp_path, path)
+    return True
+
+
+def get_content_hash(file_path):
+    """Get the content hash of a file.
+
+    The hash is computed once per process and file version.
+
+    Args:
+        file_path (str): The file path.
+
+    Returns:
+        str: The SHA-256 hex digest of the file content.
+    """
+    stat = os.stat(file_path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _content_hashes.get(file_path)
+    if not cached or cached[0] != key:
+        with open(file_path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        cached = _content_hashes[file_path] = (key, digest)
+    return cached[1]
+
+
+def is_not_modified(etag):
+    """Check the `If-None-Match` header of the current request against an ETag.
+
+    Args:
+        etag (str): The quoted ETag of the current representation.
+
+    Returns:
+        bool: True if the client already has the current representation.
+    """
+    header = frappe.request.headers.get("If-None-Match")
+    if not header:
+        return False
+    tags = [tag.strip() for tag in header.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def get_spec_response(name):
+    """Build the response serving a generated specification.
+
+    Args:
+        name (str): The base file name of the specification.
+
+    Returns:
+        Response: The response, or None after responding with a 404.
+    """
+    file_path = os.path.join(get_spec_dir(), f"{name}.min.json")
+    if not os.path.isfile(file_path):
+        return respondNotFound(message="Swagger JSON has not been generated yet")
+    return get_file_response(file_path, "application/json", CACHE_CONTROL)
+
+
+def get_file_response(file_path, content_type, cache_control):
+    """Build the response serving a file and its precompressed variants.
+
+    The precompressed variant matching the `Accept-Encoding` header is sent, and
+    requests whose `If-None-Match` matches the ETag are answered with a 304.
+
+    Args:
+        file_path (str): The path of the uncompressed file.
+        content_type (str): The content type of the file.
+        cache_control (str): The `Cache-Control` header of the response.
+
+    Returns:
+        Response: The response.
+    """
+    # Each content coding is a distinct representation with its own strong ETag
+    encoding, suffix = None, ""
+    accept_encodings = frappe.request.accept_encodings
+    for content_coding, variant_suffix in ENCODINGS:
+        if accept_encodings[content_coding] and os.path.isfile(file_path + variant_suffix):
+            encoding, suffix = content_coding, variant_suffix
+            break
+
+    digest = get_content_hash(file_path)
+    etag = f'"{digest}-{encoding}"' if encoding else f'"{digest}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding",
+    }
+    if is_not_modified(etag):
+        return Response(status=304, headers=headers)
+
+    if encoding:
+        headers["Content-Encoding"] = encoding
+
+    with open(file_path + suffix, "rb") as f:
+        content = f.read()
+    return Response(content, headers=headers, content_type=content_type)
+
+
+@frappe.whitelist(allow_guest=True, methods=["GET"])
+def get_swagger_json(shard=None):
+    """Serve the generated Swagger JSON in compact, compressed and cacheable form.
+
+    Args:
+        shard (str, optional): Serve only the shard of an app (`<app>`) or of an app
+            tag (`<app>.<tag>`), as listed by `get_swagger_index`.
+    """
+    if not shard:
+        return get_spec_response("swagger")
+    if not SHARD_NAME_PATTERN.match(shard):
+        return respondNotFound(message="Swagger JSON shard not found")
+    return get_spec_response(os.path.join(SHARDS_DIR, shard))
+
+
+@frappe.whitelist(allow_guest=True, methods=["GET"])
+def get_swagger_index():
+    """Serve the index of the per-app and per-tag Swagger JSON shards."""
+    return get_spec_response(os.path.join(SHARDS_DIR, SHARDS_INDEX))
+
+
+def get_ui_asset_name(name):
+    """Get the content-hashed name of a Swagger UI asset.
+
+    Args:
+        name (str): The file name of the asset, e.g. `swagger-ui-bundle.js`.
+
+    Returns:
+        str: The name with the first 12 digits of its content hash before the
+            extension, e.g. `swagger-ui-bundle.3f2a9c0d1b7e.js`.
+    """
+    stem, ext = os.path.splitext(name)
+    digest = get_content_hash(os.path.join(UI_ASSETS_DIR, name))
+    return f"{stem}.{digest[:12]}{ext}"
+
+
+def get_ui_asset_urls():
+    """Get the URLs of the Swagger UI assets by file name.
+
+    The hashed copies are linked once `write_ui_assets` wrote them, the endpoint
+    serving them otherwise.
+    """
+    urls = {}
+    for name in UI_ASSETS:
+        hashed_name = get_ui_asset_name(name)
+        if os.path.isfile(os.path.join(UI_ASSETS_DIR, hashed_name)):
+            urls[name] = UI_ASSET_STATIC_URL.format(hashed_name)
+        else:
+            urls[name] = UI_ASSET_URL.format(hashed_name)
+    return urls
+
+
+def write_ui_assets():
+    """Write the content-hashed copies of the Swagger UI assets, run on migrate.
+
+    The copies are written next to the assets with gzip (`.gz`) and, when the
+    `brotli` package is installed, brotli (`.br`) variants, so the web server serves
+    them from `/assets` without compressing them or calling the app. Copies of
+    previous versions are removed.
+    """
+    for name in UI_ASSETS:
+        file_path = os.path.join(UI_ASSETS_DIR, name)
+        # variants of the unhashed asset, written by previous releases
+        for _, suffix in ENCODINGS:
+            if os.path.exists(file_path + suffix):
+                os.remove(file_path + suffix)
+        with open(file_path, "rb") as f:
+            content = f.read()
+        hashed_name = get_ui_asset_name(name)
+        hashed_path = os.path.join(UI_ASSETS_DIR, hashed_name)
+
+        variants = {
+            hashed_path: lambda: content,
+            f"{hashed_path}.gz": lambda: gzip.compress(content, 9, mtime=0),
+        }
+        if brotli:
+            variants[f"{hashed_path}.br"] = lambda: brotli.compress(content, quality=11)
+        for path, compress in variants.items():
+            # the name changes with the content, so existing files are up to date
+            if os.path.exists(path):
+                continue
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(compress())
+            os.replace(tmp_path, path)
+
+        for entry in os.listdir(UI_ASSETS_DIR):
+            match = UI_ASSET_NAME_PATTERN.match(entry.removesuffix(".gz").removesuffix(".br"))
+            if (
+                match
+                and f"{match['stem']}.{match['ext']}" == name
+                and not entry.startswith(hashed_name)
+            ):
+                os.remove(os.path.join(UI_ASSETS_DIR, entry))
+
+
+@frappe.whitelist(allow_guest=True, methods=["GET"])
+def get_swagger_ui_asset(file):
+    """Serve a Swagger UI asset by its content-hashed name.
+
+    Only linked until `write_ui_assets` wrote the hashed copies served from
+    `/assets`. The hash in the name changes with the content, so matching requests
+    are cached for a year without revalidation. Stale hashes, requested by pages
+    rendered before an upgrade, get the current content without long-lived caching.
+
+    Args:
+        file (str): The content-hashed name, as returned by `get_ui_asset_urls`.
+    """
+    match = UI_ASSET_NAME_PATTERN.match(file or "")
+    name = f"{match['stem']}.{match['ext']}" if match else None
+    if name not in UI_ASSETS:
+        return respondNotFound(message="Swagger UI asset not found")
+
+    file_path = os.path.join(UI_ASSETS_DIR, name)
+    current = get_content_hash(file_path)[:12] == match["hash"]
+    return get_file_response(
+        file_path, UI_ASSETS[name], UI_ASSET_CACHE_CONTROL if current else CACHE_CONTROL
+    )
@@ -1,149 +1,764 @@
 import ast
+import enum
+import hashlib
 import importlib.util
 import inspect
 import json
+import logging
+import multiprocessing
+import operator
 import os
+import sys
+import typing
+from concurrent.futures import ProcessPoolExecutor
 
 import frappe
 from pydantic import BaseModel
 
+from .batch import BATCH_PATH, BatchRequest, BatchResponse
+from .rate_limiter import get_rate_limit_rule, rate_limit
+from .response_cache import cached_response
+from .spec_server import SHARDS_DIR, SHARDS_INDEX, get_spec_dir, write_compact_spec
+from .validator import NDJSON_CONTENT_TYPE, validate_request
+
+# Bump whenever the generated fragments change shape to invalidate existing caches
+CACHE_VERSION = 14
+
+# Pydantic schemas are shared between operations as components
+SCHEMA_REF_PREFIX = "#/components/schemas/"
+SCHEMA_REF_TEMPLATE = SCHEMA_REF_PREFIX + "{model}"
+
+# Schema components by Pydantic model, computed once per generation run
+_model_components = {}
+
+# Concurrent generation requests are coalesced into the job with this ID
+GENERATION_JOB_ID = "swagger_generate_swagger_json"
+
+# HTTP methods that can be documented for an API function
+HTTP_METHODS = ("GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS", "HEAD")
+
+# Arithmetic evaluated in decorator arguments, e.g. `max_body_size=200 * 1024 * 1024`
+NUMBER_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Pow: operator.pow,
+}
+
+# Schemas of annotated types other than Pydantic models, by unqualified type name
+TYPE_SCHEMAS = {
+    "str": {"type": "string"},
+    "int": {"type": "integer"},
+    "float": {"type": "number"},
+    "Decimal": {"type": "number"},
+    "bool": {"type": "boolean"},
+    "bytes": {"type": "string", "format": "binary"},
+    "date": {"type": "string", "format": "date"},
+    "datetime": {"type": "string", "format": "date-time"},
+    "time": {"type": "string", "format": "time"},
+    "UUID": {"type": "string", "format": "uuid"},
+    "dict": {"type": "object"},
+    "Dict": {"type": "object"},
+    "list": {"type": "array", "items": {}},
+    "List": {"type": "array", "items": {}},
+    "Any": {},
+    "object": {},
+}
+ARRAY_TYPES = ("list", "List", "Sequence", "Iterable", "set", "Set", "tuple", "Tuple")
+MAPPING_TYPES = ("dict", "Dict", "Mapping")
+
+# Functions and files skipped during generation, which are not errors
+logger = logging.getLogger(__name__)
+
+# Errors collected inside a worker process, logged by the parent process
+_worker_errors = None
+
+
+def log_generator_error(message):
+    """Log an error raised while processing API files.
+
+    Worker processes have no usable site connection, so their errors are collected
+    and returned to the parent process, which logs them with `frappe.log_error`.
 
-def find_pydantic_model_in_decorator(node):
-    """Find the name of the Pydantic model used in the validate_request decorator.
-    
     Args:
-        node (ast.AST): The AST node representing the function definition.
-    
+        message (str): The error message.
+    """
+    if _worker_errors is not None:
+        _worker_errors.append(message)
+    else:
+        frappe.log_error(message)
+
+
+def get_call_name(node):
+    """Get the name of the function called by a call node.
+
+    Args:
+        node (ast.AST): The AST node.
+
+    Returns:
+        str: The called name, e.g. `validate_request` for both `validate_request(...)`
+            and `swagger.validate_request(...)`, or None if the node is not a call.
+    """
+    if isinstance(node, ast.Call):
+        return get_name(node.func)
+    return None
+
+
+def get_name(node):
+    """Get the name referenced by a name or attribute node.
+
+    Args:
+        node (ast.AST): The AST node.
+
     Returns:
-        str: The name of the Pydantic model used in the decorator, if found.
-    """
-    for n in ast.walk(node):
-        if isinstance(n, ast.FunctionDef):
-            for decorator in n.decorator_list:
-                if isinstance(decorator, ast.Call):
-                    if (
-                        isinstance(decorator.func, ast.Name)
-                        and decorator.func.id == "validate_request"
-                    ):
-                        if decorator.args:
-                            if isinstance(decorator.args[0], ast.Name):
-                                return decorator.args[0].id
-                            elif isinstance(decorator.args[0], ast.Attribute):
-                                return f"{ast.dump(decorator.args[0].value)}.{decorator.args[0].attr}"
+        str: The name, e.g. `validate_query` for both `validate_query` and
+            `swagger.validate_query`, or None for other nodes.
+    """
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
     return None
 
 
-def get_pydantic_model_schema(model_name, module):
-    """Extract the schema from a Pydantic model.
+def get_literal_value(node):
+    """Evaluate a literal, including arithmetic on numbers such as `200 * 1024 * 1024`.
+
+    Args:
+        node (ast.AST): The AST node of the expression.
+
+    Returns:
+        The value of the expression.
+
+    Raises:
+        ValueError: If the expression is not a literal.
+    """
+    if isinstance(node, ast.BinOp) and type(node.op) in NUMBER_OPERATORS:
+        left = get_literal_value(node.left)
+        right = get_literal_value(node.right)
+        if not all(type(value) in (int, float) for value in (left, right)):
+            raise ValueError("Arithmetic on a value that is not a number")
+        return NUMBER_OPERATORS[type(node.op)](left, right)
+    return ast.literal_eval(node)
+
+
+def get_function_parameters(node):
+    """Get the parameters of a function node, mirroring `inspect.signature`.
+
+    Args:
+        node (ast.FunctionDef): The AST node representing the function definition.
+
+    Returns:
+        list: The (name, annotation, required) tuples in signature order, where the
+            annotation is the source of the annotation expression, if any.
+    """
+    args = node.args
+    positional = args.posonlyargs + args.args
+    first_default = len(positional) - len(args.defaults)
+    parameters = [
+        (arg, index < first_default) for index, arg in enumerate(positional)
+    ]
+    if args.vararg:
+        parameters.append((args.vararg, True))
+    parameters.extend(
+        (arg, default is None) for arg, default in zip(args.kwonlyargs, args.kw_defaults)
+    )
+    if args.kwarg:
+        parameters.append((args.kwarg, True))
+    return [
+        (arg.arg, ast.unparse(arg.annotation) if arg.annotation else None, required)
+        for arg, required in parameters
+    ]
+
+
+class FunctionAnalyzer(ast.NodeVisitor):
+    """Collect everything the generator needs from an API function in one traversal.
+
+    Attributes:
+        has_method_check (bool): Whether the function calls `validate_http_method`.
+        http_methods (list): The HTTP methods passed as literals to
+            `validate_http_method`, in order of appearance.
+        declared_methods (list): The HTTP methods passed to the `http_methods`
+            decorator, if any.
+        model_name (str): The Pydantic model passed to the `validate_request`
+            decorator, if any.
+        response_model (str): The source of the response type passed to
+            `validate_request` as `response_model` or to `serialize_response`, if any.
+        max_body_size (int): The `max_body_size` passed to `validate_request`, if any.
+        streams_body (bool): Whether `validate_request` streams the items of a
+            newline-delimited JSON body.
+        validates_query (bool): Whether the function is decorated with
+            `validate_query`.
+        cache_options (dict): The options of the `cached_response` decorator, if any.
+        rate_limit (dict): The options of the `rate_limit` decorator, if any.
+        parameters (list): The (name, annotation, required) tuples of the signature.
+        return_annotation (str): The source of the return annotation, if any.
+    """
+
+    def __init__(self, node):
+        self.has_method_check = False
+        self.http_methods = []
+        self.declared_methods = []
+        self.model_name = None
+        self.response_model = None
+        self.max_body_size = None
+        self.streams_body = False
+        self.validates_query = False
+        self.cache_options = None
+        self.rate_limit = None
+        self.parameters = get_function_parameters(node)
+        self.return_annotation = ast.unparse(node.returns) if node.returns else None
+
+        for decorator in node.decorator_list:
+            call_name = get_call_name(decorator)
+            if call_name == "validate_request" and not self.model_name:
+                self.model_name = self.get_model_name(decorator)
+                self.response_model = self.get_argument_source(
+                    decorator, "response_model", positional=False
+                )
+                options = self.get_decorator_options(decorator, validate_request)
+                if isinstance(options["max_body_size"], int):
+                    self.max_body_size = options["max_body_size"]
+                self.streams_body = options["stream"] is True
+            elif call_name == "serialize_response":
+                self.response_model = self.get_argument_source(decorator, "model")
+            elif call_name == "http_methods":
+                self.declared_methods = self.get_http_methods(decorator)
+            elif call_name == "validate_query" or get_name(decorator) == "validate_query":
+                self.validates_query = True
+            elif call_name == "cached_response":
+                self.cache_options = self.get_decorator_options(decorator, cached_response)
+            elif call_name == "rate_limit":
+                self.rate_limit = self.get_decorator_options(decorator, rate_limit)
+        for statement in node.body:
+            self.visit(statement)
+
+    @staticmethod
+    def get_model_name(decorator):
+        """Get the name of the model passed to a `validate_request` decorator."""
+        args = decorator.args or [
+            keyword.value for keyword in decorator.keywords if keyword.arg == "model"
+        ]
+        if args and isinstance(args[0], (ast.Name, ast.Attribute)):
+            return ast.unparse(args[0])
+        return None
+
+    @staticmethod
+    def get_argument_source(call, keyword_name, positional=True):
+        """Get the source of the first argument of a call, or of a keyword argument."""
+        args = (call.args if positional else []) or [
+            keyword.value for keyword in call.keywords if keyword.arg == keyword_name
+        ]
+        return ast.unparse(args[0]) if args else None
+
+    @staticmethod
+    def get_decorator_options(call, decorator):
+        """Get the options passed to a decorator factory, like `cached_response`.
+
+        Arguments that are not literals are documented with their default values.
+        """
+        options = {
+            name: parameter.default
+            for name, parameter in inspect.signature(decorator).parameters.items()
+        }
+        arguments = dict(zip(options, call.args))
+        arguments.update(
+            (keyword.arg, keyword.value)
+            for keyword in call.keywords
+            if keyword.arg in options
+        )
+        for name, value in arguments.items():
+            try:
+                options[name] = get_literal_value(value)
+            except (ValueError, TypeError, SyntaxError, ArithmeticError):
+                pass
+        return options
+
+    @staticmethod
+    def get_http_methods(call):
+        """Get the HTTP methods passed as string literals to a call."""
+        methods = []
+        for arg in call.args:
+            if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                method = arg.value.upper()
+                if method in HTTP_METHODS and method not in methods:
+                    methods.append(method)
+        return methods
+
+    def visit_Call(self, node):
+        if get_call_name(node) == "validate_http_method":
+            self.has_method_check = True
+            for method in self.get_http_methods(node):
+                if method not in self.http_methods:
+                    self.http_methods.append(method)
+        self.generic_visit(node)
+
+
+def get_pydantic_model(model_name, module, dependencies=None):
+    """Resolve a Pydantic model referenced by name in a module.
     
     Args:
-        model_name (str): The name of the Pydantic model.
-        module (module): The module where the model is defined.
+        model_name (str): The name of the Pydantic model, optionally dotted
+            (e.g. `models.UserModel`).
+        module (module): The module where the model is referenced.
+        dependencies (set, optional): Collects the source files of resolved models
+            defined outside of `module`, so cached fragments can be invalidated.
     
     Returns:
-        dict: The JSON schema of the Pydantic model, if valid.
+        type: The Pydantic model, if valid.
     """
-    if hasattr(module, model_name):
-        model = getattr(module, model_name)
-        if issubclass(model, BaseModel):
-            return model.model_json_schema()
+    model = module
+    for attr in model_name.split("."):
+        model = getattr(model, attr, None)
+    if isinstance(model, type) and issubclass(model, BaseModel):
+        if dependencies is not None:
+            add_model_dependencies(model, dependencies, getattr(module, "__file__", None))
+        return model
     return None
 
 
-def process_function(app_name, module_name, func_name, func, swagger, module):
-    """Process each function to update the Swagger paths.
-    
+def add_model_dependencies(model, dependencies, exclude=None):
+    """Collect the source files a Pydantic model schema depends on.
+
+    These are the files defining the model, its base classes and the models and enums
+    reachable through its field annotations, recursively.
+
+    Args:
+        model (type): The Pydantic model.
+        dependencies (set): The set the source files are added to.
+        exclude (str, optional): The file of the API module itself.
+    """
+    seen = set()
+    pending = [model]
+    while pending:
+        annotation = pending.pop()
+        if not isinstance(annotation, type):
+            pending.extend(typing.get_args(annotation))
+            continue
+        if annotation in seen:
+            continue
+        seen.add(annotation)
+        if not issubclass(annotation, (BaseModel, enum.Enum)):
+            pending.extend(typing.get_args(annotation))
+            continue
+
+        for cls in annotation.__mro__:
+            if cls.__module__.split(".")[0] in ("pydantic", "enum", "builtins"):
+                continue
+            source_file = getattr(sys.modules.get(cls.__module__), "__file__", None)
+            if source_file and source_file != exclude:
+                dependencies.add(source_file)
+        if issubclass(annotation, BaseModel):
+            pending.extend(field.annotation for field in annotation.model_fields.values())
+
+
+def get_model_components(model):
+    """Get the schema components of a Pydantic model, computed once per generation run.
+
+    The model schema and the schemas of its nested models are returned as separate
+    components referencing each other through `#/components/schemas/...`.
+
+    Args:
+        model (type): The Pydantic model.
+
+    Returns:
+        tuple: The component name of the model and the components by name.
+    """
+    if model not in _model_components:
+        schema = model.model_json_schema(ref_template=SCHEMA_REF_TEMPLATE)
+        components = schema.pop("$defs", {})
+        if list(schema) == ["$ref"]:
+            # Recursive models are emitted as a reference to their own definition
+            name = schema["$ref"].rsplit("/", 1)[-1]
+        else:
+            name = model.__name__
+            components = {name: schema, **components}
+        _model_components[model] = (name, components)
+    return _model_components[model]
+
+
+def replace_schema_refs(value, renames):
+    """Point the `$ref`s of a JSON document to renamed schema components.
+
+    Args:
+        value: The JSON document.
+        renames (dict): The new component names by old component name.
+
+    Returns:
+        A copy of the JSON document if any reference was renamed, else the document.
+    """
+    if not renames:
+        return value
+    if isinstance(value, dict):
+        ref = value.get("$ref")
+        if isinstance(ref, str) and ref.startswith(SCHEMA_REF_PREFIX):
+            name = ref[len(SCHEMA_REF_PREFIX) :]
+            if name in renames:
+                value = {**value, "$ref": SCHEMA_REF_PREFIX + renames[name]}
+        return {key: replace_schema_refs(item, renames) for key, item in value.items()}
+    if isinstance(value, list):
+        return [replace_schema_refs(item, renames) for item in value]
+    return value
+
+
+def get_schema_name(name, schema, schemas, taken):
+    """Choose the component name of a schema being merged.
+
+    An identical schema already registered under the same name, or under the title of
+    the schema with an optional numeric suffix, is reused. Otherwise the first free
+    name among those is taken.
+
+    Args:
+        name (str): The name of the schema in the components being merged.
+        schema (dict): The schema being merged.
+        schemas (dict): The schema components merged so far.
+        taken (set): The names already chosen for other components being merged.
+
+    Returns:
+        str: The component name.
+    """
+    title = schema.get("title")
+    base = title if isinstance(title, str) and title.isidentifier() else name
+    candidates = [name, base]
+    index = 2
+    while f"{base}{index}" in schemas:
+        candidates.append(f"{base}{index}")
+        index += 1
+    candidates.append(f"{base}{index}")
+
+    for candidate in candidates:
+        if schemas.get(candidate) == schema and candidate not in taken:
+            return candidate
+    for candidate in candidates:
+        if candidate not in schemas and candidate not in taken:
+            return candidate
+    index += 1
+    while f"{base}{index}" in taken:
+        index += 1
+    return f"{base}{index}"
+
+
+def merge_schemas(schemas, components):
+    """Merge schema components, renaming those that clash with a different schema.
+
+    Identical components are shared. A component whose name is already taken by a
+    different schema, e.g. two models with the same class name in different modules,
+    is added as `<name>2`, `<name>3`, ... and references to it are rewritten.
+
+    Args:
+        schemas (dict): The schema components to be updated.
+        components (dict): The schema components to merge.
+
+    Returns:
+        dict: The new component names by original name, for the renamed components.
+    """
+    renames = {}
+    # Renaming a component changes the schemas referencing it, so repeat until stable
+    for _ in range(len(components) + 1):
+        renamed = {
+            name: replace_schema_refs(schema, renames)
+            for name, schema in components.items()
+        }
+        taken = set()
+        new_renames = {}
+        for name, schema in renamed.items():
+            new_name = get_schema_name(name, schema, schemas, taken)
+            taken.add(new_name)
+            if new_name != name:
+                new_renames[name] = new_name
+        if new_renames == renames:
+            break
+        renames = new_renames
+
+    for name, schema in renamed.items():
+        schemas.setdefault(renames.get(name, name), schema)
+    return renames
+
+
+def get_model_schema_ref(model, swagger):
+    """Register the schema of a Pydantic model and reference it.
+
+    Args:
+        model (type): The Pydantic model.
+        swagger (dict): The Swagger specification holding the schema components.
+
+    Returns:
+        dict: The schema referencing the model component.
+    """
+    name, components = get_model_components(model)
+    schemas = swagger.setdefault("components", {}).setdefault("schemas", {})
+    renames = merge_schemas(schemas, components)
+    return {"$ref": SCHEMA_REF_PREFIX + renames.get(name, name)}
+
+
+def get_annotation_schema(annotation, get_model, swagger):
+    """Get the schema of a type annotation.
+
+    Builtin scalars, dates, containers, `Optional`/`Union`/`Literal` and Pydantic
+    models are understood, from the annotation source alone, so this works in both
+    analysis modes.
+
+    Args:
+        annotation (str): The source of the annotation expression.
+        get_model (callable): Resolves a Pydantic model by name.
+        swagger (dict): The Swagger specification holding the schema components.
+
+    Returns:
+        dict: The schema, or None if the annotation is missing or not understood.
+    """
+    if not annotation:
+        return None
+    try:
+        node = ast.parse(annotation, mode="eval").body
+    except SyntaxError:
+        return None
+    return get_annotation_node_schema(node, get_model, swagger)
+
+
+def get_annotation_node_schema(node, get_model, swagger):
+    """Get the schema of a parsed type annotation, see `get_annotation_schema`."""
+    if isinstance(node, ast.Constant):
+        # string annotations are forward references
+        if isinstance(node.value, str):
+            return get_annotation_schema(node.value, get_model, swagger)
+        return None
+
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        return get_union_schema([node.left, node.right], get_model, swagger)
+
+    if isinstance(node, (ast.Name, ast.Attribute)):
+        name = ast.unparse(node)
+        schema = TYPE_SCHEMAS.get(name.rsplit(".", 1)[-1])
+        if schema is not None:
+            return json.loads(json.dumps(schema))
+        model = get_model(name)
+        return get_model_schema_ref(model, swagger) if model else None
+
+    if isinstance(node, ast.Subscript):
+        origin = ast.unparse(node.value).rsplit(".", 1)[-1]
+        args = node.slice.elts if isinstance(node.slice, ast.Tuple) else [node.slice]
+        if origin in ARRAY_TYPES:
+            items = get_annotation_node_schema(args[0], get_model, swagger)
+            return {"type": "array", "items": items or {}}
+        if origin in MAPPING_TYPES:
+            values = get_annotation_node_schema(args[-1], get_model, swagger)
+            return {"type": "object", "additionalProperties": values or {}}
+        if origin == "Optional":
+            return get_union_schema(args + [ast.Constant(None)], get_model, swagger)
+        if origin == "Union":
+            return get_union_schema(args, get_model, swagger)
+        if origin == "Annotated":
+            return get_annotation_node_schema(args[0], get_model, swagger)
+        if origin == "Literal":
+            values = [arg.value for arg in args if isinstance(arg, ast.Constant)]
+            if not values:
+                return None
+            schema = TYPE_SCHEMAS.get(type(values[0]).__name__, {})
+            if any(type(value) is not type(values[0]) for value in values):
+                schema = {}
+            return {**schema, "enum": values}
+    return None
+
+
+def get_union_schema(members, get_model, swagger):
+    """Get the schema of a union of annotations, nullable when it includes None."""
+    flattened = []
+    for member in members:
+        if isinstance(member, ast.BinOp) and isinstance(member.op, ast.BitOr):
+            flattened.extend([member.left, member.right])
+        else:
+            flattened.append(member)
+
+    nullable = False
+    schemas = []
+    for member in flattened:
+        if isinstance(member, ast.Constant) and member.value is None:
+            nullable = True
+            continue
+        schema = get_annotation_node_schema(member, get_model, swagger)
+        if schema is None:
+            # an unknown member makes the whole union unknown
+            return None
+        if schema not in schemas:
+            schemas.append(schema)
+
+    if not schemas:
+        return None
+    if len(schemas) == 1:
+        schema = schemas[0]
+    else:
+        schema = {"anyOf": schemas}
+    if nullable:
+        # siblings of a $ref are ignored, so references are wrapped in allOf
+        if "$ref" in schema:
+            schema = {"allOf": [schema]}
+        schema["nullable"] = True
+    return schema
+
+
+def get_query_model_params(model, swagger):
+    """Get the query parameters described by the query model of `validate_query`.
+
+    Args:
+        model (type): The Pydantic model built from the function signature.
+        swagger (dict): The Swagger specification holding the schema components.
+
+    Returns:
+        list: The query parameters, in signature order.
+    """
+    name, components = get_model_components(model)
+    schema = components[name]
+    schemas = swagger.setdefault("components", {}).setdefault("schemas", {})
+    renames = merge_schemas(
+        schemas, {key: value for key, value in components.items() if key != name}
+    )
+    required = set(schema.get("required", []))
+    return [
+        {
+            "name": param_name,
+            "in": "query",
+            "required": param_name in required,
+            "schema": replace_schema_refs(param_schema, renames),
+        }
+        for param_name, param_schema in schema.get("properties", {}).items()
+    ]
+
+
+def add_function_operation(
+    app_name,
+    module_name,
+    func_name,
+    node,
+    get_model,
+    swagger,
+    declared_methods=None,
+    get_query_model=None,
+    cache_options=None,
+    rate_limit=None,
+):
+    """Add the operations of an API function to the Swagger paths.
+
     Args:
         app_name (str): The name of the app.
         module_name (str): The name of the module.
         func_name (str): The name of the function being processed.
-        func (function): The function object.
+        node (ast.FunctionDef): The AST node representing the function definition.
+        get_model (callable): Resolves a Pydantic model by name.
         swagger (dict): The Swagger specification to be updated.
-        module (module): The module where the function is defined.
+        declared_methods (tuple, optional): The HTTP methods recorded on the function
+            by the `http_methods` decorator, taking precedence over the source code.
+        get_query_model (callable, optional): Gets the query model built by
+            `validate_query` for the function.
+        cache_options (dict, optional): The options recorded on the function by the
+            `cached_response` decorator, taking precedence over the source code.
+        rate_limit (dict, optional): The limit recorded on the function by the
+            `rate_limit` decorator, taking precedence over the source code.
     """
-    try:
-        source_code = inspect.getsource(func)
-        tree = ast.parse(source_code)
-
-        # Skip functions that do not contain validate_http_method calls
-        if not any(
-            "validate_http_method" in ast.dump(node) and isinstance(node, ast.Call)
-            for node in ast.walk(tree)
-        ):
-            print(f"Skipping {func_name}: 'validate_http_method' not found")
-            return
-
-        # Find the Pydantic model used in the validate_request decorator
-        pydantic_model_name = find_pydantic_model_in_decorator(tree)
-
-        # Construct the API path for the function
-        path = f"/api/method/{app_name}.api.{module_name}.{func_name}".lower()
-
-        # Define the mapping of HTTP methods to check for in the source code
-        http_methods = {
-            "GET": "GET",
-            "POST": "POST",
-            "PUT": "PUT",
-            "DELETE": "DELETE",
-            "PATCH": "PATCH",
-            "OPTIONS": "OPTIONS",
-            "HEAD": "HEAD",
+    analyzer = FunctionAnalyzer(node)
+    declared_methods = list(declared_methods or analyzer.declared_methods)
+    cache_options = cache_options or analyzer.cache_options
+    if rate_limit is None and analyzer.rate_limit:
+        rate_limit = {
+            **analyzer.rate_limit,
+            "burst": analyzer.rate_limit["burst"] or analyzer.rate_limit["rate"],
         }
 
-        # Default HTTP method is POST
-        http_method = "POST"
-        for method in http_methods:
-            if method in source_code:
-                http_method = method
-                break
+    # Skip functions that neither declare their HTTP methods nor validate them
+    if not declared_methods and not analyzer.has_method_check:
+        logger.info("Skipping %s: 'validate_http_method' not found", func_name)
+        return
+
+    # Construct the API path for the function
+    path = f"/api/method/{app_name}.api.{module_name}.{func_name}".lower()
+
+    # Default HTTP method is POST
+    http_methods = declared_methods or analyzer.http_methods or ["POST"]
+
+    # Resolve the Pydantic model once for all methods that modify data
+    pydantic_schema = None
+    if analyzer.model_name and any(
+        method in ["POST", "PUT", "PATCH"] for method in http_methods
+    ):
+        model = get_model(analyzer.model_name)
+        if model:
+            pydantic_schema = get_model_schema_ref(model, swagger)
+
+    # Query parameters come from the model validating them at runtime, if any, else
+    # they are typed from the signature, as strings when not annotated
+    query_params = []
+    query_model = None
+    if any(method in ["GET", "DELETE", "OPTIONS", "HEAD"] for method in http_methods):
+        if analyzer.validates_query and get_query_model:
+            query_model = get_query_model()
+    if query_model:
+        query_params = get_query_model_params(query_model, swagger)
+    elif any(method in ["GET", "DELETE", "OPTIONS", "HEAD"] for method in http_methods):
+        for param_name, annotation, required in analyzer.parameters:
+            if required and not "kwargs" in param_name:
+                query_params.append(
+                    {
+                        "name": param_name,
+                        "in": "query",
+                        "required": True,
+                        "schema": get_annotation_schema(annotation, get_model, swagger)
+                        or {"type": "string"},
+                    }
+                )
 
+    # The response model, or else the return annotation, describes the value that
+    # frappe returns under "message"
+    response_schema = {"type": "object"}
+    message_schema = get_annotation_schema(analyzer.response_model, get_model, swagger)
+    if message_schema is None:
+        message_schema = get_annotation_schema(
+            analyzer.return_annotation, get_model, swagger
+        )
+    if message_schema is not None:
+        response_schema = {"type": "object", "properties": {"message": message_schema}}
+
+    # Initialize the path if not already present
+    if path not in swagger["paths"]:
+        swagger["paths"][path] = {}
+
+    for http_method in http_methods:
         # Define the request body for methods that modify data
         request_body = {}
-        if pydantic_model_name and http_method in ["POST", "PUT", "PATCH"]:
-            pydantic_schema = get_pydantic_model_schema(pydantic_model_name, module)
-            if pydantic_schema:
-                request_body = {
-                    "description": "Request body",
-                    "required": True,
-                    "content": {"application/json": {"schema": pydantic_schema}},
+        if pydantic_schema and http_method in ["POST", "PUT", "PATCH"]:
+            request_body = {
+                "description": "Request body",
+                "required": True,
+                "content": {"application/json": {"schema": pydantic_schema}},
+            }
+            # Streamed bodies hold one item of the model per line
+            if analyzer.streams_body:
+                request_body["content"] = {
+                    NDJSON_CONTENT_TYPE: {"schema": pydantic_schema}
                 }
+            if analyzer.max_body_size:
+                request_body["x-max-body-size"] = analyzer.max_body_size
 
         # Define query parameters for methods that retrieve data
         params = []
         if http_method in ["GET", "DELETE", "OPTIONS", "HEAD"]:
-            signature = inspect.signature(func)
-            for param_name, param in signature.parameters.items():
-                if (
-                    param.default is inspect.Parameter.empty
-                    and not "kwargs" in param_name
-                ):
-                    param_type = "string"
-                    params.append(
-                        {
-                            "name": param_name,
-                            "in": "query",
-                            "required": True,
-                            "schema": {"type": param_type},
-                        }
-                    )
+            params = query_params
 
         # Define the response schema
         responses = {
             "200": {
                 "description": "Successful response",
-                "content": {"application/json": {"schema": {"type": "object"}}},
+                "content": {"application/json": {"schema": response_schema}},
             }
         }
+        if request_body and analyzer.max_body_size:
+            responses["413"] = {
+                "description": f"Request body larger than {analyzer.max_body_size} bytes"
+            }
 
         # Assign tags for the Swagger documentation
         tags = [module_name]
 
-        # Initialize the path if not already present
-        if path not in swagger["paths"]:
-            swagger["paths"][path] = {}
-
         # Update the Swagger specification with the function details
-        swagger["paths"][path][http_method.lower()] = {
+        operation = {
             "summary": func_name.title().replace("_", " "),
             "tags": tags,
             "parameters": params,
@@ -151,11 +766,337 @@ def process_function(app_name, module_name, func_name, func, swagger, module):
             "responses": responses,
             "security": [{"basicAuth": []}],
         }
+
+        # Only GET and HEAD requests are served from the cache of `cached_response`
+        if cache_options and http_method in ["GET", "HEAD"]:
+            operation["x-cache"] = {
+                "ttl": cache_options["ttl"],
+                "varyOn": list(cache_options["vary_on"]),
+                "invalidatedBy": list(cache_options["doctypes"]),
+            }
+            responses["200"] = {
+                **responses["200"],
+                "headers": {
+                    "X-Cache": {
+                        "description": "Whether the response was served from the cache",
+                        "schema": {"type": "string", "enum": ["HIT", "MISS"]},
+                    }
+                },
+            }
+
+        if rate_limit:
+            add_rate_limit(operation, rate_limit)
+
+        swagger["paths"][path][http_method.lower()] = operation
+
+
+def add_rate_limit(operation, limit):
+    """Document a rate limit of an operation.
+
+    Adds the limit to the `x-rate-limit` extension, and the 429 response of
+    rejected requests.
+
+    Args:
+        operation (dict): The operation.
+        limit (dict): The options of the `rate_limit` decorator, or of a rate limit
+            rule of Swagger Settings.
+    """
+    operation.setdefault("x-rate-limit", []).append(
+        {
+            "rate": limit["rate"],
+            "per": limit["per"],
+            "burst": limit["burst"],
+            "maxInFlight": limit["max_in_flight"],
+            "keyBy": limit["key_by"],
+        }
+    )
+    operation["responses"]["429"] = {
+        "description": "Too many requests",
+        "headers": {
+            "Retry-After": {
+                "description": "Seconds to wait before retrying",
+                "schema": {"type": "integer"},
+            }
+        },
+    }
+
+
+def add_batch_operation(swagger):
+    """Document the batch endpoint of this app.
+
+    Args:
+        swagger (dict): The Swagger specification to be updated.
+    """
+    swagger["paths"][BATCH_PATH] = {
+        "post": {
+            "summary": "Execute Batch",
+            "description": (
+                "Run several documented API calls in one request. Each call gets its "
+                "own status code, and the changes of calls raising an exception are "
+                "rolled back."
+            ),
+            "tags": ["batch"],
+            "parameters": [],
+            "requestBody": {
+                "description": "Request body",
+                "required": True,
+                "content": {
+                    "application/json": {"schema": get_model_schema_ref(BatchRequest, swagger)}
+                },
+            },
+            "responses": {
+                "200": {
+                    "description": "Successful response",
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "object",
+                                "properties": {
+                                    "message": get_model_schema_ref(BatchResponse, swagger)
+                                },
+                            }
+                        }
+                    },
+                }
+            },
+            "security": [{"basicAuth": []}],
+        }
+    }
+
+
+def add_rate_limit_rules(paths):
+    """Document the rate limit rules of Swagger Settings.
+
+    Rules are applied to the merged paths on every generation, so changing them
+    needs no full rebuild.
+
+    Args:
+        paths (dict): The Swagger paths.
+    """
+    for path, operations in paths.items():
+        limit = get_rate_limit_rule(path)
+        if limit:
+            for operation in operations.values():
+                add_rate_limit(operation, limit)
+
+
+def process_function(
+    app_name, module_name, func_name, func, swagger, module, dependencies=None
+):
+    """Process each function to update the Swagger paths.
+    
+    Args:
+        app_name (str): The name of the app.
+        module_name (str): The name of the module.
+        func_name (str): The name of the function being processed.
+        func (function): The function object.
+        swagger (dict): The Swagger specification to be updated.
+        module (module): The module where the function is defined.
+        dependencies (set, optional): Collects source files the generated operation
+            depends on besides the module itself.
+    
+    Returns:
+        bool: False if an error occurred while processing the function.
+    """
+    try:
+        tree = ast.parse(inspect.getsource(func))
+        node = tree.body[0] if tree.body else None
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            logger.info("Skipping %s: not a function definition", func_name)
+            return True
+
+        add_function_operation(
+            app_name,
+            module_name,
+            func_name,
+            node,
+            lambda model_name: get_pydantic_model(model_name, module, dependencies),
+            swagger,
+            getattr(func, "_http_methods", None),
+            lambda: getattr(func, "_query_model", None),
+            getattr(func, "_cache_options", None),
+            getattr(func, "_rate_limit", None),
+        )
     except Exception as e:
         # Log any errors that occur during processing
-        frappe.log_error(
+        log_generator_error(
             f"Error processing function {func_name} in module {module_name}: {str(e)}"
         )
+        return False
+    return True
+
+
+def get_module_dotted_name(app_name, file_path):
+    """Get the importable name of an API module from its file path.
+
+    Args:
+        app_name (str): The name of the app.
+        file_path (str): The file path of the module.
+
+    Returns:
+        str: The dotted module name, e.g. `custom_app.api.user`.
+    """
+    parts = os.path.normpath(file_path)[: -len(".py")].split(os.sep)
+    for index in range(len(parts) - 1):
+        if parts[index] == app_name and parts[index + 1] == "api":
+            parts = parts[index:]
+            break
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    return ".".join(parts)
+
+
+class StaticModelResolver:
+    """Resolve Pydantic models referenced by name in a module that is never executed.
+
+    Names are resolved through the module-level imports found in the AST, and only the
+    modules defining referenced models are imported. Models defined in the API module
+    itself require loading that module, which happens at most once and only on demand.
+    """
+
+    def __init__(self, app_name, file_path, tree, dependencies=None):
+        self.file_path = file_path
+        self.package = get_module_dotted_name(app_name, file_path).rpartition(".")[0]
+        self.dependencies = dependencies
+        self.bindings = {}
+        self.module = None
+        self.models = {}
+
+        for node in tree.body:
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.asname:
+                        self.bindings[alias.asname] = ("module", alias.name)
+                    else:
+                        head = alias.name.split(".")[0]
+                        self.bindings[head] = ("module", head)
+            elif isinstance(node, ast.ImportFrom):
+                base = "." * node.level + (node.module or "")
+                for alias in node.names:
+                    self.bindings[alias.asname or alias.name] = ("from", base, alias.name)
+            elif isinstance(node, ast.ClassDef):
+                self.bindings[node.name] = ("local",)
+
+    def resolve(self, model_name):
+        """Resolve a (possibly dotted) model name to the model class.
+
+        Args:
+            model_name (str): The model name as written in the decorator.
+
+        Returns:
+            type: The resolved object, or None if it cannot be resolved statically.
+        """
+        head, *attrs = model_name.split(".")
+        binding = self.bindings.get(head)
+        if not binding:
+            return None
+
+        if binding[0] == "local":
+            obj = self.get_local(head)
+        elif binding[0] == "module":
+            obj = importlib.import_module(binding[1])
+        else:
+            module_name = importlib.util.resolve_name(binding[1], self.package)
+            obj = getattr(importlib.import_module(module_name), binding[2], None)
+            if obj is None:
+                obj = importlib.import_module(f"{module_name}.{binding[2]}")
+
+        for attr in attrs:
+            # `import pkg.module` makes `pkg.module` reachable, imported or not
+            if inspect.ismodule(obj):
+                try:
+                    obj = importlib.import_module(f"{obj.__name__}.{attr}")
+                    continue
+                except ImportError:
+                    pass
+            obj = getattr(obj, attr, None)
+        return obj
+
+    def get_local(self, name):
+        """Get an object defined in the API module, loading the module on first use.
+
+        Args:
+            name (str): The name of the function or class.
+
+        Returns:
+            object: The object, or None if the module does not define it.
+        """
+        if self.module is None:
+            self.module = load_module_from_file(self.file_path)
+        return getattr(self.module, name, None)
+
+    def get_model(self, model_name):
+        """Get a Pydantic model referenced by name.
+
+        Args:
+            model_name (str): The model name as written in the decorator.
+
+        Returns:
+            type: The Pydantic model, if valid.
+        """
+        if model_name not in self.models:
+            model = self.resolve(model_name)
+            if isinstance(model, type) and issubclass(model, BaseModel):
+                if self.dependencies is not None:
+                    add_model_dependencies(model, self.dependencies, self.file_path)
+            else:
+                model = None
+            self.models[model_name] = model
+        return self.models[model_name]
+
+
+def process_module_static(
+    app_name, module_name, file_path, source, swagger, dependencies=None
+):
+    """Process the API functions of a module using its AST only.
+
+    The module is parsed once and never executed, unless one of its API functions
+    references a Pydantic model defined in the module itself or validates its query
+    with `validate_query`, whose model is built when the module is loaded.
+
+    Args:
+        app_name (str): The name of the app.
+        module_name (str): The name of the module.
+        file_path (str): The file path of the module.
+        source (str): The source code of the module.
+        swagger (dict): The Swagger specification to be updated.
+        dependencies (set, optional): Collects source files the generated operations
+            depend on besides the module itself.
+
+    Returns:
+        bool: False if an error occurred while processing any function.
+    """
+    tree = ast.parse(source, filename=file_path)
+    resolver = StaticModelResolver(app_name, file_path, tree, dependencies)
+
+    # Later definitions win, and functions are processed sorted by name,
+    # like `inspect.getmembers` does for imported modules
+    functions = {
+        node.name: node
+        for node in tree.body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    }
+
+    success = True
+    for func_name, node in sorted(functions.items()):
+        try:
+            add_function_operation(
+                app_name,
+                module_name,
+                func_name,
+                node,
+                resolver.get_model,
+                swagger,
+                get_query_model=lambda: getattr(
+                    resolver.get_local(func_name), "_query_model", None
+                ),
+            )
+        except Exception as e:
+            log_generator_error(
+                f"Error processing function {func_name} in module {module_name}: {str(e)}"
+            )
+            success = False
+    return success
 
 
 def load_module_from_file(file_path):
@@ -174,14 +1115,435 @@ def load_module_from_file(file_path):
     return module
 
 
-@frappe.whitelist(allow_guest=True)
-def generate_swagger_json():
+def get_file_signature(file_path, content=None):
+    """Build the cache signature of a file.
+
+    Args:
+        file_path (str): The file path.
+        content (bytes, optional): The file content, read from disk if not provided.
+
+    Returns:
+        dict: The modification time, size and SHA-256 hash of the file.
+    """
+    stat = os.stat(file_path)
+    if content is None:
+        with open(file_path, "rb") as f:
+            content = f.read()
+    return {
+        "mtime": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": hashlib.sha256(content).hexdigest(),
+    }
+
+
+def is_signature_fresh(file_path, signature):
+    """Check whether a file still matches its cached signature.
+
+    The content hash is only computed when the modification time changed, in which
+    case the signature is refreshed in place if the content is still the same.
+
+    Args:
+        file_path (str): The file path.
+        signature (dict): The signature stored in the cache.
+
+    Returns:
+        bool: True if the file content is unchanged.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return False
+
+    if stat.st_size != signature["size"]:
+        return False
+    if stat.st_mtime_ns == signature["mtime"]:
+        return True
+
+    current = get_file_signature(file_path)
+    if current["sha256"] != signature["sha256"]:
+        return False
+    signature["mtime"] = current["mtime"]
+    return True
+
+
+def is_cache_entry_fresh(entry, file_path):
+    """Check whether a cached file entry can be reused.
+
+    Args:
+        entry (dict): The cached entry of the file.
+        file_path (str): The file path.
+
+    Returns:
+        bool: True if neither the file nor any of its dependencies changed.
+    """
+    if not is_signature_fresh(file_path, entry["signature"]):
+        return False
+    return all(
+        is_signature_fresh(path, signature)
+        for path, signature in entry["dependencies"].items()
+    )
+
+
+def get_generator_cache_path():
+    """Get the path of the generator cache file of the current site.
+
+    Returns:
+        str: The cache file path.
+    """
+    return frappe.get_site_path("private", "swagger_generator_cache.json")
+
+
+def load_generator_cache():
+    """Load the generator cache, discarding it if unreadable or outdated.
+
+    Returns:
+        dict: The generator cache.
+    """
+    try:
+        with open(get_generator_cache_path()) as cache_file:
+            cache = json.load(cache_file)
+        if cache.get("version") == CACHE_VERSION:
+            return cache
+    except (OSError, ValueError):
+        pass
+    return {"version": CACHE_VERSION, "files": {}, "failed": {}}
+
+
+def save_generator_cache(cache):
+    """Atomically write the generator cache.
+
+    Args:
+        cache (dict): The generator cache.
+    """
+    cache_path = get_generator_cache_path()
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.tmp"
+        with open(tmp_path, "w") as cache_file:
+            json.dump(cache, cache_file)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        frappe.log_error(f"Error saving swagger generator cache: {str(e)}")
+
+
+def merge_paths(paths, fragment):
+    """Merge the paths generated for one file into the Swagger paths.
+
+    Operations are merged in order, so merging the fragments of all files gives the
+    same result as processing the files directly into the Swagger specification.
+
+    Args:
+        paths (dict): The Swagger paths to be updated.
+        fragment (dict): The paths generated for one file.
+    """
+    for path, operations in fragment.items():
+        paths.setdefault(path, {}).update(operations)
+
+
+def process_file(app_name, file_path, static=False):
+    """Generate the Swagger paths of all API functions of a file.
+
+    Args:
+        app_name (str): The name of the app.
+        file_path (str): The file path of the module.
+        static (bool, optional): Analyse the source code without executing the module.
+
+    Returns:
+        dict: The cache entry of the file with the generated paths, or None if the
+            file could not be found.
+    """
+    if not (os.path.isfile(file_path) and app_name in str(file_path)):
+        logger.warning("File not found: %s", file_path)
+        return None
+
+    fragment = {"paths": {}, "components": {"schemas": {}}}
+    signature = None
+    dependencies = set()
+    cacheable = True
+    try:
+        with open(file_path, "rb") as f:
+            content = f.read()
+        signature = get_file_signature(file_path, content)
+        module_name = os.path.basename(file_path).replace(".py", "")
+        if static:
+            cacheable = process_module_static(
+                app_name,
+                module_name,
+                file_path,
+                content.decode("utf-8"),
+                fragment,
+                dependencies,
+            )
+        else:
+            module = load_module_from_file(file_path)
+            for func_name, func in inspect.getmembers(module, inspect.isfunction):
+                if (
+                    process_function(
+                        app_name, module_name, func_name, func, fragment, module, dependencies
+                    )
+                    is False
+                ):
+                    cacheable = False
+        dependencies = {path: get_file_signature(path) for path in sorted(dependencies)}
+    except Exception as e:
+        log_generator_error(f"Error loading or processing file {file_path}: {str(e)}")
+        cacheable = False
+
+    return {
+        "app": app_name,
+        "static": bool(static),
+        "signature": signature,
+        "dependencies": dependencies if cacheable else {},
+        "paths": fragment["paths"],
+        "schemas": fragment["components"]["schemas"],
+        "cacheable": cacheable,
+    }
+
+
+def _process_file_in_worker(task):
+    """Process a file inside a worker process.
+
+    Args:
+        task (tuple): The app name, file path and static flag.
+
+    Returns:
+        tuple: The cache entry of the file and the errors raised while processing it.
+    """
+    global _worker_errors
+    _worker_errors = []
+    try:
+        return process_file(*task), _worker_errors
+    finally:
+        _worker_errors = None
+
+
+def process_files(file_paths, static=False, workers=0, on_progress=None):
+    """Process API files, optionally across a pool of worker processes.
+
+    Workers are forked from the current process, so they share its `sys.path` and
+    loaded apps. Results are returned in the order of `file_paths` and errors raised
+    in workers are logged by the current process.
+
+    Args:
+        file_paths (list): The (app name, file path) pairs to process.
+        static (bool, optional): Analyse the source code without executing the modules.
+        workers (int, optional): The number of worker processes. Files are processed
+            in the current process if less than 2.
+        on_progress (callable, optional): Called with the number of processed files
+            after each file.
+
+    Returns:
+        list: The cache entries of the files, as returned by `process_file`.
+    """
+    entries = []
+    if workers < 2 or len(file_paths) < 2:
+        for app, file_path in file_paths:
+            entries.append(process_file(app, file_path, static))
+            if on_progress:
+                on_progress(len(entries))
+        return entries
+
+    tasks = [(app, file_path, static) for app, file_path in file_paths]
+    workers = min(workers, len(tasks))
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("fork")
+    ) as executor:
+        chunksize = max(1, len(tasks) // (workers * 4))
+        for entry, errors in executor.map(_process_file_in_worker, tasks, chunksize=chunksize):
+            for message in errors:
+                frappe.log_error(message)
+            entries.append(entry)
+            if on_progress:
+                on_progress(len(entries))
+    return entries
+
+
+def collect_schema_refs(value, schemas, names=None):
+    """Collect the schema components referenced by a JSON document, transitively.
+
+    Args:
+        value: The JSON document.
+        schemas (dict): The schema components.
+        names (set, optional): The component names collected so far.
+
+    Returns:
+        set: The names of the referenced components.
+    """
+    if names is None:
+        names = set()
+    if isinstance(value, dict):
+        ref = value.get("$ref")
+        if isinstance(ref, str) and ref.startswith(SCHEMA_REF_PREFIX):
+            name = ref[len(SCHEMA_REF_PREFIX) :]
+            if name not in names and name in schemas:
+                names.add(name)
+                collect_schema_refs(schemas[name], schemas, names)
+        for item in value.values():
+            collect_schema_refs(item, schemas, names)
+    elif isinstance(value, list):
+        for item in value:
+            collect_schema_refs(item, schemas, names)
+    return names
+
+
+def build_shard(swagger, paths):
+    """Build a specification holding a subset of the paths of another one.
+
+    Args:
+        swagger (dict): The full Swagger specification.
+        paths (dict): The paths of the shard.
+
+    Returns:
+        dict: The shard, with only the schema components its paths reference.
+    """
+    shard = {**swagger, "paths": paths, "components": dict(swagger["components"])}
+    schemas = swagger["components"].get("schemas")
+    if schemas:
+        names = collect_schema_refs(paths, schemas)
+        shard["components"]["schemas"] = {
+            name: schema for name, schema in schemas.items() if name in names
+        }
+        if not names:
+            del shard["components"]["schemas"]
+    return shard
+
+
+def write_spec_shards(shards_dir, swagger, path_apps):
+    """Write one shard per app and per app tag, with an index of the shards.
+
+    Shards are named `<app>` and `<app>.<tag>`. Only shards whose content changed are
+    written, so the others keep their files, compressed variants and ETags. Shards
+    left over from previous runs are removed.
+
+    Args:
+        shards_dir (str): The output directory.
+        swagger (dict): The full Swagger specification.
+        path_apps (dict): The app name by path.
+
+    Returns:
+        list: The names of the shards written or removed.
+    """
+    app_paths = {}
+    tag_paths = {}
+    for path, operations in swagger["paths"].items():
+        app = path_apps[path]
+        app_paths.setdefault(app, {})[path] = operations
+        for operation in operations.values():
+            for tag in operation.get("tags") or []:
+                tag_paths.setdefault(app, {}).setdefault(tag, {})[path] = operations
+
+    os.makedirs(shards_dir, exist_ok=True)
+    shards = {}
+    index = {"apps": []}
+    for app, paths in app_paths.items():
+        shards[app] = build_shard(swagger, paths)
+        tags = []
+        for tag, paths in sorted(tag_paths.get(app, {}).items()):
+            shard_name = f"{app}.{tag}"
+            shards[shard_name] = build_shard(swagger, paths)
+            tags.append({"name": tag, "shard": shard_name, "paths": len(paths)})
+        index["apps"].append(
+            {"name": app, "shard": app, "paths": len(app_paths[app]), "tags": tags}
+        )
+    shards[SHARDS_INDEX] = index
+
+    # unchanged shards are compared with their files and left alone
+    updated = [
+        name for name, shard in shards.items() if write_compact_spec(shards_dir, name, shard)
+    ]
+    for file_name in sorted(os.listdir(shards_dir)):
+        shard_name = file_name.partition(".min.json")[0]
+        if shard_name not in shards:
+            os.remove(os.path.join(shards_dir, file_name))
+            if shard_name not in updated:
+                updated.append(shard_name)
+    return updated
+
+
+def get_api_file_paths():
+    """Gather all Python files in the `api` folders of each installed app.
+
+    Returns:
+        list: The (app name, file path) pairs.
+    """
+    # Get the path to the Frappe bench directory
+    frappe_bench_dir = frappe.utils.get_bench_path()
+    file_paths = []
+
+    for app in frappe.get_installed_apps():
+        try:
+            api_dir = os.path.join(frappe_bench_dir, "apps", app, app, "api")
+            
+            # Check if the `api` directory exists
+            if os.path.exists(api_dir) and os.path.isdir(api_dir):
+                # Walk through the `api` directory to gather all `.py` files
+                for root, dirs, files in os.walk(api_dir):
+                    for file in files:
+                        if file.endswith(".py"):
+                            file_paths.append((app,os.path.join(root, file)))
+        except Exception as e:
+            # Log any errors encountered while processing the app
+            frappe.log_error(f"Error processing app '{app}': {str(e)}")
+            continue
+    return file_paths
+
+
+def is_cache_entry_reusable(entry, app_name, file_path, static):
+    """Check whether a cached file entry can be reused for the current generation.
+
+    Args:
+        entry (dict): The cached entry of the file, if any.
+        app_name (str): The name of the app.
+        file_path (str): The file path.
+        static (bool): Whether the static analysis mode is used.
+
+    Returns:
+        bool: True if the entry matches the generation settings and is fresh.
+    """
+    return bool(
+        entry
+        and entry["app"] == app_name
+        and entry["static"] == static
+        and is_cache_entry_fresh(entry, file_path)
+    )
+
+
+def publish_generation_progress(done, total):
+    """Publish the progress of the generation to the user who started it.
+
+    Progress is only published when the percentage changes, to limit the number of
+    realtime events on large benches.
+
+    Args:
+        done (int): The number of processed files.
+        total (int): The number of files to process.
+    """
+    percent = int(done * 100 / total) if total else 100
+    if done and done < total and percent == int((done - 1) * 100 / total):
+        return
+    frappe.publish_realtime(
+        "swagger_generation_progress",
+        {"done": done, "total": total, "percent": percent},
+        user=frappe.session.user,
+    )
+
+
+def generate_swagger_json(force=False):
     """Generate Swagger JSON documentation for all API methods.
     
     This function processes all Python files in the `api` directories of installed apps
-    to generate a Swagger JSON file that describes the API methods.
+    to generate a Swagger JSON file that describes the API methods. Files that did not
+    change since the previous run are served from the generator cache. It is not
+    whitelisted: requests go through `enqueue_swagger_generation`, which runs it in a
+    deduplicated background job.
+
+    Args:
+        force (bool, optional): Ignore the generator cache and rebuild every file.
     """
+    force = frappe.utils.cint(force)
+    _model_components.clear()
     swagger_settings = frappe.get_single("Swagger Settings")
+    static = swagger_settings.analysis_mode == "Static"
     
     # Initialize the Swagger specification
     swagger = {
@@ -214,42 +1576,67 @@ def generate_swagger_json():
         }
         swagger["security"].append({"bearerAuth": []})
 
-    # Get the path to the Frappe bench directory
-    frappe_bench_dir = frappe.utils.get_bench_path()
-    file_paths = []
+    file_paths = get_api_file_paths()
 
-    # Gather all Python files in the `api` folders of each installed app
-    for app in frappe.get_installed_apps():
-        try:
-            api_dir = os.path.join(frappe_bench_dir, "apps", app, app, "api")
-            
-            # Check if the `api` directory exists
-            if os.path.exists(api_dir) and os.path.isdir(api_dir):
-                # Walk through the `api` directory to gather all `.py` files
-                for root, dirs, files in os.walk(api_dir):
-                    for file in files:
-                        if file.endswith(".py"):
-                            file_paths.append((app,os.path.join(root, file)))
-        except Exception as e:
-            # Log any errors encountered while processing the app
-            frappe.log_error(f"Error processing app '{app}': {str(e)}")
-            continue
+    # Load the per-file cache unless a full rebuild was requested
+    cache = {"version": CACHE_VERSION, "files": {}, "failed": {}}
+    if not force:
+        cache = load_generator_cache()
+    cached_files = {}
+    failed_files = {}
 
-    # Process each Python file found
-    for app,file_path in file_paths:
-        try:
-            if os.path.isfile(file_path) and app in str(file_path):
-                module = load_module_from_file(file_path)
-                module_name = os.path.basename(file_path).replace(".py", "")
-                for func_name, func in inspect.getmembers(module, inspect.isfunction):
-                    process_function(app, module_name, func_name, func, swagger, module)
-            else:
-                print(f"File not found: {file_path}")
-        except Exception as e:
-            frappe.log_error(f"Error loading or processing file {file_path}: {str(e)}")
+    # Reuse the cached fragments of unchanged files
+    entries = [None] * len(file_paths)
+    pending = []
+    for index, (app, file_path) in enumerate(file_paths):
+        entry = cache["files"].get(file_path)
+        if is_cache_entry_reusable(entry, app, file_path, static):
+            entry["cacheable"] = True
+            entries[index] = entry
+        else:
+            pending.append(index)
+
+    # Process the remaining files, in parallel if configured
+    publish_generation_progress(0, len(pending))
+    processed = process_files(
+        [file_paths[index] for index in pending],
+        static,
+        frappe.utils.cint(swagger_settings.generator_workers),
+        on_progress=lambda done: publish_generation_progress(done, len(pending)),
+    )
+    for index, entry in zip(pending, processed):
+        entries[index] = entry
+
+    # Merge the fragments in file order, so the output does not depend on the cache
+    # or on the order in which workers finish
+    schemas = {}
+    path_apps = {}
+    for (app, file_path), entry in zip(file_paths, entries):
+        if entry:
+            renames = merge_schemas(schemas, entry["schemas"])
+            merge_paths(swagger["paths"], replace_schema_refs(entry["paths"], renames))
+            for path in entry["paths"]:
+                path_apps.setdefault(path, app)
+            if entry.pop("cacheable"):
+                cached_files[file_path] = entry
+            elif entry["signature"]:
+                failed_files[file_path] = entry["signature"]
+
+    save_generator_cache(
+        {"version": CACHE_VERSION, "files": cached_files, "failed": failed_files}
+    )
+
+    add_rate_limit_rules(swagger["paths"])
+
+    # Shared Pydantic schemas referenced by the operations
+    if schemas:
+        swagger["components"]["schemas"] = schemas
+
+    add_batch_operation(swagger)
+    path_apps[BATCH_PATH] = "swagger"
 
     # Define the path to the Swagger JSON file
-    www_dir = os.path.join(frappe_bench_dir, "apps", "swagger", "swagger", "www")
+    www_dir = get_spec_dir()
 
     # Ensure the www directory exists
     if not os.path.exists(www_dir):
@@ -260,4 +1647,88 @@ def generate_swagger_json():
     with open(file_path, "w") as swagger_file:
         json.dump(swagger, swagger_file, indent=4)
 
-    frappe.msgprint("Swagger JSON generated successfully.")
\ No newline at end of file
+    # Save the compact and precompressed forms served by `get_swagger_json`
+    write_compact_spec(www_dir, "swagger", swagger)
+
+    # Save the per-app and per-tag shards loaded on demand by the Swagger UI
+    updated_shards = write_spec_shards(os.path.join(www_dir, SHARDS_DIR), swagger, path_apps)
+
+    frappe.publish_realtime(
+        "swagger_generation_done",
+        {
+            "paths": len(swagger["paths"]),
+            "processed": len(pending),
+            "updated_shards": len(updated_shards),
+        },
+        user=frappe.session.user,
+    )
+    frappe.msgprint("Swagger JSON generated successfully.")
+
+
+@frappe.whitelist()
+def enqueue_swagger_generation(force=False):
+    """Generate the Swagger JSON in a background job.
+
+    Repeated requests while a generation is queued or running are coalesced into
+    that generation. Progress is published through the `swagger_generation_progress`
+    and `swagger_generation_done` realtime events.
+
+    Args:
+        force (bool, optional): Ignore the generator cache and rebuild every file.
+    """
+    frappe.only_for("System Manager")
+    job = frappe.enqueue(
+        "swagger.swagger_generator.generate_swagger_json",
+        queue="long",
+        job_id=GENERATION_JOB_ID,
+        deduplicate=True,
+        force=frappe.utils.cint(force),
+    )
+    if job:
+        frappe.msgprint("Swagger JSON generation has been queued.", alert=True)
+    else:
+        frappe.msgprint("Swagger JSON generation is already in progress.", alert=True)
+
+
+def api_files_changed():
+    """Check whether any API file, or Pydantic model used by one, changed since the
+    last generation.
+
+    Returns:
+        bool: True if the Swagger JSON is out of date.
+    """
+    cache = load_generator_cache()
+    file_paths = get_api_file_paths()
+    if set(cache["files"]) | set(cache["failed"]) != {
+        file_path for app, file_path in file_paths
+    }:
+        return True
+
+    # Files that failed to process only count as changed once they are edited
+    static = frappe.get_single("Swagger Settings").analysis_mode == "Static"
+    return not all(
+        is_signature_fresh(file_path, cache["failed"][file_path])
+        if file_path in cache["failed"]
+        else is_cache_entry_reusable(cache["files"][file_path], app, file_path, static)
+        for app, file_path in file_paths
+    )
+
+
+def regenerate_on_migrate():
+    """Queue the generation of the Swagger JSON after a migration, if enabled in
+    "Swagger Settings" and API files changed.
+    """
+    if not frappe.db.get_single_value("Swagger Settings", "regenerate_on_migrate"):
+        return
+    try:
+        if api_files_changed():
+            frappe.enqueue(
+                "swagger.swagger_generator.generate_swagger_json",
+                queue="long",
+                job_id=GENERATION_JOB_ID,
+                deduplicate=True,
+            )
+    except Exception:
+        frappe.log_error(
+            message=frappe.get_traceback(), title="Swagger JSON Regeneration Error"
+        )
\ No newline at end of file
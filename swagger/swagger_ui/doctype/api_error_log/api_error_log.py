@@ -2,12 +2,77 @@
 # For license information, please see license.txt
 
 # import frappe
+import gzip
+import json
+import os
+
 import frappe
 from frappe.model.document import Document
+from frappe.utils import add_days, cint, now_datetime
+
+ARCHIVE_DIR = "api_error_log_archive"
 
 
 class APIErrorLog(Document):
     def onload(self):
         if not self.seen:
             self.db_set("seen", 1, update_modified=0)
-            frappe.db.commit()
\ No newline at end of file
+            frappe.db.commit()
+
+
+def on_doctype_update():
+    # Serves the list view, which shows unseen errors by modified descending
+    frappe.db.add_index("API Error Log", ["seen", "modified"])
+
+
+def purge_old_logs():
+    """
+    Delete API Error Logs not modified within the retention period of Swagger Settings
+
+    Rows are deleted in chunks of "Purge Batch Size", committing after each chunk so
+    no lock is held for long. Repeats of an error update its modified time, so
+    recurring errors are kept. When archiving is enabled every chunk is appended to
+    a gzipped JSON Lines file in the private files of the site before it is deleted.
+    """
+    settings = frappe.get_cached_doc("Swagger Settings")
+    retention_days = cint(settings.error_log_retention_days)
+    if retention_days <= 0:
+        return 0
+
+    batch_size = max(cint(settings.error_log_purge_batch_size), 1)
+    cutoff = add_days(now_datetime(), -retention_days)
+    archive_path = get_archive_path() if settings.archive_purged_error_logs else None
+
+    purged = 0
+    while True:
+        names = frappe.get_all(
+            "API Error Log",
+            filters={"modified": ["<", cutoff]},
+            order_by="modified asc",
+            limit=batch_size,
+            pluck="name",
+        )
+        if not names:
+            break
+        if archive_path:
+            archive_logs(archive_path, names)
+        frappe.db.delete("API Error Log", {"name": ["in", names]})
+        frappe.db.commit()
+        purged += len(names)
+        if len(names) < batch_size:
+            break
+    return purged
+
+
+def get_archive_path():
+    directory = frappe.get_site_path("private", ARCHIVE_DIR)
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, f"{now_datetime():%Y-%m-%d}.jsonl.gz")
+
+
+def archive_logs(path, names):
+    logs = frappe.get_all("API Error Log", filters={"name": ["in", names]}, fields=["*"])
+    # Appended gzip members form a valid gzip file, so every run of the day adds to it
+    with gzip.open(path, "at", encoding="utf-8") as archive:
+        for log in logs:
+            archive.write(json.dumps(log, default=str) + "\n")
@@ -1,5 +1,5 @@
 frappe.listview_settings["API Error Log"] = {
-    add_fields: ["seen"],
+    add_fields: ["seen", "occurrences"],
     get_indicator: function (doc) {
       if (cint(doc.seen)) {
         return [__("Seen"), "green", "seen,=,1"];
@@ -7,5 +7,7 @@ frappe.listview_settings["API Error Log"] = {
         return [__("Not Seen"), "red", "seen,=,0"];
       }
     },
-    order_by: "seen asc, modified desc",
+    // a single sort direction, so the (seen, modified) index serves the first page
+    filters: [["seen", "=", 0]],
+    order_by: "modified desc",
   };
\ No newline at end of file
@@ -1,9 +1,70 @@
 # Copyright (c) 2024, Omkar Darves and Contributors
 # See license.txt
 
-# import frappe
+import frappe
 from frappe.tests.utils import FrappeTestCase
 
+from swagger.api_logger import get_error_fingerprint, make_error_record, write_error_logs
+
+ENDPOINT = "swagger.api.orders.create_order"
+TRACEBACK = """Traceback (most recent call last):
+  File "/apps/swagger/swagger/api/orders.py", line {line}, in create_order
+    validate_order(order)
+  File "/apps/swagger/swagger/api/orders.py", line {line}, in validate_order
+    raise ValueError(f"Order {{order}} is not valid")
+ValueError: Order {order} is not valid
+"""
+
 
 class TestAPIErrorLog(FrappeTestCase):
-	pass
+	def test_fingerprint(self):
+		fingerprint = get_error_fingerprint(TRACEBACK.format(line=10, order=1), ENDPOINT, "ValueError")
+		# line numbers and messages change between repeats of the same bug
+		self.assertEqual(
+			get_error_fingerprint(TRACEBACK.format(line=42, order=2), ENDPOINT, "ValueError"),
+			fingerprint,
+		)
+		self.assertNotEqual(
+			get_error_fingerprint(TRACEBACK.format(line=10, order=1), "swagger.api.orders.get_order", "ValueError"),
+			fingerprint,
+		)
+		self.assertNotEqual(
+			get_error_fingerprint(TRACEBACK.format(line=10, order=1), ENDPOINT, "KeyError"),
+			fingerprint,
+		)
+
+	def test_fingerprint_without_traceback(self):
+		# errors logged outside of an exception are told apart by their message
+		fingerprint = get_error_fingerprint(None, ENDPOINT, None, "Order 1 is not valid")
+		self.assertEqual(get_error_fingerprint("", ENDPOINT, None, "Order 2 is not valid"), fingerprint)
+		self.assertNotEqual(get_error_fingerprint("", ENDPOINT, None, "Customer 1 is blocked"), fingerprint)
+
+	def test_repeats_update_one_log(self):
+		fingerprint = frappe.generate_hash()
+
+		def make_record(error, sampled=True):
+			return make_error_record(
+				"Create Order API Error",
+				error,
+				fingerprint,
+				endpoint=ENDPOINT,
+				exception_type="ValueError",
+				sampled=sampled,
+			)
+
+		name = write_error_logs([make_record("first")])[fingerprint]
+		frappe.db.set_value("API Error Log", name, "seen", 1)
+
+		# unsampled repeats are counted without replacing the stored payload
+		names = write_error_logs([make_record("second", sampled=False), make_record("third", sampled=False)])
+		self.assertEqual(names, {fingerprint: name})
+		log = frappe.get_doc("API Error Log", name)
+		self.assertEqual(log.occurrences, 3)
+		self.assertEqual(log.error, "first")
+		self.assertEqual(log.seen, 0)
+
+		write_error_logs([make_record("fourth")])
+		log.reload()
+		self.assertEqual(log.occurrences, 4)
+		self.assertEqual(log.error, "fourth")
+		self.assertEqual(frappe.db.count("API Error Log", {"fingerprint": fingerprint}), 1)
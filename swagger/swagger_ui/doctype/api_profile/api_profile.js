@@ -0,0 +1,8 @@
+// Copyright (c) 2026, Omkar Darves and contributors
+// For license information, please see license.txt
+
+// frappe.ui.form.on("API Profile", {
+// 	refresh(frm) {
+
+// 	},
+// });
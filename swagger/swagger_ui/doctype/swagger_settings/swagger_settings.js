@@ -1,8 +1,38 @@
 // Copyright (c) 2024, Omkar Darves and contributors
 // For license information, please see license.txt
 
+frappe.ui.form.on("Swagger Settings", {
+    onload: function(frm) {
+      frappe.realtime.off("swagger_generation_progress");
+      frappe.realtime.on("swagger_generation_progress", function(data) {
+        frappe.show_progress(
+          __("Generating Swagger JSON"),
+          data.done,
+          data.total,
+          __("Processed {0} of {1} changed API files", [data.done, data.total])
+        );
+      });
+
+      frappe.realtime.off("swagger_generation_done");
+      frappe.realtime.on("swagger_generation_done", function(data) {
+        frappe.hide_progress();
+        frappe.show_alert({
+          message: __("Swagger JSON generated with {0} paths", [data.paths]),
+          indicator: "green",
+        });
+      });
+    },
+  });
+
 frappe.ui.form.on("Swagger Settings", "generate_swagger_json", function(frm) {
     frappe.call({
-      method: "swagger.swagger_generator.generate_swagger_json",
+      method: "swagger.swagger_generator.enqueue_swagger_generation",
+    });
+  });
+
+frappe.ui.form.on("Swagger Settings", "force_full_rebuild", function(frm) {
+    frappe.call({
+      method: "swagger.swagger_generator.enqueue_swagger_generation",
+      args: { force: 1 },
     });
-  });
\ No newline at end of file
+  });
@@ -0,0 +1,70 @@
+# Copyright (c) 2026, Omkar Darves and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import set_request
+from werkzeug.wrappers import Response
+
+from swagger.exceptions import TooManyRequestsException
+from swagger.rate_limiter import (
+	CONCURRENCY_RETRY_AFTER,
+	RATE_LIMIT_PREFIX,
+	after_request,
+	rate_limit,
+)
+
+
+class TestRateLimiter(FrappeTestCase):
+	def setUp(self):
+		set_request(method="POST", path="/api/method/swagger.tests.test_rate_limiter.create_report")
+		self.addCleanup(setattr, frappe.local, "request", None)
+		frappe.local.swagger_retry_after = None
+		frappe.cache().delete_keys(f"{RATE_LIMIT_PREFIX}|{__name__}")
+
+	def assertRejected(self, call, retry_after=None):
+		with self.assertRaises(TooManyRequestsException) as context:
+			call()
+		exception = context.exception
+		self.assertEqual(exception.http_status_code, 429)
+		if retry_after is not None:
+			self.assertEqual(exception.retry_after, retry_after)
+
+		# the Retry-After header is set on the response of the rejected request
+		response = Response(status=exception.http_status_code)
+		after_request(response)
+		self.assertEqual(response.headers["Retry-After"], str(exception.retry_after))
+		return exception
+
+	def test_rate(self):
+		@rate_limit(rate=2, per=60)
+		def create_report():
+			return "created"
+
+		self.assertEqual(create_report(), "created")
+		self.assertEqual(create_report(), "created")
+		exception = self.assertRejected(create_report)
+		# the bucket refills one token every 30 seconds
+		self.assertGreaterEqual(exception.retry_after, 1)
+		self.assertLessEqual(exception.retry_after, 30)
+
+	def test_max_in_flight(self):
+		@rate_limit(max_in_flight=1)
+		def create_report(nested=False):
+			if nested:
+				return create_report()
+			return "created"
+
+		self.assertRejected(lambda: create_report(nested=True), CONCURRENCY_RETRY_AFTER)
+		# the slot of the rejected request was released
+		self.assertEqual(create_report(), "created")
+
+	def test_no_retry_after_when_admitted(self):
+		@rate_limit(rate=2, per=60)
+		def create_report():
+			return "created"
+
+		create_report()
+		response = Response()
+		after_request(response)
+		self.assertNotIn("Retry-After", response.headers)
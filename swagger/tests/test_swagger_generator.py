@@ -0,0 +1,165 @@
+# Copyright (c) 2026, Omkar Darves and Contributors
+# See license.txt
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+from frappe.tests.utils import FrappeTestCase
+
+from swagger.swagger_generator import (
+	is_cache_entry_fresh,
+	is_cache_entry_reusable,
+	process_file,
+	process_files,
+)
+
+APP = "swagger_test_app"
+
+MODELS = '''
+from typing import List
+from pydantic import BaseModel
+
+# names of the API modules executed so far
+LOADED = []
+
+
+class Item(BaseModel):
+	sku: str
+	quantity: int
+
+
+class Order(BaseModel):
+	customer: str
+	items: List[Item]
+'''
+
+ORDERS_API = '''
+from typing import List
+
+import frappe
+from swagger import http_methods, validate_request
+from swagger_test_app import models
+
+models.LOADED.append(__name__)
+
+
+@frappe.whitelist()
+@http_methods("POST")
+@validate_request(models.Order)
+def create_order(validated_data):
+	return validated_data.customer
+
+
+@frappe.whitelist()
+@http_methods("GET")
+def get_orders(customer: str, limit: int = 20) -> List[models.Order]:
+	return []
+'''
+
+ITEMS_API = '''
+import frappe
+import swagger
+from swagger import validate_request
+from swagger_test_app.models import Item
+
+
+@frappe.whitelist()
+@validate_request(Item)
+def update_item(validated_data):
+	swagger.validate_http_method("PUT")
+
+
+def helper():
+	pass
+'''
+
+
+class TestSwaggerGenerator(FrappeTestCase):
+	def setUp(self):
+		self.bench_path = tempfile.mkdtemp(prefix="swagger-test-")
+		self.app_path = os.path.join(self.bench_path, "apps", APP)
+		package = os.path.join(self.app_path, APP)
+		os.makedirs(os.path.join(package, "api"))
+		self.models_path = self.write(os.path.join(package, "models.py"), MODELS)
+		self.write(os.path.join(package, "__init__.py"), "")
+		self.write(os.path.join(package, "api", "__init__.py"), "")
+		self.orders_path = self.write(os.path.join(package, "api", "orders.py"), ORDERS_API)
+		self.items_path = self.write(os.path.join(package, "api", "items.py"), ITEMS_API)
+		sys.path.insert(0, self.app_path)
+
+	def tearDown(self):
+		sys.path.remove(self.app_path)
+		for name in list(sys.modules):
+			if name == APP or name.startswith(f"{APP}."):
+				del sys.modules[name]
+		shutil.rmtree(self.bench_path)
+
+	def write(self, path, content):
+		with open(path, "w") as f:
+			f.write(content)
+		return path
+
+	def get_loaded_modules(self):
+		from swagger_test_app import models
+
+		return models.LOADED
+
+	def test_cache_entry_invalidated_by_changes(self):
+		entry = process_file(APP, self.orders_path)
+		self.assertTrue(entry["cacheable"])
+		self.assertIn(self.models_path, entry["dependencies"])
+		self.assertTrue(is_cache_entry_reusable(entry, APP, self.orders_path, False))
+		# fragments of the other analysis mode are never reused
+		self.assertFalse(is_cache_entry_reusable(entry, APP, self.orders_path, True))
+
+		# a touched file with the same content keeps its entry
+		stat = os.stat(self.models_path)
+		os.utime(self.models_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+		self.assertTrue(is_cache_entry_fresh(entry, self.orders_path))
+		self.assertEqual(entry["dependencies"][self.models_path]["mtime"], stat.st_mtime_ns + 10**9)
+
+		# a changed model invalidates the modules using it
+		self.write(self.models_path, MODELS.replace("quantity: int", "quantity: float"))
+		self.assertFalse(is_cache_entry_fresh(entry, self.orders_path))
+
+	def test_cache_entry_invalidated_by_module_change(self):
+		entry = process_file(APP, self.items_path)
+		self.assertTrue(is_cache_entry_fresh(entry, self.items_path))
+
+		self.write(self.items_path, ITEMS_API.replace('"PUT"', '"PUT", "PATCH"'))
+		self.assertFalse(is_cache_entry_fresh(entry, self.items_path))
+
+	def test_parallel_generation_matches_serial(self):
+		file_paths = [(APP, self.orders_path), (APP, self.items_path)]
+		for static in (False, True):
+			serial = process_files(file_paths, static)
+			parallel = process_files(file_paths, static, workers=2)
+			self.assertEqual(json.dumps(parallel), json.dumps(serial))
+
+	def test_static_analysis_matches_import(self):
+		for file_path in (self.orders_path, self.items_path):
+			imported = process_file(APP, file_path)
+			static = process_file(APP, file_path, static=True)
+			self.assertEqual(static["paths"], imported["paths"])
+			self.assertEqual(static["schemas"], imported["schemas"])
+			self.assertEqual(static["dependencies"], imported["dependencies"])
+
+		paths = process_file(APP, self.orders_path, static=True)["paths"]
+		create_order = paths[f"/api/method/{APP}.api.orders.create_order"]
+		self.assertEqual(list(create_order), ["post"])
+		self.assertEqual(
+			create_order["post"]["requestBody"]["content"]["application/json"]["schema"],
+			{"$ref": "#/components/schemas/Order"},
+		)
+		self.assertEqual(list(paths[f"/api/method/{APP}.api.orders.get_orders"]), ["get"])
+
+	def test_static_analysis_does_not_execute_modules(self):
+		entry = process_file(APP, self.orders_path, static=True)
+		self.assertTrue(entry["paths"])
+		self.assertEqual(self.get_loaded_modules(), [])
+
+		process_file(APP, self.orders_path)
+		self.assertEqual(self.get_loaded_modules(), ["orders"])
@@ -0,0 +1,154 @@
+# Copyright (c) 2026, Omkar Darves and Contributors
+# See license.txt
+
+import json
+from typing import List
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import set_request
+from pydantic import BaseModel
+
+from swagger.validator import NDJSON_CONTENT_TYPE, validate_query, validate_request
+
+
+class Item(BaseModel):
+	sku: str
+	quantity: int
+
+
+class Order(BaseModel):
+	customer: str
+	items: List[Item]
+
+
+ORDER = {"customer": "CUST-0001", "items": [{"sku": "SKU-1", "quantity": 2}]}
+
+
+class TestValidateRequest(FrappeTestCase):
+	def setUp(self):
+		frappe.local.form_dict = frappe._dict(cmd="swagger.tests.test_validator.create_order")
+		frappe.local.response = frappe._dict()
+		self.addCleanup(setattr, frappe.local, "request", None)
+		patcher = patch("swagger.log_api_error")
+		self.log_api_error = patcher.start()
+		self.addCleanup(patcher.stop)
+
+	def post(self, endpoint, data, content_type="application/json"):
+		set_request(method="POST", path="/api/method/create_order", data=data, content_type=content_type)
+		return endpoint()
+
+	def get_status(self):
+		return frappe.local.response.http_status_code
+
+	def test_valid_body(self):
+		endpoint = validate_request(Order)(lambda validated_data: validated_data)
+		order = self.post(endpoint, json.dumps(ORDER))
+		self.assertIsInstance(order, Order)
+		self.assertEqual(order.items[0].quantity, 2)
+		self.log_api_error.assert_not_called()
+
+	def test_invalid_body(self):
+		endpoint = validate_request(Order)(lambda validated_data: validated_data)
+		self.assertIsNone(self.post(endpoint, json.dumps({**ORDER, "items": [{"sku": "SKU-1"}]})))
+		self.assertEqual(self.get_status(), 422)
+		errors = frappe.local.response.errors
+		self.assertEqual([error["loc"] for error in errors], [["items", 0, "quantity"]])
+		self.log_api_error.assert_called_once()
+
+	def test_malformed_json(self):
+		endpoint = validate_request(Order)(lambda validated_data: validated_data)
+		body = '{"customer": "secret-token", "items": ['
+		self.assertIsNone(self.post(endpoint, body))
+		self.assertEqual(self.get_status(), 422)
+		errors = frappe.local.response.errors
+		self.assertEqual([error["type"] for error in errors], ["json_invalid"])
+		# the raw body is never echoed back
+		self.assertNotIn("input", errors[0])
+		self.assertNotIn("secret-token", json.dumps(errors))
+		self.log_api_error.assert_called_once()
+
+	def test_body_too_large(self):
+		endpoint = validate_request(Order, max_body_size=16)(lambda validated_data: validated_data)
+		self.assertIsNone(self.post(endpoint, json.dumps(ORDER)))
+		self.assertEqual(self.get_status(), 413)
+		self.log_api_error.assert_not_called()
+
+	def test_stream(self):
+		endpoint = validate_request(Item, stream=True)(lambda validated_data: list(validated_data))
+		body = '{"sku": "SKU-1", "quantity": 1}\n\n{"sku": "SKU-2", "quantity": 2}\n'
+		items = self.post(endpoint, body, NDJSON_CONTENT_TYPE)
+		self.assertEqual([item.sku for item in items], ["SKU-1", "SKU-2"])
+
+	def test_stream_requires_ndjson(self):
+		endpoint = validate_request(Item, stream=True)(lambda validated_data: list(validated_data))
+		self.assertIsNone(self.post(endpoint, '{"sku": "SKU-1", "quantity": 1}'))
+		self.assertEqual(self.get_status(), 415)
+
+	def test_stream_invalid_item(self):
+		endpoint = validate_request(Item, stream=True)(lambda validated_data: list(validated_data))
+		body = '{"sku": "SKU-1", "quantity": 1}\n{"sku": "SKU-2", "quantity": "two"}\n'
+		with patch.object(frappe.db, "rollback") as rollback:
+			self.assertIsNone(self.post(endpoint, body, NDJSON_CONTENT_TYPE))
+		self.assertEqual(self.get_status(), 422)
+		self.assertEqual(frappe.local.response.errors[0]["loc"], [1, "quantity"])
+		rollback.assert_called_once()
+
+	def test_stream_malformed_line(self):
+		endpoint = validate_request(Item, stream=True)(lambda validated_data: list(validated_data))
+		body = '{"sku": "SKU-1", "quantity": 1}\n{"sku": \n'
+		with patch.object(frappe.db, "rollback") as rollback:
+			self.assertIsNone(self.post(endpoint, body, NDJSON_CONTENT_TYPE))
+		self.assertEqual(self.get_status(), 422)
+		self.assertTrue(frappe.local.response.message.startswith("Invalid JSON on line 2"))
+		rollback.assert_called_once()
+
+
+class TestValidateQuery(FrappeTestCase):
+	def setUp(self):
+		frappe.local.form_dict = frappe._dict(cmd="swagger.tests.test_validator.get_orders")
+		frappe.local.response = frappe._dict()
+		patcher = patch("swagger.log_api_error")
+		self.log_api_error = patcher.start()
+		self.addCleanup(patcher.stop)
+
+	def test_coercion(self):
+		@validate_query
+		def get_orders(customer: str, limit: int = 20, active: bool = False):
+			return customer, limit, active
+
+		self.assertEqual(
+			get_orders(customer="CUST-0001", limit="5", active="true", cmd="get_orders"),
+			("CUST-0001", 5, True),
+		)
+		self.assertEqual(get_orders("CUST-0001"), ("CUST-0001", 20, False))
+
+	def test_invalid_arguments(self):
+		@validate_query
+		def get_orders(customer: str, limit: int = 20):
+			return customer, limit
+
+		self.assertIsNone(get_orders(limit="many"))
+		self.assertEqual(frappe.local.response.http_status_code, 422)
+		self.assertEqual(
+			sorted(error["loc"][0] for error in frappe.local.response.errors), ["customer", "limit"]
+		)
+		self.log_api_error.assert_called_once()
+
+	def test_reserved_names(self):
+		@validate_query
+		def get_orders(json: bool = False, _private: int = 0, model_config: str = ""):
+			return json, _private, model_config
+
+		self.assertEqual(
+			get_orders(json="1", _private="3", model_config="compact"), (True, 3, "compact")
+		)
+		self.assertEqual(get_orders(), (False, 0, ""))
+
+	def test_extra_keyword_arguments(self):
+		@validate_query
+		def get_orders(limit: int = 20, **kwargs):
+			return limit, kwargs
+
+		self.assertEqual(get_orders(limit="5", status="Open"), (5, {"status": "Open"}))
@@ -1,13 +1,55 @@
 from validator import validate as validate_
 import frappe
+import inspect
+import io
 import json
 from functools import wraps
-from pydantic import BaseModel, ValidationError
-from typing import Type
+from time import perf_counter
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, create_model
+from typing import Any, Type
+from werkzeug.wrappers import Response
 import swagger
 from .responder import respond
 
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+# Compiled TypeAdapters by validated type, shared by all decorated endpoints
+_type_adapters = {}
+
+# Content type of streamed request bodies, one JSON value per line. Unlike
+# application/json, frappe does not parse it into form_dict before the endpoint runs
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+class ItemValidationError(Exception):
+	"""Validation errors of an item of a streamed body, located by item index"""
+
+	def __init__(self, index, error):
+		super().__init__(str(error))
+		self.errors = [{**details, "loc": [index, *details["loc"]]} for details in get_errors(error)]
+
+def parse_json(data):
+	"""Parse a JSON document, with orjson when it is installed"""
+	if orjson:
+		return orjson.loads(data)
+	return json.loads(data)
+
+def get_errors(error):
+	"""
+	Get the details of a ValidationError for a 422 response
+
+	The invalid input is left out, as for malformed bodies it is the raw request
+	body, and the details are made JSON serializable
+	"""
+	return json.loads(error.json(include_url=False, include_input=False))
+
 def validate(data, rules):
+	# raw request bodies are parsed before validation
+	if isinstance(data, (bytes, str)):
+		data = parse_json(data)
+
 	valid, valid_data, errors = validate_(data, rules, return_info=True)
 
 	if not valid:
@@ -22,20 +64,325 @@ def validate_http_method(*methods):
 			from .exceptions import MethodNotAllowedException
 			raise MethodNotAllowedException
 
-def validate_request(model: Type[BaseModel]):
+def http_methods(*methods):
+	"""
+	Restrict an endpoint to the given HTTP methods
+
+	The allowed methods are precomputed once, and disallowed requests are rejected
+	before any argument parsing or body validation. Apply it above `validate_request`:
+
+	@frappe.whitelist()
+	@http_methods("GET", "HEAD")
+	def get_user(user_id): ...
+	"""
+	from .exceptions import MethodNotAllowedException
+
+	allowed_methods = frozenset(method.upper() for method in methods)
+	declared_methods = tuple(dict.fromkeys(method.upper() for method in methods))
+
+	def decorator(func):
+		@wraps(func)
+		def wrapper(*args, **kwargs):
+			# werkzeug already upper-cases the request method
+			if frappe.request and frappe.request.method not in allowed_methods:
+				raise MethodNotAllowedException
+			return func(*args, **kwargs)
+
+		# read by the swagger generator instead of scanning the source code
+		wrapper._http_methods = declared_methods
+		wrapper._allowed_methods = allowed_methods
+		return wrapper
+	return decorator
+
+def get_type_adapter(model):
+    """Get the TypeAdapter of a type, compiled once per type"""
+    adapter = _type_adapters.get(model)
+    if adapter is None:
+        adapter = _type_adapters[model] = TypeAdapter(model)
+    return adapter
+
+def get_json_validator(model):
+    """Get the function validating a raw JSON body against a model in a single pass"""
+    if isinstance(model, type) and issubclass(model, BaseModel):
+        return model.model_validate_json
+    return get_type_adapter(model).validate_json
+
+def get_python_validator(model):
+    """Get the function validating a parsed JSON value against a model"""
+    if isinstance(model, type) and issubclass(model, BaseModel):
+        return model.model_validate
+    return get_type_adapter(model).validate_python
+
+def get_body_stream():
+    """Get a file-like object reading the body of the current request
+
+    frappe reads the body while building `form_dict`; the buffered copy is read then,
+    instead of the exhausted input stream
+    """
+    data = getattr(frappe.request, "_cached_data", None)
+    if data is not None:
+        return io.BytesIO(data)
+    return frappe.request.stream
+
+def get_content_type():
+    """Get the media type of the body of the current request, without parameters"""
+    content_type = frappe.get_request_header("Content-Type") or ""
+    return content_type.partition(";")[0].strip().lower()
+
+def is_body_too_large(max_body_size):
+    """Check the Content-Length of the current request against a limit in bytes"""
+    if not max_body_size:
+        return False
+    content_length = frappe.request.content_length
+    return bool(content_length and content_length > max_body_size)
+
+def iter_json_lines(stream, max_body_size=None):
+    """
+    Parse a newline-delimited JSON body one line at a time
+
+    Only the line being parsed is held in memory, and blank lines are skipped.
+
+    Raises:
+        ValueError: If a line is not valid JSON.
+        PayloadTooLargeException: If more than `max_body_size` bytes are read.
+    """
+    from .exceptions import PayloadTooLargeException
+
+    size = 0
+    number = 0
+    while True:
+        # one byte over the limit is enough to tell the body is too large
+        line = stream.readline(max_body_size - size + 1 if max_body_size else -1)
+        if not line:
+            return
+        size += len(line)
+        number += 1
+        if max_body_size and size > max_body_size:
+            raise PayloadTooLargeException
+        if not line.strip():
+            continue
+        try:
+            yield parse_json(line)
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON on line {number}: {e}") from e
+
+def iter_validated_items(validate_item, max_body_size=None):
+    """Validate the items of the newline-delimited JSON request body one by one"""
+    for index, item in enumerate(iter_json_lines(get_body_stream(), max_body_size)):
+        try:
+            yield validate_item(item)
+        except ValidationError as e:
+            raise ItemValidationError(index, e) from e
+
+def get_json_serializer(model):
+    """Get the function dumping a handler result as the JSON body of a response
+
+    Results are validated against the model, reading attributes so documents and
+    other objects need no `as_dict()`, then dumped by pydantic-core in one pass
+    """
+    adapter = get_type_adapter(model)
+    is_model = isinstance(model, type) and issubclass(model, BaseModel)
+
+    def serialize(result):
+        if not (is_model and isinstance(result, model)):
+            result = adapter.validate_python(result, from_attributes=True)
+        return b'{"message":' + adapter.dump_json(result) + b'}'
+
+    return serialize
+
+def serialize_response(model):
+    """
+    Serialize the results of an endpoint with a Pydantic model or type
+
+    The model also documents the response in the generated Swagger JSON. Responses
+    built with `respond()` and None results are passed through unchanged:
+
+    @frappe.whitelist()
+    @http_methods("GET")
+    @serialize_response(List[OrderSummary])
+    def get_orders(customer): ...
+    """
     def decorator(func):
+        serialize = get_json_serializer(model)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
+            result = func(*args, **kwargs)
+            if result is None or isinstance(result, Response):
+                return result
+            return Response(serialize(result), content_type="application/json")
+
+        wrapper._response_model = model
+        return wrapper
+    return decorator
+
+def validate_request(model: Type[BaseModel], response_model=None, max_body_size=None, stream=False):
+    """
+    Validate the JSON body of a request with a Pydantic model or type
+
+    Requests whose Content-Length exceeds `max_body_size` bytes get a 413 response
+    before validation. frappe has read the body by then, and parsed it for
+    application/json, so the bytes accepted by the server are bounded by nginx
+    `client_max_body_size` and werkzeug `max_content_length`. With `stream`, the body must be newline-delimited JSON
+    sent as application/x-ndjson, one item per line: items are parsed and validated
+    one at a time as the handler iterates over them, so only one item is held as
+    Python objects. Other content types get a 415 response. An invalid item ends the
+    request with a 422 response, and the changes made by the handler until then are
+    rolled back:
+
+    @frappe.whitelist()
+    @http_methods("POST")
+    @validate_request(ItemModel, max_body_size=200 * 1024 * 1024, stream=True)
+    def import_items(validated_data: Iterator[ItemModel]):
+        for item in validated_data: ...
+    """
+    from .exceptions import PayloadTooLargeException, UnsupportedMediaTypeException
+
+    def decorator(func):
+        # resolved once, so requests go straight to the compiled pydantic-core validator
+        validate_json = get_json_validator(model)
+        validate_item = get_python_validator(model)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if is_body_too_large(max_body_size):
+                return PayloadTooLargeException().respond()
+            # an application/json body would be parsed whole by frappe already
+            if stream and get_content_type() != NDJSON_CONTENT_TYPE:
+                return UnsupportedMediaTypeException().respond()
+
+            # phase timings of the request, None unless metrics are enabled
+            timings = getattr(frappe.local, "swagger_metrics", None)
             try:
-                data = json.loads(frappe.request.data)
-                validated_data = model(**data)
-                return func(validated_data)
+                if stream:
+                    validated_data = iter_validated_items(validate_item, max_body_size)
+                    if timings is None:
+                        return func(validated_data)
+                    # parsing and validation are interleaved with the handler
+                    start = perf_counter()
+                    try:
+                        return func(validated_data)
+                    finally:
+                        timings["handler"] = perf_counter() - start
+
+                if timings is None:
+                    validated_data = validate_json(read_body(max_body_size))
+                    return func(validated_data)
+
+                start = perf_counter()
+                data = read_body(max_body_size)
+                timings["body"] = perf_counter() - start
+                start = perf_counter()
+                validated_data = validate_json(data)
+                timings["validation"] = perf_counter() - start
+                start = perf_counter()
+                try:
+                    return func(validated_data)
+                finally:
+                    timings["handler"] = perf_counter() - start
+            except PayloadTooLargeException as e:
+                if stream:
+                    frappe.db.rollback()
+                return e.respond()
+            except ItemValidationError as e:
+                frappe.db.rollback()
+                swagger.log_api_error()
+                return respond(status=422, message="Validation error", errors=e.errors)
             except ValidationError as e:
                 swagger.log_api_error()
-                return respond(status=422, message="Validation error", errors=e.errors())
+                return respond(status=422, message="Validation error", errors=get_errors(e))
             except Exception as e:
+                if stream:
+                    frappe.db.rollback()
                 swagger.log_api_error()
                 return respond(status=422, message=str(e))
         wrapper._model = model
+        if response_model is not None:
+            # outside of the validation, so serialization errors are not reported as 422
+            return serialize_response(response_model)(wrapper)
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
+
+def read_body(max_body_size=None):
+    """Read the body of the current request, within a limit in bytes
+
+    Requests without a Content-Length are only checked once the body is read
+    """
+    from .exceptions import PayloadTooLargeException
+
+    data = frappe.request.data
+    if max_body_size and len(data) > max_body_size:
+        raise PayloadTooLargeException
+    return data
+
+def is_reserved_field_name(name):
+    """Check whether pydantic ignores or warns about a model field name"""
+    return name.startswith(("_", "model_")) or hasattr(BaseModel, name)
+
+def get_query_model(func):
+    """Build the Pydantic model of the parameters of a function
+
+    Unannotated parameters accept any value, parameters without a default are
+    required, and *args/**kwargs are left out. Unknown query arguments, like `cmd`,
+    are ignored. Parameters whose names pydantic reserves, like `_private`, `json` or
+    `model_config`, get another field name with the parameter name as alias
+    """
+    parameters = inspect.signature(func).parameters
+    fields = {}
+    for name, parameter in parameters.items():
+        if parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
+            continue
+        annotation = Any if parameter.annotation is parameter.empty else parameter.annotation
+        default = ... if parameter.default is parameter.empty else parameter.default
+        if is_reserved_field_name(name):
+            field_name = f"param_{name.lstrip('_')}"
+            while field_name in parameters or field_name in fields:
+                field_name += "_"
+            fields[field_name] = (annotation, Field(default, alias=name))
+        else:
+            fields[name] = (annotation, default)
+    return create_model(
+        f"{func.__name__}_query", __config__=ConfigDict(extra="ignore"), **fields
+    )
+
+def validate_query(func=None):
+    """
+    Validate and coerce the query arguments of an endpoint with its signature
+
+    The model is built once, when the function is decorated; every request is then
+    validated and coerced in a single pass, and the same model documents the query
+    parameters in the generated Swagger JSON:
+
+    @frappe.whitelist()
+    @http_methods("GET")
+    @validate_query
+    def get_orders(customer: str, limit: int = 20, since: date | None = None): ...
+    """
+    def decorator(func):
+        model = get_query_model(func)
+        # model field names by parameter name
+        fields = {field.alias or name: name for name, field in model.model_fields.items()}
+        parameters = inspect.signature(func).parameters.values()
+        accepts_kwargs = any(p.kind == p.VAR_KEYWORD for p in parameters)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            # frappe passes the arguments of frappe.form_dict as keyword arguments
+            if args:
+                kwargs = {**dict(zip(fields, args)), **kwargs}
+            try:
+                params = model.model_validate(kwargs)
+            except ValidationError as e:
+                swagger.log_api_error()
+                return respond(status=422, message="Validation error", errors=get_errors(e))
+            arguments = {name: getattr(params, field) for name, field in fields.items()}
+            if accepts_kwargs:
+                arguments = {**kwargs, **arguments}
+            return func(**arguments)
+
+        wrapper._query_model = model
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
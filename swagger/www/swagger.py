@@ -0,0 +1,24 @@
+import json
+import os
+
+from swagger.spec_server import SHARDS_DIR, SHARDS_INDEX, get_spec_dir, get_ui_asset_urls
+
+no_cache = 1
+
+
+def get_context(context):
+    """Add the Swagger UI asset URLs and the shard index to the page context.
+
+    The index is inlined, so the UI can request the first shard without waiting for
+    another round trip. It is None until the Swagger JSON has been generated.
+    """
+    context.assets = get_ui_asset_urls()
+    context.spec_url = "/api/method/swagger.spec_server.get_swagger_json"
+    context.index_url = "/api/method/swagger.spec_server.get_swagger_index"
+    context.index = None
+
+    index_path = os.path.join(get_spec_dir(), SHARDS_DIR, f"{SHARDS_INDEX}.min.json")
+    if os.path.isfile(index_path):
+        with open(index_path) as f:
+            context.index = json.load(f)
+    return context